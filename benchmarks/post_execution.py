@@ -0,0 +1,96 @@
+"""
+Load test of POST v1/execution: sends requests from concurrent clients and prints the latency percentiles.
+
+Each request creates an execution (its row, its payload and the Celery message), so the latency is the one of
+the create path. Run it against the API with the database it uses, e.g. `docker compose up app database redis`
+(without workers the executions stay queued, which keeps the database load to the create path), then compare two
+commits under the same load:
+
+    git checkout <before> && docker compose up -d --build app
+    python benchmarks/post_execution.py --label before --requests 2000 --concurrency 32
+    git checkout <after> && docker compose up -d --build app
+    python benchmarks/post_execution.py --label after --requests 2000 --concurrency 32
+
+The executions created are left in the database, run `docker compose down -v` to start over from an empty one.
+"""
+import argparse
+import json
+import math
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+FACTORIAL_ID = "0192919b-2501-2fea-a93d-5d5541c4002b"
+FACTORIAL_INPUT_ID = "0192919b-2501-585f-1492-4f5d22c98267"
+
+local = threading.local()
+
+
+def post(url: str, body: dict, timeout: float) -> tuple[float, int | None]:
+    """
+    Sends one request with the session of the client thread.
+
+    Returns:
+        tuple[float, int | None]: The latency in secs and the status code, None if the request failed.
+    """
+    if not hasattr(local, "session"):
+        local.session = requests.Session()
+    started = time.perf_counter()
+    try:
+        status = local.session.post(url, json=body, timeout=timeout).status_code
+    except requests.RequestException:
+        status = None
+    return time.perf_counter() - started, status
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]  # Nearest rank
+
+
+def run(args) -> dict:
+    body = {"algorithm_id": args.algorithm_id,
+            "input": [{"id": args.input_id, "value": args.value}],
+            "alias": f"benchmark_{args.label}"}
+    with ThreadPoolExecutor(args.concurrency) as executor:
+        list(executor.map(lambda _: post(args.url, body, args.timeout), range(args.warmup)))
+        started = time.perf_counter()
+        samples = list(executor.map(lambda _: post(args.url, body, args.timeout), range(args.requests)))
+        elapsed = time.perf_counter() - started
+    ok = sorted(latency for latency, status in samples if status == 200)
+    statuses = {}
+    for _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    report = {"label": args.label,
+              "requests": args.requests,
+              "concurrency": args.concurrency,
+              "statuses": statuses,
+              "throughput_rps": round(len(samples) / elapsed, 1)}
+    if ok:
+        report.update({f"{name}_ms": round(value * 1000, 2) for name, value in (
+            ("p50", percentile(ok, 0.50)),
+            ("p90", percentile(ok, 0.90)),
+            ("p99", percentile(ok, 0.99)),
+            ("max", ok[-1]),
+            ("mean", statistics.fmean(ok)))})
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8001/v1/execution")
+    parser.add_argument("--algorithm-id", default=FACTORIAL_ID)
+    parser.add_argument("--input-id", default=FACTORIAL_INPUT_ID)
+    parser.add_argument("--value", default="20", help="value of the input, small enough to pass admission control")
+    parser.add_argument("--requests", type=int, default=1000, help="requests measured")
+    parser.add_argument("--concurrency", type=int, default=32, help="clients sending requests at the same time")
+    parser.add_argument("--warmup", type=int, default=50, help="requests sent first and not measured")
+    parser.add_argument("--timeout", type=float, default=30.0, help="secs before a request counts as failed")
+    parser.add_argument("--label", default="run", help="name of the run in the report, e.g. before or after")
+    print(json.dumps(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
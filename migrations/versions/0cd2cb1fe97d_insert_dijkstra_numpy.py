@@ -0,0 +1,73 @@
+"""insert algorithm data: dijkstra vectorized with numpy
+
+Revision ID: 0cd2cb1fe97d
+Revises: ed0137e3c0bc
+Create Date: 2026-10-18 11:03:47.918264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0cd2cb1fe97d'
+down_revision = 'ed0137e3c0bc'
+branch_labels = None
+depends_on = None
+
+def dijkstra_numpy():
+    return {
+        'id': '01a14eaf-a77c-3eeb-b581-329687f5a064',
+        'name': 'Dijkstra (NumPy)',
+        'desc': 'Dijkstra shortest path over an adjacency matrix with NumPy arrays: masked argmin to pick the next vertex and one vectorized minimum to relax its row.',
+        'source': 'https://github.com/andrelbd1/algorithm-analysis-service/blob/main/src/codes/dijkstra_numpy/__init__.py',
+        'dt': "2026-10-18 11:03:00",
+        'input':[
+            {
+                'id': '01a14eaf-a77c-955a-5a26-7685f8820803',
+                'name': 'number of nodes',
+                'input_type': 'integer',
+                'description': 'number of nodes to build a random graph'
+            }
+        ],
+        'criteria': [
+            {
+                'id': '01a14eaf-a77c-4a50-4130-050495984200',
+                'criteria_id': '001fe2d3-09a5-4bc0-b891-45d475a4b1bc',  # running time
+            },
+            {
+                'id': '01a14eaf-a77c-d9a7-db89-f7c6439a3c77',
+                'criteria_id': 'f6465865-d1a3-496c-82b7-5d7d67adf927',  # memory consume
+            }
+        ]
+    }
+
+def upgrade():
+    values = []
+    values.append(dijkstra_numpy())
+    cols_a = f"""algorithm_id, name, description, source, created_at, updated_at, enabled"""
+    cols_i = f"""input_id, algorithm_id, name, description, input_type, created_at, updated_at, enabled"""
+    cols_c = f"""algorithm_criteria_id, algorithm_id, criteria_id, created_at, updated_at, enabled"""
+    for v in values:
+        vals = f"""('{v['id']}','{v['name']}','{v['desc']}','{v['source']}','{v['dt']}','{v['dt']}',{True})"""
+        op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm({cols_a}) VALUES {vals}""")
+        for vv in v['input']:
+            vals = f"""('{vv['id']}','{v['id']}','{vv['name']}','{vv['description']}','{vv['input_type']}','{v['dt']}','{v['dt']}',{True})"""
+            op.execute(f"""INSERT INTO service_algorithm_analysis.input({cols_i}) VALUES {vals}""")
+        for vv in v['criteria']:
+            vals = f"""('{vv['id']}','{v['id']}','{vv['criteria_id']}','{v['dt']}','{v['dt']}',{True})"""
+            op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm_criteria({cols_c}) VALUES {vals}""")
+
+
+def downgrade():
+    values = []
+    values.append(dijkstra_numpy())
+    a_ids = [v['id'] for v in values]
+    a_ids = f"""('{"','".join(a_ids)}')"""
+    execution_id = f"""SELECT execution_id FROM service_algorithm_analysis.execution WHERE algorithm_id in {a_ids}"""
+    op.execute(f"""DELETE FROM service_algorithm_analysis.result WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.payload WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.execution WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm_criteria WHERE algorithm_id in {a_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.input WHERE algorithm_id in {a_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm WHERE algorithm_id in {a_ids}""")
@@ -0,0 +1,91 @@
+"""adding peak memory allocation criteria
+
+Revision ID: 2e91b6119ef8
+Revises: adbdf581b1b1
+Create Date: 2026-10-18 16:04:12.503318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2e91b6119ef8'
+down_revision = 'adbdf581b1b1'
+branch_labels = None
+depends_on = None
+
+def peak_memory():
+    return {
+        'id': '01a14ebf-aed2-b569-5566-5f3e51e6c4ea',
+        'name': 'Peak Memory Allocation',
+        'desc': 'Measures the peak of the Python heap allocated by the algorithm during its execution (tracemalloc), and the growth of the process peak RSS.',
+        'dt': "2026-10-18 16:04:00",
+        'algorithms': [
+            {
+                'id': '01a14ebf-aed2-5165-887f-9cf0070b3830',
+                'alg_id': '0192919b-2501-91c1-d4bb-c71b4c0785d5',  # dijkstra
+            },
+            {
+                'id': '01a14ebf-aed2-7036-9a30-3b1ec8e6ae13',
+                'alg_id': '01a14eae-45d5-3c5f-0d45-a33bacebe41b',  # dijkstra (binary heap)
+            },
+            {
+                'id': '01a14ebf-aed2-d5fa-eb36-6205f9b43677',
+                'alg_id': '01a14eaf-a77c-3eeb-b581-329687f5a064',  # dijkstra (numpy)
+            },
+            {
+                'id': '01a14ebf-aed2-8bb5-0664-444c1197e5f5',
+                'alg_id': '0192919b-2501-2fea-a93d-5d5541c4002b',  # factorial
+            },
+            {
+                'id': '01a14ebf-aed2-9c86-aed4-9a9293f63377',
+                'alg_id': '01a14eb9-840a-328b-7d22-bac6c62d6404',  # factorial (iterative)
+            },
+            {
+                'id': '01a14ebf-aed2-76b3-0c10-2a650d6dc359',
+                'alg_id': '01a14eb9-840a-ed39-5e45-7b6eb914cf22',  # factorial (binary splitting)
+            },
+            {
+                'id': '01a14ebf-aed2-421f-8346-1a94bf02e8c5',
+                'alg_id': '01a14eb9-840a-0aac-ca76-fe7dfc401be1',  # factorial (math.factorial)
+            },
+            {
+                'id': '01a14ebf-aed2-c833-abac-0a12c6390d9f',
+                'alg_id': '0195316b-d5ca-431a-8d95-f3f65e3ec1dd',  # fibonacci
+            },
+            {
+                'id': '01a14ebf-aed2-6af8-88e9-e499e9ae5c52',
+                'alg_id': '01a14eb8-10a5-ca81-3a49-fd01f01935d5',  # fibonacci (iterative)
+            },
+            {
+                'id': '01a14ebf-aed2-f9f2-37cc-274b571e1e7d',
+                'alg_id': '01a14eb8-10a5-63b2-5a1d-323531410704',  # fibonacci (memoized)
+            },
+            {
+                'id': '01a14ebf-aed2-8b49-b340-fb09e16e9ecb',
+                'alg_id': '01a14eb8-10a5-e5a1-e7fb-c07310e87f0e',  # fibonacci (matrix power)
+            },
+            {
+                'id': '01a14ebf-aed2-5b2e-847b-979c32447d7f',
+                'alg_id': '01a14eb8-10a5-380e-547a-f85fe4b6a1dd',  # fibonacci (fast doubling)
+            }
+        ]
+    }
+
+def upgrade():
+    v = peak_memory()
+    cols_c = f"""criteria_id, name, description, created_at, updated_at, enabled"""
+    cols_a = f"""algorithm_criteria_id, algorithm_id, criteria_id, created_at, updated_at, enabled"""
+    vals = f"""('{v['id']}','{v['name']}','{v['desc']}','{v['dt']}','{v['dt']}',{True})"""
+    op.execute(f"""INSERT INTO service_algorithm_analysis.criteria({cols_c}) VALUES {vals}""")
+    for vv in v['algorithms']:
+        vals = f"""('{vv['id']}','{vv['alg_id']}','{v['id']}','{v['dt']}','{v['dt']}',{True})"""
+        op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm_criteria({cols_a}) VALUES {vals}""")
+
+
+def downgrade():
+    c_id = peak_memory()['id']
+    op.execute(f"""DELETE FROM service_algorithm_analysis.result WHERE criteria_id = '{c_id}'""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm_criteria WHERE criteria_id = '{c_id}'""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.criteria WHERE criteria_id = '{c_id}'""")
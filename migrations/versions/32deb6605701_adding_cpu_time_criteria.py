@@ -0,0 +1,91 @@
+"""adding cpu time criteria
+
+Revision ID: 32deb6605701
+Revises: 2e91b6119ef8
+Create Date: 2026-10-18 16:41:27.180244
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '32deb6605701'
+down_revision = '2e91b6119ef8'
+branch_labels = None
+depends_on = None
+
+def cpu_time():
+    return {
+        'id': '01a14ec3-12cd-45a1-5ef3-1eef4389f9c8',
+        'name': 'CPU Time',
+        'desc': 'Measures the processor time used by the algorithm for a given input, taken in the same runs as its running time.',
+        'dt': "2026-10-18 16:41:00",
+        'algorithms': [
+            {
+                'id': '01a14ec3-12cd-d2d9-f7a6-515b41334632',
+                'alg_id': '0192919b-2501-91c1-d4bb-c71b4c0785d5',  # dijkstra
+            },
+            {
+                'id': '01a14ec3-12cd-e1e0-4b59-29bf44aac21a',
+                'alg_id': '01a14eae-45d5-3c5f-0d45-a33bacebe41b',  # dijkstra (binary heap)
+            },
+            {
+                'id': '01a14ec3-12cd-9063-07a0-fc5943ce9f28',
+                'alg_id': '01a14eaf-a77c-3eeb-b581-329687f5a064',  # dijkstra (numpy)
+            },
+            {
+                'id': '01a14ec3-12cd-d2cc-6d36-428206a5ed38',
+                'alg_id': '0192919b-2501-2fea-a93d-5d5541c4002b',  # factorial
+            },
+            {
+                'id': '01a14ec3-12cd-90d3-93bd-5ad46551abe9',
+                'alg_id': '01a14eb9-840a-328b-7d22-bac6c62d6404',  # factorial (iterative)
+            },
+            {
+                'id': '01a14ec3-12cd-1e1b-f6f9-e7be86ef041a',
+                'alg_id': '01a14eb9-840a-ed39-5e45-7b6eb914cf22',  # factorial (binary splitting)
+            },
+            {
+                'id': '01a14ec3-12cd-fcf2-cfd2-cf6bf41a78f1',
+                'alg_id': '01a14eb9-840a-0aac-ca76-fe7dfc401be1',  # factorial (math.factorial)
+            },
+            {
+                'id': '01a14ec3-12cd-ee06-f887-bc9e30798051',
+                'alg_id': '0195316b-d5ca-431a-8d95-f3f65e3ec1dd',  # fibonacci
+            },
+            {
+                'id': '01a14ec3-12cd-6aa1-0c4a-697032348ba5',
+                'alg_id': '01a14eb8-10a5-ca81-3a49-fd01f01935d5',  # fibonacci (iterative)
+            },
+            {
+                'id': '01a14ec3-12cd-e588-aed2-4f893615cf62',
+                'alg_id': '01a14eb8-10a5-63b2-5a1d-323531410704',  # fibonacci (memoized)
+            },
+            {
+                'id': '01a14ec3-12cd-fd05-c170-e8cfd3515407',
+                'alg_id': '01a14eb8-10a5-e5a1-e7fb-c07310e87f0e',  # fibonacci (matrix power)
+            },
+            {
+                'id': '01a14ec3-12cd-e229-f8e7-f9986ae4ee07',
+                'alg_id': '01a14eb8-10a5-380e-547a-f85fe4b6a1dd',  # fibonacci (fast doubling)
+            }
+        ]
+    }
+
+def upgrade():
+    v = cpu_time()
+    cols_c = f"""criteria_id, name, description, created_at, updated_at, enabled"""
+    cols_a = f"""algorithm_criteria_id, algorithm_id, criteria_id, created_at, updated_at, enabled"""
+    vals = f"""('{v['id']}','{v['name']}','{v['desc']}','{v['dt']}','{v['dt']}',{True})"""
+    op.execute(f"""INSERT INTO service_algorithm_analysis.criteria({cols_c}) VALUES {vals}""")
+    for vv in v['algorithms']:
+        vals = f"""('{vv['id']}','{vv['alg_id']}','{v['id']}','{v['dt']}','{v['dt']}',{True})"""
+        op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm_criteria({cols_a}) VALUES {vals}""")
+
+
+def downgrade():
+    c_id = cpu_time()['id']
+    op.execute(f"""DELETE FROM service_algorithm_analysis.result WHERE criteria_id = '{c_id}'""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm_criteria WHERE criteria_id = '{c_id}'""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.criteria WHERE criteria_id = '{c_id}'""")
@@ -0,0 +1,25 @@
+"""adding execution created_at index
+
+Revision ID: 3da9d4913c61
+Revises: ba69c62662bb
+Create Date: 2026-10-18 21:04:36.218457
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3da9d4913c61'
+down_revision = 'ba69c62662bb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('idx_execution_created_at_id', 'execution', ['created_at', 'execution_id'], unique=False,
+                    schema='service_algorithm_analysis')
+
+
+def downgrade():
+    op.drop_index('idx_execution_created_at_id', table_name='execution', schema='service_algorithm_analysis')
@@ -0,0 +1,50 @@
+"""adding graph type and density inputs
+
+Revision ID: 4bafae54ca48
+Revises: ea33b1e6ebb6
+Create Date: 2026-10-18 13:05:42.758964
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4bafae54ca48'
+down_revision = 'ea33b1e6ebb6'
+branch_labels = None
+depends_on = None
+
+def graph_inputs():
+    graph_type = {
+        'name': 'graph type',
+        'input_type': 'string',
+        'description': 'family of the random graph: complete (default), erdos-renyi, grid, barabasi-albert or dag',
+    }
+    density = {
+        'name': 'density',
+        'input_type': 'float',
+        'description': 'edge probability of the erdos-renyi, barabasi-albert and dag graphs (optional, 0.1 by default)',
+    }
+    return [
+        {'id': '01a14eb6-5d62-b802-7a97-5611303e1447', 'alg_id': '0192919b-2501-91c1-d4bb-c71b4c0785d5', **graph_type},  # dijkstra
+        {'id': '01a14eb6-5d62-68a0-02d2-c2c0ddeaac2f', 'alg_id': '0192919b-2501-91c1-d4bb-c71b4c0785d5', **density},
+        {'id': '01a14eb6-5d62-85af-f3d1-98992eba53b3', 'alg_id': '01a14eae-45d5-3c5f-0d45-a33bacebe41b', **graph_type},  # dijkstra (binary heap)
+        {'id': '01a14eb6-5d62-6c35-9a70-ca336e4d41b6', 'alg_id': '01a14eae-45d5-3c5f-0d45-a33bacebe41b', **density},
+        {'id': '01a14eb6-5d62-3fba-9c8d-1ba86aa8eaaa', 'alg_id': '01a14eaf-a77c-3eeb-b581-329687f5a064', **graph_type},  # dijkstra (numpy)
+        {'id': '01a14eb6-5d62-8020-1a09-2125eb9ab4ea', 'alg_id': '01a14eaf-a77c-3eeb-b581-329687f5a064', **density},
+    ]
+
+def upgrade():
+    dt = "2026-10-18 13:05:00"
+    cols_i = f"""input_id, algorithm_id, name, description, input_type, required, created_at, updated_at, enabled"""
+    for v in graph_inputs():
+        vals = f"""('{v['id']}','{v['alg_id']}','{v['name']}','{v['description']}','{v['input_type']}',{False},'{dt}','{dt}',{True})"""
+        op.execute(f"""INSERT INTO service_algorithm_analysis.input({cols_i}) VALUES {vals}""")
+
+
+def downgrade():
+    i_ids = [v['id'] for v in graph_inputs()]
+    i_ids = f"""('{"','".join(i_ids)}')"""
+    op.execute(f"""DELETE FROM service_algorithm_analysis.payload WHERE input_id in {i_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.input WHERE input_id in {i_ids}""")
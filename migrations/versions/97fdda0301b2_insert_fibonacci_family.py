@@ -0,0 +1,91 @@
+"""insert algorithm data: iterative, memoized, matrix power and fast doubling fibonacci
+
+Revision ID: 97fdda0301b2
+Revises: 4bafae54ca48
+Create Date: 2026-10-18 14:02:10.338417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '97fdda0301b2'
+down_revision = '4bafae54ca48'
+branch_labels = None
+depends_on = None
+
+def fibonacci(alg_id: str, name: str, desc: str, package: str, input_id: str, criteria_ids: tuple):
+    return {
+        'id': alg_id,
+        'name': name,
+        'desc': desc,
+        'source': f'https://github.com/andrelbd1/algorithm-analysis-service/blob/main/src/codes/{package}/__init__.py',
+        'dt': "2026-10-18 14:02:00",
+        'input':[
+            {
+                'id': input_id,
+                'name': 'fibonacci number',
+                'input_type': 'integer',
+                'description': 'number to calculate fibonacci sequence'
+            }
+        ],
+        'criteria': [
+            {
+                'id': criteria_ids[0],
+                'criteria_id': '001fe2d3-09a5-4bc0-b891-45d475a4b1bc',  # running time
+            },
+            {
+                'id': criteria_ids[1],
+                'criteria_id': 'f6465865-d1a3-496c-82b7-5d7d67adf927',  # memory consume
+            }
+        ]
+    }
+
+def fibonacci_family():
+    return [
+        fibonacci('01a14eb8-10a5-ca81-3a49-fd01f01935d5', 'Fibonacci (iterative)',
+                  'Fibonacci number computed bottom-up keeping only the last two values. Runs in O(n) additions.',
+                  'fibonacci_iterative', '01a14eb8-10a5-79fd-38e4-d24f48221667',
+                  ('01a14eb8-10a5-da59-9611-3433d0f1f534', '01a14eb8-10a5-8340-e2d4-b80b52c4eb56')),
+        fibonacci('01a14eb8-10a5-63b2-5a1d-323531410704', 'Fibonacci (memoized)',
+                  'Fibonacci recursion where each value is computed once and kept in a memo. Runs in O(n) additions.',
+                  'fibonacci_memoized', '01a14eb8-10a5-02cc-7a3d-d0003f0237c7',
+                  ('01a14eb8-10a5-678c-29d4-94803d7e1d3f', '01a14eb8-10a5-c2f1-3a4d-f5f7753b1583')),
+        fibonacci('01a14eb8-10a5-e5a1-e7fb-c07310e87f0e', 'Fibonacci (matrix power)',
+                  'Fibonacci number as a power of the 2x2 matrix [[1, 1], [1, 0]], by exponentiation by squaring. Runs in O(log n) matrix products.',
+                  'fibonacci_matrix', '01a14eb8-10a5-1930-2b1a-6b9bf821575e',
+                  ('01a14eb8-10a5-86c2-c7c6-50ad340f7351', '01a14eb8-10a5-12b7-0ae8-127eff172182')),
+        fibonacci('01a14eb8-10a5-380e-547a-f85fe4b6a1dd', 'Fibonacci (fast doubling)',
+                  'Fibonacci number with the fast doubling identities F(2k) = F(k)(2F(k+1) - F(k)) and F(2k+1) = F(k)² + F(k+1)². Runs in O(log n) steps.',
+                  'fibonacci_fast_doubling', '01a14eb8-10a5-5c35-13bd-b8add49d563c',
+                  ('01a14eb8-10a6-f452-2871-f85a31552ecd', '01a14eb8-10a6-6c01-22c0-7d8e2eff6556')),
+    ]
+
+def upgrade():
+    values = fibonacci_family()
+    cols_a = f"""algorithm_id, name, description, source, created_at, updated_at, enabled"""
+    cols_i = f"""input_id, algorithm_id, name, description, input_type, created_at, updated_at, enabled"""
+    cols_c = f"""algorithm_criteria_id, algorithm_id, criteria_id, created_at, updated_at, enabled"""
+    for v in values:
+        vals = f"""('{v['id']}','{v['name']}','{v['desc']}','{v['source']}','{v['dt']}','{v['dt']}',{True})"""
+        op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm({cols_a}) VALUES {vals}""")
+        for vv in v['input']:
+            vals = f"""('{vv['id']}','{v['id']}','{vv['name']}','{vv['description']}','{vv['input_type']}','{v['dt']}','{v['dt']}',{True})"""
+            op.execute(f"""INSERT INTO service_algorithm_analysis.input({cols_i}) VALUES {vals}""")
+        for vv in v['criteria']:
+            vals = f"""('{vv['id']}','{v['id']}','{vv['criteria_id']}','{v['dt']}','{v['dt']}',{True})"""
+            op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm_criteria({cols_c}) VALUES {vals}""")
+
+
+def downgrade():
+    values = fibonacci_family()
+    a_ids = [v['id'] for v in values]
+    a_ids = f"""('{"','".join(a_ids)}')"""
+    execution_id = f"""SELECT execution_id FROM service_algorithm_analysis.execution WHERE algorithm_id in {a_ids}"""
+    op.execute(f"""DELETE FROM service_algorithm_analysis.result WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.payload WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.execution WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm_criteria WHERE algorithm_id in {a_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.input WHERE algorithm_id in {a_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm WHERE algorithm_id in {a_ids}""")
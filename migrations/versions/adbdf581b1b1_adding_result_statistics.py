@@ -0,0 +1,26 @@
+"""adding result statistics
+
+Revision ID: adbdf581b1b1
+Revises: d825bac34473
+Create Date: 2026-10-18 15:21:37.114520
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'adbdf581b1b1'
+down_revision = 'd825bac34473'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('result', sa.Column('statistics', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+                  schema='service_algorithm_analysis')
+
+
+def downgrade():
+    op.drop_column('result', 'statistics', schema='service_algorithm_analysis')
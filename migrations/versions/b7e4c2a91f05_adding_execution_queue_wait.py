@@ -0,0 +1,28 @@
+"""adding execution queue wait
+
+Revision ID: b7e4c2a91f05
+Revises: 3da9d4913c61
+Create Date: 2026-10-18 23:12:08.604511
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e4c2a91f05'
+down_revision = '3da9d4913c61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('execution', sa.Column('queue', sa.String(length=100), nullable=True),
+                  schema='service_algorithm_analysis')
+    op.add_column('execution', sa.Column('queue_wait_secs', sa.Float(), nullable=True),
+                  schema='service_algorithm_analysis')
+
+
+def downgrade():
+    op.drop_column('execution', 'queue_wait_secs', schema='service_algorithm_analysis')
+    op.drop_column('execution', 'queue', schema='service_algorithm_analysis')
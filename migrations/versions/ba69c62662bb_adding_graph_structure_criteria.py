@@ -0,0 +1,76 @@
+"""adding density, degree, weight histogram and connected components criteria
+
+Revision ID: ba69c62662bb
+Revises: 32deb6605701
+Create Date: 2026-10-18 19:20:14.512873
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ba69c62662bb'
+down_revision = '32deb6605701'
+branch_labels = None
+depends_on = None
+
+def criteria(c_id: str, name: str, desc: str, link_ids: tuple):
+    return {
+        'id': c_id,
+        'name': name,
+        'desc': desc,
+        'dt': "2026-10-18 19:20:00",
+        'algorithms': [
+            {
+                'id': link_ids[0],
+                'alg_id': '0192919b-2501-91c1-d4bb-c71b4c0785d5',  # dijkstra
+            },
+            {
+                'id': link_ids[1],
+                'alg_id': '01a14eae-45d5-3c5f-0d45-a33bacebe41b',  # dijkstra (binary heap)
+            },
+            {
+                'id': link_ids[2],
+                'alg_id': '01a14eaf-a77c-3eeb-b581-329687f5a064',  # dijkstra (numpy)
+            }
+        ]
+    }
+
+def graph_structure():
+    return [
+        criteria('01a14edb-867f-06f9-9664-c59c503a7539', 'Density',
+                 'Ratio of the edges of the graph to the edges a graph with the same nodes can have.',
+                 ('01a14edb-867f-2c58-53b1-43c005c00d4e', '01a14edb-867f-cfc8-7a46-cab1fab30040',
+                  '01a14edb-867f-1c8d-db8b-b1729ac0e7c7')),
+        criteria('01a14edb-867f-70da-17a2-16b27c8a79fa', 'Degree',
+                 'Mean number of edges of the nodes of the graph, with the min, max and distribution of the degrees.',
+                 ('01a14edb-867f-5af8-afe6-2dbb5d4b624f', '01a14edb-867f-de45-ff1b-027ecc04f46c',
+                  '01a14edb-867f-608d-ba82-85484c99f75e')),
+        criteria('01a14edb-867f-eab3-c0e9-e0dc2cb130a7', 'Weight Histogram',
+                 'Histogram of the weights of the edges of the graph, with their mean and distribution.',
+                 ('01a14edb-867f-970b-2374-c76f4e663f8f', '01a14edb-867f-8970-e04f-72b38d7c3b03',
+                  '01a14edb-867f-a3a4-691c-10000fa867d7')),
+        criteria('01a14edb-867f-ae29-9c2d-d4b5ee714bf9', 'Connected Components',
+                 'Count the connected components of the graph, ignoring the direction of the edges.',
+                 ('01a14edb-867f-2b0e-1bea-d0a87d32e8c8', '01a14edb-867f-bc2d-817f-fd9e5e1bf329',
+                  '01a14edb-867f-b0d2-fef7-3b0437e9c09a')),
+    ]
+
+def upgrade():
+    cols_c = f"""criteria_id, name, description, created_at, updated_at, enabled"""
+    cols_a = f"""algorithm_criteria_id, algorithm_id, criteria_id, created_at, updated_at, enabled"""
+    for v in graph_structure():
+        vals = f"""('{v['id']}','{v['name']}','{v['desc']}','{v['dt']}','{v['dt']}',{True})"""
+        op.execute(f"""INSERT INTO service_algorithm_analysis.criteria({cols_c}) VALUES {vals}""")
+        for vv in v['algorithms']:
+            vals = f"""('{vv['id']}','{vv['alg_id']}','{v['id']}','{v['dt']}','{v['dt']}',{True})"""
+            op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm_criteria({cols_a}) VALUES {vals}""")
+
+
+def downgrade():
+    c_ids = [v['id'] for v in graph_structure()]
+    c_ids = f"""('{"','".join(c_ids)}')"""
+    op.execute(f"""DELETE FROM service_algorithm_analysis.result WHERE criteria_id in {c_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm_criteria WHERE criteria_id in {c_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.criteria WHERE criteria_id in {c_ids}""")
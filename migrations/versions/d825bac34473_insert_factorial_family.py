@@ -0,0 +1,87 @@
+"""insert algorithm data: iterative, binary splitting and math.factorial factorial
+
+Revision ID: d825bac34473
+Revises: 97fdda0301b2
+Create Date: 2026-10-18 14:40:51.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd825bac34473'
+down_revision = '97fdda0301b2'
+branch_labels = None
+depends_on = None
+
+def factorial(alg_id: str, name: str, desc: str, package: str, input_id: str, criteria_ids: tuple):
+    return {
+        'id': alg_id,
+        'name': name,
+        'desc': desc,
+        'source': f'https://github.com/andrelbd1/algorithm-analysis-service/blob/main/src/codes/{package}/__init__.py',
+        'dt': "2026-10-18 14:40:00",
+        'input':[
+            {
+                'id': input_id,
+                'name': 'factorial number',
+                'input_type': 'integer',
+                'description': 'number to calculate factorial'
+            }
+        ],
+        'criteria': [
+            {
+                'id': criteria_ids[0],
+                'criteria_id': '001fe2d3-09a5-4bc0-b891-45d475a4b1bc',  # running time
+            },
+            {
+                'id': criteria_ids[1],
+                'criteria_id': 'f6465865-d1a3-496c-82b7-5d7d67adf927',  # memory consume
+            }
+        ]
+    }
+
+def factorial_family():
+    return [
+        factorial('01a14eb9-840a-328b-7d22-bac6c62d6404', 'Factorial (iterative)',
+                  'Factorial computed with a loop of multiplications, without recursion. Runs in O(n) multiplications.',
+                  'factorial_iterative', '01a14eb9-840a-f79b-db63-c7725236ef11',
+                  ('01a14eb9-840a-9f24-a1cc-8e620efbb90d', '01a14eb9-840a-3fc0-3dbe-83949231d28d')),
+        factorial('01a14eb9-840a-ed39-5e45-7b6eb914cf22', 'Factorial (binary splitting)',
+                  'Factorial as a balanced product tree, so both operands of each multiplication have about the same size.',
+                  'factorial_binary_splitting', '01a14eb9-840a-6ada-cfe3-accc66d26e1c',
+                  ('01a14eb9-840a-15bf-85b0-b3032d7ae987', '01a14eb9-840a-85f5-b822-e55ba12ba5f3')),
+        factorial('01a14eb9-840a-0aac-ca76-fe7dfc401be1', 'Factorial (math.factorial)',
+                  'Factorial from the Python standard library math.factorial, a C implementation of binary splitting.',
+                  'factorial_math', '01a14eb9-840a-eb15-f1a5-8c78d78c1a25',
+                  ('01a14eb9-840a-334f-e9d3-3ac2267f957f', '01a14eb9-840a-1284-7467-26d295d6cd3d')),
+    ]
+
+def upgrade():
+    values = factorial_family()
+    cols_a = f"""algorithm_id, name, description, source, created_at, updated_at, enabled"""
+    cols_i = f"""input_id, algorithm_id, name, description, input_type, created_at, updated_at, enabled"""
+    cols_c = f"""algorithm_criteria_id, algorithm_id, criteria_id, created_at, updated_at, enabled"""
+    for v in values:
+        vals = f"""('{v['id']}','{v['name']}','{v['desc']}','{v['source']}','{v['dt']}','{v['dt']}',{True})"""
+        op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm({cols_a}) VALUES {vals}""")
+        for vv in v['input']:
+            vals = f"""('{vv['id']}','{v['id']}','{vv['name']}','{vv['description']}','{vv['input_type']}','{v['dt']}','{v['dt']}',{True})"""
+            op.execute(f"""INSERT INTO service_algorithm_analysis.input({cols_i}) VALUES {vals}""")
+        for vv in v['criteria']:
+            vals = f"""('{vv['id']}','{v['id']}','{vv['criteria_id']}','{v['dt']}','{v['dt']}',{True})"""
+            op.execute(f"""INSERT INTO service_algorithm_analysis.algorithm_criteria({cols_c}) VALUES {vals}""")
+
+
+def downgrade():
+    values = factorial_family()
+    a_ids = [v['id'] for v in values]
+    a_ids = f"""('{"','".join(a_ids)}')"""
+    execution_id = f"""SELECT execution_id FROM service_algorithm_analysis.execution WHERE algorithm_id in {a_ids}"""
+    op.execute(f"""DELETE FROM service_algorithm_analysis.result WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.payload WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.execution WHERE execution_id in ({execution_id})""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm_criteria WHERE algorithm_id in {a_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.input WHERE algorithm_id in {a_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.algorithm WHERE algorithm_id in {a_ids}""")
@@ -0,0 +1,50 @@
+"""adding optional inputs and graph seed input
+
+Revision ID: ea33b1e6ebb6
+Revises: 0cd2cb1fe97d
+Create Date: 2026-10-18 12:21:09.635240
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ea33b1e6ebb6'
+down_revision = '0cd2cb1fe97d'
+branch_labels = None
+depends_on = None
+
+def seed_inputs():
+    return [
+        {
+            'id': '01a14eb2-b92f-2725-bd10-7d2b8a8309df',
+            'alg_id': '0192919b-2501-91c1-d4bb-c71b4c0785d5',  # dijkstra
+        },
+        {
+            'id': '01a14eb2-b930-f9c4-556c-f040c3ca6272',
+            'alg_id': '01a14eae-45d5-3c5f-0d45-a33bacebe41b',  # dijkstra (binary heap)
+        },
+        {
+            'id': '01a14eb2-b930-8f95-702a-5ab1f24204ca',
+            'alg_id': '01a14eaf-a77c-3eeb-b581-329687f5a064',  # dijkstra (numpy)
+        },
+    ]
+
+def upgrade():
+    op.add_column('input', sa.Column('required', sa.Boolean(), nullable=False, server_default=sa.true()),
+                  schema='service_algorithm_analysis')
+    dt = "2026-10-18 12:21:00"
+    desc = 'seed of the random graph generator (optional, drawn at random when omitted)'
+    cols_i = f"""input_id, algorithm_id, name, description, input_type, required, created_at, updated_at, enabled"""
+    for v in seed_inputs():
+        vals = f"""('{v['id']}','{v['alg_id']}','seed','{desc}','integer',{False},'{dt}','{dt}',{True})"""
+        op.execute(f"""INSERT INTO service_algorithm_analysis.input({cols_i}) VALUES {vals}""")
+
+
+def downgrade():
+    i_ids = [v['id'] for v in seed_inputs()]
+    i_ids = f"""('{"','".join(i_ids)}')"""
+    op.execute(f"""DELETE FROM service_algorithm_analysis.payload WHERE input_id in {i_ids}""")
+    op.execute(f"""DELETE FROM service_algorithm_analysis.input WHERE input_id in {i_ids}""")
+    op.drop_column('input', 'required', schema='service_algorithm_analysis')
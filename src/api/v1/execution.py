@@ -9,7 +9,7 @@ from src.common.functions import validate_date, validate_field_null, validate_uu
 from src.config import ApplicationConfig
 from src.controllers.execution import ControllerExecution
 from src.exceptions import ParamInvalid
-from src.tasks.execution import queue_execution
+from src.tasks.execution import queue_execution, queue_sweep
 
 config_app = ApplicationConfig()
 
@@ -125,6 +125,78 @@ class ViewGetExecution(ViewExecution):
         return await self.__get_execution_by_id(id)
 
 
+class ViewGetEstimate(ViewExecution):
+
+    __param_search_by = {
+        "algorithm_id": fields.Str(required=True, validate=validate_uuid),
+        "input_id": fields.Str(required=True, validate=validate_uuid),
+        "value": fields.Int(required=True, validate=validate_non_negative_integer),
+    }
+
+    async def __estimate(self):
+        params = parser.parse(
+            self.__param_search_by, self.request, location="querystring"
+        )
+        logger.info("estimate execution", extra=self._log_extra)
+        result = self._controller_execution.estimate({
+            "algorithm_id": params["algorithm_id"],
+            "input": [{"id": params["input_id"], "value": str(params["value"])}],
+        })
+        logger.info("Get estimate execution", extra=self._log_extra)
+        return result
+
+    @InternalRequestHandler.api_method_wrapper
+    async def get(self):
+        """
+        ---
+        tags:
+        - Execution
+        summary: Estimate the results of an execution
+        description: 'Predicted result value of each criteria, with a 95% prediction interval, fitted to the done
+            results of the algorithm for other values of the input. Served from in-memory models refreshed
+            every ESTIMATE_REFRESH_SECS.'
+        produces:
+        - application/json
+        parameters:
+          - in: header
+            name: X-Individual-Id
+          - in: header
+            name: X-Request-Id
+          - name: algorithm_id
+            in: query
+            description: algorithm id
+            required: true
+            schema:
+              type: string
+              example: "0192919b-2501-91c1-d4bb-c71b4c0785d5"
+          - name: input_id
+            in: query
+            description: id of the integer input to estimate
+            required: true
+            schema:
+              type: string
+              example: "0192919b-2501-59d0-d088-50be8a4e5ae6"
+          - name: value
+            in: query
+            description: value of the input
+            required: true
+            schema:
+              type: number
+              example: 5000
+              minimum: 0
+        responses:
+            SyncApiDefaultResponse:
+              description: response Sync Api Successfully
+              schema:
+                $ref: '#/definitions/ResponseGetEstimateSuccessfully'
+            SyncApiError:
+              description: request return known error
+              schema:
+                $ref: '#/definitions/DefaultExceptionError'
+        """
+        return await self.__estimate()
+
+
 class ViewPostExecution(ViewExecution):
 
     __param_search_by = {
@@ -133,18 +205,31 @@ class ViewPostExecution(ViewExecution):
         "alias": fields.Str(required=False),
         "execution_status": fields.Str(required=False, validate=ViewExecution.validate_status),
         "request_date": fields.Str(required=False, validate=validate_date),
-        "page": fields.Int(required=True, dump_default=0, validate=validate_non_negative_integer),
+        "page": fields.Int(required=False, load_default=0, validate=validate_non_negative_integer),
         "amount": fields.Int(required=True, dump_default=20, validate=validate_non_negative_integer),
+        "cursor": fields.Str(required=False, validate=validate_uuid),
     }
 
+    async def __create_sweep(self, params: dict):
+        execution_ids = self._controller_execution.add_sweep(params)
+        params_queue = {"execution_ids": execution_ids}
+        params_queue.update(self._log_extra)
+        queue_sweep(params_queue, params.get("queue"))
+        result = {"ids": execution_ids, "alias": params["alias"]}
+        if "rejected" in params:
+            result["rejected"] = params["rejected"]
+        return result
+
     async def __create_execution(self):
         params = self._params
         logger.info("request create execution", extra=self._log_extra)
         params.update(self._log_extra)
+        if any("sweep" in i for i in params["input"]):
+            return await self.__create_sweep(params)
         execution_id = self._controller_execution.add(params)
         params_queue = {"execution_id": execution_id}
         params_queue.update(self._log_extra)
-        queue_execution(params_queue)
+        queue_execution(params_queue, params.get("queue"))
         return {"id": str(execution_id)}
 
     async def __list_objects(self):
@@ -182,12 +267,18 @@ class ViewPostExecution(ViewExecution):
               maximum: 100
           - name: page
             in: query
-            description: page for search
-            required: true
+            description: page for search, ignored with a cursor
             schema:
               type: number
               example: 0
               minimum: 0
+          - name: cursor
+            in: query
+            description: next_cursor of the previous page, returns the page after it. Unlike page, deep pages cost
+                the same as the first one
+            schema:
+              type: string
+              example: "0195dfda-3263-82cc-6b25-9a302b1df9b5"
           - name: execution_id
             in: query
             description: value for search by execution id. Multiple values separated by ';'
@@ -254,6 +345,10 @@ class ViewPostExecution(ViewExecution):
               description: response Sync Api Successfully
               schema:
                 $ref: '#/definitions/PostCreateExecutionSuccess'
+            SyncApiSweepResponse:
+              description: response Sync Api Successfully when an input has a sweep
+              schema:
+                $ref: '#/definitions/PostCreateSweepSuccess'
             SyncApiError:
               description: request return known error
               schema:
@@ -125,3 +125,97 @@ class ViewGetReport(ViewResult):
                 $ref: '#/definitions/DefaultExceptionError'
         """
         return await self.__evaluation_report_list(algorithm_id, criteria_id, input_id)
+
+
+class ViewGetComplexityReport(ViewResult):
+
+    __param_search_by = {
+        "alias": fields.Str(required=False),
+        "request_date": fields.Str(required=False, validate=validate_date),
+        "n": fields.Int(required=False, validate=validate_non_negative_integer),
+    }
+
+    async def __complexity_report(self, algorithm_id, criteria_id, input_id):
+        validate_uuid(algorithm_id)
+        validate_uuid(criteria_id)
+        validate_uuid(input_id)
+        params = {
+            "algorithm_id": algorithm_id,
+            "criteria_id": criteria_id,
+            "input_id": input_id
+        }
+        params_parse = parser.parse(
+            self.__param_search_by, self.request, location="querystring"
+        )
+        params.update(params_parse)
+        logger.info("complexity report", extra=self._log_extra)
+        params.update(self._log_extra)
+        result = self._controller_result.complexity_report(params)
+        logger.info("Get complexity report", extra=self._log_extra)
+        return result
+
+    @InternalRequestHandler.api_method_wrapper
+    async def get(self, algorithm_id, criteria_id, input_id):
+        """
+        ---
+        tags:
+        - Result
+        summary: Complexity class fitted to the evaluation results
+        description: 'Fits O(1), O(log n), O(n), O(n log n), O(n^2), O(n^3), O(phi^n) and O(2^n) to the average result
+          of each input value by least squares, and predicts the result for an input value n.'
+        produces:
+        - application/json
+        parameters:
+          - in: header
+            name: X-Individual-Id
+          - in: header
+            name: X-Request-Id
+          - name: algorithm_id
+            in: path
+            description: value to search by algorithm id.
+            required: true
+            schema:
+              type: string
+              example: "0192919b-2501-2fea-a93d-5d5541c4002b"
+          - name: criteria_id
+            in: path
+            description: value for search by criteria id.
+            required: true
+            schema:
+              type: string
+              example: "001fe2d3-09a5-4bc0-b891-45d475a4b1bc"
+          - name: input_id
+            in: path
+            description: value for search by input id.
+            required: true
+            schema:
+              type: string
+              example: "0192919b-2501-585f-1492-4f5d22c98267"
+          - name: n
+            in: query
+            description: input value to predict the result of
+            schema:
+              type: number
+              example: 100000
+              minimum: 0
+          - name: alias
+            in: query
+            description: value for search by alias
+            schema:
+              type: string
+          - name: request_date
+            in: query
+            description: value for search by request date ("YYYY-MM-DD")
+            schema:
+              type: string
+        responses:
+            SyncApiDefaultResponse:
+              description: response Sync Api Successfully
+              schema:
+                $ref: '#/definitions/ResponseGetComplexityReportSuccessfully'
+            SyncApiError:
+              description: request return known error
+              schema:
+                $ref: '#/definitions/DefaultExceptionError'
+        """
+        return await self.__complexity_report(algorithm_id, criteria_id, input_id)
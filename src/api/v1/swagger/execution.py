@@ -38,6 +38,8 @@ class ResponseGetExecutionSuccessfully:
                 },
                 "status": "DONE",
                 "message": null,
+                "queue": "algorithm-analysis-service_execution",
+                "queue_wait_secs": "0.042",
                 "request_date": "2025-03-29 03:02:53",
                 "result": [
                     {
@@ -45,7 +47,17 @@ class ResponseGetExecutionSuccessfully:
                         "value": "0.0000324",
                         "unit": "secs",
                         "message": null,
-                        "status": "DONE"
+                        "status": "DONE",
+                        "statistics": {
+                            "min": 0.0000311,
+                            "median": 0.0000324,
+                            "mean": 0.0000329,
+                            "p95": 0.0000351,
+                            "stddev": 0.0000012,
+                            "repeat": 20,
+                            "loops": 5000,
+                            "timer_overhead": 0.00000002
+                        }
                     }
                 ]
             }
@@ -86,11 +98,22 @@ class ResponseGetExecutionListSuccessfully:
                         "value": "0.0000324",
                         "unit": "secs",
                         "message": null,
-                        "status": "DONE"
+                        "status": "DONE",
+                        "statistics": {
+                            "min": 0.0000311,
+                            "median": 0.0000324,
+                            "mean": 0.0000329,
+                            "p95": 0.0000351,
+                            "stddev": 0.0000012,
+                            "repeat": 20,
+                            "loops": 5000,
+                            "timer_overhead": 0.00000002
+                        }
                     }
                 ]
             }
-        ]
+        ],
+        "next_cursor": null
     }
     """
 
@@ -120,6 +143,12 @@ class PostCreateExecution:
                         type: string
                         description: A string representing any value (e.g., an integer to calculate factorial, graph set as a list of nodes, and edges)
                         example: "20"
+                    sweep:
+                        type: object
+                        description: Instead of value, runs one execution per value of an integer input, all with the same alias.
+                                     Either {"start", "stop", "step"} with stop included, or a list of integers.
+                                     Only one input can have a sweep, the response is then PostCreateSweepSuccess.
+                        example: {"start": 100, "stop": 5000, "step": 100}
             required: true
         alias:
             type: string
@@ -143,3 +172,55 @@ class PostCreateExecutionSuccess:
             type: string
             example: "Execution_2025_01_01_16_06_41"
     """
+
+
+@register_swagger_model
+class PostCreateSweepSuccess:
+    """
+    ---
+    type: object
+    description: IDs of the executions of a sweep, in the order of the sweep
+    properties:
+        ids:
+            type: array
+            items:
+                type: string
+            example: ["21d88834-5021-5fff-a66f-0069f40ec3e7", "21d88834-5021-5fff-a66f-0069f40ec3e8"]
+        alias:
+            type: string
+            example: "Execution_2025_01_01_16_06_41"
+        rejected:
+            type: object
+            description: Sweep values left out because their estimated cost exceeds the budget, only when any
+            example: {
+                "values": [5000],
+                "message": "Estimated Running Time of 125 secs for number of nodes 5000 (O(n^2), fitted to 12 input
+                            values) exceeds the budget of 120 secs"
+            }
+    """
+
+
+@register_swagger_model
+class ResponseGetEstimateSuccessfully:
+    """
+    ---
+    type: object
+    description: Route used to estimate the results of an execution before requesting it.
+    example: {
+        "algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+        "estimates": [
+            {
+                "input_id": "0192919b-2501-59d0-d088-50be8a4e5ae6",
+                "input_value": 5000,
+                "criteria_id": "001fe2d3-09a5-4bc0-b891-45d475a4b1bc",
+                "criteria": "Running Time",
+                "unit": "secs",
+                "complexity": "O(n^2)",
+                "points": 12,
+                "value": "7.51",
+                "lower": "7.02",
+                "upper": "8.00"
+            }
+        ]
+    }
+    """
@@ -13,8 +13,42 @@ class ResponseGetEvaluationReportListSuccessfully:
             {
                 "input_value": "5",
                 "average": "0.000002165000000000000000",
-                "unit": "secs"
+                "unit": "secs",
+                "statistics": {
+                    "min": "0.000002050000000000000000",
+                    "median": "0.000002160000000000000000",
+                    "mean": "0.000002165000000000000000",
+                    "p95": "0.000002310000000000000000",
+                    "stddev": "0.000000070000000000000000"
+                }
             }
         ]
     }
     """
+
+
+@register_swagger_model
+class ResponseGetComplexityReportSuccessfully:
+    """
+    ---
+    type: object
+    description: Route used to return the complexity class that best fits the evaluation results.
+    example: {
+        "unit": "secs",
+        "points": 6,
+        "best": {
+            "complexity": "O(n^2)",
+            "coefficients": {"a": 0.0012, "b": 3.1e-07},
+            "r2": 0.9987
+        },
+        "models": [
+            {"complexity": "O(n^2)", "coefficients": {"a": 0.0012, "b": 3.1e-07}, "r2": 0.9987},
+            {"complexity": "O(n^3)", "coefficients": {"a": 0.0954, "b": 8.7e-11}, "r2": 0.9712},
+            {"complexity": "O(n log n)", "coefficients": {"a": -0.2107, "b": 8.5e-05}, "r2": 0.9421},
+            {"complexity": "O(n)", "coefficients": {"a": -0.3391, "b": 0.00098}, "r2": 0.9283},
+            {"complexity": "O(log n)", "coefficients": {"a": -2.8541, "b": 0.4512}, "r2": 0.7005},
+            {"complexity": "O(1)", "coefficients": {"a": 1.1874, "b": 0.0}, "r2": 0.0}
+        ],
+        "prediction": {"n": 10000, "value": "31.0012"}
+    }
+    """
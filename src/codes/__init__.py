@@ -2,13 +2,24 @@ import logging
 
 from .base import BaseCode
 from .dijkstra import Dijkstra
+from .dijkstra_heap import DijkstraHeap
+from .dijkstra_numpy import DijkstraNumpy
 from .factorial import Factorial
+from .factorial_binary_splitting import FactorialBinarySplitting
+from .factorial_iterative import FactorialIterative
+from .factorial_math import FactorialMath
 from .fibonacci import Fibonacci
+from .fibonacci_fast_doubling import FibonacciFastDoubling
+from .fibonacci_iterative import FibonacciIterative
+from .fibonacci_matrix import FibonacciMatrix
+from .fibonacci_memoized import FibonacciMemoized
 
 log = logging.getLogger(__file__)
 
 
-__all__ = ["Dijkstra", "Factorial", "Fibonacci"]
+__all__ = ["Dijkstra", "DijkstraHeap", "DijkstraNumpy", "Factorial", "FactorialBinarySplitting", "FactorialIterative",
+           "FactorialMath", "Fibonacci", "FibonacciFastDoubling", "FibonacciIterative", "FibonacciMatrix",
+           "FibonacciMemoized"]
 
 
 class Codes:
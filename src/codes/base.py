@@ -2,13 +2,23 @@ import logging
 from abc import abstractmethod
 
 from src.common import Singleton
+from src.exceptions import ParamInvalid
 
 
 log = logging.getLogger(__file__)
 
 
 class BaseCode(metaclass=Singleton):
+    """
+    Base of the codes under analysis. Instances are singletons shared by every execution of a worker, so they
+    hold no per-run state: run gets its inputs from params and keeps what it computes in locals.
+    """
     name = 'base'
+    time_limit = None  # Wall-clock deadline of a measurement in secs, SANDBOX_TIME_LIMIT_SECS if None
+    memory_limit = None  # Address space a measurement may allocate in bytes, SANDBOX_MEMORY_LIMIT_BYTES if None
+    # Declared running time of one run in the required integer input, as (ComplexityFit class, secs per unit of
+    # growth), e.g. ('O(n^2)', 2e-7). Used to admit executions of algorithms without results yet
+    complexity = None
 
     @abstractmethod
     def run(self, params: dict):
@@ -17,3 +27,15 @@ class BaseCode(metaclass=Singleton):
     @staticmethod
     def setup(payload: list):
         pass
+
+    @staticmethod
+    def non_negative(params: dict, key: str) -> int:
+        """
+        Returns the integer input of params, for the codes only defined from 0 (e.g. F(n), n!).
+
+        Raises:
+            ParamInvalid: If the input is negative.
+        """
+        if (n := params.get(key)) < 0:
+            raise ParamInvalid(f"{key} must not be negative: {n}")
+        return n
@@ -1,107 +1,138 @@
 import logging
-import random
+import time
+import numpy as np
 from src.codes.base import BaseCode
+from src.codes.graph import DEFAULT_DENSITY, cached_complete_graph, generate_graph, random_seed
 
 log = logging.getLogger(__file__)
 
+INF = float('inf')
+
 
 class Dijkstra(BaseCode):
     name = 'Dijkstra'
+    complexity = ('O(n^2)', 2e-7)
 
-    def __init__(self):
-        self.inf = float('inf')
-        self.graph = []
-        self.n_vertices = len(self.graph)
-
-    def __min_distance(self, dist: list, visited: list) -> int:
-        minimum = self.inf  # Initialize minimum distance for next node
-        for v in range(self.n_vertices):  # get nearest vertex not visited
+    @staticmethod
+    def __min_distance(dist: list, visited: list) -> int | None:
+        minimum = INF  # Initialize minimum distance for next node
+        min_index = None  # Stays None when the vertices left are unreachable
+        for v in range(len(dist)):  # get nearest vertex not visited
             if dist[v] < minimum and visited[v] is False:
                 minimum = dist[v]
                 min_index = v
         return min_index
 
-    def __print_distance(self, dist, target=None) -> int:
+    @staticmethod
+    def __print_distance(dist, target=None) -> int:
         if target:
             return dist[target]
 
+    @staticmethod
+    def __row(graph, u: int) -> list:
+        # Read array-backed rows as Python ints: the loop stays pure Python and uint weights cannot overflow.
+        row = graph[u]
+        return row.tolist() if isinstance(row, np.ndarray) else row
+
     def run(self, params: dict) -> int:  # O(n2)
-        self.graph = params.get("graph")
-        self.n_vertices = len(self.graph)
+        # The instance is shared by every execution of the worker: per-run state (the graph above all)
+        # stays in locals, so it is released when the run returns.
+        graph = params.get("graph")
+        n_vertices = len(graph)
         src = params.get("source")
         target = params.get("target")
-        visited = [False] * self.n_vertices
-        dist = [self.inf] * self.n_vertices
+        visited = [False] * n_vertices
+        dist = [INF] * n_vertices
         dist[src] = 0
         path_prev = {src: None}
-        for _ in range(self.n_vertices):
+        for _ in range(n_vertices):
             # Get the minimum distance vertex not visited yet.
             # u is always equal to src in first iteration.
             u = self.__min_distance(dist, visited)
+            if u is None:
+                break
             visited[u] = True
+            row = self.__row(graph, u)
             # Update distance value of the adjacent vertices
-            for v in range(self.n_vertices):
-                if (self.graph[u][v] > 0 and  # Check if has edge
+            for v in range(n_vertices):
+                if (row[v] > 0 and  # Check if has edge
                         visited[v] is False and
-                        dist[v] > dist[u] + self.graph[u][v]):
-                    dist[v] = dist[u] + self.graph[u][v]
+                        dist[v] > dist[u] + row[v]):
+                    dist[v] = dist[u] + row[v]
                     path_prev.update({v: u})
         return self.__print_distance(dist, target)
 
     @staticmethod
-    def setup(payload: list):
+    def __generated_input(name: str, value, input_type: str) -> dict:
+        return {'payload_id': None, "input_value": value, 'input': {
+            'input_id': None,
+            'name': name,
+            'description': None,
+            'input_type': input_type,
+        }}
+
+    @staticmethod
+    def setup(payload: list, sparse: bool = False):
         """
-        Generates an adjacency matrix representation of a worst-case graph for Dijkstra's algorithm.
+        Generates a random graph for Dijkstra's algorithm.
+
+        The graph family is given by the optional "graph type" input (see src.codes.graph.GRAPH_TYPES),
+        complete by default, which is the worst case of Dijkstra's algorithm. "density" sets the edge
+        probability of the random families. Graphs are generated from a seed and served from the on-disk
+        graph cache, so executions with the same inputs and seed run on the same graph, and their
+        generation time and memory are measured apart from the algorithm.
 
         Args:
             payload (list): A list of dictionaries containing input parameters. 
                             The dictionary should have keys "input" and "input_value".
                             The "input" key should map to another dictionary with at least the key "name".
                             The "input_value" key should map to the value of the input parameter.
-            num_nodes (int): Number of nodes in the graph.
+            sparse (bool): When True the graph is a CSRGraph, otherwise a numpy.ndarray adjacency matrix
+                           of unsigned weights. Defaults to False.
 
         Note:
             The function modifies the input payload list in place by appending the generated graph,
-            source node, and target node as new dictionaries.
+            source node, and target node as new dictionaries. The seed, graph type and density used
+            are appended too when missing, so they can be stored with the execution.
         """
+        seed = graph_type = density = None
         for p in payload:
             p_input = p.get("input")
-            if p_input.get("name") == "number of nodes":
-                num_nodes = int(p.get("input_value"))
-                break
-        
-        # Initialize an empty adjacency matrix
-        graph = [[0] * num_nodes for _ in range(num_nodes)]
+            match p_input.get("name"):
+                case "number of nodes":
+                    num_nodes = int(p.get("input_value"))
+                case "seed":
+                    seed = int(p.get("input_value"))
+                case "graph type":
+                    graph_type = p.get("input_value").strip().lower()
+                case "density":
+                    density = float(p.get("input_value"))
+        if seed is None:
+            seed = random_seed()
+            payload.append(Dijkstra.__generated_input('seed', seed, 'integer'))
+        if graph_type is None:
+            graph_type = 'complete'
+            payload.append(Dijkstra.__generated_input('graph type', graph_type, 'string'))
+        if density is None and graph_type in ('erdos-renyi', 'barabasi-albert', 'dag'):
+            density = DEFAULT_DENSITY
+            payload.append(Dijkstra.__generated_input('density', density, 'float'))
 
-        # Create a complete undirected graph with random weights
-        for i in range(num_nodes):
-            for j in range(i + 1, num_nodes):  # Ensures undirected edges
-                weight = random.randint(1, 100)  # Random weight between 1 and 100
-                graph[i][j] = weight
-                graph[j][i] = weight  # Mirror the weight for undirected property
+        time_init = time.perf_counter()
+        if sparse:
+            graph = generate_graph(graph_type, num_nodes, density, seed)
+            graph_bytes = sum(a.nbytes for a in graph.arrays().values())
+        elif graph_type == 'complete':
+            graph = cached_complete_graph(num_nodes, seed)
+            graph_bytes = graph.nbytes
+        else:
+            graph = generate_graph(graph_type, num_nodes, density, seed).to_matrix()
+            graph_bytes = graph.nbytes
+        log.info(f"{graph_type} graph of {num_nodes} nodes and seed {seed} loaded in "
+                 f"{time.perf_counter() - time_init:.7f} secs, {graph_bytes} bytes")
 
         # Choose source as the first node (0) and target as the last node (num_nodes - 1)
         source = 0
         target = num_nodes - 1
-
-        source_input = {'payload_id': None, "input_value": source, 'input':{
-            'input_id': None,
-            'name': 'source',
-            'description': None,
-            'input_type': 'integer',
-        }}
-        target_input = {'payload_id': None, "input_value": target, 'input':{
-            'input_id': None,
-            'name': 'target',
-            'description': None,
-            'input_type': 'integer',
-        }}
-        graph_input = {'payload_id': None, "input_value": graph, 'input':{
-            'input_id': None,
-            'name': 'graph',
-            'description': None,
-            'input_type': 'list',
-        }}
-        payload.append(source_input)
-        payload.append(target_input)
-        payload.append(graph_input)
+        payload.append(Dijkstra.__generated_input('source', source, 'integer'))
+        payload.append(Dijkstra.__generated_input('target', target, 'integer'))
+        payload.append(Dijkstra.__generated_input('graph', graph, 'csr' if sparse else 'ndarray'))
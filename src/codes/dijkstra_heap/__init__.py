@@ -0,0 +1,46 @@
+import heapq
+import logging
+from src.codes.base import BaseCode
+from src.codes.dijkstra import Dijkstra
+
+log = logging.getLogger(__file__)
+
+
+class DijkstraHeap(BaseCode):
+    name = 'Dijkstra (binary heap)'
+    complexity = ('O(n^2)', 1e-7)
+
+    def run(self, params: dict) -> int:  # O((V+E) log V)
+        graph = params.get("graph")
+        src = params.get("source")
+        target = params.get("target")
+        dist = [float('inf')] * graph.n_vertices
+        dist[src] = 0
+        heap = [(0, src)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:  # Stale entry, u was already settled with a shorter distance
+                continue
+            if u == target:
+                break
+            for v, weight in graph.neighbours(u):
+                if d + weight < dist[v]:
+                    dist[v] = d + weight
+                    heapq.heappush(heap, (dist[v], v))
+        return dist[target]
+
+    @staticmethod
+    def setup(payload: list):
+        """
+        Generates the same random graph as Dijkstra.setup, directly in CSR format.
+
+        Args:
+            payload (list): A list of dictionaries containing input parameters.
+                            It must contain the "number of nodes" input.
+
+        Note:
+            The function modifies the input payload list in place by appending the generated graph,
+            source node, and target node as new dictionaries. The graph is a CSRGraph, so sparse
+            graph types are never expanded to a dense matrix.
+        """
+        Dijkstra.setup(payload, sparse=True)
@@ -0,0 +1,48 @@
+import logging
+import numpy as np
+from src.codes.base import BaseCode
+from src.codes.dijkstra import Dijkstra
+
+log = logging.getLogger(__file__)
+
+
+class DijkstraNumpy(BaseCode):
+    name = 'Dijkstra (NumPy)'
+    complexity = ('O(n^2)', 2e-8)
+
+    def run(self, params: dict) -> int:  # O(n2), each step vectorized
+        graph = params.get("graph")
+        src = params.get("source")
+        target = params.get("target")
+        n_vertices = len(graph)
+        visited = np.zeros(n_vertices, dtype=bool)
+        dist = np.full(n_vertices, np.inf)
+        dist[src] = 0
+        for _ in range(n_vertices):
+            # Get the minimum distance vertex not visited yet, visited vertices are masked with inf.
+            u = int(np.argmin(np.where(visited, np.inf, dist)))
+            if visited[u] or np.isinf(dist[u]) or u == target:
+                break
+            visited[u] = True
+            # Relax the whole row at once: only edges to vertices not visited yet are candidates.
+            row = graph[u]
+            candidates = np.where((row > 0) & ~visited, dist[u] + row, np.inf)
+            np.minimum(dist, candidates, out=dist)
+        if np.isinf(dist[target]):
+            return float('inf')
+        return int(dist[target])
+
+    @staticmethod
+    def setup(payload: list):
+        """
+        Generates the same random graph as Dijkstra.setup, which is already a NumPy matrix.
+
+        Args:
+            payload (list): A list of dictionaries containing input parameters.
+                            It must contain the "number of nodes" input.
+
+        Note:
+            The function modifies the input payload list in place by appending the generated graph,
+            source node, and target node as new dictionaries.
+        """
+        Dijkstra.setup(payload)
@@ -6,6 +6,7 @@ log = logging.getLogger(__file__)
 
 class Factorial(BaseCode):
     name = 'Factorial'
+    complexity = ('O(n)', 2e-6)
 
     def run(self, params: dict) -> int:
         n = params.get("factorial number")
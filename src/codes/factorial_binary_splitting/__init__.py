@@ -0,0 +1,26 @@
+import logging
+from src.codes.base import BaseCode
+
+log = logging.getLogger(__file__)
+
+
+class FactorialBinarySplitting(BaseCode):
+    name = 'Factorial (binary splitting)'
+    complexity = ('O(n^2)', 5e-11)
+
+    def __product(self, low: int, high: int) -> int:
+        # Product of low..high (inclusive), split in halves so that both operands of every
+        # multiplication have about the same size, which is where Karatsuba pays off.
+        if high - low < 8:
+            result = low
+            for k in range(low + 1, high + 1):
+                result *= k
+            return result
+        middle = (low + high) // 2
+        return self.__product(low, middle) * self.__product(middle + 1, high)
+
+    def run(self, params: dict) -> int:  # O(log n) recursion depth
+        n = params.get("factorial number")
+        if n < 2:
+            return 1
+        return self.__product(2, n)
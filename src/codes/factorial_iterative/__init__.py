@@ -0,0 +1,16 @@
+import logging
+from src.codes.base import BaseCode
+
+log = logging.getLogger(__file__)
+
+
+class FactorialIterative(BaseCode):
+    name = 'Factorial (iterative)'
+    complexity = ('O(n^2)', 5e-10)
+
+    def run(self, params: dict) -> int:  # O(n) multiplications
+        n = params.get("factorial number")
+        result = 1
+        for k in range(2, n + 1):
+            result *= k
+        return result
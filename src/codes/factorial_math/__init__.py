@@ -0,0 +1,14 @@
+import logging
+import math
+from src.codes.base import BaseCode
+
+log = logging.getLogger(__file__)
+
+
+class FactorialMath(BaseCode):
+    name = 'Factorial (math.factorial)'
+    complexity = ('O(n^2)', 3e-11)
+
+    def run(self, params: dict) -> int:
+        # CPython's implementation: binary splitting of the odd part plus a shift for the powers of two.
+        return math.factorial(params.get("factorial number"))
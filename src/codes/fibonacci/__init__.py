@@ -6,6 +6,8 @@ log = logging.getLogger(__file__)
 
 class Fibonacci(BaseCode):
     name = 'Fibonacci sequence'
+    time_limit = 60  # Exponential, n=60 would run for centuries
+    complexity = ('O(phi^n)', 4e-7)  # About 8 secs at n=35 and 90 secs at n=40
 
     def run(self, params: dict) -> int:
         key = "fibonacci number"
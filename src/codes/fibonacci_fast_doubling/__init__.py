@@ -0,0 +1,23 @@
+import logging
+from src.codes.base import BaseCode
+
+log = logging.getLogger(__file__)
+
+
+class FibonacciFastDoubling(BaseCode):
+    name = 'Fibonacci (fast doubling)'
+    complexity = ('O(n^2)', 1e-13)
+
+    def run(self, params: dict) -> int:  # O(log n) steps
+        """
+        Computes F(n) with the fast doubling identities, reading the bits of n from the most significant:
+            F(2k) = F(k) * (2 * F(k + 1) - F(k))
+            F(2k + 1) = F(k)² + F(k + 1)²
+        """
+        n = self.non_negative(params, "fibonacci number")
+        a, b = 0, 1  # F(k), F(k + 1) with k = 0
+        for bit in bin(n)[2:]:
+            a, b = a * (2 * b - a), a * a + b * b
+            if bit == '1':
+                a, b = b, a + b
+        return a
@@ -0,0 +1,16 @@
+import logging
+from src.codes.base import BaseCode
+
+log = logging.getLogger(__file__)
+
+
+class FibonacciIterative(BaseCode):
+    name = 'Fibonacci (iterative)'
+    complexity = ('O(n^2)', 3e-11)
+
+    def run(self, params: dict) -> int:  # O(n) additions
+        n = self.non_negative(params, "fibonacci number")
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
@@ -0,0 +1,29 @@
+import logging
+from src.codes.base import BaseCode
+
+log = logging.getLogger(__file__)
+
+
+class FibonacciMatrix(BaseCode):
+    name = 'Fibonacci (matrix power)'
+    complexity = ('O(n^2)', 5e-13)
+
+    @staticmethod
+    def __multiply(x: tuple, y: tuple) -> tuple:
+        # 2x2 matrices as (a, b, c, d) = [[a, b], [c, d]]
+        return (x[0] * y[0] + x[1] * y[2], x[0] * y[1] + x[1] * y[3],
+                x[2] * y[0] + x[3] * y[2], x[2] * y[1] + x[3] * y[3])
+
+    def run(self, params: dict) -> int:  # O(log n) matrix products
+        """
+        Computes F(n) as the top right entry of [[1, 1], [1, 0]]^n, by exponentiation by squaring.
+        """
+        n = self.non_negative(params, "fibonacci number")
+        result = (1, 0, 0, 1)
+        base = (1, 1, 1, 0)
+        while n > 0:
+            if n & 1:
+                result = self.__multiply(result, base)
+            base = self.__multiply(base, base)
+            n >>= 1
+        return result[1]
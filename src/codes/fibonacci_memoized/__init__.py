@@ -0,0 +1,32 @@
+import logging
+from src.codes.base import BaseCode
+
+log = logging.getLogger(__file__)
+
+
+class FibonacciMemoized(BaseCode):
+    name = 'Fibonacci (memoized)'
+    complexity = ('O(n^2)', 5e-11)
+
+    def run(self, params: dict) -> int:  # O(n) additions
+        """
+        Top-down recursion F(n) = F(n - 1) + F(n - 2) where each value is computed once.
+
+        The memo is local to the call, so repeated runs are measured from scratch, and the
+        recursion is driven by an explicit stack, so large n does not hit the recursion limit.
+        Once F(k) is known, F(k - 2) is dropped from the memo: the calls left on the stack only
+        ask for F(k) and F(k - 1), and keeping every value would hold about n²/2 bits.
+        """
+        n = self.non_negative(params, "fibonacci number")
+        memo = {0: 0, 1: 1}
+        stack = [n]
+        while stack:
+            k = stack[-1]
+            if k in memo:
+                stack.pop()
+            elif k - 1 in memo and k - 2 in memo:
+                memo[k] = memo[k - 1] + memo.pop(k - 2)
+                stack.pop()
+            else:
+                stack.append(k - 1)
+        return memo[n]
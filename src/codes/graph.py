@@ -0,0 +1,333 @@
+import logging
+import math
+import secrets
+
+import numpy as np
+
+from src.internal_services.graph_cache import GraphCache
+
+log = logging.getLogger(__file__)
+
+GENERATOR_VERSION = 1  # Bump when a generator changes, so cached graphs are not reused.
+
+
+def random_seed() -> int:
+    return secrets.randbits(32)
+
+
+def weight_dtype(max_weight: int) -> np.dtype:
+    """
+    Returns the smallest unsigned integer dtype able to hold weights up to max_weight.
+
+    Args:
+        max_weight (int): The largest edge weight the graph may have.
+
+    Returns:
+        np.dtype: uint8, uint16 or uint32.
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_weight <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError(f'Weight {max_weight} is too large for a graph.')
+
+
+def complete_graph(num_nodes: int, max_weight: int = 100, seed: int = None) -> np.ndarray:
+    """
+    Generates the adjacency matrix of a complete undirected graph with random weights.
+
+    The weights are drawn in one call, the upper triangle is kept and mirrored onto the
+    lower triangle in one vectorized step, so no Python-level loop touches the n² cells.
+
+    Args:
+        num_nodes (int): Number of nodes in the graph.
+        max_weight (int): Weights are drawn uniformly from 1 to max_weight. Defaults to 100.
+        seed (int, optional): Seed of the random generator, the same seed gives the same graph.
+
+    Returns:
+        np.ndarray: A (num_nodes, num_nodes) matrix of the smallest unsigned dtype that fits
+                    max_weight, with zeros on the diagonal.
+    """
+    dtype = weight_dtype(max_weight)
+    rng = np.random.default_rng(seed)
+    graph = np.triu(rng.integers(1, max_weight, size=(num_nodes, num_nodes), dtype=dtype, endpoint=True), k=1)
+    graph += graph.T  # Mirror the weight for undirected property
+    return graph
+
+
+def cached_complete_graph(num_nodes: int, seed: int) -> np.ndarray:
+    """
+    Returns complete_graph(num_nodes, seed=seed) from the graph cache, generating it on a miss.
+
+    Args:
+        num_nodes (int): Number of nodes in the graph.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        np.ndarray: The adjacency matrix, memory-mapped read-only when served from the cache.
+    """
+    params = {'generator': 'complete', 'num_nodes': num_nodes, 'density': 1.0, 'seed': seed,
+              'version': GENERATOR_VERSION}
+    arrays = GraphCache().get_or_create(params, lambda: {'matrix': complete_graph(num_nodes, seed=seed)})
+    return arrays['matrix']
+
+
+def _random_weights(rng: np.random.Generator, size: int, max_weight: int) -> np.ndarray:
+    return rng.integers(1, max_weight, size=size, dtype=weight_dtype(max_weight), endpoint=True)
+
+
+def _pairs(n_pairs: int, probability: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draws each of n_pairs candidate edges with the given probability, in O(E) expected time.
+
+    The number of edges is drawn from the binomial distribution first and that many distinct
+    pair indices are then sampled, so the n_pairs candidates are never enumerated.
+    """
+    return np.sort(rng.choice(n_pairs, size=rng.binomial(n_pairs, probability), replace=False))
+
+
+def _upper_triangle(num_nodes: int, k: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Maps row-major indices of the strict upper triangle of a (num_nodes, num_nodes) matrix to (i, j).
+    """
+    def row_start(i):
+        return i * (2 * num_nodes - i - 1) // 2
+
+    b = 2 * num_nodes - 1
+    i = ((b - np.sqrt(b * b - 8 * k.astype(np.float64))) // 2).astype(np.int64)
+    i = np.where(row_start(i + 1) <= k, i + 1, i)  # Fix floating point rounding of the square root
+    i = np.where(row_start(i) > k, i - 1, i)
+    return i, k - row_start(i) + i + 1
+
+
+def erdos_renyi_graph(num_nodes: int, probability: float, max_weight: int = 100, seed: int = None) -> 'CSRGraph':
+    """
+    Generates an Erdős–Rényi G(n, p) undirected graph with random weights.
+
+    Args:
+        num_nodes (int): Number of nodes in the graph.
+        probability (float): Probability of each edge.
+        max_weight (int): Weights are drawn uniformly from 1 to max_weight. Defaults to 100.
+        seed (int, optional): Seed of the random generator, the same seed gives the same graph.
+
+    Returns:
+        CSRGraph: The generated graph.
+    """
+    rng = np.random.default_rng(seed)
+    src, dst = _upper_triangle(num_nodes, _pairs(num_nodes * (num_nodes - 1) // 2, probability, rng))
+    return CSRGraph.from_edges(num_nodes, src, dst, _random_weights(rng, len(src), max_weight))
+
+
+def random_dag(num_nodes: int, probability: float, max_weight: int = 100, seed: int = None) -> 'CSRGraph':
+    """
+    Generates a random directed acyclic graph, where each edge i -> j with i < j exists with the
+    given probability. The node numbering is a topological order.
+
+    Args:
+        num_nodes (int): Number of nodes in the graph.
+        probability (float): Probability of each edge.
+        max_weight (int): Weights are drawn uniformly from 1 to max_weight. Defaults to 100.
+        seed (int, optional): Seed of the random generator, the same seed gives the same graph.
+
+    Returns:
+        CSRGraph: The generated graph.
+    """
+    rng = np.random.default_rng(seed)
+    src, dst = _upper_triangle(num_nodes, _pairs(num_nodes * (num_nodes - 1) // 2, probability, rng))
+    return CSRGraph.from_edges(num_nodes, src, dst, _random_weights(rng, len(src), max_weight), directed=True)
+
+
+def grid_graph(num_nodes: int, max_weight: int = 100, seed: int = None) -> 'CSRGraph':
+    """
+    Generates a 2D grid graph with random weights. The grid has ceil(sqrt(num_nodes)) columns and
+    its last row is left incomplete when num_nodes is not a perfect square.
+
+    Args:
+        num_nodes (int): Number of nodes in the graph.
+        max_weight (int): Weights are drawn uniformly from 1 to max_weight. Defaults to 100.
+        seed (int, optional): Seed of the random generator, the same seed gives the same graph.
+
+    Returns:
+        CSRGraph: The generated graph.
+    """
+    rng = np.random.default_rng(seed)
+    cols = math.isqrt(max(num_nodes - 1, 0)) + 1  # ceil(sqrt(num_nodes))
+    nodes = np.arange(num_nodes, dtype=np.int64)
+    right = nodes[(nodes % cols != cols - 1) & (nodes + 1 < num_nodes)]
+    down = nodes[nodes + cols < num_nodes]
+    src = np.concatenate((right, down))
+    dst = np.concatenate((right + 1, down + cols))
+    return CSRGraph.from_edges(num_nodes, src, dst, _random_weights(rng, len(src), max_weight))
+
+
+def barabasi_albert_graph(num_nodes: int, edges_per_node: int, max_weight: int = 100,
+                          seed: int = None) -> 'CSRGraph':
+    """
+    Generates a Barabási–Albert scale-free undirected graph with random weights.
+
+    Each new node is attached to edges_per_node distinct existing nodes chosen with probability
+    proportional to their degree, by sampling from the list of edge endpoints.
+
+    Args:
+        num_nodes (int): Number of nodes in the graph.
+        edges_per_node (int): Number of edges of each new node, between 1 and num_nodes - 1.
+        max_weight (int): Weights are drawn uniformly from 1 to max_weight. Defaults to 100.
+        seed (int, optional): Seed of the random generator, the same seed gives the same graph.
+
+    Returns:
+        CSRGraph: The generated graph.
+    """
+    rng = np.random.default_rng(seed)
+    m = edges_per_node
+    n_edges = max(0, m * (num_nodes - m))
+    src = np.empty(n_edges, dtype=np.int64)
+    dst = np.empty(n_edges, dtype=np.int64)
+    endpoints = np.empty(2 * n_edges, dtype=np.int64)
+    targets = np.arange(m, dtype=np.int64)
+    for v in range(m, num_nodes):
+        e = m * (v - m)
+        src[e:e + m] = v
+        dst[e:e + m] = targets
+        endpoints[2 * e:2 * e + m] = targets
+        endpoints[2 * e + m:2 * e + 2 * m] = v
+        chosen = set()
+        while len(chosen) < m:
+            chosen.update(endpoints[rng.integers(0, 2 * e + 2 * m, size=m - len(chosen))].tolist())
+        targets = np.fromiter(chosen, dtype=np.int64, count=m)
+    return CSRGraph.from_edges(num_nodes, src, dst, _random_weights(rng, n_edges, max_weight))
+
+
+GRAPH_TYPES = ('complete', 'erdos-renyi', 'grid', 'barabasi-albert', 'dag')
+DEFAULT_DENSITY = 0.1
+
+
+def generate_graph(graph_type: str, num_nodes: int, density: float, seed: int) -> 'CSRGraph':
+    """
+    Returns a graph of the given family in CSR format, from the graph cache when possible.
+
+    Args:
+        graph_type (str): One of GRAPH_TYPES.
+        num_nodes (int): Number of nodes in the graph.
+        density (float): Edge probability of "erdos-renyi" and "dag". For "barabasi-albert" each new
+                         node gets round(density * (num_nodes - 1) / 2) edges, which gives about the same
+                         density. Ignored by "complete" and "grid".
+        seed (int): Seed of the random generator.
+
+    Returns:
+        CSRGraph: The generated graph.
+
+    Raises:
+        ValueError: If graph_type is unknown or density is not in (0, 1].
+    """
+    if graph_type not in GRAPH_TYPES:
+        raise ValueError(f'Graph type {graph_type} is not one of {", ".join(GRAPH_TYPES)}.')
+    if graph_type == 'complete':
+        return CSRGraph.from_matrix(cached_complete_graph(num_nodes, seed))
+    if graph_type == 'grid':
+        density = None
+    elif not 0 < density <= 1:
+        raise ValueError(f'Density {density} must be greater than 0 and at most 1.')
+    match graph_type:
+        case 'erdos-renyi':
+            def build():
+                return erdos_renyi_graph(num_nodes, density, seed=seed)
+        case 'dag':
+            def build():
+                return random_dag(num_nodes, density, seed=seed)
+        case 'grid':
+            def build():
+                return grid_graph(num_nodes, seed=seed)
+        case 'barabasi-albert':
+            edges_per_node = min(max(1, round(density * (num_nodes - 1) / 2)), max(1, num_nodes - 1))
+
+            def build():
+                return barabasi_albert_graph(num_nodes, edges_per_node, seed=seed)
+    params = {'generator': graph_type, 'num_nodes': num_nodes, 'density': density, 'seed': seed,
+              'version': GENERATOR_VERSION}
+    return CSRGraph(**GraphCache().get_or_create(params, lambda: build().arrays()))
+
+
+class CSRGraph:
+    """
+    Graph stored in compressed sparse row (CSR) format.
+
+    The neighbours of vertex u are indices[indptr[u]:indptr[u + 1]] and the
+    weight of each of those edges is at the same position in weights.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    def __len__(self) -> int:
+        return self.n_vertices
+
+    @property
+    def n_vertices(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices)
+
+    @classmethod
+    def from_matrix(cls, matrix) -> 'CSRGraph':
+        """
+        Builds a CSR graph from an adjacency matrix, where a value greater than zero is an edge.
+
+        Args:
+            matrix (list | np.ndarray): A square adjacency matrix.
+
+        Returns:
+            CSRGraph: The same graph in CSR format.
+        """
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(0, 0)
+        edges = matrix > 0
+        indptr = np.zeros(len(matrix) + 1, dtype=np.int64)
+        np.cumsum(np.count_nonzero(edges, axis=1), out=indptr[1:])
+        rows, indices = np.nonzero(edges)
+        return cls(indptr, indices.astype(np.int32), matrix[rows, indices])
+
+    @classmethod
+    def from_edges(cls, num_nodes: int, src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+                   directed: bool = False) -> 'CSRGraph':
+        """
+        Builds a CSR graph from an edge list.
+
+        Args:
+            num_nodes (int): Number of vertices.
+            src (np.ndarray): Source vertex of each edge.
+            dst (np.ndarray): Destination vertex of each edge.
+            weights (np.ndarray): Weight of each edge.
+            directed (bool): When False, each edge is stored in both directions. Defaults to False.
+
+        Returns:
+            CSRGraph: The graph, with the neighbours of each vertex sorted.
+        """
+        if not directed:
+            src, dst, weights = np.concatenate((src, dst)), np.concatenate((dst, src)), np.concatenate((weights, weights))
+        order = np.lexsort((dst, src))
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+        return cls(indptr, dst[order].astype(np.int32), weights[order])
+
+    def arrays(self) -> dict:
+        return {'indptr': self.indptr, 'indices': self.indices, 'weights': self.weights}
+
+    def to_matrix(self) -> np.ndarray:
+        """
+        Returns the dense adjacency matrix of the graph, with zeros where there is no edge.
+        """
+        matrix = np.zeros((self.n_vertices, self.n_vertices), dtype=self.weights.dtype)
+        rows = np.repeat(np.arange(self.n_vertices), np.diff(self.indptr))
+        matrix[rows, self.indices] = self.weights
+        return matrix
+
+    def neighbours(self, u: int):
+        """
+        Returns (neighbour, weight) pairs of vertex u as Python ints.
+        """
+        start, end = self.indptr[u], self.indptr[u + 1]
+        return zip(self.indices[start:end].tolist(), self.weights[start:end].tolist())
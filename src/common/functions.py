@@ -1,5 +1,7 @@
 import json
 import re
+import resource
+import sys
 import uuid
 from datetime import date, datetime, timezone
 from typing import Any
@@ -8,6 +10,19 @@ from webargs import ValidationError
 from src.exceptions import ObjectNotFound, ParamInvalid
 
 
+def current_rss() -> int:
+    """
+    Returns the resident set size of the current process in bytes, or its peak
+    (resource.getrusage) where /proc is not available.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
 def date_utc_now() -> datetime:
     """
     Get the current date and time in UTC.
@@ -42,6 +57,23 @@ def format_to_alphanumeric(value: str, replace: str = '_') -> str:
     return re.sub('[^0-9a-zA-Z]+', replace, value)
 
 
+def format_uuid(value: Any) -> str:
+    """
+    Formats a UUID given in any case or form accepted by uuid.UUID to the one of str(uuid.UUID), lowercase and
+    hyphenated, which is how the IDs read from the database compare. A value that is not a UUID is lowercased.
+
+    Args:
+        value (Any): The UUID to be formatted.
+
+    Returns:
+        str: The formatted UUID.
+    """
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return str(value).lower()
+
+
 def log_extra(individual_id: str, unique_id: str) -> dict:
     return {"unique_id": unique_id, "individual_id": individual_id}
 
@@ -2,6 +2,7 @@ import logging
 import logging.config
 import os
 import pytz
+import tempfile
 
 from dotenv import load_dotenv
 from kombu import Exchange, Queue
@@ -49,10 +50,34 @@ class ApplicationConfig:
     STATUS_QUEUE = "QUEUE"
     STATUS_WARNING = 'WARNING'
 
+    GRAPH_CACHE_DIR = os.environ.get("GRAPH_CACHE_DIR", os.path.join(tempfile.gettempdir(), PROJECT_NAME, "graphs"))
+    GRAPH_CACHE_MAX_BYTES = int(os.environ.get("GRAPH_CACHE_MAX_BYTES", 10_737_418_240))
+    CPU_LOCK_DIR = os.environ.get("CPU_LOCK_DIR", os.path.join(GRAPH_CACHE_DIR, ".cpu-locks"))
+    CRITERIA_POOL_WORKERS = int(os.environ.get("CRITERIA_POOL_WORKERS", min(os.cpu_count() or 1, 4)))
+    EXECUTION_FANOUT = os.environ.get("EXECUTION_FANOUT", "false").lower() == "true"
+    SWEEP_MAX_POINTS = int(os.environ.get("SWEEP_MAX_POINTS", 1000))
+    ESTIMATE_REFRESH_SECS = float(os.environ.get("ESTIMATE_REFRESH_SECS", 300))
+    RUNNING_TIME_WARMUP = int(os.environ.get("RUNNING_TIME_WARMUP", 1))
+    RUNNING_TIME_MIN_SECS = float(os.environ.get("RUNNING_TIME_MIN_SECS", 0.2))
+    RUNNING_TIME_BUDGET_SECS = float(os.environ.get("RUNNING_TIME_BUDGET_SECS", 2.0))
+    RUNNING_TIME_MIN_REPEAT = int(os.environ.get("RUNNING_TIME_MIN_REPEAT", 3))
+    RUNNING_TIME_MAX_REPEAT = int(os.environ.get("RUNNING_TIME_MAX_REPEAT", 100))
+    SANDBOX_ENABLED = os.environ.get("SANDBOX_ENABLED", "true").lower() == "true"
+    SANDBOX_TIME_LIMIT_SECS = float(os.environ.get("SANDBOX_TIME_LIMIT_SECS", 600))
+    SANDBOX_MEMORY_LIMIT_BYTES = int(os.environ.get("SANDBOX_MEMORY_LIMIT_BYTES", 4_294_967_296))
+    ADMISSION_ENABLED = os.environ.get("ADMISSION_ENABLED", "true").lower() == "true"
+    ADMISSION_MAX_SECS = float(os.environ.get("ADMISSION_MAX_SECS", 120))
+    ADMISSION_MAX_BYTES = int(os.environ.get("ADMISSION_MAX_BYTES", SANDBOX_MEMORY_LIMIT_BYTES))
+
     TIMEZONE_APP = os.environ.get("TIMEZONE_APP", "America/Vancouver")
     TIME_CRON_PROCESS_EXECUTION = os.environ.get("TIME_CRON_PROCESS_EXECUTION", 1)
     TIMEZONE_VAN = pytz.timezone(TIMEZONE_APP)
     QUEUE_EXECUTION = os.environ.get("QUEUE_EXECUTION", PROJECT_NAME+"_execution")
+    QUEUE_EXECUTION_SLOW = os.environ.get("QUEUE_EXECUTION_SLOW", PROJECT_NAME + "_execution_slow")
+    QUEUE_EXECUTION_HEAVY = os.environ.get("QUEUE_EXECUTION_HEAVY", PROJECT_NAME + "_execution_heavy")
+    ROUTING_SLOW_SECS = float(os.environ.get("ROUTING_SLOW_SECS", 1))
+    ROUTING_HEAVY_SECS = float(os.environ.get("ROUTING_HEAVY_SECS", 60))
+    ROUTING_HEAVY_BYTES = int(os.environ.get("ROUTING_HEAVY_BYTES", 1_073_741_824))
     QUEUE_CRON = os.environ.get("QUEUE_CRON", PROJECT_NAME+"_cron")
     CELERY_GET_BROKER = os.environ.get("CELERY_GET_BROKER", "REDIS")
     broker_transport_options: dict = {}
@@ -73,6 +98,8 @@ class ApplicationConfig:
                                                                        port=RABBITMQ_PORT)
     elif CELERY_GET_BROKER == "SQS":
         SQS_URL = os.environ.get("SQS_URL")
+        SQS_URL_SLOW = os.environ.get("SQS_URL_SLOW", SQS_URL)
+        SQS_URL_HEAVY = os.environ.get("SQS_URL_HEAVY", SQS_URL)
         SQS_AWS_REGION = os.environ.get('SQS_AWS_REGION', 'us-east-1')
         SQS_ACCESS_KEY = os.environ.get('SQS_ACCESS_KEY')
         SQS_SECRET_KEY = os.environ.get('SQS_SECRET_KEY')
@@ -82,6 +109,12 @@ class ApplicationConfig:
                 QUEUE_EXECUTION: {  # SQS queue name
                     "url": SQS_URL,
                 },
+                QUEUE_EXECUTION_SLOW: {
+                    "url": SQS_URL_SLOW,
+                },
+                QUEUE_EXECUTION_HEAVY: {
+                    "url": SQS_URL_HEAVY,
+                },
                 # QUEUE_CRON: {
                 #     "url": SQS_URL,
                 # }
@@ -89,14 +122,15 @@ class ApplicationConfig:
         }
         broker_url = r'sqs://'
         if SQS_ACCESS_KEY and SQS_SECRET_KEY:
-            _ = CELERY_BROKER_TRANSPORT_OPTIONS['predefined_queues'][QUEUE_EXECUTION]
-            _.update({"access_key_id": SQS_ACCESS_KEY, "secret_access_key": SQS_SECRET_KEY})
+            for _ in CELERY_BROKER_TRANSPORT_OPTIONS['predefined_queues'].values():
+                _.update({"access_key_id": SQS_ACCESS_KEY, "secret_access_key": SQS_SECRET_KEY})
             # _ = CELERY_BROKER_TRANSPORT_OPTIONS['predefined_queues'][QUEUE_CRON]
             # _.update({"access_key_id": SQS_ACCESS_KEY, "secret_access_key": SQS_SECRET_KEY})
             broker_url = r"sqs://{ACCESS_KEY}:{SECRET_KEY}@".format(ACCESS_KEY=SQS_ACCESS_KEY,
                                                                     SECRET_KEY=SQS_SECRET_KEY)
         broker_transport_options = CELERY_BROKER_TRANSPORT_OPTIONS
     backend = None
+    result_backend = os.environ.get("CELERY_RESULT_BACKEND")  # Required by the chords of EXECUTION_FANOUT
     broker_connection_retry = True
     broker_connection_retry_on_startup = True
     # name_cron = QUEUE_CRON
@@ -124,6 +158,16 @@ class ApplicationConfig:
             Exchange(QUEUE_EXECUTION),
             routing_key=QUEUE_EXECUTION,
         ),
+        Queue(
+            QUEUE_EXECUTION_SLOW,
+            Exchange(QUEUE_EXECUTION_SLOW),
+            routing_key=QUEUE_EXECUTION_SLOW,
+        ),
+        Queue(
+            QUEUE_EXECUTION_HEAVY,
+            Exchange(QUEUE_EXECUTION_HEAVY),
+            routing_key=QUEUE_EXECUTION_HEAVY,
+        ),
         # Queue(
         #     QUEUE_CRON,
         #     Exchange(QUEUE_CRON),
@@ -1,15 +1,20 @@
 import json
 import logging
 from datetime import datetime
-from sqlalchemy import DateTime, String, and_, func, null, select
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DateTime, Integer, String, and_, func, literal, null, select, tuple_
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.engine.cursor import LegacyCursorResult
+from sqlalchemy.orm import joinedload, selectinload
 
-from src.codes import Codes
-from src.common.functions import (format_date, format_datetime, format_to_alphanumeric,
+from src.codes import BaseCode, Codes
+from src.common.functions import (format_date, format_datetime, format_to_alphanumeric, format_uuid,
                                   result_json, validate_object)
 from src.config import ApplicationConfig
-from src.evaluation import Evaluation
+from src.evaluation import Evaluation, MeasurementSession, Sandbox
+from src.evaluation.cpu_lock import CpuLock
+from src.exceptions import LimitExceeded, ParamInvalid
+from src.internal_services.complexity_fit import ComplexityFit
+from src.internal_services.estimate_model import EstimateModel
 from src.models.tb_algorithm import Algorithm
 from src.models.tb_criteria import Criteria
 from src.models.tb_execution import Execution
@@ -20,8 +25,9 @@ from src.models.tb_result import Result
 from . import ControllerDefault
 from .algorithm import ControllerAlgorithm
 from .criteria import ControllerCriteria
+from .input import ControllerInput
 from .payload import ControllerPayload
-from .result import ControllerResult
+from .result import ControllerResult, ResultBatch
 
 log = logging.getLogger(__file__)
 config_app = ApplicationConfig()
@@ -37,6 +43,10 @@ class ControllerExecution(ControllerDefault):
     def __controller_criteria(self):
         return ControllerCriteria()
 
+    @property
+    def __controller_input(self):
+        return ControllerInput()
+
     @property
     def __controller_payload(self):
         return ControllerPayload()
@@ -99,6 +109,108 @@ class ControllerExecution(ControllerDefault):
                     continue
         return query.where(and_(*filter_value))
 
+    @staticmethod
+    def __budgets(code_class: type) -> dict:
+        """
+        Returns the budget of one run by result unit: the admission limits, capped by the sandbox limits of the code.
+        """
+        max_secs = min(config_app.ADMISSION_MAX_SECS, code_class.time_limit or config_app.ADMISSION_MAX_SECS)
+        max_bytes = min(config_app.ADMISSION_MAX_BYTES, code_class.memory_limit or config_app.ADMISSION_MAX_BYTES)
+        return {'secs': max_secs, 'MiB': max_bytes / 2 ** 20}
+
+    @staticmethod
+    def __code_class(params: dict) -> type | None:
+        """
+        Returns the code class of the algorithm of the execution, or None when it has no code.
+        """
+        if (algorithm := params.get("algorithm")) is None:
+            return None
+        try:
+            return type(Codes.get_instance(algorithm.name))
+        except NotImplementedError:
+            return None
+
+    def __costs(self, params: dict, inputs: list, payload: list) -> list[dict]:
+        """
+        Estimates the cost of one run of a payload for each required integer input (the input size).
+
+        The estimates of the done results of the algorithm come first (see estimate). When an input has no
+        running time estimate yet, the running time declared by the code (BaseCode.complexity) is used instead.
+
+        Args:
+            params (dict): The parameters of the execution, after __prepare_params.
+            inputs (list): The inputs of the algorithm, as returned by Input.get.
+            payload (list): A list of {"id", "value"}.
+
+        Returns:
+            list[dict]: One item per estimate, with criteria, unit, value, input, input_value and source.
+        """
+        model = EstimateModel()
+        code_class = self.__code_class(params)
+        sizes = {i['input_id']: i for i in inputs if i['input_type'] in ('int', 'integer') and i.get('required', True)}
+        costs = []
+        for p in payload:
+            if (size := sizes.get(format_uuid(p.get('id')))) is None:
+                continue
+            try:
+                n = int(str(p.get('value')).strip())
+            except ValueError:
+                continue
+            estimates = [dict(e, source=f"{e['complexity']}, fitted to {e['points']} input values")
+                         for e in model.estimate(str(params["algorithm_id"]), size['input_id'], n)]
+            if code_class and code_class.complexity and not any(e['unit'] == 'secs' for e in estimates):
+                complexity, secs = code_class.complexity
+                declared = {'complexity': complexity, 'coefficients': {'a': 0.0, 'b': secs}}
+                estimates.append({'criteria': 'Running Time', 'unit': 'secs',
+                                  'value': ComplexityFit.predict(declared, n),
+                                  'source': f"{complexity}, declared by the code"})
+            costs.extend(dict(e, input=size['name'], input_value=n) for e in estimates)
+        return costs
+
+    def __over_budget(self, params: dict, costs: list) -> str | None:
+        """
+        Tells why one run of a payload exceeds the budget, or None when it is admitted (or admission is disabled).
+
+        Args:
+            params (dict): The parameters of the execution, after __prepare_params.
+            costs (list): The estimates of one run, as returned by __costs.
+
+        Returns:
+            str | None: The first estimate over its budget, with its source, or None.
+        """
+        if not config_app.ADMISSION_ENABLED:
+            return None
+        budgets = self.__budgets(self.__code_class(params) or BaseCode)
+        for cost in costs:
+            if (budget := budgets.get(cost['unit'])) is not None and cost['value'] > budget:
+                return (f"Estimated {cost['criteria']} of {cost['value']:.4g} {cost['unit']} for {cost['input']} "
+                        f"{cost['input_value']} ({cost['source']}) exceeds the budget of {budget:.4g} {cost['unit']}")
+        return None
+
+    @staticmethod
+    def __queue(runs: list[list]) -> str:
+        """
+        Routes a task by the estimated cost of its runs (one run per execution, several for a sweep).
+
+        The task is heavy when its runs add up to more than ROUTING_HEAVY_SECS or one of them needs more than
+        ROUTING_HEAVY_BYTES, slow when they add up to more than ROUTING_SLOW_SECS, and fast otherwise. Runs
+        without a running time estimate are slow, so an unknown cost never holds up the fast queue.
+
+        Args:
+            runs (list[list]): The estimates of each run, as returned by __costs.
+
+        Returns:
+            str: QUEUE_EXECUTION (fast), QUEUE_EXECUTION_SLOW or QUEUE_EXECUTION_HEAVY.
+        """
+        secs = [max((c['value'] for c in costs if c['unit'] == 'secs'), default=None) for costs in runs]
+        mib = max((c['value'] for costs in runs for c in costs if c['unit'] == 'MiB'), default=0.0)
+        total_secs = sum(s for s in secs if s is not None)
+        if total_secs > config_app.ROUTING_HEAVY_SECS or mib * 2 ** 20 > config_app.ROUTING_HEAVY_BYTES:
+            return config_app.QUEUE_EXECUTION_HEAVY
+        if None in secs or total_secs > config_app.ROUTING_SLOW_SECS:
+            return config_app.QUEUE_EXECUTION_SLOW
+        return config_app.QUEUE_EXECUTION
+
     def __format_result(self, execution) -> dict:
         """
         Formats a execution dictionary into a structured format for output.
@@ -121,6 +233,8 @@ class ControllerExecution(ControllerDefault):
                     - alias (str): The alias of the execution.
                 - status (str): The current status of the execution.
                 - message (str): A message associated with the execution.
+                - queue (str): The queue the execution was processed from, None until it is.
+                - queue_wait_secs (str): The secs its task waited in the queue, None until it is processed.
                 - request_date (str): The formatted creation date of the execution.
                 - result (list): A list of dictionaries representing enabled results,
                   each containing:
@@ -129,6 +243,7 @@ class ControllerExecution(ControllerDefault):
                     - unit (str): The unit of the result value.
                     - message (str): A message associated with the result.
                     - status (str): The status of the result.
+                    - statistics (dict | None): The distribution of the repeated measurements, if any.
         """
         r_payload = {
             "algorithm_id": execution["algorithm_id"],
@@ -142,12 +257,15 @@ class ControllerExecution(ControllerDefault):
                      'value': r.get('value'),
                      'unit': r.get('unit'),
                      'message': r.get('message'),
-                     'status': r.get('status')} for r in execution["result"] if r.get('enabled')]
+                     'status': r.get('status'),
+                     'statistics': r.get('statistics')} for r in execution["result"] if r.get('enabled')]
         return {
             "execution_id": execution["execution_id"],
             "payload": r_payload,
             "status": execution["status"],
             "message": execution["message"],
+            "queue": execution.get("queue"),
+            "queue_wait_secs": None if execution.get("queue_wait_secs") is None else str(execution["queue_wait_secs"]),
             "request_date": execution["created_at"].strftime(format_datetime()),
             "result": r_result
         }
@@ -168,6 +286,28 @@ class ControllerExecution(ControllerDefault):
             obj = item
         return obj
 
+    def __get_detail(self, execution_id: str) -> Execution:
+        """
+        Retrieve an instance of the Execution with the specified execution_id, with everything Execution.get reads
+        loaded along: its algorithm and the algorithm inputs, its payload and their inputs, its results and their
+        criteria. It takes four queries, however large the payload and the results.
+
+        Args:
+            execution_id (str): The unique identifier of the execution to retrieve.
+
+        Returns:
+            Execution: The Execution instance with the specified execution_id if found and enabled, otherwise None.
+        """
+        query = self._orm.session.query(Execution).filter_by(execution_id=execution_id,
+                                                             enabled=True). \
+            options(joinedload(Execution.algorithm).selectinload(Algorithm.input),
+                    selectinload(Execution.payload).joinedload(Payload.input_ref),
+                    selectinload(Execution.result).joinedload(Result.criteria))
+        obj = None
+        for item in query:
+            obj = item
+        return obj
+
     def __get_options_search(self, params: dict) -> LegacyCursorResult:
         """
         Retrieves a list of executions based on the provided search criteria.
@@ -177,23 +317,34 @@ class ControllerExecution(ControllerDefault):
                 Expected keys include:
                     - "amount" (int, optional): The number of records to retrieve. Defaults to 0.
                     - "page" (int, optional): The page number for pagination. Defaults to 0.
+                    - "cursor" (str, optional): The next_cursor of the previous page, the page is then the
+                      executions after it instead of the one given by "page".
                     - Additional keys for filtering are passed to `__add_multiple_filters`.
 
         Returns:
             sqlalchemy.engine.ResultProxy: The result of the executed query, containing the requested
-            execution options and a count of total records.
+            execution options, in the (created_at DESC, execution_id DESC) order, and a count of total records
+            last. One execution more than "amount" is read, to tell whether a page follows.
+
+        Raises:
+            ParamInvalid: If the cursor is not an execution.
 
         Notes:
             - The query retrieves execution details, including algorithm, input, payload, criteria,
               and result information.
             - Filters are applied to ensure only enabled records are included.
-            - Pagination is implemented using the "amount" and "page" parameters.
+            - Pagination is implemented using the "amount" and "page" parameters, or "amount" and "cursor".
+              A cursor is an execution, looked up first, the page is the executions that follow it in the
+              (created_at DESC, execution_id DESC) order, read from idx_execution_created_at_id: a row value
+              comparison seeks to it instead of skipping the rows of the previous pages, so every page costs
+              the same as the first one.
             - The query uses a Common Table Expression (CTE) for modularity and includes a union
               to combine the data query with a count query.
         """
         amount = params.get("amount", 0)
         page = params.get("page", 0)
-        data_query = select(func.row_number().over(order_by=Execution.execution_id).label('id'),
+        cursor = params.get("cursor")
+        data_query = select(null().cast(Integer).label('id'),
                             Execution.execution_id, Execution.algorithm_id, Algorithm.name.label("algorithm_name"),
                             Execution.alias, Execution.status, Execution.message, Execution.created_at
                             ). \
@@ -201,7 +352,17 @@ class ControllerExecution(ControllerDefault):
             filter(Execution.enabled.is_(True), Algorithm.enabled.is_(True))
         data_query = self.__add_multiple_filters(params, data_query)
         data_query = data_query.order_by(Execution.created_at.desc(), Execution.execution_id.desc())
-        data_query = data_query.limit(amount).offset(page * amount)
+        if cursor is not None:
+            after = self._orm.session.query(Execution.created_at, Execution.execution_id). \
+                filter_by(execution_id=cursor).first()
+            if after is None:
+                raise ParamInvalid(f"Cursor invalid: {cursor}")
+            position = tuple_(literal(after.created_at, Execution.created_at.type),
+                              literal(after.execution_id, Execution.execution_id.type))
+            data_query = data_query.filter(tuple_(Execution.created_at, Execution.execution_id) < position)
+            data_query = data_query.limit(amount + 1)
+        else:
+            data_query = data_query.limit(amount + 1).offset(page * amount)
         data_query = data_query.cte("data_query")
         count_query = select(func.count(func.distinct(Execution.execution_id)).label("total_executions")). \
             join(Algorithm, Execution.algorithm_id == Algorithm.algorithm_id). \
@@ -216,12 +377,14 @@ class ControllerExecution(ControllerDefault):
                        null().cast(String).label("message"), null().cast(DateTime).label("created_at"),
                        null().cast(String).label("criteria_name"), null().cast(String).label("value"),
                        null().cast(String).label("unit"), null().cast(String).label("result_message"),
-                       null().cast(String).label("result_status")).limit(1).cte("count")
+                       null().cast(String).label("result_status"),
+                       null().cast(JSONB).label("result_statistics")).limit(1).cte("count")
         smt = select(data_query.c.id, data_query.c.execution_id, data_query.c.algorithm_id,
                      data_query.c.algorithm_name, Payload.input_id, Input.name.label("input_name"),
                      Payload.input_value, data_query.c.alias, data_query.c.status, data_query.c.message,
                      data_query.c.created_at, Criteria.name.label("criteria_name"), Result.value,
-                     Result.unit, Result.message.label("result_message"), Result.status.label("result_status")
+                     Result.unit, Result.message.label("result_message"), Result.status.label("result_status"),
+                     Result.statistics.label("result_statistics")
                      ). \
             join(Payload, data_query.c.execution_id == Payload.execution_id, isouter=True). \
             join(Input, Payload.input_id == Input.input_id, isouter=True). \
@@ -236,12 +399,69 @@ class ControllerExecution(ControllerDefault):
                              count.c.algorithm_name, count.c.input_id, count.c.input_name,
                              count.c.input_value, count.c.alias, count.c.status, count.c.message,
                              count.c.created_at, count.c.criteria_name, count.c.value,
-                             count.c.unit, count.c.result_message, count.c.result_status))
+                             count.c.unit, count.c.result_message, count.c.result_status,
+                             count.c.result_statistics)). \
+            subquery("rows")
+        smt = select(smt).order_by(smt.c.created_at.desc().nulls_last(), smt.c.execution_id.desc().nulls_last())
         return self._orm.execute_query(smt)
 
+    def __new_execution(self, params: dict, inputs: list[Input]) -> Execution:
+        """
+        Adds an execution and its payload to the session, the execution is set to error when the payload is invalid.
+        Nothing is committed: the caller commits the executions it creates at once.
+        """
+        execution = Execution()
+        execution.add(params)
+        self._orm.session.add(execution)
+        if self.__controller_payload.add(params, execution, inputs) is False:
+            execution.set_status_to_error("Invalid payload")
+        return execution
+
+    def __prepare_params(self, params: dict):
+        algorithm = self.__controller_algorithm.get_instance(params["algorithm_id"])
+        alias = f"Execution_{datetime.now(config_app.TIMEZONE_VAN).strftime(format_datetime())}"
+        alias = format_to_alphanumeric(params.get('alias', alias))
+        params.update({
+            "alias": alias,
+            "algorithm": algorithm,
+        })
+
+    @staticmethod
+    def __sweep_points(sweep) -> list[int]:
+        """
+        Expands a sweep into its input values.
+
+        Args:
+            sweep (dict | list): Either {"start": int, "stop": int, "step": int} where stop is included
+                                 and step defaults to 1, or a list of integers.
+
+        Returns:
+            list[int]: The input values, one execution is created for each.
+
+        Raises:
+            ParamInvalid: If the sweep is malformed or has more than SWEEP_MAX_POINTS values.
+        """
+        try:
+            if isinstance(sweep, dict):
+                start, stop, step = int(sweep["start"]), int(sweep["stop"]), int(sweep.get("step", 1))
+                if step <= 0 or stop < start:
+                    raise ValueError
+                points = range(start, stop + 1, step)
+            elif isinstance(sweep, list) and sweep:
+                points = [int(v) for v in sweep]
+            else:
+                raise ValueError
+        except (KeyError, TypeError, ValueError):
+            raise ParamInvalid(f'Sweep invalid: {sweep}')
+        if len(points) > config_app.SWEEP_MAX_POINTS:
+            raise ParamInvalid(f'Sweep has more than {config_app.SWEEP_MAX_POINTS} points')
+        return list(points)
+
     def add(self, params: dict) -> str:
         """
-        Adds a new execution with the given parameters.
+        Adds a new execution with the given parameters, and sets params["queue"] to the queue its
+        estimated cost routes it to (see __queue). The inputs of the algorithm are read once, for the
+        estimate and the payload, and the execution and its payload are inserted in one transaction, on one session.
 
         Args:
             params (dict): A dictionary containing the parameters for the execution.
@@ -252,27 +472,128 @@ class ControllerExecution(ControllerDefault):
 
         Raises:
             KeyError: If "algorithm_id" is not present in params.
+            LimitExceeded: If the estimated cost of the execution exceeds the admission budget.
             Exception: If there is an error during the execution creation process.
         """
-        algorithm = self.__controller_algorithm.get_instance(params["algorithm_id"])
-        alias = f"Execution_{datetime.now(config_app.TIMEZONE_VAN).strftime(format_datetime())}"
-        alias = format_to_alphanumeric(params.get('alias', alias))
-        params.update({
-            "alias": alias,
-            "algorithm": algorithm,
-        })
-        execution = Execution()
-        execution.add(params)
-        if self.__controller_payload.add(params, execution) is False:
-            execution.set_status_to_error("Invalid payload")
-        self._orm.object_commit(execution)
-        execution_id = str(execution.execution_id)
-        self._orm_disconnect()
+        with self._orm.single_session():
+            self.__prepare_params(params)
+            instances = self.__controller_input.get_instances_by_algorithm_id(params["algorithm_id"])
+            costs = self.__costs(params, [i.get() for i in instances], params.get("input") or [])
+            if (reason := self.__over_budget(params, costs)) is not None:
+                raise LimitExceeded(reason)
+            params["queue"] = self.__queue([costs])
+            execution_id = str(self.__new_execution(params, instances).execution_id)
+            self._orm.commit()
         return execution_id
 
+    def add_sweep(self, params: dict) -> list[str]:
+        """
+        Adds one execution per value of a swept integer input, all with the same alias.
+
+        Exactly one item of params["input"] has a "sweep" key instead of "value" (see __sweep_points).
+        Each point is a regular execution with its own payload, so results and reports treat them
+        like executions requested one by one. Points whose estimated cost exceeds the admission budget are
+        left out and reported in params["rejected"] ({"values", "message"}). The sweep runs in one task,
+        params["queue"] is set to the queue the estimated cost of all its points routes it to.
+
+        Args:
+            params (dict): A dictionary containing the parameters for the executions.
+                           Expected keys include "algorithm_id", "input" and optionally "alias".
+
+        Returns:
+            list[str]: The IDs of the new executions, in the order of the sweep.
+
+        Raises:
+            ParamInvalid: If not exactly one input is swept, it is not an integer input or the sweep is malformed.
+            LimitExceeded: If the estimated cost of every point exceeds the admission budget.
+        """
+        swept = [i for i in params["input"] if "sweep" in i]
+        if len(swept) != 1:
+            raise ParamInvalid('Exactly one input must have a sweep')
+        swept = swept[0]
+        points = self.__sweep_points(swept["sweep"])
+        with self._orm.single_session():
+            instances = self.__controller_input.get_instances_by_algorithm_id(params["algorithm_id"])
+            inputs = [i.get() for i in instances]
+            input_type = next((i['input_type'] for i in inputs if i['input_id'] == format_uuid(swept.get('id'))), None)
+            if input_type not in ('int', 'integer'):
+                raise ParamInvalid(f'Sweep input must be an integer input: {swept.get("id")}')
+            self.__prepare_params(params)
+            admitted, runs, rejected = [], [], {}
+            for value in points:
+                point = dict(params)
+                point["input"] = [{"id": i.get("id"), "value": str(value)} if i is swept else i
+                                  for i in params["input"]]
+                costs = self.__costs(point, inputs, point["input"])
+                if (reason := self.__over_budget(point, costs)) is not None:
+                    rejected[value] = reason
+                    continue
+                admitted.append(point)
+                runs.append(costs)
+            if not admitted:
+                raise LimitExceeded(next(iter(rejected.values())))
+            if rejected:
+                params["rejected"] = {"values": list(rejected), "message": next(iter(rejected.values()))}
+            params["queue"] = self.__queue(runs)
+            execution_ids = [str(self.__new_execution(point, instances).execution_id) for point in admitted]
+            self._orm.commit()
+        return execution_ids
+
     def db_disconnect(self):
         self._orm_disconnect()
 
+    def estimate(self, params: dict) -> str:
+        """
+        Estimates the result values of an execution before it is requested, from the done results of the
+        algorithm for other input values (see EstimateModel). The models are refreshed apart, by the server,
+        the estimate does not query the database.
+
+        Args:
+            params (dict): A dictionary with "algorithm_id" and "input", a list of {"id", "value"} as in add.
+                           Integer values are estimated, the other inputs are ignored.
+
+        Returns:
+            str: JSON-encoded string containing:
+                - algorithm_id (str): The algorithm estimated.
+                - estimates (list[dict]): One item per input and criteria with a model, with input_id,
+                  input_value, criteria_id, criteria, unit, complexity, points (the input values fitted),
+                  value and the 95% prediction interval lower and upper. Empty without enough history.
+        """
+        model = EstimateModel()
+        estimates = []
+        for i in params["input"]:
+            try:
+                value = int(str(i.get("value")).strip())
+            except ValueError:
+                continue
+            for e in model.estimate(params["algorithm_id"], i.get("id"), value):
+                e.update({k: str(e[k]) for k in ("value", "lower", "upper")})
+                estimates.append({"input_id": i.get("id"), "input_value": value, **e})
+        result = {"algorithm_id": params["algorithm_id"],
+                  "estimates": estimates}
+        return json.dumps(result_json(result))
+
+    def finish_fanout(self, params: dict):
+        """
+        Sets the status of a fanned out execution from the statuses of its results, once all its criteria
+        were processed (see prepare_fanout).
+
+        The status is derived as in run (see Execution.set_status_from_results): a result left unprocessed
+        (e.g. the setup of its subtask failed) is in error. A subtask that dies fails the chord instead, see
+        fail_execution.
+
+        Args:
+            params (dict): A dictionary containing the following keys:
+                - execution_id: The ID of the execution to update.
+        """
+        execution_id = params.get("execution_id")
+        statuses = self.__controller_result.get_statuses_by_execution_id(execution_id)
+        execution = self.__get_instance(execution_id)
+        validate_object(execution_id, execution)
+        execution.set_status_from_results(statuses)
+        self._orm.object_commit(execution)
+        CpuLock.discard(execution_id)
+
     def get(self, p_id) -> dict:
         """
         Retrieve and format a execution based on the provided ID.
@@ -288,7 +609,7 @@ class ControllerExecution(ControllerDefault):
                   }
         """
         execution = []
-        if (obj := self.__get_instance(p_id)):
+        if (obj := self.__get_detail(p_id)):
             execution.append(self.__format_result(obj.get()))
         result = {'executions': execution}
         self._orm_disconnect()
@@ -302,6 +623,7 @@ class ControllerExecution(ControllerDefault):
             kwargs (dict): A dictionary of search parameters which may include:
                 - "amount" (int): The number of items to return per page (default is 20).
                 - "page" (int): The page number to return (default is 0).
+                - "cursor" (str): The next_cursor of the previous page, returns the page after it instead of "page".
                 - "execution_id": Filters by execution ID(s).
                 - "algorithm_id": Filters by algorithm ID(s).
                 - "alias": Filters by execution alias using a case-insensitive partial match.
@@ -309,7 +631,11 @@ class ControllerExecution(ControllerDefault):
                 - "request_date": Filters by execution creation date (start and end of the day).
 
         Returns:
-            str: A JSON string containing the total number of items and a list of executions with their details.
+            str: A JSON string containing the total number of items, a list of executions with their details and
+                 the next_cursor to get the page after this one, null on the last page.
+
+        Raises:
+            ParamInvalid: If the cursor is not an execution.
         """
         query = self.__get_options_search(kwargs)
         list_execution = []
@@ -324,6 +650,7 @@ class ControllerExecution(ControllerDefault):
                 "unit": execution[13],
                 "message": execution[14],
                 "status": execution[15],
+                "statistics": execution[16],
             }
             if previous_execution_id == execution[1]:
                 list_execution[-1]["result"].append(execution_result)
@@ -347,11 +674,64 @@ class ControllerExecution(ControllerDefault):
                 "request_date": str(execution[10]),
                 "result": [execution_result]
                 }),
+        next_cursor = None
+        if len(list_execution) > (amount := kwargs.get("amount", 0)):
+            list_execution = list_execution[:amount]
+            next_cursor = list_execution[-1]["execution_id"] if list_execution else None
         result = {"total_items": total_items,
-                  "executions": list_execution}
+                  "executions": list_execution,
+                  "next_cursor": next_cursor}
         self._orm_disconnect()
         return json.dumps(result_json(result))
 
+    def prepare_fanout(self, params: dict) -> list[dict]:
+        """
+        Prepares an execution to have its criteria processed as parallel subtasks (see EXECUTION_FANOUT).
+
+        Sets the execution to "progressing", sets the code up once and stores the inputs it generated, so the
+        subtasks set the code up from the same inputs and read the generated graph from the graph cache, and
+        adds the result of every criterion.
+
+        Args:
+            params (dict): A dictionary containing the parameters for processing the algorithm.
+                Expected keys:
+                    - "execution_id": The ID of the execution to be processed.
+                    - "queue", "queue_wait_secs": The queue of the task and the secs it waited in it, if known.
+
+        Returns:
+            list[dict]: One item per group of criteria that can be processed apart (see MeasurementSession.groups),
+                        with keys 'probe' and 'results', the result_id and criteria_name of each criterion.
+        """
+        execution_id = params.get("execution_id")
+        execution = self.__get_instance(execution_id)
+        validate_object(execution_id, execution)
+        execution.set_status_to_progressing()
+        execution.set_queue_wait(params.get("queue"), params.get("queue_wait_secs"))
+        self._orm.object_commit(execution)
+        execution_data = execution.get()
+        algorithm = execution_data['algorithm']
+        payload = execution_data['payload']
+        code = Codes.get_instance(algorithm['name'])
+        try:
+            code.setup(payload)
+            self.__controller_payload.add_generated_inputs(execution, payload)
+        finally:
+            payload.clear()
+        criteria = self.__controller_criteria.get_criteria_by_algorithm_id(algorithm['algorithm_id'])
+        criteria = [(c, Evaluation.get_instance(c['criteria_name'])) for c in criteria]
+        groups = MeasurementSession.groups(criteria, key=lambda c: c[1])
+        result_ids = iter(self.__controller_result.add_results(execution_id, [c['criteria_id']
+                                                                              for group in groups for c, _ in group]))
+        return [{"probe": group[0][1].probe,
+                 "results": [{"result_id": next(result_ids), "criteria_name": c['criteria_name']} for c, _ in group]}
+                for group in groups]
+
+    def refresh_estimates(self):
+        """
+        Refits the estimate models to the done results, with one aggregation query.
+        """
+        EstimateModel().refresh(self.__controller_result.estimate_series())
+
     def run(self, params: dict):
         """
         Run an algorithm based on the provided parameters.
@@ -360,6 +740,7 @@ class ControllerExecution(ControllerDefault):
             params (dict): A dictionary containing the parameters for processing the algorithm.
                 Expected keys:
                     - "execution_id": The ID of the execution to be processed.
+                    - "queue", "queue_wait_secs": The queue of the task and the secs it waited in it, if known.
 
         Raises:
             ValueError: If the execution_id is not found or the execution is invalid.
@@ -367,42 +748,121 @@ class ControllerExecution(ControllerDefault):
         Workflow:
             01. Retrieves the execution instance using the execution_id.
             02. Validates the execution object.
-            03. Sets the execution status to "progressing".
+            03. Sets the execution status to "progressing" and records the queue wait of its task.
             04. Commits the execution object to the ORM.
             05. Retrieves the execution data and associates it with the execution.
             06. Retrieves the algorithm and payload from the execution data.
             07. Gets the code instance for the algorithm.
-            08. Setups the code instance for running.
-            09. Fetches the criteria associated with the algorithm.
-            10. Processes each criterion:
+            08. Setups the code instance for running and stores the inputs it generated (e.g. seed).
+            09. Fetches the criteria associated with the algorithm and orders them by probe, so that the
+                criteria sharing a measurement are processed together, and the criteria that do not run the code
+                are evaluated first, concurrently in the criteria pool (see MeasurementSession).
+            10. Adds the results of all the criteria in one statement and sets them to "progressing" in another.
+            11. Processes each criterion:
                 - Logs the processing of the criterion.
-                - Retrieves the criterion instance.
-                - Adds the execution data to the result controller and gets the result ID.
-                - Processes the evaluation for the criterion.
-            11. Sets the execution status to "DONE".
-            12. Commits the execution object to the ORM.
+                - Processes the evaluation for the criterion, measuring the code once per probe, in a sandbox
+                  with the code's time and memory limits if enabled.
+                The results are written together once the criteria of a measurement are processed (see ResultBatch).
+                Then releases the payload, generated inputs included.
+            12. Sets the execution status from the statuses of the results: "DONE", or "WARNING" or "ERROR"
+                when a result went over a limit or failed (see Execution.set_status_from_results).
+            13. Commits the execution object to the ORM.
         """
         execution_id = params.get("execution_id")
         execution = self.__get_instance(execution_id)
         validate_object(execution_id, execution)
         execution.set_status_to_progressing()
+        execution.set_queue_wait(params.get("queue"), params.get("queue_wait_secs"))
         self._orm.object_commit(execution)
         execution_data = execution.get()
-        execution_data['execution'] = execution
         algorithm = execution_data['algorithm']
         payload = execution_data['payload']
         code = Codes.get_instance(algorithm['name'])
         code.setup(payload)
+        self.__controller_payload.add_generated_inputs(execution, payload)
         criteria = self.__controller_criteria.get_criteria_by_algorithm_id(algorithm['algorithm_id'])
-        for c in criteria:
-            log.info(f"processing criteria of {c['criteria_name']}")
-            execution_data['criteria'] = self.__controller_criteria.get_instance(c['criteria_id'])
-            result_id = self.__controller_result.add(execution_data)
-            evaluation = Evaluation.get_instance(c['criteria_name'])
-            evaluation.process(code, payload, result_id)
-        execution.set_status_to_done()
+        criteria = [(c, Evaluation.get_instance(c['criteria_name'])) for c in criteria]
+        session = MeasurementSession(Sandbox.for_code(code))
+        session.concurrent([evaluation for _, evaluation in criteria])
+        criteria = session.schedule(criteria, key=lambda c: c[1])
+        result_ids = self.__controller_result.add_results(execution_id, [c['criteria_id'] for c, _ in criteria])
+        results = ResultBatch(result_ids)
+        results.start()
+        try:
+            probe = None
+            for (c, evaluation), result_id in zip(criteria, result_ids):
+                if evaluation.probe != probe:
+                    results.flush()  # Writes the results of the previous measurement
+                    probe = evaluation.probe
+                log.info(f"processing criteria of {c['criteria_name']}")
+                evaluation.process(code, payload, result_id, session, results)
+        finally:
+            payload.clear()  # Releases the generated inputs (e.g. the graph) before the next task
+            results.flush()
+        execution.set_status_from_results(results.statuses)
         self._orm.object_commit(execution)
 
+    def run_criteria(self, params: dict):
+        """
+        Processes a group of criteria of an execution prepared by prepare_fanout.
+
+        The code is set up from the execution payload, generated inputs included, so it runs on the same input
+        as the other groups. A setup that fails sets the results of the group to error.
+
+        Args:
+            params (dict): A dictionary containing the following keys:
+                - execution_id: The ID of the execution.
+                - results (list[dict]): The result_id and criteria_name of each criterion of the group.
+        """
+        execution_id = params.get("execution_id")
+        execution = self.__get_instance(execution_id)
+        validate_object(execution_id, execution)
+        execution_data = execution.get()
+        payload = execution_data['payload']
+        code = Codes.get_instance(execution_data['algorithm']['name'])
+        results = ResultBatch([result['result_id'] for result in params.get("results", [])])
+        try:
+            try:
+                code.setup(payload)
+            except Exception as error:
+                log.exception(f"setup of {code.name} failed: {error}")
+                for result in params.get("results", []):
+                    results.set_error_result({"result_id": result['result_id'], "error": str(error)})
+                return
+            results.start()
+            session = MeasurementSession(Sandbox.for_code(code), lock=execution_id)
+            for result in params.get("results", []):
+                log.info(f"processing criteria of {result['criteria_name']}")
+                evaluation = Evaluation.get_instance(result['criteria_name'])
+                evaluation.process(code, payload, result['result_id'], session, results)
+        finally:
+            payload.clear()
+            results.flush()
+
+    def run_sweep(self, params: dict):
+        """
+        Runs the executions of a sweep one after the other, in one DB session.
+
+        An execution that fails is set to error and the sweep goes on with the next one. The session is rolled
+        back first, as a failed statement leaves its transaction aborted and nothing else could be written.
+
+        Args:
+            params (dict): A dictionary containing the parameters for processing the sweep.
+                Expected keys:
+                    - "execution_ids": The IDs of the executions to be processed, in order.
+                    - "queue", "queue_wait_secs": The queue of the task and the secs it waited in it, recorded
+                      on every execution of the sweep.
+        """
+        with self._orm.single_session():
+            for execution_id in params.get("execution_ids", []):
+                try:
+                    self.run({"execution_id": execution_id, "queue": params.get("queue"),
+                              "queue_wait_secs": params.get("queue_wait_secs")})
+                except Exception as error:
+                    log.exception(f"sweep execution {execution_id} failed: {error}")
+                    self._orm.session.rollback()
+                    self.set_error_execution({"execution_id": execution_id, "error": str(error)})
+
     def set_enabled_to_false(self, p_id):
         """
         Disables the execution instance associated with the given primary ID.
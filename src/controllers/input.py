@@ -13,7 +13,7 @@ class ControllerInput(ControllerDefault):
         Query inputs by algorithm ID.
 
         This method queries the database for inputs associated with a given algorithm ID
-        that are enabled. It returns the input ID, input type, name, and description.
+        that are enabled. It returns the input ID, input type, name, description and whether it is required.
 
         Args:
             algorithm_id (str): The ID of the algorithm to query inputs for.
@@ -25,6 +25,7 @@ class ControllerInput(ControllerDefault):
                                        Input.input_type,
                                        Input.name,
                                        Input.description,
+                                       Input.required,
                                        ).filter(Input.algorithm_id == algorithm_id,
                                                 Input.enabled.is_(True))
 
@@ -41,6 +42,7 @@ class ControllerInput(ControllerDefault):
             - input_type (str): The type of the input.
             - name (str): The name of the input.
             - description (str): The description of the input.
+            - required (bool): Whether the input must be sent in the payload.
         """
         query = self.__query_input_by_algorithm_id(algorithm_id)
         items = []
@@ -49,6 +51,7 @@ class ControllerInput(ControllerDefault):
                           "input_type": i[1],
                           "name": i[2],
                           "description": i[3],
+                          "required": i[4],
                           })
         self._orm.remove_session()
         return items
@@ -70,3 +73,18 @@ class ControllerInput(ControllerDefault):
             result = item
         self._orm_disconnect()
         return result
+
+    def get_instances_by_algorithm_id(self, algorithm_id: str) -> list[Input]:
+        """
+        Retrieve the enabled instances of Input of an algorithm, in one query.
+
+        Args:
+            algorithm_id (str): The ID of the algorithm for which to retrieve the inputs.
+
+        Returns:
+            list[Input]: The instances of Input of the algorithm.
+        """
+        items = self._orm.session.query(Input).filter(Input.algorithm_id == algorithm_id,
+                                                      Input.enabled.is_(True)).all()
+        self._orm_disconnect()
+        return items
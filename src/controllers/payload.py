@@ -20,20 +20,21 @@ class ControllerPayload(ControllerDefault):
         Validates the payload against the required inputs and their types.
 
         Args:
-            inputs (list): A list of dictionaries where each dictionary contains 'input_id' and 'input_type'.
+            inputs (list): A list of dictionaries where each dictionary contains 'input_id', 'input_type'
+                           and optionally 'required' (defaults to True).
             payload (list): A list of dictionaries where each dictionary contains 'id' and 'value'.
 
         Returns:
             bool: True if the payload is valid, False otherwise.
 
         Raises:
-            ValueError: If the payload contains invalid or missing inputs.
+            ValueError: If the payload contains invalid or missing required inputs.
         """
-        required_inputs = {i['input_id']: False for i in inputs}
+        required_inputs = {i['input_id']: False for i in inputs if i.get('required', True)}
         type_inputs = {i['input_id']: i['input_type'] for i in inputs}
         try:
             for p in payload:
-                if p.get('id') not in required_inputs:
+                if p.get('id') not in type_inputs:
                     continue
                 p_value = p.get('value', '')
                 match type_inputs.get(p.get('id')):
@@ -46,7 +47,8 @@ class ControllerPayload(ControllerDefault):
                         int(p_value.strip())
                     case _:
                         continue
-                required_inputs[p['id']] = True
+                if p['id'] in required_inputs:
+                    required_inputs[p['id']] = True
             if any(value is False for value in required_inputs.values()):
                 raise ValueError("Payload validation failed due to missing inputs.")
             return True
@@ -61,32 +63,69 @@ class ControllerPayload(ControllerDefault):
                                        .filter(Payload.execution_id == execution_id,
                                                Payload.enabled.is_(True))
 
-    def add(self, params: dict, execution: Execution) -> bool:
+    def add(self, params: dict, execution: Execution, inputs: list[Input] = None) -> bool:
         """
         Adds a payload to the execution if the input parameters are valid.
 
+        The inputs of the algorithm are fetched in one query, unless the caller already read them, and the payload
+        rows are added to the session of the execution without committing: the caller commits them with the
+        execution, in one transaction.
+
         Args:
             params (dict): A dictionary containing the parameters for the payload.
                            Expected keys are "algorithm_id" and "input".
             execution (Execution): The execution object to which the payload will be added.
+            inputs (list[Input]): The enabled inputs of the algorithm, fetched if None.
 
         Returns:
             bool: True if the payload is valid and added successfully, False otherwise.
         """
         is_valid = False
         if (algorithm_id := params.get("algorithm_id")):
-            inputs = self.__controller_input.get_input_by_algorithm_id(algorithm_id)
+            if inputs is None:
+                inputs = self.__controller_input.get_instances_by_algorithm_id(algorithm_id)
+            instances = {str(i.input_id): i for i in inputs}
+            inputs = [i.get() for i in instances.values()]
             if (is_valid := self.__is_payload_valid(inputs, params.get("input"))):
+                payloads = []
                 for i in params.get("input"):
-                    p = {'input_value': i.get('value'),
-                         'execution': execution,
-                         'input': self.__controller_input.get_instance(i.get('id')),
-                         }
                     payload = Payload()
-                    payload.add(p)
-                    self._orm.object_commit(payload)
+                    payload.add({'input_value': i.get('value'),
+                                 'execution': execution,
+                                 'input': instances.get(str(i.get('id')).lower()),
+                                 })
+                    payloads.append(payload)
+                self._orm.session.add_all(payloads)
         return is_valid
 
+    def add_generated_inputs(self, execution: Execution, payload: list):
+        """
+        Stores the payload items generated by a code setup that match an input of the algorithm.
+
+        A setup may draw a value for an optional input that was not sent (e.g. the seed of a random
+        graph). Storing it with the execution makes the run reproducible.
+
+        Args:
+            execution (Execution): The execution the payload belongs to.
+            payload (list): The payload after code.setup(). Items without 'payload_id' were generated.
+        """
+        inputs = {i.name: i for i in execution.algorithm.input if i.enabled}
+        payloads = []
+        for p in payload:
+            if p.get('payload_id') is not None or (input_obj := inputs.get(p['input'].get('name'))) is None:
+                continue
+            payload_obj = Payload()
+            payload_obj.add({'input_value': str(p.get('input_value')),
+                             'execution': execution,
+                             'input': input_obj,
+                             })
+            payloads.append(payload_obj)
+            p.update({'payload_id': str(payload_obj.payload_id)})
+            p['input'].update({'input_id': str(input_obj.input_id)})
+        if payloads:
+            self._orm.session.add_all(payloads)
+            self._orm.commit()
+
     def get_payload_by_execution_id(self, execution_id: str) -> list[dict]:
         """
         Retrieve payload details associated with a specific execution ID.
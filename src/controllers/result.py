@@ -1,11 +1,15 @@
 import json
 import logging
 from datetime import datetime
-from sqlalchemy import String, and_, func, null, select, Integer, Numeric
+from sqlalchemy import String, and_, func, insert, null, select, update, Integer, Numeric
 from sqlalchemy.engine.cursor import LegacyCursorResult
+from sqlalchemy.sql.selectable import CTE
 
 from src.common.functions import format_date, result_json, validate_object
 from src.config import ApplicationConfig
+from src.exceptions import ParamInvalid
+from src.internal_services.app_ulid import AppUlid
+from src.internal_services.complexity_fit import ComplexityFit
 from src.models.tb_algorithm import Algorithm
 from src.models.tb_criteria import Criteria
 from src.models.tb_execution import Execution
@@ -18,6 +22,8 @@ from . import ControllerDefault
 log = logging.getLogger(__file__)
 config_app = ApplicationConfig()
 
+STATISTICS = ("min", "median", "mean", "p95", "stddev")
+
 
 class ControllerResult(ControllerDefault):
 
@@ -86,6 +92,29 @@ class ControllerResult(ControllerDefault):
             result = item
         return result
 
+    def __data_query(self, params: dict) -> CTE:
+        """
+        Selects the done results matching the filters, with the value of the required input of their execution.
+        Only required inputs are selected, optional ones (e.g. a seed) do not describe the input size.
+        """
+        data_query = select(func.row_number().over(order_by=Execution.execution_id).label('id'),
+                            Execution.algorithm_id, Criteria.criteria_id, Criteria.name.label('criteria_name'),
+                            Payload.input_id, func.cast(Payload.input_value, Integer).label('input_value'),
+                            Result.unit, func.cast(Result.value, Numeric).label('value'),
+                            *[func.cast(Result.statistics[k].astext, Numeric).label(k) for k in STATISTICS]
+                            ). \
+            join(Payload, Execution.execution_id == Payload.execution_id). \
+            join(Input, Input.input_id == Payload.input_id). \
+            join(Algorithm, Execution.algorithm_id == Algorithm.algorithm_id). \
+            join(Result, Result.execution_id == Execution.execution_id). \
+            join(Criteria, Criteria.criteria_id == Result.criteria_id). \
+            filter(Execution.enabled.is_(True), Algorithm.enabled.is_(True), Input.required.is_(True),
+                   Result.status == config_app.STATUS_DONE)
+        if params:
+            data_query = self.__add_multiple_filters(params, data_query)
+        data_query = data_query.order_by(func.cast(Payload.input_value, Integer).asc())
+        return data_query.cte("data_query")
+
     def __make_report(self, params: dict) -> LegacyCursorResult:
         """
         Generates a paginated report of average result values grouped by input value and unit.
@@ -100,37 +129,50 @@ class ControllerResult(ControllerDefault):
         Returns:
             LegacyCursorResult: The result of the executed query, including paginated average values and a count of total groups.
         The report aggregates results by input value and unit, computes the average for each group, and supports pagination.
+        Results with statistics (e.g. running time) also get the lowest min and the average of the other statistics.
         """
         amount = params.get("amount", 0)
         page = params.get("page", 0)
-        data_query = select(func.row_number().over(order_by=Execution.execution_id).label('id'),
-                            func.cast(Payload.input_value, Integer).label('input_value'),
-                            Result.unit, func.cast(Result.value, Numeric).label('value')
-                            ). \
-            join(Payload, Execution.execution_id == Payload.execution_id). \
-            join(Input, Input.input_id == Payload.input_id). \
-            join(Algorithm, Execution.algorithm_id == Algorithm.algorithm_id). \
-            join(Result, Result.execution_id == Execution.execution_id). \
-            join(Criteria, Criteria.criteria_id == Result.criteria_id). \
-            filter(Execution.enabled.is_(True), Algorithm.enabled.is_(True),
-                   Result.status == config_app.STATUS_DONE)
-        data_query = self.__add_multiple_filters(params, data_query)
-        data_query = data_query.order_by(func.cast(Payload.input_value, Integer).asc())
-        data_query = data_query.cte("data_query")
+        data_query = self.__data_query(params)
         group_query = select(func.row_number().over(order_by=data_query.c.input_value).label('id'),
                              data_query.c.input_value.label('input_value'), data_query.c.unit.label('unit'),
-                             func.avg(data_query.c.value).label('average')). \
+                             func.avg(data_query.c.value).label('average'),
+                             *[(func.min if k == "min" else func.avg)(data_query.c[k]).label(k) for k in STATISTICS]). \
             group_by(data_query.c.input_value, data_query.c.unit). \
             order_by(data_query.c.input_value). \
             limit(amount).offset(page * amount). \
             cte("group_query")
         count = select(func.count(func.distinct(data_query.c.input_value)).label("id"),
                        null().cast(Integer).label("input_value"), null().cast(String).label("unit"),
-                       null().cast(Numeric).label("average"))
+                       null().cast(Numeric).label("average"), *[null().cast(Numeric).label(k) for k in STATISTICS])
         smt = select(group_query.c.id, group_query.c.input_value,
-                     group_query.c.average, group_query.c.unit). \
+                     group_query.c.average, group_query.c.unit, *[group_query.c[k] for k in STATISTICS]). \
             union_all(select(count.c.id, count.c.input_value,
-                             count.c.average, count.c.unit))
+                             count.c.average, count.c.unit, *[count.c[k] for k in STATISTICS]))
+        return self._orm.execute_query(smt)
+
+    def __make_series(self, params: dict) -> LegacyCursorResult:
+        """
+        Generates the average result value of every input value, in ascending input value order, without pagination.
+        """
+        data_query = self.__data_query(params)
+        smt = select(data_query.c.input_value, func.avg(data_query.c.value).label('average'), data_query.c.unit). \
+            group_by(data_query.c.input_value, data_query.c.unit). \
+            order_by(data_query.c.input_value)
+        return self._orm.execute_query(smt)
+
+    def __make_estimate_series(self) -> LegacyCursorResult:
+        """
+        Generates the average result value of every input value of every (algorithm, criteria, input), ordered by
+        algorithm, criteria, input and input value.
+        """
+        data_query = self.__data_query({})
+        keys = (data_query.c.algorithm_id, data_query.c.criteria_id, data_query.c.criteria_name,
+                data_query.c.input_id, data_query.c.input_value)
+        smt = select(*keys, func.avg(data_query.c.value).label('average'), data_query.c.unit). \
+            group_by(*keys, data_query.c.unit). \
+            order_by(data_query.c.algorithm_id, data_query.c.criteria_id, data_query.c.input_id,
+                     data_query.c.input_value)
         return self._orm.execute_query(smt)
 
     def add(self, params: dict) -> str:
@@ -141,6 +183,86 @@ class ControllerResult(ControllerDefault):
         self._orm_disconnect()
         return result_id
 
+    def add_results(self, execution_id: str, criteria_ids: list[str]) -> list[str]:
+        """
+        Adds a queued result for each criterion of an execution, in one INSERT statement.
+
+        Args:
+            execution_id (str): The ID of the execution.
+            criteria_ids (list[str]): The IDs of the criteria to evaluate.
+
+        Returns:
+            list[str]: The IDs of the new results, in the order of criteria_ids.
+        """
+        rows = [{"result_id": AppUlid.ulid_to_uuid(),
+                 "execution_id": execution_id,
+                 "criteria_id": criteria_id,
+                 "status": config_app.STATUS_QUEUE,
+                 "enabled": True,
+                 } for criteria_id in criteria_ids]
+        if rows:
+            self._orm.session.execute(insert(Result).values(rows))
+            self._orm.commit()
+        self._orm_disconnect()
+        return [str(row["result_id"]) for row in rows]
+
+    def complexity_report(self, kwargs: dict) -> str:
+        """
+        Fits the complexity classes O(1), O(log n), O(n), O(n log n), O(n^2), O(n^3), O(phi^n) and O(2^n) to the
+        average result value of each input value, e.g. to tell how the running time of an algorithm grows.
+
+        Args:
+            kwargs (dict): Dictionary of search parameters, which may include:
+                - algorithm_id, criteria_id, input_id, alias, request_date: Filters, as in report.
+                - n (int, optional): Input value to predict the result value of.
+
+        Returns:
+            str: JSON-encoded string containing:
+                - unit (str): The unit of the result values.
+                - points (int): The number of input values fitted.
+                - best (dict): The best fitting class, with complexity, coefficients (y = a + b * f(n)) and r2.
+                - models (list[dict]): Every class fitted, best first, then by r2.
+                - prediction (dict | None): The input value n and the value predicted by the best class.
+
+        Raises:
+            ParamInvalid: If there are fewer than 3 input values, or results in more than one unit.
+        """
+        series = [(row[0], row[1], row[2]) for row in self.__make_series(kwargs)]
+        self._orm_disconnect()
+        if len(units := {row[2] for row in series}) > 1:
+            raise ParamInvalid(f"results in more than one unit ({', '.join(sorted(map(str, units)))}), filter by criteria")
+        models = ComplexityFit.fit([row[0] for row in series], [row[1] for row in series])
+        prediction = None
+        if (n := kwargs.get("n")) is not None:
+            prediction = {"n": n, "value": str(ComplexityFit.predict(models[0], n))}
+        result = {"unit": series[0][2],
+                  "points": len(series),
+                  "best": models[0],
+                  "models": models,
+                  "prediction": prediction}
+        return json.dumps(result_json(result))
+
+    def estimate_series(self) -> list[tuple]:
+        """
+        Retrieves the series the estimate models are fitted to.
+
+        Returns:
+            list[tuple]: (algorithm_id, criteria_id, criteria_name, input_id, input_value, average, unit) rows,
+                         ordered by algorithm_id, criteria_id, input_id and input_value.
+        """
+        series = [tuple(row) for row in self.__make_estimate_series()]
+        self._orm_disconnect()
+        return series
+
+    def get_statuses_by_execution_id(self, execution_id: str) -> list[str]:
+        """
+        Retrieves the status of every enabled result of an execution.
+        """
+        query = self._orm.session.query(Result.status).filter_by(execution_id=execution_id, enabled=True)
+        statuses = [item[0] for item in query]
+        self._orm_disconnect()
+        return statuses
+
     def report(self, kwargs: dict) -> str:
         """
         Generates a report of algorithm executions based on provided search criteria.
@@ -162,6 +284,7 @@ class ControllerResult(ControllerDefault):
                     - input_value (str): The input value used in the execution.
                     - average (str): The average result for the input value.
                     - unit (str): The unit of measurement for the result.
+                    - statistics (dict | None): min, median, mean, p95 and stddev for results that have them.
         """
         report_result = []
         query = self.__make_report(kwargs)
@@ -169,10 +292,12 @@ class ControllerResult(ControllerDefault):
             if report[1] is None:
                 total_items = report[0]
                 break
+            stats = dict(zip(STATISTICS, report[4:]))
             report_result.append({
                 "input_value": str(report[1]),
                 "average": str(report[2]),
-                "unit": report[3]
+                "unit": report[3],
+                "statistics": {k: str(v) for k, v in stats.items()} if any(v is not None for v in stats.values()) else None
             })
         result = {"total_items": total_items,
                   "report": report_result}
@@ -204,6 +329,26 @@ class ControllerResult(ControllerDefault):
         self._orm.object_commit(result)
         self._orm_disconnect()
 
+    def set_progress_results(self, result_ids: list[str]):
+        """
+        Sets the status of results to progressing, in one UPDATE statement.
+        """
+        if result_ids:
+            smt = update(Result).where(Result.result_id.in_(result_ids)). \
+                values(status=config_app.STATUS_PROCESSING). \
+                execution_options(synchronize_session=False)
+            self._orm.session.execute(smt)
+            self._orm.commit()
+        self._orm_disconnect()
+
+    def update_results(self, mappings: list[dict]):
+        """
+        Updates results from a list of mappings with their result_id and the columns to set, in one
+        executemany UPDATE per set of columns.
+        """
+        self._orm.bulk_update_mappings(Result, mappings)
+        self._orm_disconnect()
+
     def set_warning_result(self, params: dict):
         result_id = params.get("result_id")
         warning = params.get("warning")
@@ -212,3 +357,63 @@ class ControllerResult(ControllerDefault):
         result.set_status_to_warning(warning)
         self._orm.object_commit(result)
         self._orm_disconnect()
+
+
+class ResultBatch:
+    """
+    Stands in for ControllerResult in BaseEvaluation.process to record the outcome of the results of an
+    execution, and writes them at once with flush instead of committing each state of each result.
+
+    The results are set to progressing together by start, the outcomes are kept in memory until flush.
+    """
+
+    def __init__(self, result_ids: list[str]):
+        self.__result_ids = list(result_ids)
+        self.__pending = {}
+        self.__statuses = {}
+
+    @property
+    def __controller_result(self):
+        return ControllerResult()
+
+    def __record(self, result_id: str, result: Result, columns: tuple):
+        self.__pending[result_id] = {"result_id": result_id, **{c: getattr(result, c) for c in columns}}
+        self.__statuses[result_id] = result.status
+
+    @property
+    def statuses(self) -> list[str]:
+        """
+        The status of every result recorded, flushed or not, a result without outcome is still progressing.
+        """
+        return [self.__statuses.get(result_id, config_app.STATUS_PROCESSING) for result_id in self.__result_ids]
+
+    def start(self):
+        self.__controller_result.set_progress_results(self.__result_ids)
+
+    def set_progress_result(self, params: dict):
+        """
+        Does nothing, the results were set to progressing by start.
+        """
+
+    def set_done_result(self, params: dict):
+        result = Result()
+        result.set_status_to_done(params)
+        self.__record(params.get("result_id"), result, ("status", "value", "unit", "message", "statistics"))
+
+    def set_warning_result(self, params: dict):
+        result = Result()
+        result.set_status_to_warning(params.get("warning"))
+        self.__record(params.get("result_id"), result, ("status", "message"))
+
+    def set_error_result(self, params: dict):
+        result = Result()
+        result.set_status_to_error(params.get("error"))
+        self.__record(params.get("result_id"), result, ("status", "message"))
+
+    def flush(self):
+        """
+        Writes the outcomes recorded since the last flush.
+        """
+        if self.__pending:
+            self.__controller_result.update_results(list(self.__pending.values()))
+            self.__pending = {}
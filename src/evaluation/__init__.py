@@ -1,17 +1,26 @@
 import logging
 
 from .base import BaseEvaluation
+from .connected_components import ConnectedComponents
 from .count_edges import CountEdges
 from .count_nodes import CountNodes
+from .cpu_time import CpuTime
+from .degree import Degree
+from .density import Density
 from .detect_cycle import DetectCycle
 from .memory_consume import MemoryConsume
+from .peak_memory import PeakMemory
 from .running_time import RunningTime
+from .weight_histogram import WeightHistogram
+from .sandbox import Sandbox
+from .session import MeasurementSession
 
 
 log = logging.getLogger(__file__)
 
 
-__all__ = ["CountEdges", "CountNodes", "DetectCycle", "MemoryConsume", "RunningTime"]
+__all__ = ["ConnectedComponents", "CountEdges", "CountNodes", "CpuTime", "Degree", "Density", "DetectCycle",
+           "MeasurementSession", "MemoryConsume", "PeakMemory", "RunningTime", "Sandbox", "WeightHistogram"]
 
 
 class Evaluation:
@@ -3,7 +3,10 @@ from abc import abstractmethod
 
 from src.codes.base import BaseCode
 from src.controllers import ControllerDefault
-from src.controllers.result import ControllerResult
+from src.controllers.result import ControllerResult, ResultBatch
+from src.evaluation.sandbox import Sandbox
+from src.evaluation.session import MeasurementSession
+from src.exceptions import LimitExceeded
 
 
 log = logging.getLogger(__file__)
@@ -11,6 +14,8 @@ log = logging.getLogger(__file__)
 
 class BaseEvaluation(ControllerDefault):
     name = 'base'
+    probe = None  # How the criterion runs the code, criteria with the same probe share one measurement
+    runs = 1  # Runs of the code a measurement takes at most, it is given the time limit of that many runs
 
     @property
     def __controller_result(self):
@@ -45,7 +50,8 @@ class BaseEvaluation(ControllerDefault):
             params.update({name: value})
         return params
 
-    def process(self, code: BaseCode, payload: list, result_id: str):
+    def process(self, code: BaseCode, payload: list, result_id: str, session: MeasurementSession = None,
+                results: ResultBatch = None):
         """
         Processes the given code and payload, and updates the result status.
 
@@ -53,6 +59,10 @@ class BaseEvaluation(ControllerDefault):
             code (BaseCode): The code to be evaluated.
             payload (list): The payload containing parameters for running the code.
             result_id (str): The unique identifier for the result.
+            session (MeasurementSession, optional): Shares the measurements between the criteria of an execution,
+                                                    a session sandboxed for the code is used if None.
+            results (ResultBatch, optional): Records the status of the result to write it with the other results of
+                                             the execution, it is committed right away if None.
 
         Raises:
             Exception: If an error occurs during the evaluation process.
@@ -61,25 +71,44 @@ class BaseEvaluation(ControllerDefault):
         1. Initializes the result dictionary with the result_id.
         2. Sets the progress status of the result.
         3. Loads the parameters from the payload.
-        4. Runs the evaluation with the given code and parameters.
-        5. Updates the result dictionary with the evaluation value, unit, and message.
+        4. Runs the evaluation with the given code and parameters through the session, in a sandbox if enabled.
+        5. Updates the result dictionary with the evaluation value, unit, message and statistics, if any.
         6. Sets the done status of the result.
-        7. If an error occurs, logs the error, updates the result dictionary with the error message, and sets the error status.
+        7. If the run exceeds a time or memory limit, sets the warning status with the limit exceeded.
+        8. If an error occurs, logs the error, updates the result dictionary with the error message, and sets the error status.
         """
+        results = results if results is not None else self.__controller_result
         try:
             result = {'result_id': result_id}
-            self.__controller_result.set_progress_result(result)
+            results.set_progress_result(result)
             params = self.__load_payload(payload)
-            evaluation = self.run(code, params)
+            session = session if session is not None else MeasurementSession(Sandbox.for_code(code))
+            evaluation = session.evaluate(self, code, params)
             result.update({'value': evaluation.get('value'),
                            'unit': evaluation.get('unit'),
                            'message': evaluation.get('message'),
+                           'statistics': evaluation.get('statistics'),
                            })
-            self.__controller_result.set_done_result(result)
+            results.set_done_result(result)
+        except LimitExceeded as warning:
+            log.warning(f'Evaluation stopped: {warning}')
+            result.update({'warning': str(warning)})
+            results.set_warning_result(result)
         except Exception as error:
             log.error(f'Error processing evaluation: {error}')
             result.update({'error': str(error)})
-            self.__controller_result.set_error_result(result)
+            results.set_error_result(result)
+
+    def measure(self, code: BaseCode, params: dict, deadline: float = None) -> dict:
+        """
+        Runs the code with the criterion probe and returns the measurement, which report turns into the result.
+        A measurement that runs the code more than once takes no more runs than fit before the deadline
+        (time.monotonic), if any.
+        """
+        return self.run(code, params)
+
+    def report(self, measurement: dict) -> dict:
+        return measurement
 
     @abstractmethod
     def run(self, code: BaseCode, payload: dict) -> dict:
@@ -0,0 +1,25 @@
+import logging
+
+from src.codes.base import BaseCode
+from src.evaluation.base import BaseEvaluation
+from src.evaluation.graph_view import GraphView
+
+log = logging.getLogger(__file__)
+
+
+class ConnectedComponents(BaseEvaluation):
+    name = 'Connected Components'
+
+    def run(self, code: BaseCode, params: dict) -> dict:
+        """
+        Given a graph, counts its connected components, ignoring the direction of the edges.
+
+        Args:
+            code (BaseCode): An instance of a class that inherits from BaseCode, which contains the code to be executed.
+            params (dict): A dictionary of parameters, expected to contain a 'graph' key with the graph data.
+
+        Returns:
+            dict: A dictionary containing the number of components with keys 'value' and 'unit' (set to 'component(s)').
+        """
+        graph = GraphView(params.get('graph', []))
+        return {'value': f'{graph.components()}', 'unit': 'component(s)'}
@@ -2,6 +2,7 @@ import logging
 
 from src.codes.base import BaseCode
 from src.evaluation.base import BaseEvaluation
+from src.evaluation.graph_view import GraphView
 
 log = logging.getLogger(__file__)
 
@@ -25,10 +26,8 @@ class CountEdges(BaseEvaluation):
         result['value'] = f'{self.count_edges(graph)}'
         return result
 
-    def count_edges(self, graph: list) -> int:
-        edge_count = 0
-        for i in range(len(graph)):
-            for j in range(len(graph[i])):
-                if graph[i][j] > 0:
-                    edge_count += 1
-        return edge_count
\ No newline at end of file
+    def count_edges(self, graph) -> int:
+        """
+        Counts the values greater than zero of an adjacency matrix, or the edges of a CSRGraph.
+        """
+        return GraphView(graph).n_edges
@@ -2,6 +2,7 @@ import logging
 
 from src.codes.base import BaseCode
 from src.evaluation.base import BaseEvaluation
+from src.evaluation.graph_view import GraphView
 
 log = logging.getLogger(__file__)
 
@@ -20,6 +21,6 @@ class CountNodes(BaseEvaluation):
         Returns:
             dict: A dictionary containing the number of nodes with keys 'value' and 'unit' (set to 'node(s)').
         """
-        graph = params.get('graph', [])
-        result = {'value': f'{len(graph)}', 'unit': 'node(s)'}
+        graph = GraphView(params.get('graph', []))
+        result = {'value': f'{graph.n_vertices}', 'unit': 'node(s)'}
         return result
@@ -0,0 +1,59 @@
+import fcntl
+import logging
+import os
+
+from src.config import ApplicationConfig
+
+log = logging.getLogger(__file__)
+
+config_app = ApplicationConfig()
+
+
+class CpuLock:
+    """
+    Readers-writer lock on the CPU among the criteria fanned out from one execution, held while they are evaluated.
+
+    Timing criteria take it exclusively, so no other criterion of the same execution runs on the host while they
+    time the code. The other criteria share it and run concurrently with each other. Executions do not lock each
+    other, and an execution processed by a single task does not lock at all (see MeasurementSession), so the
+    workers of the other queues are never held up by a timing run.
+
+    The lock is a flock on a file named after the execution in CPU_LOCK_DIR, which must be on a file system
+    shared by the workers of the host (the graph cache volume by default). An empty CPU_LOCK_DIR disables it.
+    """
+
+    def __init__(self, exclusive: bool, name: str, directory: str = None):
+        self.__exclusive = exclusive
+        self.__path = self.path(name, directory)
+        self.__fd = None
+
+    @staticmethod
+    def path(name: str, directory: str = None) -> str:
+        directory = config_app.CPU_LOCK_DIR if directory is None else directory
+        return os.path.join(directory, f"{name}.lock") if directory else ""
+
+    @classmethod
+    def discard(cls, name: str, directory: str = None):
+        """
+        Removes the lock file of a name once nothing takes the lock anymore, e.g. when its execution is finished.
+        """
+        if (path := cls.path(name, directory)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        if not self.__path:
+            return self
+        os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+        self.__fd = os.open(self.__path, os.O_RDWR | os.O_CREAT, 0o666)
+        fcntl.flock(self.__fd, fcntl.LOCK_EX if self.__exclusive else fcntl.LOCK_SH)
+        return self
+
+    def __exit__(self, *exc):
+        if self.__fd is not None:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+            os.close(self.__fd)
+            self.__fd = None
+        return False
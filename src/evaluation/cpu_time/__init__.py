@@ -0,0 +1,55 @@
+import logging
+
+from src.codes.base import BaseCode
+from src.evaluation.base import BaseEvaluation
+from src.evaluation.running_time import RunningTime
+from src.evaluation.session import PROBE_TIMING
+
+log = logging.getLogger(__file__)
+
+
+class CpuTime(BaseEvaluation):
+    name = 'CPU Time'
+    probe = PROBE_TIMING
+
+    @property
+    def runs(self) -> int:
+        return RunningTime().runs
+
+    def measure(self, code: BaseCode, params: dict, deadline: float = None) -> dict:
+        """
+        Takes the same timed repetitions as Running Time, so both criteria share one measurement in a session.
+        """
+        return RunningTime().measure(code, params, deadline)
+
+    def report(self, measurement: dict) -> dict:
+        """
+        Returns:
+            dict: A dictionary containing the CPU time of the code execution with keys:
+                - 'value': The median CPU time of one call as a string formatted to 9 decimal places.
+                - 'unit': The unit of the CPU time, which is 'secs'.
+                - 'statistics': min, median, mean, p95 and stddev of the CPU time of one call, in secs,
+                                with the number of repetitions and loops per repetition.
+        """
+        stats = RunningTime.distribution(measurement['cpu'])
+        stats.update({'repeat': measurement['repeat'],
+                      'loops': measurement['loops'],
+                      })
+        return {'value': f'{stats["median"]:.9f}',
+                'unit': 'secs',
+                'statistics': stats,
+                }
+
+    def run(self, code: BaseCode, params: dict) -> dict:
+        """
+        Measures the CPU time (time.process_time) of one call of the code. Unlike the running time, it does not
+        count the time the process waits (I/O, sleep, other processes).
+
+        Args:
+            code (BaseCode): An instance of BaseCode that has a run method to be executed.
+            params (dict): A dictionary of parameters to be passed to the code's run method.
+
+        Returns:
+            dict: See report.
+        """
+        return self.report(self.measure(code, params))
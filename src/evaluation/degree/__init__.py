@@ -0,0 +1,29 @@
+import logging
+
+from src.codes.base import BaseCode
+from src.evaluation.base import BaseEvaluation
+from src.evaluation.graph_view import GraphView, describe
+
+log = logging.getLogger(__file__)
+
+
+class Degree(BaseEvaluation):
+    name = 'Degree'
+
+    def run(self, code: BaseCode, params: dict) -> dict:
+        """
+        Given a graph, computes the degree of its nodes, the number of edges leaving each of them.
+
+        Args:
+            code (BaseCode): An instance of a class that inherits from BaseCode, which contains the code to be executed.
+            params (dict): A dictionary of parameters, expected to contain a 'graph' key with the graph data.
+
+        Returns:
+            dict: A dictionary with keys 'value', the mean degree, 'unit' (set to 'edge(s)') and 'statistics', the min,
+                  median, mean, p95, stddev and max degree (None without nodes).
+        """
+        degrees = GraphView(params.get('graph', [])).degrees()
+        if not len(degrees):
+            return {'value': '0', 'unit': 'edge(s)', 'statistics': None}
+        statistics = describe(degrees)
+        return {'value': f"{statistics['mean']:.6g}", 'unit': 'edge(s)', 'statistics': statistics}
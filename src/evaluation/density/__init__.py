@@ -0,0 +1,25 @@
+import logging
+
+from src.codes.base import BaseCode
+from src.evaluation.base import BaseEvaluation
+from src.evaluation.graph_view import GraphView
+
+log = logging.getLogger(__file__)
+
+
+class Density(BaseEvaluation):
+    name = 'Density'
+
+    def run(self, code: BaseCode, params: dict) -> dict:
+        """
+        Given a graph, computes its density, the edges over the n(n - 1) a graph of n nodes can have.
+
+        Args:
+            code (BaseCode): An instance of a class that inherits from BaseCode, which contains the code to be executed.
+            params (dict): A dictionary of parameters, expected to contain a 'graph' key with the graph data.
+
+        Returns:
+            dict: A dictionary with keys 'value', the density from 0 (no edges) to 1 (complete graph), and 'unit' (None).
+        """
+        graph = GraphView(params.get('graph', []))
+        return {'value': f'{graph.density:.6g}', 'unit': None}
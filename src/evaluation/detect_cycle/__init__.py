@@ -1,10 +1,17 @@
 import logging
+from collections import deque
+
+import numpy as np
 
 from src.codes.base import BaseCode
 from src.evaluation.base import BaseEvaluation
+from src.evaluation.graph_view import GraphView
 
 log = logging.getLogger(__file__)
 
+MAX_REPORTED_NODES = 10  # Nodes of the cycle written in the result message, longer cycles are elided
+EDGE_CHUNK = 1 << 16  # Edges converted to Python integers at once by the union-find, a cycle usually closes early
+
 
 class DetectCycle(BaseEvaluation):
     name = 'Detect Cycle'
@@ -18,37 +25,135 @@ class DetectCycle(BaseEvaluation):
             params (dict): A dictionary of parameters, expected to contain a 'graph' key with the graph data.
 
         Returns:
-            dict: A dictionary with the result of the cycle detection. 
+            dict: A dictionary with the result of the cycle detection.
                   'value' will be 'Cycle detected' if a cycle is found, otherwise 'No cycle detected'.
                   'unit' will be None.
+                  'message' will be the first cycle found, if any (e.g. 'cycle of 3 node(s): 0 -> 1 -> 2 -> 0').
         """
         result = {'value': 'No cycle detected', 'unit': None}
-        graph = params.get('graph', [])
-        if self.is_cyclic(graph):
-            result['value'] = 'Cycle detected'
+        cycle = self.find_cycle(GraphView(params.get('graph', [])))
+        if cycle is not None:
+            result.update({'value': 'Cycle detected', 'message': self.__describe(cycle)})
         return result
 
-    def is_cyclic(self, graph):
-        visited = [False] * len(graph)
-        rec_stack = [False] * len(graph)
-
-        for node in range(len(graph)):
-            if not visited[node]:
-                if self.is_cyclic_util(graph, node, visited, rec_stack):
-                    return True
-        return False
-
-    def is_cyclic_util(self, graph, v, visited, rec_stack):
-        visited[v] = True
-        rec_stack[v] = True
-
-        for neighbour in range(len(graph)):
-            if graph[v][neighbour] > 0:
-                if not visited[neighbour]:
-                    if self.is_cyclic_util(graph, neighbour, visited, rec_stack):
-                        return True
-                elif rec_stack[neighbour]:
-                    return True
-
-        rec_stack[v] = False
-        return False
\ No newline at end of file
+    @staticmethod
+    def __describe(cycle: list) -> str:
+        nodes = cycle if len(cycle) <= MAX_REPORTED_NODES + 1 else cycle[:MAX_REPORTED_NODES] + ['...', cycle[-1]]
+        return f"cycle of {len(cycle) - 1} node(s): {' -> '.join(map(str, nodes))}"
+
+    def is_cyclic(self, graph) -> bool:
+        return self.find_cycle(GraphView(graph)) is not None
+
+    def find_cycle(self, graph: GraphView) -> list[int] | None:
+        """
+        Finds a cycle of the graph in O(V + E), without recursion.
+
+        A graph that stores every edge in both directions is undirected, and u - v - u is not a cycle of it:
+        its cycles are found with union-find. Other graphs are directed and their cycles are found with Kahn's
+        algorithm. An edge from a vertex to itself is a cycle of both.
+
+        Args:
+            graph (GraphView): The graph.
+
+        Returns:
+            list[int] | None: The vertices of the first cycle found in the order of its edges, the first vertex
+                              repeated at the end, or None if the graph has no cycle.
+        """
+        if (u := graph.self_loop()) is not None:
+            return [u, u]
+        if graph.is_symmetric():
+            return self.__undirected_cycle(graph)
+        return self.__directed_cycle(graph)
+
+    @staticmethod
+    def __undirected_cycle(graph: GraphView) -> list[int] | None:
+        """
+        A forest of c trees has V - c edges, any more close a cycle, so a forest is told apart without a search.
+        Otherwise the edges u - v, u < v, join the trees of a union-find until one joins two vertices of the same
+        tree, which closes the cycle made of that edge and the path between them in the forest.
+        """
+        n = graph.n_vertices
+        if graph.n_edges // 2 <= n - graph.components():
+            return None
+        root = list(range(n))
+        size = [1] * n
+        forest = {}
+
+        def find(x: int) -> int:
+            while root[x] != x:
+                root[x] = root[root[x]]
+                x = root[x]
+            return x
+
+        for sources, targets in graph.edges():
+            forward = sources < targets
+            sources, targets = sources[forward], targets[forward]
+            for start in range(0, len(sources), EDGE_CHUNK):
+                for u, v in zip(sources[start:start + EDGE_CHUNK].tolist(), targets[start:start + EDGE_CHUNK].tolist()):
+                    root_u, root_v = find(u), find(v)
+                    if root_u == root_v:
+                        return DetectCycle.__forest_path(forest, v, u) + [v]
+                    if size[root_u] < size[root_v]:
+                        root_u, root_v = root_v, root_u
+                    root[root_v] = root_u
+                    size[root_u] += size[root_v]
+                    forest.setdefault(u, []).append(v)
+                    forest.setdefault(v, []).append(u)
+        return None
+
+    @staticmethod
+    def __forest_path(forest: dict, source: int, target: int) -> list[int]:
+        """
+        Returns the path from source to target in a forest, by breadth-first search.
+        """
+        previous = {source: None}
+        queue = deque([source])
+        while target not in previous:
+            u = queue.popleft()
+            for v in forest.get(u, []):
+                if v not in previous:
+                    previous[v] = u
+                    queue.append(v)
+        path = [target]
+        while path[-1] != source:
+            path.append(previous[path[-1]])
+        return path[::-1]
+
+    @staticmethod
+    def __directed_cycle(graph: GraphView) -> list[int] | None:
+        """
+        Kahn's algorithm removes the vertices without incoming edges, one after the other, the graph is acyclic
+        when they all go. Otherwise every vertex left has an incoming edge from another vertex left, so following
+        those edges backwards from any of them comes back to a vertex already seen, closing a cycle.
+        """
+        n = graph.n_vertices
+        indptr, indices = graph.adjacency()
+        in_degrees = np.bincount(indices, minlength=n).tolist()
+        offsets, targets = memoryview(np.ascontiguousarray(indptr)), memoryview(np.ascontiguousarray(indices))
+        stack = [v for v in range(n) if in_degrees[v] == 0]
+        removed = 0
+        while stack:
+            u = stack.pop()
+            removed += 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                in_degrees[v] -= 1
+                if in_degrees[v] == 0:
+                    stack.append(v)
+        if removed == n:
+            return None
+        left = np.array(in_degrees) > 0
+        sources = np.repeat(np.arange(n), np.diff(indptr))
+        inner = left[sources] & left[indices]
+        predecessor = np.full(n, -1)
+        predecessor[indices[inner]] = sources[inner]
+        predecessor = predecessor.tolist()
+        v = int(np.argmax(left))
+        seen = {}
+        path = []
+        while v not in seen:
+            seen[v] = len(path)
+            path.append(v)
+            v = predecessor[v]
+        cycle = path[seen[v]:] + [v]
+        return cycle[::-1]
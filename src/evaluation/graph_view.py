@@ -0,0 +1,259 @@
+import numpy as np
+
+from src.codes.graph import CSRGraph
+from src.exceptions import ParamInvalid
+
+BLOCK_CELLS = 1 << 24  # Cells of an adjacency matrix reduced at once, bounds the temporaries to 16 MiB of booleans
+
+
+def describe(values: np.ndarray) -> dict:
+    """
+    Returns the min, median, mean, p95, stddev and max of values, as the statistics of a result.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return {'min': float(values.min()),
+            'median': float(np.median(values)),
+            'mean': float(values.mean()),
+            'p95': float(np.percentile(values, 95)),
+            'stddev': float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+            'max': float(values.max())}
+
+
+def describe_counts(counts: np.ndarray) -> dict:
+    """
+    Returns the statistics of describe for a frequency table, counts[v] being how many times v occurs, without
+    expanding it. The quantiles are interpolated between ranks as numpy.percentile does.
+    """
+    values = np.flatnonzero(counts)
+    frequencies = counts[values]
+    total = int(frequencies.sum())
+    ranks = np.cumsum(frequencies)
+
+    def quantile(q: float) -> float:
+        position = (total - 1) * q
+        low, high = values[np.searchsorted(ranks, [np.floor(position), np.ceil(position)], side='right')]
+        return float(low + (position - np.floor(position)) * (high - low))
+
+    mean = float((values * frequencies).sum() / total)
+    variance = float(((values - mean) ** 2 * frequencies).sum() / (total - 1)) if total > 1 else 0.0
+    return {'min': float(values[0]),
+            'median': quantile(0.5),
+            'mean': mean,
+            'p95': quantile(0.95),
+            'stddev': variance ** 0.5,
+            'max': float(values[-1])}
+
+
+class GraphView:
+    """
+    Array view of the graph parameter of a code, for the structural criteria: an adjacency matrix (list or
+    numpy.ndarray, a value greater than zero is an edge) or a CSRGraph.
+
+    Everything is computed with numpy reductions, a matrix in blocks of rows, so the criteria take a pass or
+    two over the graph in compiled code instead of one interpreter iteration per cell.
+
+    The edges are the ones stored: an undirected graph stores each edge in both directions, so it counts twice
+    and the degree of a vertex is the number of edges stored in its row.
+    """
+
+    def __init__(self, graph):
+        if isinstance(graph, CSRGraph):
+            self.__csr, self.__matrix = graph, None
+            return
+        matrix = np.asarray(graph)
+        if matrix.size == 0:
+            matrix = matrix.reshape(0, 0)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ParamInvalid(f"graph must be a square adjacency matrix, not of shape {matrix.shape}")
+        self.__csr, self.__matrix = None, matrix
+
+    def __blocks(self):
+        """
+        Yields the matrix in blocks of rows.
+        """
+        n = len(self.__matrix)
+        rows = max(BLOCK_CELLS // max(n, 1), 1)
+        for start in range(0, n, rows):
+            yield self.__matrix[start:start + rows]
+
+    def __sources(self) -> np.ndarray:
+        """
+        Returns the source vertex of every edge of the CSRGraph, aligned with its indices.
+        """
+        return np.repeat(np.arange(self.__csr.n_vertices), np.diff(self.__csr.indptr))
+
+    @property
+    def n_vertices(self) -> int:
+        return self.__csr.n_vertices if self.__csr is not None else len(self.__matrix)
+
+    @property
+    def n_edges(self) -> int:
+        return int(self.degrees().sum())
+
+    @property
+    def density(self) -> float:
+        """
+        The edges stored over the n(n - 1) that fit in a graph without self-loops, 1.0 for a complete graph.
+        """
+        n = self.n_vertices
+        return self.n_edges / (n * (n - 1)) if n > 1 else 0.0
+
+    def degrees(self) -> np.ndarray:
+        """
+        Returns the number of edges stored in the row of each vertex.
+        """
+        if self.__csr is not None:
+            return np.diff(self.__csr.indptr)
+        if not len(self.__matrix):
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate([np.count_nonzero(block > 0, axis=1) for block in self.__blocks()])
+
+    def in_degrees(self) -> np.ndarray:
+        """
+        Returns the number of edges stored in the column of each vertex.
+        """
+        if self.__csr is not None:
+            return np.bincount(self.__csr.indices, minlength=self.__csr.n_vertices)
+        degrees = np.zeros(len(self.__matrix), dtype=np.int64)
+        for block in self.__blocks():
+            degrees += np.count_nonzero(block > 0, axis=0)
+        return degrees
+
+    def edges(self):
+        """
+        Yields the edges stored, in blocks of (sources, targets) arrays, in the order of their source then target.
+        """
+        if self.__csr is not None:
+            sources = self.__sources()
+            for start in range(0, len(sources), BLOCK_CELLS):
+                yield sources[start:start + BLOCK_CELLS], self.__csr.indices[start:start + BLOCK_CELLS]
+            return
+        start = 0
+        for block in self.__blocks():
+            sources, targets = np.nonzero(block > 0)
+            yield sources + start, targets
+            start += len(block)
+
+    def adjacency(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (indptr, indices) arrays of the graph in CSR form, the ones of the CSRGraph or built from the
+        matrix: the targets of the edges of u are indices[indptr[u]:indptr[u + 1]], in increasing order.
+        """
+        if self.__csr is not None:
+            return self.__csr.indptr, self.__csr.indices
+        indptr = np.zeros(self.n_vertices + 1, dtype=np.int64)
+        np.cumsum(self.degrees(), out=indptr[1:])
+        targets = [targets.astype(np.int32) for _, targets in self.edges()]
+        return indptr, np.concatenate(targets) if targets else np.zeros(0, dtype=np.int32)
+
+    def self_loop(self) -> int | None:
+        """
+        Returns the first vertex with an edge to itself, or None.
+        """
+        if self.__csr is not None:
+            sources = self.__sources()
+            loops = sources[self.__csr.indices == sources]
+        else:
+            loops = np.flatnonzero(np.diagonal(self.__matrix) > 0)
+        return int(loops[0]) if loops.size else None
+
+    def is_symmetric(self) -> bool:
+        """
+        Tells whether every edge u -> v is stored with its reverse v -> u, i.e. the graph is undirected.
+        """
+        if self.__csr is not None:
+            n, sources = self.__csr.n_vertices, self.__sources()
+            indices = self.__csr.indices.astype(np.int64)
+            return np.array_equal(np.sort(sources * n + indices), np.sort(indices * n + sources))
+        n = len(self.__matrix)
+        rows = max(BLOCK_CELLS // max(n, 1), 1)
+        for start in range(0, n, rows):
+            if not np.array_equal(self.__matrix[start:start + rows] > 0, (self.__matrix[:, start:start + rows] > 0).T):
+                return False
+        return True
+
+    def weights(self) -> np.ndarray:
+        """
+        Returns the weight of every edge.
+        """
+        if self.__csr is not None:
+            return self.__csr.weights
+        if not len(self.__matrix):
+            return np.zeros(0, dtype=self.__matrix.dtype)
+        return np.concatenate([block[block > 0] for block in self.__blocks()])
+
+    def weight_counts(self) -> np.ndarray | None:
+        """
+        Returns how many edges have each weight, indexed by weight, or None when the weights are not integers.
+        Unlike weights, it never holds more than a block of the matrix.
+        """
+        dtype = self.__csr.weights.dtype if self.__csr is not None else self.__matrix.dtype
+        if not np.issubdtype(dtype, np.integer):
+            return None
+        if self.__csr is not None:
+            weights = self.__csr.weights
+            return np.bincount(weights[weights > 0])
+        counts = np.zeros(0, dtype=np.int64)
+        for block in self.__blocks():
+            block_counts = np.bincount(block[block > 0])
+            if len(block_counts) > len(counts):
+                counts = np.pad(counts, (0, len(block_counts) - len(counts)))
+            counts[:len(block_counts)] += block_counts
+        return counts
+
+    def __matrix_components(self) -> int:
+        """
+        Counts the components by breadth-first search, a whole frontier at a time: a vertex is reached from the
+        frontier by an edge in a row of the frontier (out) or in its column (in). Each row and each column is
+        read once over all the searches.
+        """
+        n = len(self.__matrix)
+        visited = np.zeros(n, dtype=bool)
+        rows = max(BLOCK_CELLS // max(n, 1), 1)
+        components = 0
+        while not visited.all():
+            start = int(np.argmin(visited))
+            visited[start] = True
+            frontier = np.array([start])
+            components += 1
+            while frontier.size:
+                reached = np.zeros(n, dtype=bool)
+                for i in range(0, frontier.size, rows):
+                    block = frontier[i:i + rows]
+                    reached |= (self.__matrix[block] > 0).any(axis=0)
+                    reached |= (self.__matrix[:, block] > 0).any(axis=1)
+                reached &= ~visited
+                visited |= reached
+                frontier = np.flatnonzero(reached)
+        return components
+
+    def __csr_components(self) -> int:
+        """
+        Counts the components by hooking and pointer jumping: every vertex points to the root of its tree, each
+        round hooks the larger root of the endpoints of every edge to the smaller one and then points every vertex
+        to its root again, until no edge joins two trees.
+        """
+        csr = self.__csr
+        parent = np.arange(csr.n_vertices)
+        src = np.repeat(parent, np.diff(csr.indptr))
+        dst = csr.indices
+        while True:
+            roots_src, roots_dst = parent[src], parent[dst]
+            joins = roots_src != roots_dst
+            if not joins.any():
+                break
+            np.minimum.at(parent, np.maximum(roots_src, roots_dst)[joins], np.minimum(roots_src, roots_dst)[joins])
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+        return int(np.count_nonzero(parent == np.arange(csr.n_vertices)))
+
+    def components(self) -> int:
+        """
+        Returns the number of (weakly) connected components, the direction of the edges is ignored.
+        """
+        if self.__csr is not None:
+            return self.__csr_components()
+        return self.__matrix_components()
@@ -3,12 +3,14 @@ from memory_profiler import memory_usage
 
 from src.codes.base import BaseCode
 from src.evaluation.base import BaseEvaluation
+from src.evaluation.session import PROBE_RSS_SAMPLING
 
 log = logging.getLogger(__file__)
 
 
 class MemoryConsume(BaseEvaluation):
     name = 'Memory Consume'
+    probe = PROBE_RSS_SAMPLING
 
     def run(self, code: BaseCode, params: dict) -> dict:
         """
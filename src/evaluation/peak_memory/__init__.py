@@ -0,0 +1,68 @@
+import gc
+import logging
+import resource
+import sys
+import tracemalloc
+
+from src.codes.base import BaseCode
+from src.evaluation.base import BaseEvaluation
+from src.evaluation.session import PROBE_HEAP_TRACING
+
+log = logging.getLogger(__file__)
+
+
+class PeakMemory(BaseEvaluation):
+    name = 'Peak Memory Allocation'
+    probe = PROBE_HEAP_TRACING
+
+    @staticmethod
+    def __max_rss() -> int:
+        """
+        Peak resident set size of the process in bytes, ru_maxrss is in KiB on Linux and in bytes on macOS.
+        """
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+    def run(self, code: BaseCode, params: dict) -> dict:
+        """
+        Executes the given code and measures the peak of the Python heap it allocates.
+
+        Unlike Memory Consume, which samples the whole process RSS every 0.1 secs, tracemalloc accounts every
+        allocation, so short runs are measured exactly and the memory held by the worker before the run
+        (interpreter, ORM, Celery) is not counted. The growth of the process peak RSS is reported separately,
+        it also covers memory allocated outside the Python heap (e.g. numpy buffers).
+
+        Args:
+            code (BaseCode): An instance of a class that inherits from BaseCode, which contains the code to be executed.
+            params (dict): A dictionary of parameters to be passed to the code's run method.
+
+        Returns:
+            dict: A dictionary containing the peak allocation with keys:
+                - 'value': The peak allocation as a string formatted to 7 decimal places.
+                - 'unit': The unit of the peak allocation, which is 'MiB'.
+                - 'statistics': The peak allocation in bytes ('peak_bytes') and the growth of the process
+                                peak RSS in bytes ('rss_delta_bytes').
+        """
+        result = {'value': None, 'unit': None}
+        gc.collect()
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            rss_before = self.__max_rss()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            code.run(params)
+            _, peak = tracemalloc.get_traced_memory()
+            rss_after = self.__max_rss()
+        finally:
+            if started:
+                tracemalloc.stop()
+        peak_bytes = max(peak - baseline, 0)
+        result.update({'value': f'{peak_bytes / 2 ** 20:.7f}',
+                       'unit': 'MiB',
+                       'statistics': {'peak_bytes': peak_bytes,
+                                      'rss_delta_bytes': rss_after - rss_before,
+                                      },
+                       })
+        return result
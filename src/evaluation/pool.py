@@ -0,0 +1,191 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.codes.graph import CSRGraph
+from src.config import ApplicationConfig
+
+log = logging.getLogger(__file__)
+config_app = ApplicationConfig()
+
+SHM_PATH = '/dev/shm'  # The tmpfs of the POSIX shared memory blocks on Linux
+
+
+class SharedParams:
+    """
+    Run parameters with their numpy arrays (the graph, as a matrix or as the arrays of a CSRGraph) copied once
+    to shared memory, so the pool workers map them instead of unpickling a copy each.
+
+    The creator owns the blocks and releases them with close, the workers attach to them by name.
+    Check that the arrays fit in shared memory first (see fits): a tmpfs that is full does not fail the
+    creation of a block, it kills the process that writes to it with SIGBUS.
+    """
+
+    def __init__(self, params: dict):
+        self.__blocks = []
+        self.spec = {name: self.__share(value) for name, value in params.items()}
+
+    @staticmethod
+    def nbytes(params: dict) -> int:
+        """
+        Returns the size of the arrays of the parameters, i.e. the shared memory they take.
+        """
+        size = 0
+        for value in params.values():
+            if isinstance(value, np.ndarray):
+                size += value.nbytes
+            elif isinstance(value, CSRGraph):
+                size += sum(array.nbytes for array in value.arrays().values())
+        return size
+
+    @classmethod
+    def fits(cls, params: dict) -> bool:
+        """
+        Whether the arrays of the parameters fit in the free space of the shared memory (SHM_PATH), e.g. the 64 MB
+        a Docker container gets by default. Without SHM_PATH the space is not known and they are taken to fit.
+        """
+        try:
+            stat = os.statvfs(SHM_PATH)
+        except OSError:
+            return True
+        return cls.nbytes(params) <= stat.f_bavail * stat.f_frsize
+
+    def __share_array(self, array: np.ndarray) -> tuple:
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.__blocks.append(block)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return block.name, array.shape, array.dtype.str
+
+    def __share(self, value) -> tuple:
+        if isinstance(value, np.ndarray):
+            return 'ndarray', self.__share_array(value)
+        if isinstance(value, CSRGraph):
+            return 'csr', {name: self.__share_array(array) for name, array in value.arrays().items()}
+        return 'value', value
+
+    def close(self):
+        for block in self.__blocks:
+            block.close()
+            block.unlink()
+        self.__blocks = []
+
+    @staticmethod
+    def attach(spec: dict) -> tuple[dict, list]:
+        """
+        Maps the parameters of a spec, returning them and the shared memory blocks to close once they are released.
+        """
+        blocks = []
+
+        def array(name: str, shape: tuple, dtype: str) -> np.ndarray:
+            blocks.append(shared_memory.SharedMemory(name=name))
+            return np.ndarray(shape, dtype=dtype, buffer=blocks[-1].buf)
+
+        params = {}
+        for name, (kind, value) in spec.items():
+            match kind:
+                case 'ndarray':
+                    params[name] = array(*value)
+                case 'csr':
+                    params[name] = CSRGraph(**{k: array(*v) for k, v in value.items()})
+                case _:
+                    params[name] = value
+        return params, blocks
+
+
+def _run(name: str, spec: dict) -> dict:
+    """
+    Runs a criterion in a pool worker on the shared parameters.
+    """
+    from src.evaluation import Evaluation  # Imported here, src.evaluation imports this module
+
+    params, blocks = SharedParams.attach(spec)
+    try:
+        return Evaluation.get_instance(name).run(None, params)
+    finally:
+        del params
+        for block in blocks:
+            block.close()
+
+
+class CriteriaPool:
+    """
+    Process pool that evaluates the criteria without probe (e.g. count nodes, detect cycle) of an execution
+    concurrently. They do not run the code, they are functions of its parameters (the graph above all).
+
+    The pool is started on first use with CRITERIA_POOL_WORKERS workers (the CPUs of the host, up to 4, the
+    pool is disabled with less than 2) and kept for the life of the worker.
+    Its processes are forked from a fork server, not from the worker and its threads, and the parameters
+    reach them through shared memory.
+    """
+    __executor = None
+    __lock = threading.Lock()
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return config_app.CRITERIA_POOL_WORKERS > 1  # A single process would only add the copy to shared memory
+
+    @classmethod
+    def __get_executor(cls) -> ProcessPoolExecutor:
+        with cls.__lock:
+            if cls.__executor is None:
+                cls.__executor = ProcessPoolExecutor(config_app.CRITERIA_POOL_WORKERS,
+                                                     mp_context=multiprocessing.get_context('forkserver'))
+            return cls.__executor
+
+    @classmethod
+    def shutdown(cls):
+        with cls.__lock:
+            if cls.__executor is not None:
+                cls.__executor.shutdown(cancel_futures=True)
+                cls.__executor = None
+
+    @staticmethod
+    def __evaluate_in_process(evaluations: list, params: dict) -> dict:
+        results = {}
+        for evaluation in evaluations:
+            try:
+                results[evaluation.name] = evaluation.run(None, params)
+            except Exception as error:
+                results[evaluation.name] = error
+        return results
+
+    @classmethod
+    def evaluate(cls, evaluations: list, params: dict) -> dict:
+        """
+        Evaluates criteria concurrently on the same parameters. Parameters that do not fit in shared memory
+        (see SharedParams.fits) are evaluated one criterion after the other in the calling process instead.
+
+        Args:
+            evaluations (list): The criteria to evaluate, without probe.
+            params (dict): The parameters of the code's run method.
+
+        Returns:
+            dict: The result of each criterion by name, as returned by its run method, or the exception it raised.
+        """
+        if not SharedParams.fits(params):
+            log.warning(f"{SharedParams.nbytes(params)} bytes do not fit in {SHM_PATH}, "
+                        f"evaluating {', '.join(e.name for e in evaluations)} in process")
+            return cls.__evaluate_in_process(evaluations, params)
+        shared = SharedParams(params)
+        try:
+            executor = cls.__get_executor()
+            futures = {evaluation.name: executor.submit(_run, evaluation.name, shared.spec) for evaluation in evaluations}
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except BrokenProcessPool as error:
+                    log.error(f"criteria pool is broken: {error}")
+                    cls.shutdown()  # Started again on next use
+                    results[name] = error
+                except Exception as error:
+                    results[name] = error
+            return results
+        finally:
+            shared.close()
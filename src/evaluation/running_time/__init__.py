@@ -1,34 +1,161 @@
+import gc
 import logging
+import math
+import statistics
 import time
 
 from src.codes.base import BaseCode
+from src.config import ApplicationConfig
 from src.evaluation.base import BaseEvaluation
+from src.evaluation.session import PROBE_TIMING
 
 log = logging.getLogger(__file__)
+config_app = ApplicationConfig()
 
 
 class RunningTime(BaseEvaluation):
     name = 'Running Time'
+    probe = PROBE_TIMING
 
-    def run(self, code: BaseCode, params: dict) -> dict:
+    @property
+    def runs(self) -> int:
+        """
+        The warmup calls and the minimum repetitions, the calls of a code slower than RUNNING_TIME_MIN_SECS.
+        """
+        return max(config_app.RUNNING_TIME_WARMUP, 0) + config_app.RUNNING_TIME_MIN_REPEAT
+
+    @staticmethod
+    def __fits(deadline: float | None, secs: float) -> bool:
+        return deadline is None or time.monotonic() + secs < deadline
+
+    @staticmethod
+    def __noop(params: dict):
+        pass
+
+    @staticmethod
+    def __time_loops(func, params: dict, loops: int) -> tuple[float, float]:
+        """
+        Times loops calls of func(params) with the garbage collector disabled, as timeit does.
+
+        Returns:
+            tuple[float, float]: The wall time and the CPU time of the calls.
+        """
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            wall_init, cpu_init = time.perf_counter(), time.process_time()
+            for _ in range(loops):
+                func(params)
+            return time.perf_counter() - wall_init, time.process_time() - cpu_init
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    @staticmethod
+    def __warmup(code: BaseCode, params: dict) -> list[float] | None:
+        """
+        Runs the code RUNNING_TIME_WARMUP times, with the garbage collector enabled as in a plain run.
+
+        Returns:
+            list[float] | None: The garbage collections per call of each generation, None without warmup.
+        """
+        if config_app.RUNNING_TIME_WARMUP <= 0:
+            return None
+        collections = [g['collections'] for g in gc.get_stats()]
+        for _ in range(config_app.RUNNING_TIME_WARMUP):
+            code.run(params)
+        return [(g['collections'] - c) / config_app.RUNNING_TIME_WARMUP for g, c in zip(gc.get_stats(), collections)]
+
+    def __autorange(self, code: BaseCode, params: dict, deadline: float = None) -> tuple[int, tuple[float, float]]:
         """
-        Executes the provided code with given parameters and measures its running time.
+        Finds the number of loops (1, 2, 5, 10, 20, 50, ...) that takes at least RUNNING_TIME_MIN_SECS,
+        like timeit.Timer.autorange, or the largest one tried when the next would end after the deadline.
+
+        Returns:
+            tuple[int, tuple[float, float]]: The number of loops and the wall and CPU time they took.
+        """
+        loops, number, elapsed = 1, None, None
+        while True:
+            for factor in (1, 2, 5):
+                if number is not None and not self.__fits(deadline, elapsed[0] * loops * factor / number):
+                    return number, elapsed
+                number = loops * factor
+                elapsed = self.__time_loops(code.run, params, number)
+                if elapsed[0] >= config_app.RUNNING_TIME_MIN_SECS:
+                    return number, elapsed
+            loops *= 10
+
+    @staticmethod
+    def distribution(samples: list[float]) -> dict:
+        ordered = sorted(samples)
+        return {'min': ordered[0],
+                'median': statistics.median(ordered),
+                'mean': statistics.fmean(ordered),
+                'p95': ordered[math.ceil(0.95 * len(ordered)) - 1],  # Nearest rank
+                'stddev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+                }
+
+    def measure(self, code: BaseCode, params: dict, deadline: float = None) -> dict:
+        """
+        Measures the time of one call of the code, timeit style.
+
+        The code is run RUNNING_TIME_WARMUP times first. The number of calls per repetition is then
+        calibrated so that a repetition lasts at least RUNNING_TIME_MIN_SECS, and repetitions are taken
+        until RUNNING_TIME_BUDGET_SECS is spent, between RUNNING_TIME_MIN_REPEAT and RUNNING_TIME_MAX_REPEAT
+        of them. The time of an empty loop of the same length (timer and call overhead) is subtracted
+        from every repetition. Wall and CPU time are taken in the same repetitions.
+
+        With a deadline, the calibration and the repetitions stop before one that would end after it, even
+        under RUNNING_TIME_MIN_REPEAT: the measurement has fewer repetitions instead of going over the limit.
 
         Args:
             code (BaseCode): An instance of BaseCode that has a run method to be executed.
             params (dict): A dictionary of parameters to be passed to the code's run method.
+            deadline (float, optional): The time.monotonic() by which the measurement must be done.
 
+        Returns:
+            dict: The wall and CPU time of one call in each repetition ('wall', 'cpu'), with 'repeat', 'loops',
+                  'timer_overhead' and the garbage collections per call of each generation ('gc_collections').
+        """
+        gc_collections = self.__warmup(code, params)
+        loops, elapsed = self.__autorange(code, params, deadline)
+        repeat = int(config_app.RUNNING_TIME_BUDGET_SECS / elapsed[0]) if elapsed[0] > 0 else config_app.RUNNING_TIME_MAX_REPEAT
+        repeat = min(max(repeat, config_app.RUNNING_TIME_MIN_REPEAT), config_app.RUNNING_TIME_MAX_REPEAT)
+        overhead = [min(o) for o in zip(*[self.__time_loops(self.__noop, params, loops) for _ in range(3)])]
+        samples = [elapsed]
+        while len(samples) < repeat and self.__fits(deadline, samples[-1][0]):
+            samples.append(self.__time_loops(code.run, params, loops))
+        return {'wall': [max(s[0] - overhead[0], 0.0) / loops for s in samples],
+                'cpu': [max(s[1] - overhead[1], 0.0) / loops for s in samples],
+                'repeat': len(samples),
+                'loops': loops,
+                'timer_overhead': overhead[0] / loops,
+                'gc_collections': gc_collections,
+                }
+
+    def report(self, measurement: dict) -> dict:
+        """
         Returns:
             dict: A dictionary containing the running time of the code execution with keys:
-                - 'value': The running time as a string formatted to 7 decimal places.
+                - 'value': The median time of one call as a string formatted to 9 decimal places.
                 - 'unit': The unit of the running time, which is 'secs'.
+                - 'statistics': min, median, mean, p95 and stddev of the time of one call, in secs, with the
+                                number of repetitions, loops per repetition, the timer overhead and the
+                                garbage collections per call of each generation.
+        """
+        stats = self.distribution(measurement['wall'])
+        stats.update({'repeat': measurement['repeat'],
+                      'loops': measurement['loops'],
+                      'timer_overhead': measurement['timer_overhead'],
+                      'gc_collections': measurement['gc_collections'],
+                      })
+        return {'value': f'{stats["median"]:.9f}',
+                'unit': 'secs',
+                'statistics': stats,
+                }
+
+    def run(self, code: BaseCode, params: dict) -> dict:
+        """
+        Measures the running time of one call of the code, see measure and report.
         """
-        result = {'value': None, 'unit': None}
-        time_init = time.perf_counter()
-        code.run(params)
-        time_end = time.perf_counter()
-        run_time = time_end-time_init
-        result.update({'value': f'{run_time:.7f}',
-                       'unit': 'secs',
-                       })
-        return result
+        return self.report(self.measure(code, params))
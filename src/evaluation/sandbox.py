@@ -0,0 +1,157 @@
+import logging
+import math
+import os
+import pickle
+import resource
+import select
+import signal
+import time
+from typing import Callable
+
+from src.codes.base import BaseCode
+from src.config import ApplicationConfig
+from src.exceptions import LimitExceeded
+
+log = logging.getLogger(__file__)
+config_app = ApplicationConfig()
+
+
+class Sandbox:
+    """
+    Runs a function in a forked child process, with its CPU time (RLIMIT_CPU) and address space (RLIMIT_AS)
+    limited and a wall-clock deadline. The result comes back pickled over a pipe.
+
+    A run that goes over a limit is killed on its own, so it neither pins nor OOM-kills the worker and the other
+    tasks it would run.
+
+    The time limit is the one of a single run of the code, a function that runs the code several times (e.g. a
+    timing measurement) is given the time limit of all its runs.
+    """
+
+    def __init__(self, time_limit: float, memory_limit: int):
+        self.__time_limit = time_limit
+        self.__memory_limit = memory_limit
+
+    @property
+    def time_limit(self) -> float:
+        return self.__time_limit
+
+    @classmethod
+    def for_code(cls, code: BaseCode):
+        """
+        Returns the sandbox of a code, with the limits declared by its class or the default ones,
+        or None when SANDBOX_ENABLED is off.
+        """
+        if not config_app.SANDBOX_ENABLED:
+            return None
+        time_limit = getattr(type(code), 'time_limit', None)
+        memory_limit = getattr(type(code), 'memory_limit', None)
+        return cls(time_limit or config_app.SANDBOX_TIME_LIMIT_SECS,
+                   config_app.SANDBOX_MEMORY_LIMIT_BYTES if memory_limit is None else memory_limit)
+
+    @staticmethod
+    def __address_space() -> int:
+        try:
+            with open('/proc/self/statm') as statm:
+                return int(statm.read().split()[0]) * resource.getpagesize()
+        except OSError:
+            return 0
+
+    @staticmethod
+    def __set_limit(kind: int, soft: int, hard: int):
+        _, max_hard = resource.getrlimit(kind)
+        if max_hard != resource.RLIM_INFINITY:
+            soft, hard = min(soft, max_hard), min(hard, max_hard)
+        resource.setrlimit(kind, (soft, hard))
+
+    def __child(self, write_fd: int, func: Callable, args: tuple, time_limit: float):
+        """
+        Runs func(*args) with the limits set and writes (kind, value) to the pipe, kind being 'done',
+        'memory' or 'error'. Never returns, the child exits without running the parent's exit handlers.
+        """
+        status = 0
+        try:
+            cpu_limit = math.ceil(time_limit) + 1
+            self.__set_limit(resource.RLIMIT_CPU, cpu_limit, cpu_limit + 1)
+            if self.__memory_limit > 0:
+                # The child starts with the worker's address space (interpreter, ORM, Celery)
+                memory_limit = self.__address_space() + self.__memory_limit
+                self.__set_limit(resource.RLIMIT_AS, memory_limit, memory_limit)
+            try:
+                message = ('done', func(*args))
+            except MemoryError:
+                message = ('memory', None)
+            except Exception as error:
+                message = ('error', f'{type(error).__name__}: {error}')
+            with os.fdopen(write_fd, 'wb') as pipe:
+                pipe.write(pickle.dumps(message))
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    @staticmethod
+    def __read(read_fd: int, deadline: float) -> bytes | None:
+        """
+        Reads the pipe until the child closes it, or returns None once the deadline is over.
+        """
+        chunks = []
+        while (remaining := deadline - time.monotonic()) > 0:
+            ready, _, _ = select.select([read_fd], [], [], remaining)
+            if not ready:
+                break
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+        return None
+
+    def run(self, func: Callable, *args, runs: int = 1):
+        """
+        Runs func(*args) in the sandbox.
+
+        Args:
+            func (Callable): The function to run, its result must be picklable.
+            *args: The arguments of the function.
+            runs (int): The runs of the code func makes at most, the time limits are the ones of that many runs.
+
+        Returns:
+            The result of func.
+
+        Raises:
+            LimitExceeded: If the run went over the deadline, the CPU time or the memory limit.
+            RuntimeError: If func raised an exception or the child died for another reason.
+        """
+        time_limit = self.__time_limit * runs
+        what = 'the run' if runs == 1 else f'the {runs} runs of the measurement'
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            self.__child(write_fd, func, args, time_limit)
+        os.close(write_fd)
+        try:
+            data = self.__read(read_fd, time.monotonic() + time_limit)
+        finally:
+            os.close(read_fd)
+        if data is None:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            raise LimitExceeded(f'Time limit exceeded: {what} took more than {time_limit:g} secs')
+        _, status = os.waitpid(pid, 0)
+        if not data:
+            match os.WTERMSIG(status) if os.WIFSIGNALED(status) else None:
+                case signal.SIGXCPU:
+                    raise LimitExceeded(f'CPU time limit exceeded: {what} used more than {time_limit:g} secs')
+                case signal.SIGKILL:
+                    raise LimitExceeded('The run was killed, it went over the CPU time or the memory limit')
+                case _:
+                    raise RuntimeError(f'The run failed without result (exit status {status})')
+        kind, value = pickle.loads(data)
+        match kind:
+            case 'memory':
+                raise LimitExceeded(f'Memory limit exceeded: the run allocated more than '
+                                    f'{self.__memory_limit / 2 ** 20:g} MiB')
+            case 'error':
+                raise RuntimeError(value)
+        return value
@@ -0,0 +1,150 @@
+import contextlib
+import logging
+import time
+
+from src.codes.base import BaseCode
+from src.evaluation.cpu_lock import CpuLock
+from src.evaluation.pool import CriteriaPool
+from src.evaluation.sandbox import Sandbox
+
+log = logging.getLogger(__file__)
+
+# Probes, i.e. ways of running the code to measure it. Metrics collected by the same probe are taken in the
+# same runs, while probes interfere with each other (the tracemalloc hooks and the RSS sampling thread slow
+# the code down and grow the RSS), so each probe runs the code in its own isolated runs.
+PROBE_RSS_SAMPLING = 'rss sampling'
+PROBE_HEAP_TRACING = 'heap tracing'
+PROBE_TIMING = 'timing'
+PROBES = (PROBE_RSS_SAMPLING, PROBE_HEAP_TRACING, PROBE_TIMING)
+
+
+class MeasurementSession:
+    """
+    Measures a code once per probe for all the criteria of an execution.
+
+    Criteria declare the probe they read (BaseEvaluation.probe). The first criterion of a probe runs the
+    measurement and the following ones report from it, e.g. running time and CPU time come from the
+    same timed runs. Criteria without probe (e.g. count nodes) do not run the code and are evaluated as usual.
+
+    With a sandbox, each measurement runs in a forked child with time and memory limits. The time limit of the
+    code is the one of a single run, a measurement is given the time of the runs of its probe (BaseEvaluation.runs)
+    and the deadline they make, to take no more runs than fit. A measurement that exceeds a limit, or fails for
+    any other reason, fails all the criteria of its probe without being run again.
+
+    A session given a lock name (the criteria of an execution fanned out to several tasks) holds the CPU lock of
+    that name: timing measurements exclusively, every other evaluation shared (see CpuLock). Without one, the
+    criteria are evaluated one after the other by the task and nothing is locked.
+
+    Criteria without probe declared with concurrent are evaluated all at once in the criteria pool, when the
+    first of them is, so they are done before the code is measured.
+    """
+
+    def __init__(self, sandbox: Sandbox = None, lock: str = None):
+        self.__sandbox = sandbox
+        self.__lock = lock
+        self.__measurements = {}
+        self.__concurrent = {}
+        self.__results = {}
+
+    @staticmethod
+    def rank(evaluation) -> int:
+        return PROBES.index(evaluation.probe) + 1 if evaluation.probe in PROBES else 0
+
+    @classmethod
+    def schedule(cls, evaluations: list, key=lambda e: e) -> list:
+        """
+        Orders the evaluations so that those that do not run the code come first, followed by
+        the evaluations of each probe, one probe after the other.
+
+        Args:
+            evaluations (list): The evaluations, or items holding them.
+            key (Callable): Returns the evaluation of an item.
+
+        Returns:
+            list: The items, in the order they must be processed.
+        """
+        return sorted(evaluations, key=lambda e: cls.rank(key(e)))
+
+    @classmethod
+    def groups(cls, evaluations: list, key=lambda e: e) -> list[list]:
+        """
+        Splits the evaluations into groups that can be processed apart, e.g. by different workers: one group
+        per probe, as its criteria share a measurement, and one group per criterion without probe.
+
+        Args:
+            evaluations (list): The evaluations, or items holding them.
+            key (Callable): Returns the evaluation of an item.
+
+        Returns:
+            list[list]: The groups of items, in the order of schedule.
+        """
+        groups, by_probe = [], {}
+        for item in cls.schedule(evaluations, key):
+            probe = key(item).probe
+            if probe is None:
+                groups.append([item])
+            elif probe in by_probe:
+                by_probe[probe].append(item)
+            else:
+                by_probe[probe] = [item]
+                groups.append(by_probe[probe])
+        return groups
+
+    def __cpu_lock(self, exclusive: bool):
+        return CpuLock(exclusive=exclusive, name=self.__lock) if self.__lock else contextlib.nullcontext()
+
+    def concurrent(self, evaluations: list):
+        """
+        Declares the criteria of the execution, those without probe are evaluated concurrently in the criteria
+        pool if there are at least two of them and the pool is enabled (see CriteriaPool).
+
+        Args:
+            evaluations (list): The evaluations of the execution.
+        """
+        concurrent = {e.name: e for e in evaluations if e.probe is None}
+        self.__concurrent = concurrent if len(concurrent) > 1 and CriteriaPool.enabled() else {}
+
+    def evaluate(self, evaluation, code: BaseCode, params: dict) -> dict:
+        """
+        Evaluates a criterion, measuring the code only if its probe was not measured yet.
+
+        Args:
+            evaluation (BaseEvaluation): The criterion to evaluate.
+            code (BaseCode): The code to be measured.
+            params (dict): The parameters of the code's run method.
+
+        Returns:
+            dict: The result of the criterion, as returned by its run method.
+
+        Raises:
+            LimitExceeded: If the sandboxed measurement went over a limit.
+            Exception: The error the measurement of the probe raised, for every criterion of the probe.
+        """
+        if evaluation.probe is None:
+            if evaluation.name in self.__concurrent and not self.__results:
+                log.info(f"evaluating {', '.join(self.__concurrent)} in the criteria pool")
+                with self.__cpu_lock(exclusive=False):
+                    self.__results = CriteriaPool.evaluate(list(self.__concurrent.values()), params)
+            if evaluation.name in self.__results:
+                result = self.__results[evaluation.name]
+                if isinstance(result, Exception):
+                    raise result
+                return result
+            with self.__cpu_lock(exclusive=False):
+                return evaluation.run(code, params)
+        if evaluation.probe not in self.__measurements:
+            log.info(f"measuring {code.name} with {evaluation.probe} probe")
+            try:
+                with self.__cpu_lock(exclusive=evaluation.probe == PROBE_TIMING):
+                    if self.__sandbox is not None:
+                        deadline = time.monotonic() + self.__sandbox.time_limit * evaluation.runs
+                        measurement = self.__sandbox.run(evaluation.measure, code, params, deadline, runs=evaluation.runs)
+                    else:
+                        measurement = evaluation.measure(code, params)
+            except Exception as error:
+                measurement = error
+            self.__measurements[evaluation.probe] = measurement
+        measurement = self.__measurements[evaluation.probe]
+        if isinstance(measurement, Exception):
+            raise measurement
+        return evaluation.report(measurement)
@@ -0,0 +1,48 @@
+import logging
+
+import numpy as np
+
+from src.codes.base import BaseCode
+from src.evaluation.base import BaseEvaluation
+from src.evaluation.graph_view import GraphView, describe, describe_counts
+
+log = logging.getLogger(__file__)
+
+BINS = 10
+
+
+class WeightHistogram(BaseEvaluation):
+    name = 'Weight Histogram'
+
+    def run(self, code: BaseCode, params: dict) -> dict:
+        """
+        Given a graph, computes the histogram of the weights of its edges.
+
+        Integer weights (those of the generated graphs) are counted by value, so the statistics and the histogram
+        come from a table as long as the largest weight instead of from every edge.
+
+        Args:
+            code (BaseCode): An instance of a class that inherits from BaseCode, which contains the code to be executed.
+            params (dict): A dictionary of parameters, expected to contain a 'graph' key with the graph data.
+
+        Returns:
+            dict: A dictionary with keys 'value', the mean weight, 'unit' (set to 'weight') and 'statistics', the min,
+                  median, mean, p95, stddev and max weight, with the histogram: 'bins', the BINS + 1 edges of the bins
+                  of equal width, and 'counts', the edges in each bin (None without edges).
+        """
+        graph = GraphView(params.get('graph', []))
+        counts = graph.weight_counts()
+        if counts is not None:
+            if not counts.any():
+                return {'value': '0', 'unit': 'weight', 'statistics': None}
+            statistics = describe_counts(counts)
+            histogram, bins = np.histogram(np.arange(len(counts)), bins=BINS, weights=counts,
+                                           range=(statistics['min'], statistics['max']))
+        else:
+            weights = graph.weights()
+            if not len(weights):
+                return {'value': '0', 'unit': 'weight', 'statistics': None}
+            statistics = describe(weights)
+            histogram, bins = np.histogram(weights, bins=BINS)
+        statistics.update({'bins': bins.tolist(), 'counts': histogram.astype(np.int64).tolist()})
+        return {'value': f"{statistics['mean']:.6g}", 'unit': 'weight', 'statistics': statistics}
@@ -32,3 +32,7 @@ class ParamInvalid(AppError):
 
 class ObjectNotFound(AppError):
     status = HTTPStatus.NOT_FOUND
+
+
+class LimitExceeded(AppError):
+    status = HTTPStatus.UNPROCESSABLE_ENTITY
@@ -0,0 +1,141 @@
+import numpy as np
+
+from src.common import Singleton
+from src.exceptions import ParamInvalid
+
+MIN_POINTS = 3
+MIN_R2 = 0.5  # A growth class must explain at least half of the variance, otherwise the series is O(1)
+MAX_EXPONENT = 1000  # 2**n overflows float64 past n=1023
+PHI = (1 + 5 ** 0.5) / 2  # Growth of the recursive Fibonacci, F(n) calls are about PHI**n
+# Two-sided 95% quantiles of the Student t distribution by degrees of freedom, the normal quantile past 30
+T_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228, 2.201, 2.179, 2.160, 2.145, 2.131,
+        2.120, 2.110, 2.101, 2.093, 2.086, 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+T_95_NORMAL = 1.960
+
+
+def _log(n: np.ndarray) -> np.ndarray:
+    return np.log2(np.maximum(n, 1))
+
+
+# Complexity classes, simplest first, with the growth f(n) of the model y = a + b * f(n)
+COMPLEXITIES = (
+    ('O(1)', None),
+    ('O(log n)', _log),
+    ('O(n)', lambda n: n),
+    ('O(n log n)', lambda n: n * _log(n)),
+    ('O(n^2)', lambda n: n ** 2),
+    ('O(n^3)', lambda n: n ** 3),
+    ('O(phi^n)', lambda n: np.power(PHI, n)),
+    ('O(2^n)', np.exp2),
+)
+EXPONENTIALS = ('O(phi^n)', 'O(2^n)')
+
+
+class ComplexityFit(metaclass=Singleton):
+    """
+    Fits complexity classes to a (input size, measurement) series by least squares.
+
+    Every class is the model y = a + b * f(n), b >= 0: a is the constant overhead and b the cost per unit of
+    growth. All the classes are fitted at once, as one matrix of growths.
+    """
+
+    @staticmethod
+    def fit(sizes: list, values: list) -> list[dict]:
+        """
+        Fits every complexity class to the series.
+
+        Args:
+            sizes (list): The input sizes n, at least MIN_POINTS distinct ones.
+            values (list): The measurement for each input size (e.g. average running time).
+
+        Returns:
+            list[dict]: One item per class, best fit first, with keys 'complexity', 'coefficients' ({'a', 'b'})
+                        and 'r2'. Classes that cannot be evaluated on the sizes (phi^n and 2^n past n=1000) are
+                        left out.
+
+        Raises:
+            ParamInvalid: If there are fewer than MIN_POINTS distinct input sizes.
+        """
+        n = np.asarray(sizes, dtype=np.float64)
+        y = np.asarray(values, dtype=np.float64)
+        if len(np.unique(n)) < MIN_POINTS:
+            raise ParamInvalid(f"at least {MIN_POINTS} input values are required to fit a complexity")
+        growths = [(name, f) for name, f in COMPLEXITIES[1:] if name not in EXPONENTIALS or n.max() <= MAX_EXPONENT]
+        # Growths are scaled to [0, 1] to keep 2^n and n^3 well conditioned, b is scaled back after solving
+        f = np.stack([g(n) for _, g in growths])
+        scale = f.max(axis=1)
+        f = f / scale[:, None]
+        f_centered = f - f.mean(axis=1, keepdims=True)
+        y_centered = y - y.mean()
+        variance = (f_centered ** 2).sum(axis=1)
+        b = np.maximum(np.divide(f_centered @ y_centered, variance, out=np.zeros_like(variance), where=variance > 0), 0)
+        a = y.mean() - b * f.mean(axis=1)
+        residuals = ((y - (a[:, None] + b[:, None] * f)) ** 2).sum(axis=1)
+        total = (y_centered ** 2).sum()
+        r2 = 1 - residuals / total if total > 0 else np.where(residuals > 0, 0.0, 1.0)
+        models = [{'complexity': 'O(1)', 'coefficients': {'a': float(y.mean()), 'b': 0.0}, 'r2': 0.0}]
+        for (name, _), a_k, b_k, s_k, r2_k in zip(growths, a, b, scale, r2):
+            models.append({'complexity': name, 'coefficients': {'a': float(a_k), 'b': float(b_k / s_k)}, 'r2': float(r2_k)})
+        best = max(models[1:], key=lambda m: m['r2'])
+        if best['r2'] < MIN_R2:
+            best = models[0]
+        # Best first, then by R², the simplest class first on ties
+        return [best] + sorted((m for m in models if m is not best), key=lambda m: -m['r2'])
+
+    @staticmethod
+    def band(model: dict, sizes: list, values: list) -> dict:
+        """
+        Summarizes the residuals of a fitted model, to compute prediction intervals without the series.
+
+        Args:
+            model (dict): A model returned by fit for the same series.
+            sizes (list): The input sizes n the model was fitted to.
+            values (list): The measurement for each input size.
+
+        Returns:
+            dict: 'points', the mean 'x_mean' and sum of squared deviations 'sxx' of the growths f(n),
+                  and the residual standard error 'se'.
+        """
+        n = np.asarray(sizes, dtype=np.float64)
+        y = np.asarray(values, dtype=np.float64)
+        growth = dict(COMPLEXITIES)[model['complexity']]
+        x = np.zeros_like(n) if growth is None else growth(n)
+        residuals = y - np.array([ComplexityFit.predict(model, size) for size in n])
+        dof = max(len(n) - (1 if growth is None else 2), 1)
+        return {'points': len(n),
+                'x_mean': float(x.mean()),
+                'sxx': float(((x - x.mean()) ** 2).sum()),
+                'se': float(np.sqrt((residuals ** 2).sum() / dof))}
+
+    @staticmethod
+    def interval(model: dict, band: dict, size: int) -> tuple[float, float]:
+        """
+        Returns the 95% prediction interval of the model for an input size, from the band of its fit.
+
+        The interval widens with the residual error of the fit and with the distance of f(size) from the
+        fitted growths, so extrapolations are less certain than interpolations. The lower bound is not
+        negative, as measurements are not.
+        """
+        value = ComplexityFit.predict(model, size)
+        if not np.isfinite(value):
+            return value, value
+        growth = dict(COMPLEXITIES)[model['complexity']]
+        points = band['points']
+        dof = max(points - (1 if growth is None else 2), 1)
+        t = T_95[dof - 1] if dof <= len(T_95) else T_95_NORMAL
+        x = 0.0 if growth is None else float(growth(np.float64(size)))
+        spread = (x - band['x_mean']) ** 2 / band['sxx'] if band['sxx'] > 0 else 0.0
+        margin = float(t * band['se'] * np.sqrt(1 + 1 / points + spread))
+        return max(value - margin, 0.0), value + margin
+
+    @staticmethod
+    def predict(model: dict, size: int) -> float:
+        """
+        Returns the value the fitted model predicts for an input size.
+        """
+        growth = dict(COMPLEXITIES)[model['complexity']]
+        coefficients = model['coefficients']
+        if growth is None or coefficients['b'] == 0:
+            return coefficients['a']
+        with np.errstate(over='ignore'):  # 2^n is inf past n=1023
+            return float(coefficients['a'] + coefficients['b'] * growth(np.float64(size)))
@@ -0,0 +1,78 @@
+import logging
+from itertools import groupby
+
+from src.common import Singleton
+from src.common.functions import format_uuid
+from src.internal_services.complexity_fit import MIN_POINTS, ComplexityFit
+
+log = logging.getLogger(__file__)
+
+
+class EstimateModel(metaclass=Singleton):
+    """
+    In-memory complexity models of the done results, one per (algorithm, criteria, input), used to estimate
+    what an execution will cost before it is queued.
+
+    The models are fitted from the series of average result values by input value and swapped in at once on
+    refresh, so estimates never run an aggregation query and never see a half refreshed model. The API server
+    refreshes them every ESTIMATE_REFRESH_SECS out of its IOLoop (see ApiServer.refresh_estimates), the
+    requests only read them.
+    """
+
+    def __init__(self):
+        self.__models = {}
+
+    @staticmethod
+    def __fit(series: list) -> dict | None:
+        """
+        Fits the series of one (algorithm, criteria, input), or None when it is too short or mixes units.
+        """
+        if len({row[6] for row in series}) > 1 or len({row[4] for row in series}) < MIN_POINTS:
+            return None
+        sizes = [row[4] for row in series]
+        values = [float(row[5]) for row in series]
+        model = ComplexityFit.fit(sizes, values)[0]
+        return {"criteria_id": str(series[0][1]),
+                "criteria": series[0][2],
+                "unit": series[0][6],
+                "model": model,
+                "band": ComplexityFit.band(model, sizes, values)}
+
+    def refresh(self, rows: list):
+        """
+        Replaces the models with the ones fitted to the series.
+
+        Args:
+            rows (list): (algorithm_id, criteria_id, criteria_name, input_id, input_value, average, unit) rows,
+                         ordered by algorithm_id, criteria_id and input_id.
+        """
+        models = {}
+        for (algorithm_id, _, input_id), series in groupby(
+                rows, key=lambda row: (format_uuid(row[0]), str(row[1]), format_uuid(row[3]))):
+            if (fitted := self.__fit(list(series))) is not None:
+                models.setdefault((algorithm_id, input_id), []).append(fitted)
+        self.__models = models
+        log.info(f"estimate models refreshed: {sum(len(m) for m in models.values())}")
+
+    def estimate(self, algorithm_id: str, input_id: str, input_value: int) -> list[dict]:
+        """
+        Estimates every criteria with a model for an input value of the algorithm. The ids can be in any case, the
+        models are keyed by the ids as read from the database (see format_uuid).
+
+        Returns:
+            list[dict]: One item per criteria, with keys criteria_id, criteria, unit, complexity, points,
+                        value and the 95% prediction interval lower and upper.
+        """
+        estimates = []
+        for fitted in self.__models.get((format_uuid(algorithm_id), format_uuid(input_id)), []):
+            model = fitted["model"]
+            lower, upper = ComplexityFit.interval(model, fitted["band"], input_value)
+            estimates.append({"criteria_id": fitted["criteria_id"],
+                              "criteria": fitted["criteria"],
+                              "unit": fitted["unit"],
+                              "complexity": model["complexity"],
+                              "points": fitted["band"]["points"],
+                              "value": ComplexityFit.predict(model, input_value),
+                              "lower": lower,
+                              "upper": upper})
+        return sorted(estimates, key=lambda e: e["criteria"])
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+from typing import Callable
+
+import numpy as np
+
+from src.common import Singleton
+from src.config import ApplicationConfig
+
+log = logging.getLogger(__file__)
+
+config_app = ApplicationConfig()
+
+
+class GraphCache(metaclass=Singleton):
+    """
+    Content-addressed on-disk cache of generated graphs, shared by every worker on a host.
+
+    Each entry is a directory named after the hash of the generation parameters, holding one
+    .npy file per array. Entries are read back memory-mapped and evicted least recently used
+    first once the cache grows over max_bytes.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = None):
+        self.__path = pathlib.Path(path or config_app.GRAPH_CACHE_DIR)
+        self.__max_bytes = config_app.GRAPH_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.__max_bytes > 0
+
+    @staticmethod
+    def key(params: dict) -> str:
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def __entry_size(entry: pathlib.Path) -> int:
+        return sum(f.stat().st_size for f in entry.iterdir())
+
+    def __entries(self) -> list[tuple]:
+        """
+        Lists (last use, size, path) of the stored entries, least recently used first.
+        Entries removed by another worker while listing are skipped.
+        """
+        entries = []
+        for entry in self.__path.iterdir():
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, self.__entry_size(entry), entry))
+            except FileNotFoundError:
+                continue
+        return sorted(entries, key=lambda e: e[0])
+
+    def __evict(self, keep: pathlib.Path):
+        entries = self.__entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.__max_bytes:
+                break
+            if entry == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            log.info(f"graph cache entry {entry.name} evicted")
+
+    def __load(self, entry: pathlib.Path) -> dict | None:
+        try:
+            arrays = {f.stem: np.load(f, mmap_mode='r') for f in entry.glob('*.npy')}
+            os.utime(entry)  # Mark as recently used
+        except FileNotFoundError:
+            return None
+        return arrays or None
+
+    def __store(self, entry: pathlib.Path, arrays: dict):
+        self.__path.mkdir(parents=True, exist_ok=True)
+        tmp = pathlib.Path(tempfile.mkdtemp(dir=self.__path, prefix='.tmp-'))
+        try:
+            for name, array in arrays.items():
+                np.save(tmp / f'{name}.npy', array)
+            # Atomic publish, it fails if another worker stored the same graph first.
+            os.rename(tmp, entry)
+        except OSError as error:
+            log.info(f"graph cache entry {entry.name} not stored: {error}")
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def get_or_create(self, params: dict, build: Callable[[], dict]) -> dict:
+        """
+        Returns the arrays of a cached graph, building and storing them on a miss.
+
+        Args:
+            params (dict): The generation parameters (e.g. generator, num_nodes, density, seed),
+                           the cache key is their content hash.
+            build (Callable[[], dict]): Builds the graph as a dict of named numpy arrays.
+
+        Returns:
+            dict: The named arrays, memory-mapped read-only when served from the cache.
+        """
+        if not self.enabled:
+            return build()
+        entry = self.__path / self.key(params)
+        if (arrays := self.__load(entry)) is not None:
+            return arrays
+        arrays = build()
+        self.__store(entry, arrays)
+        self.__evict(keep=entry)
+        return self.__load(entry) or arrays
@@ -1,3 +1,6 @@
+import threading
+from contextlib import contextmanager
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 
@@ -13,6 +16,7 @@ class Orm:
                                       pool_size=pool_size,)
 
         self.__db_session = scoped_session(sessionmaker(bind=self.__engine, autocommit=False, autoflush=True))
+        self.__local = threading.local()
 
     @property
     def session(self):
@@ -50,8 +54,22 @@ class Orm:
         self.commit()
 
     def remove_session(self):
-        """remove session sql"""
-        self.__db_session.remove()
+        """remove session sql, unless it is held by single_session()"""
+        if getattr(self.__local, 'held', 0) == 0:
+            self.__db_session.remove()
+
+    @contextmanager
+    def single_session(self):
+        """
+        Keeps one session for the whole block: remove_session() calls made inside it are ignored
+        and the session is removed once, on exit.
+        """
+        self.__local.held = getattr(self.__local, 'held', 0) + 1
+        try:
+            yield self.session
+        finally:
+            self.__local.held -= 1
+            self.remove_session()
 
     def bulk_save_objects(self, list_objects):
         if list_objects:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKeyConstraint, Index, String, Text
+from sqlalchemy import Column, Float, ForeignKeyConstraint, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -25,9 +25,12 @@ class Execution(BaseModel):
     status = Column(String(20), nullable=False)
     alias = Column(String(100))
     message = Column(Text)
+    queue = Column(String(100))
+    queue_wait_secs = Column(Float)
     algorithm = relationship("Algorithm")
     __table_args__ = (
         Index("idx_execution_algorithm", algorithm_id),
+        Index("idx_execution_created_at_id", "created_at", execution_id),
         ForeignKeyConstraint(
             [algorithm_id], ["{}.algorithm.algorithm_id".format(config_app.DB_SCHEMA)]
         ),
@@ -95,6 +98,7 @@ class Execution(BaseModel):
         return result
 
     def add(self, params):
+        self.execution_id = AppUlid.ulid_to_uuid()  # Drawn here, not on insert, so the rows of a flush are inserted in one batch
         self.__enabled = True
         self.__status = STATUS_QUEUE
         self.__set_params(params)
@@ -116,6 +120,27 @@ class Execution(BaseModel):
         self.__status = STATUS_ERROR
         self.__message = message
 
+    def set_queue_wait(self, queue: str, secs: float):
+        """
+        Records the queue the execution was processed from and the secs its task waited in it.
+        """
+        self.queue = queue
+        self.queue_wait_secs = secs
+
+    def set_status_from_results(self, statuses: list[str]):
+        """
+        Sets the status of a processed execution from the statuses of its results: error when a result is in error
+        or was left unprocessed, warning when a result went over a limit, done otherwise.
+        """
+        failed = sum(status not in (STATUS_DONE, STATUS_WARNING) for status in statuses)
+        warned = statuses.count(STATUS_WARNING)
+        if failed:
+            self.set_status_to_error(f"{failed} of {len(statuses)} criteria failed")
+        elif warned:
+            self.set_status_to_warning(f"{warned} of {len(statuses)} criteria exceeded a limit")
+        else:
+            self.set_status_to_done()
+
     def get(self):
         payload = self.__parser_payload()
         result = self.__parser_result()
@@ -125,6 +150,8 @@ class Execution(BaseModel):
             "status": self.__status,
             "alias": self.__alias,
             "message": self.__message,
+            "queue": self.queue,
+            "queue_wait_secs": self.queue_wait_secs,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "enabled": self.enabled,
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKeyConstraint, Index, String, Text
+from sqlalchemy import Boolean, Column, ForeignKeyConstraint, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -20,6 +20,7 @@ class Input(BaseModel):
     name = Column(String(50), nullable=False)
     input_type = Column(String(10), nullable=False)
     description = Column(Text)
+    required = Column(Boolean, nullable=False, default=True)
     algorithm = relationship("Algorithm", backref="input")
     __table_args__ = (
         Index("idx_input_algorithm", algorithm_id),
@@ -55,6 +56,15 @@ class Input(BaseModel):
     def __description(self, value):
         self.description = value
 
+    @property
+    def __required(self):
+        return self.required
+
+    @__required.setter
+    def __required(self, value):
+        validate_param("required", value, "bool")
+        self.required = value
+
     def __set_algorithm(self, value):
         if not isinstance(value, Algorithm):
             raise ParamInvalid("Value invalid to Algorithm")
@@ -64,6 +74,7 @@ class Input(BaseModel):
         self.__name = params.get("name")
         self.__description = params.get("description")
         self.__input_type = params.get("input_type")
+        self.__required = params.get("required", True)
         self.__set_algorithm(params.get("algorithm"))
 
     def add(self, params):
@@ -79,6 +90,7 @@ class Input(BaseModel):
             "name": self.__name,
             "description": self.__description,
             "input_type": self.__input_type,
+            "required": self.__required,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "enabled": self.enabled,
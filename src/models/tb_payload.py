@@ -59,6 +59,7 @@ class Payload(BaseModel):
         self.__set_input_ref(params.get("input"))
 
     def add(self, params):
+        self.payload_id = AppUlid.ulid_to_uuid()  # Drawn here, not on insert, so the rows of a flush are inserted in one batch
         self.__enabled = True
         self.__set_params(params)
 
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, ForeignKeyConstraint, Index, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from src.common.functions import validate_param
@@ -28,6 +28,7 @@ class Result(BaseModel):
     unit = Column(String(50), nullable=True)
     status = Column(String(20), nullable=False)
     message = Column(Text)
+    statistics = Column(JSONB, nullable=True)
     execution = relationship("Execution", backref="result")
     criteria = relationship("Criteria")
     __table_args__ = (
@@ -75,6 +76,16 @@ class Result(BaseModel):
     def __message(self, value):
         self.message = value
 
+    @property
+    def __statistics(self):
+        return self.statistics
+
+    @__statistics.setter
+    def __statistics(self, value):
+        if value is not None:
+            validate_param("statistics", value, "dict")
+        self.statistics = value
+
     def __set_execution(self, value):
         if not isinstance(value, Execution):
             raise ParamInvalid("Value invalid to Execution")
@@ -108,6 +119,7 @@ class Result(BaseModel):
         self.__value = params.get("value")
         self.__unit = params.get("unit")
         self.__message = params.get("message")
+        self.__statistics = params.get("statistics")
 
     def set_status_to_warning(self, message):
         self.__status = STATUS_WARNING
@@ -126,6 +138,7 @@ class Result(BaseModel):
             "unit": self.__unit,
             "status": self.__status,
             "message": self.__message,
+            "statistics": self.__statistics,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "enabled": self.enabled,
@@ -2,8 +2,8 @@ from tornado.web import url
 
 from src.api.healthcheck import AlgorithmAnalysisService
 from src.api.v1.algorithm import ViewDeleteAlgorithm, ViewGetAlgorithm
-from src.api.v1.execution import ViewGetExecution, ViewPostExecution
-from src.api.v1.result import ViewGetReport
+from src.api.v1.execution import ViewGetEstimate, ViewGetExecution, ViewPostExecution
+from src.api.v1.result import ViewGetComplexityReport, ViewGetReport
 
 
 class Routes:
@@ -11,7 +11,9 @@ class Routes:
         url(r'/healthcheck', AlgorithmAnalysisService),
         url(r'/v1/algorithm/([^/]*)', ViewDeleteAlgorithm),
         url(r'/v1/algorithm', ViewGetAlgorithm),
+        url(r'/v1/execution/estimate', ViewGetEstimate),
         url(r'/v1/execution/([^/]*)', ViewGetExecution),
         url(r'/v1/execution', ViewPostExecution),
         url(r'/v1/result/evaluation-report/algorithm/([^/]*)/criteria/([^/]*)/input/([^/]*)', ViewGetReport),
+        url(r'/v1/result/complexity-report/algorithm/([^/]*)/criteria/([^/]*)/input/([^/]*)', ViewGetComplexityReport),
     ]
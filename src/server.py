@@ -6,6 +6,7 @@ import typing
 import tornado
 # from elasticapm.contrib.tornado import ElasticAPM
 from tornado.httpserver import HTTPServer
+from tornado.ioloop import IOLoop, PeriodicCallback
 from tornado.netutil import bind_sockets
 from tornado.web import Application
 from tornado_swagger.setup import (API_SWAGGER_2, STATIC_PATH,
@@ -13,6 +14,7 @@ from tornado_swagger.setup import (API_SWAGGER_2, STATIC_PATH,
                                    generate_doc_from_endpoints)
 
 from src.config import ApplicationConfig
+from src.controllers.execution import ControllerExecution
 from src.routes import Routes
 
 config_app = ApplicationConfig()
@@ -93,6 +95,17 @@ class ApiServer:
         # self.add_apm(app)
         return app
 
+    @staticmethod
+    async def refresh_estimates():
+        """
+        Refits the estimate models in a thread of the IOLoop executor, so the aggregation query does not hold
+        the requests up while it runs.
+        """
+        try:
+            await IOLoop.current().run_in_executor(None, ControllerExecution().refresh_estimates)
+        except Exception as error:
+            logger.exception(f"estimate models not refreshed: {error}")
+
     def bind_port(self):
         self.__sockets = bind_sockets(config_app.PORT_API)
         tornado.process.fork_processes(config_app.AMOUNT_PROCESS_API)
@@ -102,4 +115,6 @@ class ApiServer:
         app = self.make_app()
         server = HTTPServer(app, max_buffer_size=config_app.MAX_BUFFER_SIZE)
         server.add_sockets(self.__sockets)
+        await self.refresh_estimates()
+        PeriodicCallback(self.refresh_estimates, config_app.ESTIMATE_REFRESH_SECS * 1000).start()
         await asyncio.Event().wait()
@@ -1,6 +1,10 @@
 import logging
+import time
+
+from celery import chord
 
 from src.common import Singleton
+from src.common.functions import current_rss
 from src.config import ApplicationConfig
 from src.controllers.execution import ControllerExecution
 
@@ -24,21 +28,100 @@ def process_algorithm(self, **params: dict):
         **params (dict): A dictionary of parameters required for processing the algorithm. Expected keys include:
             - individual_id (str): The ID of the individual.
             - unique_id (str): A unique identifier for the execution.
+            - queue (str), queued_at (float): The queue the task was routed to and when (see queue_execution).
+
+    With EXECUTION_FANOUT, the criteria are not processed here but fanned out as a chord of process_criteria
+    tasks, and finish_execution sets the status of the execution once all of them are done (see fan_out).
 
     Raises:
         Exception: If an error occurs during the algorithm processing, it is logged, and the error is set in the execution.
 
     Logs:
-        Logs the completion of the execution or any exceptions that occur,
-        along with the provided individual_id and unique_id.
+        Logs the time the task waited in its queue (also stored with the execution), the completion of the execution
+        or any exceptions that occur, along with the provided individual_id and unique_id, and the worker RSS before
+        and after the task.
     """
+    rss = current_rss()
     try:
         extra = {
             "individual_id": params.get("individual_id"),
             "unique_id": params.get("unique_id")
         }
+        params["queue_wait_secs"] = log_queue_wait(params, extra)
         controller = ControllerExecution()
-        controller.run(params)
+        if config_app.EXECUTION_FANOUT:
+            groups = controller.prepare_fanout(params)
+            fan_out(params, groups)
+            log.info(f"Execution is fanned out in {len(groups)} tasks", extra=extra)
+        else:
+            controller.run(params)
+            log.info("Execution is done", extra=extra)
+    except Exception as error:
+        log.exception(str(error), extra=extra)
+        params.update({'error': str(error)})
+        controller.set_error_execution(params)
+        Singleton.drop()
+        raise error
+    finally:
+        controller.db_disconnect()
+        log_rss(rss, extra)
+
+
+@celery_app.task(bind=True, queue=config_app.QUEUE_EXECUTION)
+def process_criteria(self, **params: dict):
+    """
+    Processes a group of criteria of a fanned out execution (see fan_out).
+
+    Errors are logged and not raised, so the chord goes on to finish_execution, which sets the execution to
+    error as the results of the group are left unprocessed. A task that dies instead (e.g. its worker is killed)
+    fails the chord, and fail_execution sets the execution to error.
+
+    Args:
+        self (Task): The Celery task instance.
+        **params (dict): A dictionary of parameters required for processing the criteria. Expected keys include:
+            - execution_id (str): The ID of the execution.
+            - results (list[dict]): The result_id and criteria_name of each criterion of the group.
+            - individual_id (str): The ID of the individual.
+            - unique_id (str): A unique identifier for the execution.
+    """
+    rss = current_rss()
+    try:
+        extra = {
+            "individual_id": params.get("individual_id"),
+            "unique_id": params.get("unique_id")
+        }
+        log_queue_wait(params, extra)
+        controller = ControllerExecution()
+        controller.run_criteria(params)
+        log.info(f"Criteria {', '.join(r['criteria_name'] for r in params.get('results', []))} are done", extra=extra)
+    except Exception as error:
+        log.exception(str(error), extra=extra)
+        Singleton.drop()
+    finally:
+        controller.db_disconnect()
+        log_rss(rss, extra)
+
+
+@celery_app.task(bind=True, queue=config_app.QUEUE_EXECUTION)
+def finish_execution(self, results: list, **params: dict):
+    """
+    Sets the status of a fanned out execution from the statuses of its results, as the callback of its chord.
+
+    Args:
+        self (Task): The Celery task instance.
+        results (list): The return values of the process_criteria tasks of the chord, unused.
+        **params (dict): A dictionary with the execution_id, individual_id and unique_id.
+
+    Raises:
+        Exception: If an error occurs, it is logged, and the error is set in the execution.
+    """
+    try:
+        extra = {
+            "individual_id": params.get("individual_id"),
+            "unique_id": params.get("unique_id")
+        }
+        controller = ControllerExecution()
+        controller.finish_fanout(params)
         log.info("Execution is done", extra=extra)
     except Exception as error:
         log.exception(str(error), extra=extra)
@@ -50,7 +133,123 @@ def process_algorithm(self, **params: dict):
         controller.db_disconnect()
 
 
-def queue_execution(params: dict):
+@celery_app.task(queue=config_app.QUEUE_EXECUTION)
+def fail_execution(request, exc, traceback, **params: dict):
+    """
+    Sets a fanned out execution to error when its chord fails, as the errback of finish_execution.
+
+    A process_criteria task that dies (e.g. its worker is OOM-killed, WorkerLostError) fails the chord and
+    Celery never calls finish_execution, the execution would be left in progress.
+
+    The task is not bound: Celery calls the errbacks that take (request, exc, traceback) with the error, but
+    a bound one only with the id of the failed task.
+
+    Args:
+        request (Context): The request of the failed task, unused.
+        exc (Exception): The error that failed the chord.
+        traceback (str): The traceback of the error, unused.
+        **params (dict): A dictionary with the execution_id, individual_id and unique_id.
+    """
+    try:
+        extra = {
+            "individual_id": params.get("individual_id"),
+            "unique_id": params.get("unique_id")
+        }
+        log.error(f"Execution chord failed: {exc}", extra=extra)
+        controller = ControllerExecution()
+        controller.set_error_execution(dict(params, error=f"Criteria processing failed: {exc}"))
+    except Exception as error:
+        log.exception(str(error), extra=extra)
+        Singleton.drop()
+        raise error
+    finally:
+        controller.db_disconnect()
+
+
+@celery_app.task(bind=True, queue=config_app.QUEUE_EXECUTION)
+def process_sweep(self, **params: dict):
+    """
+    Processes the executions of an input-size sweep asynchronously, in one task.
+
+    Args:
+        self (Task): The Celery task instance.
+        **params (dict): A dictionary of parameters required for processing the sweep. Expected keys include:
+            - execution_ids (list[str]): The IDs of the executions of the sweep.
+            - individual_id (str): The ID of the individual.
+            - unique_id (str): A unique identifier for the execution.
+
+    Raises:
+        Exception: If an error occurs outside of the executions, which set their own errors.
+    """
+    rss = current_rss()
+    try:
+        extra = {
+            "individual_id": params.get("individual_id"),
+            "unique_id": params.get("unique_id")
+        }
+        params["queue_wait_secs"] = log_queue_wait(params, extra)
+        controller = ControllerExecution()
+        controller.run_sweep(params)
+        log.info(f"Sweep of {len(params.get('execution_ids', []))} executions is done", extra=extra)
+    except Exception as error:
+        log.exception(str(error), extra=extra)
+        Singleton.drop()
+        raise error
+    finally:
+        controller.db_disconnect()
+        log_rss(rss, extra)
+
+
+def fan_out(params: dict, groups: list[dict]):
+    """
+    Queues one process_criteria task per group of criteria of an execution, as a chord whose callback is
+    finish_execution, with fail_execution as its errback.
+
+    The groups of criteria that do not run the code (e.g. count nodes) go to QUEUE_EXECUTION, as they are
+    cheap, the measured ones to the queue the execution was routed to.
+
+    Args:
+        params (dict): The parameters of the process_algorithm task.
+        groups (list[dict]): The groups of criteria, as returned by ControllerExecution.prepare_fanout.
+    """
+    queue = params.get("queue") or config_app.QUEUE_EXECUTION
+    common = {key: params.get(key) for key in ("execution_id", "individual_id", "unique_id")}
+    header = []
+    for group in groups:
+        group_queue = queue if group["probe"] else config_app.QUEUE_EXECUTION
+        kwargs = dict(common, results=group["results"], queue=group_queue, queued_at=time.time())
+        header.append(process_criteria.signature(kwargs=kwargs, queue=group_queue))
+    callback = finish_execution.signature(kwargs=common, queue=queue)
+    callback.link_error(fail_execution.signature(kwargs=common, queue=config_app.QUEUE_EXECUTION))
+    chord(header)(callback)
+
+
+def log_rss(rss_before: int, extra: dict):
+    """
+    Logs the worker RSS before and after a task, memory a task leaves resident shows as a growth.
+    """
+    rss_after = current_rss()
+    log.info(f"worker RSS {rss_before / 2 ** 20:.1f} MiB before the task, {rss_after / 2 ** 20:.1f} MiB after "
+             f"({(rss_after - rss_before) / 2 ** 20:+.1f} MiB)", extra=extra)
+
+
+def log_queue_wait(params: dict, extra: dict) -> float | None:
+    """
+    Logs the time a task waited in its queue, to size the workers of each queue.
+
+    Returns:
+        float | None: The secs the task waited, stored with its executions, or None if it was not queued by
+                      queue_execution or queue_sweep.
+    """
+    if (queued_at := params.get("queued_at")) is None:
+        return None
+    wait = max(time.time() - queued_at, 0.0)
+    log.info(f"task waited {wait:.3f} secs in queue {params.get('queue')}",
+             extra=dict(extra, queue=params.get("queue"), queue_wait_secs=wait))
+    return wait
+
+
+def queue_execution(params: dict, queue: str = None):
     """
     Queue the process_execution task with the given parameters.
 
@@ -58,5 +257,21 @@ def queue_execution(params: dict):
 
     Args:
         params (dict): A dictionary of parameters to pass to the process_execution task.
+        queue (str, optional): The queue chosen by the cost of the execution (see ControllerExecution.add),
+                               QUEUE_EXECUTION by default.
+    """
+    params.update({"queue": queue or config_app.QUEUE_EXECUTION, "queued_at": time.time()})
+    process_algorithm.apply_async(kwargs=params, queue=params["queue"])
+
+
+def queue_sweep(params: dict, queue: str = None):
+    """
+    Queue the process_sweep task with the given parameters.
+
+    Args:
+        params (dict): A dictionary of parameters to pass to the process_sweep task.
+        queue (str, optional): The queue chosen by the cost of the sweep (see ControllerExecution.add_sweep),
+                               QUEUE_EXECUTION by default.
     """
-    process_algorithm.delay(**params)
+    params.update({"queue": queue or config_app.QUEUE_EXECUTION, "queued_at": time.time()})
+    process_sweep.apply_async(kwargs=params, queue=params["queue"])
@@ -2,6 +2,8 @@ import json
 
 import mock
 
+from src.exceptions import LimitExceeded, ParamInvalid
+
 from tests import BaseTestClassTornado
 
 
@@ -389,6 +391,27 @@ class TestViewExecution(BaseTestClassTornado):
         self.assertEqual(response.code, 400)
         self.assertIsInstance(result, dict)
 
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_get_list_objects_cursor(self, mock_controller):
+        mock_controller().list_objects.return_value = json.dumps({"total_items": 0, "executions": [],
+                                                                  "next_cursor": None})
+        url = self._url + "?amount=20&cursor=0195dfda-3263-82cc-6b25-9a302b1df9b5"
+        response = self.fetch(url, headers=self._header, method='GET')
+        result = json.loads(response.body.decode())
+        self.assertTrue(mock_controller().list_objects.called)
+        self.assertEqual(mock_controller().list_objects.call_args[0][0]["cursor"], "0195dfda-3263-82cc-6b25-9a302b1df9b5")
+        self.assertEqual(response.code, 200)
+        self.assertIsInstance(result, dict)
+
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_get_list_objects_cursor_invalid(self, mock_controller):
+        url = self._url + "?amount=20&cursor=wrong"
+        response = self.fetch(url, headers=self._header, method='GET')
+        result = json.loads(response.body.decode())
+        self.assertFalse(mock_controller().list_objects.called)
+        self.assertEqual(response.code, 400)
+        self.assertIsInstance(result, dict)
+
     @mock.patch("src.api.v1.execution.ControllerExecution")
     def test_get_list_objects_amount_invalid(self, mock_controller):
         url = self._url + "?amount=2.2&page=0&execution_id=21d88834-5021-5fff-a66f-0069f40ec3e7"
@@ -512,15 +535,97 @@ class TestViewExecution(BaseTestClassTornado):
             ],
             "alias": "Execution_2025_01_01_16_06_41",
         }
-        mock_controller().add.return_value = {"id": "21d88834-5021-5fff-a66f-0069f40ec3e7"}
+        def add(params):
+            params["queue"] = "algorithm-analysis-service_execution_slow"
+            return "21d88834-5021-5fff-a66f-0069f40ec3e7"
+
+        mock_controller().add.side_effect = add
         response = self.fetch(url, body=json.dumps(payload), headers=self._header, method='POST')
         result = json.loads(response.body.decode())
         self.assertTrue(mock_controller().add.called)
-        self.assertTrue(mock_task.called)
+        self.assertEqual(mock_task.call_args.args[1], "algorithm-analysis-service_execution_slow")
         self.assertEqual(response.code, 200)
         self.assertIsInstance(result, dict)
         self.assertIsNotNone(result["id"])        
 
+    @mock.patch("src.api.v1.execution.queue_sweep")
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_post_sweep(self, mock_controller, mock_task):
+        url = self._url
+        payload = {
+            "algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+            "input": [
+                {
+                "id": "0192919b-2501-59d0-d088-50be8a4e5ae6",
+                "sweep": {"start": 100, "stop": 5000, "step": 100}
+                }
+            ],
+            "alias": "Sweep_2025_01_01_16_06_41",
+        }
+        execution_ids = ["21d88834-5021-5fff-a66f-0069f40ec3e7", "21d88834-5021-5fff-a66f-0069f40ec3e8"]
+
+        def add_sweep(params):
+            params["alias"] = payload["alias"]
+            return execution_ids
+
+        mock_controller().add_sweep.side_effect = add_sweep
+        response = self.fetch(url, body=json.dumps(payload), headers=self._header, method='POST')
+        result = json.loads(response.body.decode())
+        self.assertEqual(response.code, 200)
+        self.assertFalse(mock_controller().add.called)
+        self.assertEqual(mock_task.call_args.args[0]["execution_ids"], execution_ids)
+        self.assertEqual(result["ids"], execution_ids)
+        self.assertEqual(result["alias"], payload["alias"])
+
+    @mock.patch("src.api.v1.execution.queue_sweep")
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_post_sweep_rejected(self, mock_controller, mock_task):
+        payload = {
+            "algorithm_id": "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
+            "input": [{"id": "0195316d-80fc-40c2-b3ca-44a90d8c6851", "sweep": [20, 30, 40]}],
+        }
+        rejected = {"values": [40], "message": "Estimated Running Time of 2199 secs exceeds the budget of 60 secs"}
+
+        def add_sweep(params):
+            params.update({"alias": "Sweep", "rejected": rejected})
+            return ["21d88834-5021-5fff-a66f-0069f40ec3e7", "21d88834-5021-5fff-a66f-0069f40ec3e8"]
+
+        mock_controller().add_sweep.side_effect = add_sweep
+        response = self.fetch(self._url, body=json.dumps(payload), headers=self._header, method='POST')
+        result = json.loads(response.body.decode())
+        self.assertEqual(response.code, 200)
+        self.assertEqual(len(result["ids"]), 2)
+        self.assertEqual(result["rejected"], rejected)
+
+    @mock.patch("src.api.v1.execution.queue_execution")
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_post_over_budget(self, mock_controller, mock_task):
+        payload = {
+            "algorithm_id": "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
+            "input": [{"id": "0195316d-80fc-40c2-b3ca-44a90d8c6851", "value": "60"}],
+        }
+        mock_controller().add.side_effect = LimitExceeded("Estimated Running Time of 2.306e+09 secs exceeds the budget")
+        response = self.fetch(self._url, body=json.dumps(payload), headers=self._header, method='POST')
+        self.assertEqual(response.code, 422)
+        self.assertIn("exceeds the budget", response.body.decode())
+        self.assertFalse(mock_task.called)
+
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_post_sweep_invalid(self, mock_controller):
+        url = self._url
+        payload = {
+            "algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+            "input": [
+                {
+                "id": "0192919b-2501-59d0-d088-50be8a4e5ae6",
+                "sweep": {"start": 100}
+                }
+            ],
+        }
+        mock_controller().add_sweep.side_effect = ParamInvalid("Sweep invalid")
+        response = self.fetch(url, body=json.dumps(payload), headers=self._header, method='POST')
+        self.assertEqual(response.code, 400)
+
     def test_post_algorithm_id_null(self):
         url = self._url
         payload = {
@@ -588,4 +693,53 @@ class TestViewExecution(BaseTestClassTornado):
         response = self.fetch(url, body=json.dumps(payload), headers=self._header, method='POST')
         self.assertTrue(mock_controller().add.called)
         self.assertEqual(response.code, 500)
-    
\ No newline at end of file
+    
+
+class TestViewEstimate(BaseTestClassTornado):
+
+    def setUp(self):
+        super(BaseTestClassTornado, self).setUp()
+        self._url = "/v1/execution/estimate"
+        self._header = {'Content-Type': 'application/json'}
+        self._query = "?algorithm_id=0192919b-2501-91c1-d4bb-c71b4c0785d5&input_id=0192919b-2501-59d0-d088-50be8a4e5ae6"
+
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_get(self, mock_controller):
+        mock_controller().estimate.return_value = json.dumps({
+            "algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+            "estimates": [
+                {
+                    "input_id": "0192919b-2501-59d0-d088-50be8a4e5ae6",
+                    "input_value": 5000,
+                    "criteria_id": "001fe2d3-09a5-4bc0-b891-45d475a4b1bc",
+                    "criteria": "Running Time",
+                    "unit": "secs",
+                    "complexity": "O(n^2)",
+                    "points": 12,
+                    "value": "7.51",
+                    "lower": "7.02",
+                    "upper": "8.00"
+                }
+            ]
+        })
+        response = self.fetch(self._url + self._query + "&value=5000", headers=self._header, method='GET')
+        result = json.loads(response.body.decode())
+        self.assertEqual(response.code, 200)
+        self.assertEqual(result["estimates"][0]["complexity"], "O(n^2)")
+        self.assertFalse(mock_controller().get.called)
+        self.assertEqual(mock_controller().estimate.call_args.args[0], {
+            "algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+            "input": [{"id": "0192919b-2501-59d0-d088-50be8a4e5ae6", "value": "5000"}]
+        })
+
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_get_value_invalid(self, mock_controller):
+        response = self.fetch(self._url + self._query + "&value=-1", headers=self._header, method='GET')
+        self.assertFalse(mock_controller().estimate.called)
+        self.assertEqual(response.code, 400)
+
+    @mock.patch("src.api.v1.execution.ControllerExecution")
+    def test_get_value_missing(self, mock_controller):
+        response = self.fetch(self._url + self._query, headers=self._header, method='GET')
+        self.assertFalse(mock_controller().estimate.called)
+        self.assertEqual(response.code, 422)
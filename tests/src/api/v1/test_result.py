@@ -80,4 +80,39 @@ class TestViewResult(BaseTestClassTornado):
         result = json.loads(response.body.decode())
         self.assertFalse(mock_controller().report.called)
         self.assertEqual(response.code, 400)
-        self.assertIsInstance(result, dict)
\ No newline at end of file
+        self.assertIsInstance(result, dict)
+
+class TestViewComplexityReport(BaseTestClassTornado):
+
+    def setUp(self):
+        super(BaseTestClassTornado, self).setUp()
+        self._url = "/v1/result/complexity-report/algorithm/0192919b-2501-2fea-a93d-5d5541c4002b/criteria/001fe2d3-09a5-4bc0-b891-45d475a4b1bc/input/0192919b-2501-585f-1492-4f5d22c98267"
+        self._header = {'Content-Type': 'application/json'}
+
+    @mock.patch("src.api.v1.result.ControllerResult")
+    def test_get(self, mock_controller):
+        mock_controller().complexity_report.return_value = json.dumps({
+            "unit": "secs",
+            "points": 3,
+            "best": {"complexity": "O(n)", "coefficients": {"a": 0.0, "b": 0.001}, "r2": 1.0},
+            "models": [{"complexity": "O(n)", "coefficients": {"a": 0.0, "b": 0.001}, "r2": 1.0}],
+            "prediction": {"n": 1000, "value": "1.0"}
+            })
+        response = self.fetch(self._url + "?n=1000", headers=self._header, method='GET')
+        result = json.loads(response.body.decode())
+        self.assertEqual(response.code, 200)
+        self.assertEqual(result["best"]["complexity"], "O(n)")
+        self.assertEqual(mock_controller().complexity_report.call_args.args[0]["n"], 1000)
+
+    @mock.patch("src.api.v1.result.ControllerResult")
+    def test_get_n_invalid(self, mock_controller):
+        response = self.fetch(self._url + "?n=-1", headers=self._header, method='GET')
+        self.assertFalse(mock_controller().complexity_report.called)
+        self.assertEqual(response.code, 400)
+
+    @mock.patch("src.api.v1.result.ControllerResult")
+    def test_get_criteria_invalid(self, mock_controller):
+        url = "/v1/result/complexity-report/algorithm/0192919b-2501-2fea-a93d-5d5541c4002b/criteria/invalid-id/input/0192919b-2501-585f-1492-4f5d22c98267"
+        response = self.fetch(url, headers=self._header, method='GET')
+        self.assertFalse(mock_controller().complexity_report.called)
+        self.assertEqual(response.code, 400)
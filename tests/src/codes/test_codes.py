@@ -1,5 +1,14 @@
+import gc
+import math
+import sys
+import weakref
+
+import numpy as np
+
 from src.codes import Codes
 from src.codes.base import BaseCode
+from src.codes.graph import CSRGraph
+from src.exceptions import ParamInvalid
 
 from tests import BaseTestClass
 
@@ -25,14 +34,75 @@ class TestCodes(BaseTestClass):
         code = self.__codes.get_instance("Dijkstra")
         self.assertIsInstance(code, BaseCode)
 
+    def test_setup_dijkstra(self):
+        code = self.__codes.get_instance("Dijkstra")
+        payload = [{'payload_id': None,
+                     'input': {
+                         'input_id': '0192919b-2501-59d0-d088-50be8a4e5ae6',
+                         'name': 'number of nodes',
+                         'input_type': 'integer',
+                         },
+                     'input_value': '10'}]
+        code.setup(payload)
+        params = {p['input']['name']: p['input_value'] for p in payload}
+        self.assertEqual(params['source'], 0)
+        self.assertEqual(params['target'], 9)
+        self.assertIsInstance(params['graph'], np.ndarray)
+        self.assertEqual(params['graph'].shape, (10, 10))
+        self.assertEqual(params['graph'].dtype, np.uint8)
+        self.assertIsInstance(code.run(params), int)
+        self.assertIsInstance(int(params['seed']), int)
+
+    def test_setup_dijkstra_seed(self):
+        code = self.__codes.get_instance("Dijkstra")
+        graphs = []
+        for _ in range(2):
+            payload = [{'payload_id': None,
+                         'input': {
+                             'input_id': '0192919b-2501-59d0-d088-50be8a4e5ae6',
+                             'name': 'number of nodes',
+                             'input_type': 'integer',
+                             },
+                         'input_value': '10'},
+                       {'payload_id': None,
+                         'input': {
+                             'input_id': '01a14eb2-b92f-2725-bd10-7d2b8a8309df',
+                             'name': 'seed',
+                             'input_type': 'integer',
+                             },
+                         'input_value': '42'}]
+            code.setup(payload)
+            self.assertEqual(len([p for p in payload if p['input']['name'] == 'seed']), 1)
+            graphs.append(next(p['input_value'] for p in payload if p['input']['name'] == 'graph'))
+        self.assertTrue((graphs[0] == graphs[1]).all())
+
+    def test_get_dijkstra_heap(self):
+        code = self.__codes.get_instance("Dijkstra (binary heap)")
+        self.assertIsInstance(code, BaseCode)
+
+    def test_get_dijkstra_numpy(self):
+        code = self.__codes.get_instance("Dijkstra (NumPy)")
+        self.assertIsInstance(code, BaseCode)
+
     def test_get_factorial(self):
         code = self.__codes.get_instance("Factorial")
         self.assertIsInstance(code, BaseCode)
+
+    def test_get_factorial_family(self):
+        for name in ("Factorial (iterative)", "Factorial (binary splitting)", "Factorial (math.factorial)"):
+            code = self.__codes.get_instance(name)
+            self.assertIsInstance(code, BaseCode)
         
     def test_get_fibonacci_sequence(self):
         code = self.__codes.get_instance("Fibonacci sequence")
         self.assertIsInstance(code, BaseCode)
 
+    def test_get_fibonacci_family(self):
+        for name in ("Fibonacci (iterative)", "Fibonacci (memoized)", "Fibonacci (matrix power)",
+                     "Fibonacci (fast doubling)"):
+            code = self.__codes.get_instance(name)
+            self.assertIsInstance(code, BaseCode)
+
     def test_run_dijkstra(self):
         code = self.__codes.get_instance("Dijkstra")
         payload = [{'payload_id': '0195e2e4-5079-c5f4-1b8a-c33287607035',
@@ -64,6 +134,187 @@ class TestCodes(BaseTestClass):
         self.assertIsInstance(res, int)
         self.assertEqual(res, 21)
 
+    def test_run_dijkstra_stateless(self):
+        code = self.__codes.get_instance("Dijkstra")
+        graph = np.array([[0, 4, 0], [4, 0, 1], [0, 1, 0]], dtype=np.uint8)
+        ref = weakref.ref(graph)
+        self.assertEqual(code.run({"source": 0, "target": 2, "graph": graph}), 5)
+        del graph
+        gc.collect()
+        # The shared instance must not keep the graph of the last run
+        self.assertIsNone(ref())
+
+    def test_codes_hold_no_state(self):
+        for code_class in BaseCode.__subclasses__():
+            self.assertEqual(vars(self.__codes.get_instance(code_class.name)), {}, code_class.name)
+
+    def test_run_dijkstra_heap(self):
+        code = self.__codes.get_instance("Dijkstra (binary heap)")
+        graph = [[0, 4, 0, 0, 0, 0, 0, 8, 0],
+                 [4, 0, 8, 0, 0, 0, 0, 11, 0],
+                 [0, 8, 0, 7, 0, 4, 0, 0, 2],
+                 [0, 0, 7, 0, 9, 14, 0, 0, 0],
+                 [0, 0, 0, 9, 0, 10, 0, 0, 0],
+                 [0, 0, 4, 14, 10, 0, 2, 0, 0],
+                 [0, 0, 0, 0, 0, 2, 0, 1, 6],
+                 [8, 11, 0, 0, 0, 0, 1, 0, 7],
+                 [0, 0, 2, 0, 0, 0, 6, 7, 0]]
+        params = {
+            "source": 0,
+            "target": 4,
+            "graph": CSRGraph.from_matrix(graph)
+        }
+        res = code.run(params)
+        self.assertIsInstance(res, int)
+        self.assertEqual(res, 21)
+
+    def test_setup_dijkstra_heap(self):
+        code = self.__codes.get_instance("Dijkstra (binary heap)")
+        payload = [{'payload_id': '0195e2e4-5079-c5f4-1b8a-c33287607035',
+                     'input': {
+                         'input_id': '01a14eae-45d5-487e-8c2c-92207668b965',
+                         'name': 'number of nodes',
+                         'input_type': 'integer',
+                         },
+                     'input_value': '10'}]
+        code.setup(payload)
+        params = {p['input']['name']: p['input_value'] for p in payload}
+        self.assertIsInstance(params['graph'], CSRGraph)
+        self.assertEqual(params['graph'].n_vertices, 10)
+        self.assertEqual(params['graph'].n_edges, 10 * 9)
+        self.assertEqual(code.run(params), code.run(params))
+
+    def test_run_dijkstra_heap_same_as_dijkstra(self):
+        payload = [{'payload_id': None,
+                     'input': {
+                         'input_id': None,
+                         'name': 'number of nodes',
+                         'input_type': 'integer',
+                         },
+                     'input_value': '30'}]
+        self.__codes.get_instance("Dijkstra").setup(payload)
+        params = {p['input']['name']: p['input_value'] for p in payload}
+        expected = self.__codes.get_instance("Dijkstra").run(params)
+        params['graph'] = CSRGraph.from_matrix(params['graph'])
+        res = self.__codes.get_instance("Dijkstra (binary heap)").run(params)
+        self.assertEqual(res, expected)
+
+    def test_run_dijkstra_numpy(self):
+        code = self.__codes.get_instance("Dijkstra (NumPy)")
+        graph = np.array([[0, 4, 0, 0, 0, 0, 0, 8, 0],
+                          [4, 0, 8, 0, 0, 0, 0, 11, 0],
+                          [0, 8, 0, 7, 0, 4, 0, 0, 2],
+                          [0, 0, 7, 0, 9, 14, 0, 0, 0],
+                          [0, 0, 0, 9, 0, 10, 0, 0, 0],
+                          [0, 0, 4, 14, 10, 0, 2, 0, 0],
+                          [0, 0, 0, 0, 0, 2, 0, 1, 6],
+                          [8, 11, 0, 0, 0, 0, 1, 0, 7],
+                          [0, 0, 2, 0, 0, 0, 6, 7, 0]])
+        params = {
+            "source": 0,
+            "target": 4,
+            "graph": graph
+        }
+        res = code.run(params)
+        self.assertIsInstance(res, int)
+        self.assertEqual(res, 21)
+
+    def test_run_dijkstra_numpy_unreachable(self):
+        code = self.__codes.get_instance("Dijkstra (NumPy)")
+        params = {
+            "source": 0,
+            "target": 2,
+            "graph": np.array([[0, 1, 0],
+                               [1, 0, 0],
+                               [0, 0, 0]])
+        }
+        self.assertEqual(code.run(params), float('inf'))
+
+    def test_run_dijkstra_numpy_same_as_dijkstra(self):
+        payload = [{'payload_id': None,
+                     'input': {
+                         'input_id': None,
+                         'name': 'number of nodes',
+                         'input_type': 'integer',
+                         },
+                     'input_value': '30'}]
+        code = self.__codes.get_instance("Dijkstra (NumPy)")
+        code.setup(payload)
+        params = {p['input']['name']: p['input_value'] for p in payload}
+        self.assertIsInstance(params['graph'], np.ndarray)
+        res = code.run(params)
+        params['graph'] = params['graph'].tolist()
+        expected = self.__codes.get_instance("Dijkstra").run(params)
+        self.assertEqual(res, expected)
+
+    def test_run_dijkstra_unreachable(self):
+        code = self.__codes.get_instance("Dijkstra")
+        params = {
+            "source": 0,
+            "target": 2,
+            "graph": [[0, 1, 0],
+                      [1, 0, 0],
+                      [0, 0, 0]]
+        }
+        self.assertEqual(code.run(params), float('inf'))
+
+    def test_setup_dijkstra_graph_types_same_result(self):
+        for graph_type in ('complete', 'erdos-renyi', 'grid', 'barabasi-albert', 'dag'):
+            results = []
+            for name in ("Dijkstra", "Dijkstra (binary heap)", "Dijkstra (NumPy)"):
+                payload = [{'payload_id': None,
+                             'input': {'input_id': None, 'name': 'number of nodes', 'input_type': 'integer'},
+                             'input_value': '40'},
+                           {'payload_id': None,
+                             'input': {'input_id': None, 'name': 'graph type', 'input_type': 'string'},
+                             'input_value': graph_type},
+                           {'payload_id': None,
+                             'input': {'input_id': None, 'name': 'seed', 'input_type': 'integer'},
+                             'input_value': '3'}]
+                code = self.__codes.get_instance(name)
+                code.setup(payload)
+                params = {p['input']['name']: p['input_value'] for p in payload}
+                results.append(code.run(params))
+            self.assertEqual(len(set(results)), 1, graph_type)
+
+    def test_setup_dijkstra_heap_sparse(self):
+        code = self.__codes.get_instance("Dijkstra (binary heap)")
+        payload = [{'payload_id': None,
+                     'input': {'input_id': None, 'name': 'number of nodes', 'input_type': 'integer'},
+                     'input_value': '1000'},
+                   {'payload_id': None,
+                     'input': {'input_id': None, 'name': 'graph type', 'input_type': 'string'},
+                     'input_value': 'erdos-renyi'},
+                   {'payload_id': None,
+                     'input': {'input_id': None, 'name': 'density', 'input_type': 'float'},
+                     'input_value': '0.01'}]
+        code.setup(payload)
+        params = {p['input']['name']: p['input_value'] for p in payload}
+        self.assertIsInstance(params['graph'], CSRGraph)
+        self.assertLess(params['graph'].n_edges, 1000 * 999 * 0.02)
+        self.assertIn('seed', params)
+
+    def test_setup_dijkstra_generated_density(self):
+        payload = [{'payload_id': None,
+                     'input': {'input_id': None, 'name': 'number of nodes', 'input_type': 'integer'},
+                     'input_value': '10'},
+                   {'payload_id': None,
+                     'input': {'input_id': None, 'name': 'graph type', 'input_type': 'string'},
+                     'input_value': 'dag'}]
+        self.__codes.get_instance("Dijkstra").setup(payload)
+        params = {p['input']['name']: p['input_value'] for p in payload}
+        self.assertEqual(params['density'], 0.1)
+
+    def test_setup_dijkstra_graph_type_invalid(self):
+        payload = [{'payload_id': None,
+                     'input': {'input_id': None, 'name': 'number of nodes', 'input_type': 'integer'},
+                     'input_value': '10'},
+                   {'payload_id': None,
+                     'input': {'input_id': None, 'name': 'graph type', 'input_type': 'string'},
+                     'input_value': 'not_exist'}]
+        with self.assertRaises(ValueError):
+            self.__codes.get_instance("Dijkstra").setup(payload)
+
     def test_run_factorial(self):
         code = self.__codes.get_instance("Factorial")
         code.setup([])
@@ -72,6 +323,22 @@ class TestCodes(BaseTestClass):
         self.assertIsInstance(res, int)
         self.assertEqual(res, 5 * 4 * 3 * 2 * 1)
 
+    def test_run_factorial_family_same_as_factorial(self):
+        reference = self.__codes.get_instance("Factorial")
+        for name in ("Factorial (iterative)", "Factorial (binary splitting)", "Factorial (math.factorial)"):
+            code = self.__codes.get_instance(name)
+            for n in range(30):
+                res = code.run({"factorial number": n})
+                self.assertIsInstance(res, int)
+                self.assertEqual(res, reference.run({"factorial number": n}), (name, n))
+
+    def test_run_factorial_family_past_recursion_limit(self):
+        n = sys.getrecursionlimit() * 2
+        expected = math.factorial(n)
+        for name in ("Factorial (iterative)", "Factorial (binary splitting)", "Factorial (math.factorial)"):
+            res = self.__codes.get_instance(name).run({"factorial number": n})
+            self.assertEqual(res, expected, name)
+
     def test_run_fibonacci_sequence(self):
         code = self.__codes.get_instance("Fibonacci sequence")
         code.setup([])
@@ -79,3 +346,27 @@ class TestCodes(BaseTestClass):
         self.assertIsInstance(code, BaseCode)
         self.assertIsInstance(res, int)
         self.assertEqual(res, 8)
+
+    def test_run_fibonacci_family_same_as_fibonacci_sequence(self):
+        reference = self.__codes.get_instance("Fibonacci sequence")
+        for name in ("Fibonacci (iterative)", "Fibonacci (memoized)", "Fibonacci (matrix power)",
+                     "Fibonacci (fast doubling)"):
+            code = self.__codes.get_instance(name)
+            for n in range(20):
+                res = code.run({"fibonacci number": n})
+                self.assertIsInstance(res, int)
+                self.assertEqual(res, reference.run({"fibonacci number": n}), (name, n))
+
+    def test_run_fibonacci_family_negative(self):
+        for name in ("Fibonacci (iterative)", "Fibonacci (memoized)", "Fibonacci (matrix power)",
+                     "Fibonacci (fast doubling)"):
+            for n in (-1, -5):
+                with self.assertRaises(ParamInvalid, msg=(name, n)):
+                    self.__codes.get_instance(name).run({"fibonacci number": n})
+
+    def test_run_fibonacci_family_large(self):
+        expected = self.__codes.get_instance("Fibonacci (iterative)").run({"fibonacci number": 5000})
+        self.assertEqual(expected % 10 ** 10, 4_382_863_125)  # Last digits of F(5000)
+        for name in ("Fibonacci (memoized)", "Fibonacci (matrix power)", "Fibonacci (fast doubling)"):
+            res = self.__codes.get_instance(name).run({"fibonacci number": 5000})
+            self.assertEqual(res, expected, name)
@@ -0,0 +1,136 @@
+import numpy as np
+
+from src.codes.graph import (CSRGraph, barabasi_albert_graph, complete_graph, erdos_renyi_graph, generate_graph,
+                              grid_graph, random_dag, weight_dtype)
+
+from tests import BaseTestClass
+
+
+class TestCSRGraph(BaseTestClass):
+
+    def test_from_matrix(self):
+        graph = CSRGraph.from_matrix([[0, 3, 0],
+                                      [3, 0, 5],
+                                      [0, 5, 0]])
+        self.assertEqual(graph.n_vertices, 3)
+        self.assertEqual(len(graph), 3)
+        self.assertEqual(graph.n_edges, 4)
+        self.assertEqual(list(graph.indptr), [0, 1, 3, 4])
+        self.assertEqual(list(graph.indices), [1, 0, 2, 1])
+        self.assertEqual(list(graph.weights), [3, 3, 5, 5])
+
+    def test_neighbours(self):
+        graph = CSRGraph.from_matrix([[0, 3, 0],
+                                      [3, 0, 5],
+                                      [0, 5, 0]])
+        self.assertEqual(list(graph.neighbours(1)), [(0, 3), (2, 5)])
+        self.assertEqual(list(graph.neighbours(2)), [(1, 5)])
+
+    def test_from_matrix_empty(self):
+        graph = CSRGraph.from_matrix([])
+        self.assertEqual(graph.n_vertices, 0)
+        self.assertEqual(graph.n_edges, 0)
+
+    def test_from_matrix_ndarray(self):
+        graph = CSRGraph.from_matrix(np.array([[0, 3, 0],
+                                               [3, 0, 5],
+                                               [0, 5, 0]], dtype=np.uint8))
+        self.assertEqual(graph.n_edges, 4)
+        self.assertEqual(graph.weights.dtype, np.uint8)
+        self.assertEqual(list(graph.neighbours(0)), [(1, 3)])
+
+    def test_from_edges(self):
+        graph = CSRGraph.from_edges(3, np.array([1, 0]), np.array([2, 1]), np.array([5, 3]))
+        self.assertEqual(graph.indptr.tolist(), [0, 1, 3, 4])
+        self.assertEqual(graph.indices.tolist(), [1, 0, 2, 1])
+        self.assertEqual(graph.weights.tolist(), [3, 3, 5, 5])
+
+    def test_from_edges_directed(self):
+        graph = CSRGraph.from_edges(3, np.array([1, 0]), np.array([2, 1]), np.array([5, 3]), directed=True)
+        self.assertEqual(graph.indptr.tolist(), [0, 1, 2, 2])
+        self.assertEqual(graph.indices.tolist(), [1, 2])
+
+    def test_to_matrix(self):
+        matrix = np.array([[0, 3, 0],
+                           [3, 0, 5],
+                           [0, 5, 0]], dtype=np.uint8)
+        self.assertTrue((CSRGraph.from_matrix(matrix).to_matrix() == matrix).all())
+
+
+class TestGraphGenerator(BaseTestClass):
+
+    def test_weight_dtype(self):
+        self.assertEqual(weight_dtype(100), np.uint8)
+        self.assertEqual(weight_dtype(255), np.uint8)
+        self.assertEqual(weight_dtype(256), np.uint16)
+        self.assertEqual(weight_dtype(70_000), np.uint32)
+
+    def test_weight_dtype_too_large(self):
+        with self.assertRaises(ValueError):
+            weight_dtype(2 ** 40)
+
+    def test_complete_graph(self):
+        graph = complete_graph(50)
+        self.assertIsInstance(graph, np.ndarray)
+        self.assertEqual(graph.shape, (50, 50))
+        self.assertEqual(graph.dtype, np.uint8)
+        self.assertTrue((graph == graph.T).all())
+        self.assertFalse(graph.diagonal().any())
+        self.assertEqual(np.count_nonzero(graph), 50 * 49)
+        self.assertTrue(graph.max() <= 100)
+
+    def test_complete_graph_max_weight(self):
+        graph = complete_graph(20, max_weight=1000)
+        self.assertEqual(graph.dtype, np.uint16)
+        self.assertTrue((graph == graph.T).all())
+
+    def test_complete_graph_seed(self):
+        self.assertTrue((complete_graph(20, seed=7) == complete_graph(20, seed=7)).all())
+        self.assertFalse((complete_graph(20, seed=7) == complete_graph(20, seed=8)).all())
+
+    def test_erdos_renyi_graph(self):
+        graph = erdos_renyi_graph(200, 0.1, seed=1)
+        matrix = graph.to_matrix()
+        self.assertTrue((matrix == matrix.T).all())
+        self.assertFalse(matrix.diagonal().any())
+        self.assertAlmostEqual(graph.n_edges / (200 * 199), 0.1, delta=0.02)
+        self.assertEqual(graph.weights.dtype, np.uint8)
+        self.assertTrue((graph.indices == erdos_renyi_graph(200, 0.1, seed=1).indices).all())
+
+    def test_random_dag(self):
+        graph = random_dag(100, 0.2, seed=1)
+        matrix = graph.to_matrix()
+        self.assertFalse(np.tril(matrix).any())  # Edges only go from lower to higher nodes
+        self.assertAlmostEqual(graph.n_edges / (100 * 99 / 2), 0.2, delta=0.05)
+
+    def test_grid_graph(self):
+        graph = grid_graph(9)
+        degrees = np.diff(graph.indptr).tolist()
+        self.assertEqual(degrees, [2, 3, 2, 3, 4, 3, 2, 3, 2])
+        self.assertEqual(graph.n_edges, 2 * 12)
+
+    def test_grid_graph_incomplete_row(self):
+        graph = grid_graph(7)
+        self.assertEqual(graph.n_vertices, 7)
+        self.assertEqual(graph.n_edges, 2 * 8)
+
+    def test_barabasi_albert_graph(self):
+        graph = barabasi_albert_graph(500, 3, seed=1)
+        matrix = graph.to_matrix()
+        self.assertTrue((matrix == matrix.T).all())
+        self.assertFalse(matrix.diagonal().any())
+        self.assertEqual(graph.n_edges, 2 * 3 * (500 - 3))
+        self.assertGreater(np.diff(graph.indptr).max(), 20)  # Hubs
+
+    def test_generate_graph(self):
+        for graph_type in ('complete', 'erdos-renyi', 'grid', 'barabasi-albert', 'dag'):
+            graph = generate_graph(graph_type, 30, 0.2, seed=5)
+            self.assertIsInstance(graph, CSRGraph)
+            self.assertEqual(graph.n_vertices, 30)
+            self.assertTrue((graph.indices == generate_graph(graph_type, 30, 0.2, seed=5).indices).all())
+
+    def test_generate_graph_invalid(self):
+        with self.assertRaises(ValueError):
+            generate_graph('not_exist', 10, 0.1, seed=1)
+        with self.assertRaises(ValueError):
+            generate_graph('erdos-renyi', 10, 0, seed=1)
@@ -1,5 +1,7 @@
 
 from datetime import date, datetime
+
+import numpy as np
 from src.common.functions import *
 from src.exceptions import ObjectNotFound, ParamInvalid
 from tests import BaseTestClass
@@ -8,6 +10,13 @@ from webargs import ValidationError
 
 class TestFunctions(BaseTestClass):
 
+    def test_current_rss(self):
+        rss = current_rss()
+        self.assertGreater(rss, 0)
+        block = np.ones(64 * 2 ** 20, dtype=np.uint8)
+        self.assertGreater(current_rss(), rss + 32 * 2 ** 20)
+        del block
+
     def test_date_utc_now(self):
         date = date_utc_now()
         assert isinstance(date, datetime)
@@ -100,6 +109,11 @@ class TestFunctions(BaseTestClass):
         with self.assertRaises(ParamInvalid):
             validate_param('field', param, 'tuple')
 
+    def test_format_uuid(self):
+        self.assertEqual(format_uuid("0192919B-2501-59D0-D088-50BE8A4E5AE6"), "0192919b-2501-59d0-d088-50be8a4e5ae6")
+        self.assertEqual(format_uuid("0192919b250159d0d08850be8a4e5ae6"), "0192919b-2501-59d0-d088-50be8a4e5ae6")
+        self.assertEqual(format_uuid("NOT-A-UUID"), "not-a-uuid")
+
     def test_validate_date_success(self):
         date_string = "2024-06-01"
         result = validate_date(date_string)
@@ -0,0 +1,16 @@
+from src.models.tb_algorithm import Algorithm
+from src.models.tb_input import Input
+
+
+def inputs(items: list) -> list[Input]:
+    """
+    Builds the Input instances of an algorithm from their description.
+    """
+    instances = []
+    for item in items:
+        instance = Input()
+        instance.add({'name': item.get('name', 'mock_name'), 'description': item.get('description'),
+                      'input_type': item['input_type'], 'required': item.get('required', True), 'algorithm': Algorithm()})
+        instance.input_id = item['input_id']
+        instances.append(instance)
+    return instances
@@ -1,12 +1,55 @@
+import gc
 import json
+
 import mock
+import numpy as np
 from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
 from src.common import Singleton
+from src.common.functions import current_rss
+from src.config import ApplicationConfig
 from src.controllers.execution import ControllerExecution
-from src.exceptions import ObjectNotFound
+from src.controllers.result import ResultBatch
+from src.exceptions import LimitExceeded, ObjectNotFound, ParamInvalid
+from src.evaluation import MeasurementSession
+from src.evaluation.session import PROBE_RSS_SAMPLING, PROBE_TIMING
+from src.models.base import Base
 from src.models.tb_algorithm import Algorithm
+from src.models.tb_criteria import Criteria
 from src.models.tb_execution import Execution, STATUS_DONE, STATUS_ERROR, STATUS_PROCESSING, STATUS_WARNING
+from src.models.tb_input import Input
+from src.models.tb_payload import Payload
+from src.models.tb_result import Result
 from tests import BaseTestClass
+from tests.src.controllers import inputs
+
+
+@compiles(UUID, "sqlite")
+def compile_uuid(type_, compiler, **kw):
+    return "CHAR(36)"
+
+
+@compiles(JSONB, "sqlite")
+def compile_jsonb(type_, compiler, **kw):
+    return "JSON"
+
+
+def sqlite_engine():
+    """
+    Returns an in-memory SQLite engine with the tables of the models, to count the queries of the ORM.
+    """
+    engine = create_engine("sqlite://")
+    event.listen(engine, "connect",
+                 lambda connection, _: connection.execute(f"ATTACH DATABASE ':memory:' AS {ApplicationConfig.DB_SCHEMA}"))
+    Base.metadata.create_all(engine)
+    return engine
+
+
+FIBONACCI_INPUTS = [{"input_id": "0195316d-80fc-40c2-b3ca-44a90d8c6851", "input_type": "integer",
+                     "name": "fibonacci number", "required": True}]
 
 
 class TestControllerExecution(BaseTestClass):
@@ -29,8 +72,9 @@ class TestControllerExecution(BaseTestClass):
         }
         result = self.__controller_execution.add(params)        
         self.assertIsNotNone(result)
-        self.assertTrue(mock_orm().orm.object_commit.called)
-        self.assertTrue(mock_orm().orm.remove_session.called)
+        self.assertEqual(mock_orm().orm.commit.call_count, 1)
+        self.assertFalse(mock_orm().orm.object_commit.called)
+        self.assertTrue(mock_orm().orm.single_session.called)
 
     @mock.patch("src.controllers.execution.ControllerPayload")
     @mock.patch("src.controllers.execution.ControllerAlgorithm")
@@ -43,8 +87,278 @@ class TestControllerExecution(BaseTestClass):
         }
         result = self.__controller_execution.add(params)        
         self.assertIsNotNone(result)
-        self.assertTrue(mock_orm().orm.object_commit.called)
-        self.assertTrue(mock_orm().orm.remove_session.called)
+        self.assertTrue(mock_orm().orm.commit.called)
+        self.assertTrue(mock_orm().orm.single_session.called)
+
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_query_count(self, mock_orm, mock_result):
+        engine = sqlite_engine()
+        with Session(engine) as session:
+            algorithm = Algorithm(name="Fibonacci sequence", description="mock_description", source="mock_source")
+            input = Input(name="fibonacci number", input_type="integer", algorithm=algorithm)
+            session.add(input)
+            session.commit()
+            algorithm_id, input_id = str(algorithm.algorithm_id), str(input.input_id)
+        statements = []
+
+        def count(connection, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        with Session(engine) as session:
+            mock_orm().orm.session = session
+            mock_orm().orm.commit.side_effect = session.commit
+            execution_id = self.__controller_execution.add({"algorithm_id": algorithm_id,
+                                                            "input": [{"id": input_id, "value": "20"}]})
+        event.remove(engine, "before_cursor_execute", count)
+        # The inputs of the algorithm are read once, for the admission estimate and for the payload
+        self.assertEqual(len([s for s in statements if s.lstrip().startswith("SELECT") and "FROM" in s
+                              and ".input" in s.split("FROM", 1)[1].split("WHERE", 1)[0]]), 1)
+        with Session(engine) as session:
+            payload = session.query(Payload).filter(Payload.execution_id == execution_id).one()
+            self.assertEqual((str(payload.input_id), payload.input_value), (input_id, "20"))
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_sweep(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm()
+        mock_payload().add.return_value = True
+        mock_input().get_instances_by_algorithm_id.return_value = inputs([
+            {'input_id': '0192919b-2501-59d0-d088-50be8a4e5ae6', 'input_type': 'integer'}])
+        params = {
+            "algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+            "input": [{"id": "0192919b-2501-59d0-d088-50be8a4e5ae6", "sweep": {"start": 100, "stop": 500, "step": 100}},
+                      {"id": "01a14eb2-b92f-2725-bd10-7d2b8a8309df", "value": "42"}],
+        }
+        result = self.__controller_execution.add_sweep(params)
+        self.assertEqual(len(result), 5)
+        self.assertEqual(mock_orm().orm.commit.call_count, 1)
+        self.assertTrue(mock_orm().orm.single_session.called)
+        values = [c.args[0]["input"][0]["value"] for c in mock_payload().add.call_args_list]
+        self.assertEqual(values, ["100", "200", "300", "400", "500"])
+        self.assertEqual(mock_payload().add.call_args_list[0].args[0]["input"][1], {"id": "01a14eb2-b92f-2725-bd10-7d2b8a8309df",
+                                                                                     "value": "42"})
+        aliases = {c.args[0]["alias"] for c in mock_payload().add.call_args_list}
+        self.assertEqual(len(aliases), 1)
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_sweep_upper_case_id(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm()
+        mock_input().get_instances_by_algorithm_id.return_value = inputs([
+            {'input_id': '0192919b-2501-59d0-d088-50be8a4e5ae6', 'input_type': 'integer'}])
+        params = {
+            "algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+            "input": [{"id": "0192919B-2501-59D0-D088-50BE8A4E5AE6", "sweep": [100, 200]}],
+        }
+        self.assertEqual(len(self.__controller_execution.add_sweep(params)), 2)
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_over_declared_budget(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm(name="Fibonacci sequence")
+        mock_input().get_instances_by_algorithm_id.return_value = inputs(FIBONACCI_INPUTS)
+        params = {"algorithm_id": "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
+                  "input": [{"id": "0195316d-80fc-40c2-b3ca-44a90d8c6851", "value": "45"}]}
+        with self.assertRaises(LimitExceeded) as error:
+            self.__controller_execution.add(params)
+        # 4e-7 * phi^45 secs, over the 60 secs time limit of the recursive Fibonacci
+        self.assertIn("Running Time of 1015 secs for fibonacci number 45", str(error.exception))
+        self.assertIn("O(phi^n), declared by the code", str(error.exception))
+        self.assertIn("budget of 60 secs", str(error.exception))
+        self.assertFalse(mock_orm().orm.commit.called)
+        params["input"][0]["value"] = "20"
+        self.assertIsNotNone(self.__controller_execution.add(params))
+        self.assertTrue(mock_orm().orm.commit.called)
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_declared_budget_boundary(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm(name="Fibonacci sequence")
+        mock_input().get_instances_by_algorithm_id.return_value = inputs(FIBONACCI_INPUTS)
+        params = {"algorithm_id": "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
+                  "input": [{"id": "0195316d-80fc-40c2-b3ca-44a90d8c6851", "value": "35"}]}
+        # The recursive Fibonacci runs in seconds at n=35 (about phi^35 calls), 2^35 would estimate it over the limit
+        self.assertIsNotNone(self.__controller_execution.add(params))
+        params["input"][0]["value"] = "40"
+        with self.assertRaises(LimitExceeded) as error:
+            self.__controller_execution.add(params)
+        self.assertIn("Running Time of 91.53 secs for fibonacci number 40", str(error.exception))
+
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_over_estimated_budget(self, mock_orm, mock_algorithm, mock_payload, mock_input, mock_result):
+        algorithm_id, input_id = "0195316b-d5ca-431a-8d95-f3f65e3ec1dd", "0195316d-80fc-40c2-b3ca-44a90d8c6851"
+        mock_algorithm().get_instance.return_value = Algorithm(name="Fibonacci sequence")
+        mock_input().get_instances_by_algorithm_id.return_value = inputs(FIBONACCI_INPUTS)
+        mock_result().estimate_series.return_value = [
+            (algorithm_id, "001fe2d3-09a5-4bc0-b891-45d475a4b1bc", "Running Time", input_id, n, 1e-8 * 2 ** n, "secs")
+            for n in (10, 15, 20, 25)
+        ] + [
+            (algorithm_id, "01a14ebf-aed2-b569-5566-5f3e51e6c4ea", "Peak Memory Allocation", input_id, n, 0.01, "MiB")
+            for n in (10, 15, 20, 25)
+        ]
+        self.__controller_execution.refresh_estimates()
+        params = {"algorithm_id": algorithm_id, "input": [{"id": input_id, "value": "35"}]}
+        with self.assertRaises(LimitExceeded) as error:
+            self.__controller_execution.add(params)
+        # The history (1e-8 * 2^n) comes before the declaration (4e-7 * phi^n)
+        self.assertIn("Running Time of 343.6 secs for fibonacci number 35 (O(2^n), fitted to 4 input values)",
+                      str(error.exception))
+
+    @mock.patch.multiple("src.controllers.execution.config_app", ADMISSION_ENABLED=True, ADMISSION_MAX_SECS=1.0)
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_admission_budgets(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm(name="Dijkstra")
+        mock_input().get_instances_by_algorithm_id.return_value = inputs([
+            {"input_id": "0192919b-2501-59d0-d088-50be8a4e5ae6", "input_type": "integer", "name": "number of nodes",
+             "required": True},
+            {"input_id": "01a14eb2-b92f-2725-bd10-7d2b8a8309df", "input_type": "integer", "name": "seed",
+             "required": False}])
+        params = {"algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+                  "input": [{"id": "0192919b-2501-59d0-d088-50be8a4e5ae6", "value": "1000"},
+                            {"id": "01a14eb2-b92f-2725-bd10-7d2b8a8309df", "value": "10000000"}]}
+        # 2e-7 * 1000^2 = 0.2 secs, the seed is not an input size
+        self.assertIsNotNone(self.__controller_execution.add(params))
+        params["input"][0]["value"] = "5000"
+        with self.assertRaises(LimitExceeded) as error:
+            self.__controller_execution.add(params)
+        self.assertIn("budget of 1 secs", str(error.exception))
+        with mock.patch("src.controllers.execution.config_app.ADMISSION_ENABLED", False):
+            self.assertIsNotNone(self.__controller_execution.add(params))
+
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_queue(self, mock_orm, mock_algorithm, mock_payload, mock_input, mock_result):
+        algorithm_id, input_id = "0192919b-2501-91c1-d4bb-c71b4c0785d5", "0192919b-2501-59d0-d088-50be8a4e5ae6"
+        mock_algorithm().get_instance.return_value = Algorithm(name="Dijkstra")
+        mock_input().get_instances_by_algorithm_id.return_value = inputs([
+            {"input_id": input_id, "input_type": "integer", "name": "number of nodes", "required": True}])
+        mock_result().estimate_series.return_value = [
+            (algorithm_id, "f6465865-d1a3-496c-82b7-5d7d67adf927", "Memory Consume", input_id, n, 1e-5 * n ** 2, "MiB")
+            for n in (100, 200, 400, 800)]
+        self.__controller_execution.refresh_estimates()
+        # Running time declared by Dijkstra: 2e-7 * n^2 secs, memory estimated from the results: 1e-5 * n^2 MiB
+        for n, queue in ((1000, "algorithm-analysis-service_execution"),  # 0.2 secs, 10 MiB
+                         (3000, "algorithm-analysis-service_execution_slow"),  # 1.8 secs, 90 MiB
+                         (12000, "algorithm-analysis-service_execution_heavy"),  # 28.8 secs, 1440 MiB
+                         (20000, "algorithm-analysis-service_execution_heavy")):  # 80 secs, 4000 MiB
+            params = {"algorithm_id": algorithm_id, "input": [{"id": input_id, "value": str(n)}]}
+            self.__controller_execution.add(params)
+            self.assertEqual(params["queue"], queue, n)
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_queue_unknown_cost(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm()
+        params = {"algorithm_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"}
+        self.__controller_execution.add(params)
+        self.assertEqual(params["queue"], "algorithm-analysis-service_execution_slow")
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_sweep_queue(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm(name="Dijkstra (NumPy)")
+        mock_payload().add.return_value = True
+        mock_input().get_instances_by_algorithm_id.return_value = inputs([
+            {"input_id": "0192919b-2501-59d0-d088-50be8a4e5ae6", "input_type": "integer", "name": "number of nodes",
+             "required": True}])
+        # 2e-8 * n^2 secs each, the points add up: 0.2 secs for one point of 3000, 1.8 secs for the sweep
+        params = {"algorithm_id": "01a14eaf-a77c-3eeb-b581-329687f5a064",
+                  "input": [{"id": "0192919b-2501-59d0-d088-50be8a4e5ae6", "sweep": [3000]}]}
+        self.__controller_execution.add_sweep(params)
+        self.assertEqual(params["queue"], "algorithm-analysis-service_execution")
+        params["input"] = [{"id": "0192919b-2501-59d0-d088-50be8a4e5ae6", "sweep": [3000] * 9}]
+        self.__controller_execution.add_sweep(params)
+        self.assertEqual(params["queue"], "algorithm-analysis-service_execution_slow")
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_sweep_over_budget(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm(name="Fibonacci sequence")
+        mock_payload().add.return_value = True
+        mock_input().get_instances_by_algorithm_id.return_value = inputs(FIBONACCI_INPUTS)
+        params = {"algorithm_id": "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
+                  "input": [{"id": "0195316d-80fc-40c2-b3ca-44a90d8c6851", "sweep": [20, 30, 40, 50]}]}
+        result = self.__controller_execution.add_sweep(params)
+        self.assertEqual(len(result), 2)
+        values = [c.args[0]["input"][0]["value"] for c in mock_payload().add.call_args_list]
+        self.assertEqual(values, ["20", "30"])
+        self.assertEqual(params["rejected"]["values"], [40, 50])
+        self.assertIn("fibonacci number 40", params["rejected"]["message"])
+        params = {"algorithm_id": "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
+                  "input": [{"id": "0195316d-80fc-40c2-b3ca-44a90d8c6851", "sweep": [40, 50]}]}
+        with self.assertRaises(LimitExceeded):
+            self.__controller_execution.add_sweep(params)
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_sweep_list(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm()
+        mock_payload().add.return_value = True
+        mock_input().get_instances_by_algorithm_id.return_value = inputs([
+            {'input_id': '0192919b-2501-585f-1492-4f5d22c98267', 'input_type': 'integer'}])
+        params = {
+            "algorithm_id": "0192919b-2501-2fea-a93d-5d5541c4002b",
+            "input": [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": [10, "20", 40]}],
+        }
+        result = self.__controller_execution.add_sweep(params)
+        self.assertEqual(len(result), 3)
+        values = [c.args[0]["input"][0]["value"] for c in mock_payload().add.call_args_list]
+        self.assertEqual(values, ["10", "20", "40"])
+
+    @mock.patch("src.controllers.execution.ControllerInput")
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.ControllerAlgorithm")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_sweep_invalid(self, mock_orm, mock_algorithm, mock_payload, mock_input):
+        mock_algorithm().get_instance.return_value = Algorithm()
+        mock_input().get_instances_by_algorithm_id.return_value = inputs([
+            {'input_id': '0192919b-2501-585f-1492-4f5d22c98267', 'input_type': 'integer'},
+            {'input_id': '01a14eb6-5d62-b802-7a97-5611303e1447', 'input_type': 'string'}])
+        invalid = [
+            [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": {"start": 10, "stop": 1}}],
+            [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": {"start": 1, "stop": 10, "step": 0}}],
+            [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": {"stop": 10}}],
+            [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": {"start": 1, "stop": 10 ** 9}}],
+            [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": []}],
+            [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": ["a"]}],
+            [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": "1-10"}],
+            [{"id": "01a14eb6-5d62-b802-7a97-5611303e1447", "sweep": [1, 2]}],
+            [{"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": [1, 2]},
+             {"id": "0192919b-2501-585f-1492-4f5d22c98267", "sweep": [1, 2]}],
+        ]
+        for input in invalid:
+            with self.assertRaises(ParamInvalid):
+                self.__controller_execution.add_sweep({"algorithm_id": "0192919b-2501-2fea-a93d-5d5541c4002b",
+                                                       "input": input})
+        self.assertFalse(mock_orm().orm.commit.called)
 
     @mock.patch("src.controllers.OrmConnect")
     def test_get(self, mock_orm):
@@ -79,12 +393,43 @@ class TestControllerExecution(BaseTestClass):
         self.assertTrue(mock_orm().orm.remove_session.called)
         self.assertIsNotNone(result)
 
+    @mock.patch("src.controllers.OrmConnect")
+    def test_get_query_count(self, mock_orm):
+        engine = sqlite_engine()
+        counts = []
+        for size in (1, 10):
+            with Session(engine) as session:
+                algorithm = Algorithm(name="mock_algorithm", description="mock_description", source="mock_source")
+                execution = Execution(alias="mock_alias", status=STATUS_DONE, algorithm=algorithm)
+                for i in range(size):
+                    input = Input(name=f"mock_input_{i}", input_type="integer", algorithm=algorithm)
+                    session.add(Payload(execution=execution, input_ref=input, input_value=str(i)))
+                    session.add(Result(execution=execution, criteria=Criteria(name=f"mock_criteria_{i}"),
+                                       status=STATUS_DONE, value=str(i)))
+                session.commit()
+                execution_id = str(execution.execution_id)
+            statements = []
+
+            def count(connection, cursor, statement, *args):
+                statements.append(statement)
+
+            event.listen(engine, "before_cursor_execute", count)
+            with Session(engine) as session:
+                mock_orm().orm.session = session
+                result = self.__controller_execution.get(execution_id)
+            event.remove(engine, "before_cursor_execute", count)
+            execution = result['executions'][0]
+            self.assertEqual(len(execution['payload']['input']), size)
+            self.assertEqual(sorted(r['value'] for r in execution['result']), sorted(str(i) for i in range(size)))
+            counts.append(len(statements))
+        self.assertEqual(counts, [4, 4])
+
     @mock.patch("src.controllers.OrmConnect")
     def test_list_objects(self, mock_orm):
         mock_executions = (1, "019774be-31d2-4ea9-1493-f0cd729e0406", "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
                            "Fibonacci sequence", "0195316d-80fc-40c2-b3ca-44a90d8c6851", "fibonacci number",
                            "100", "VALUE_100", "DONE", None, datetime.now(), "Running Time",
-                           "664.9029433", "secs", None, "DONE")
+                           "664.9029433", "secs", None, "DONE", None)
         mock_count = tuple([1]+[None]*(len(mock_executions)-1))
         mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
         params = {"amount": 100,
@@ -97,12 +442,49 @@ class TestControllerExecution(BaseTestClass):
         self.assertIn("total_items", result.keys())
         self.assertIsInstance(result['executions'][0]['result'], list)
 
+    @mock.patch("src.controllers.OrmConnect")
+    def test_list_objects_cursor(self, mock_orm):
+        created_at = datetime(2025, 3, 29, 3, 2, 53)
+        for size, sizes in ((7, [3, 3, 1]), (6, [3, 3])):
+            engine = sqlite_engine()
+            with Session(engine) as session:
+                algorithm = Algorithm(name="mock_algorithm", description="mock_description", source="mock_source")
+                session.add_all([Execution(alias=f"mock_alias_{i}", status=STATUS_DONE, algorithm=algorithm,
+                                           created_at=created_at.replace(minute=i // 2)) for i in range(size)])
+                session.commit()
+            with Session(engine) as session:
+                mock_orm().orm.session = session
+                mock_orm().orm.execute_query.side_effect = session.execute
+                offset_pages = [json.loads(self.__controller_execution.list_objects({"amount": 3, "page": page}))
+                                for page in range(len(sizes))]
+                cursor_pages = [json.loads(self.__controller_execution.list_objects({"amount": 3}))]
+                while cursor_pages[-1]["next_cursor"] is not None:
+                    cursor_pages.append(json.loads(self.__controller_execution.list_objects(
+                        {"amount": 3, "cursor": cursor_pages[-1]["next_cursor"]})))
+            # A last page that is exactly full has no next page
+            self.assertEqual([len(page["executions"]) for page in cursor_pages], sizes)
+            self.assertEqual([[e["execution_id"] for e in page["executions"]] for page in cursor_pages],
+                             [[e["execution_id"] for e in page["executions"]] for page in offset_pages])
+            executions = [e for page in cursor_pages for e in page["executions"]]
+            self.assertEqual(executions, sorted(executions, key=lambda e: (e["request_date"], e["execution_id"]),
+                                                reverse=True))
+            self.assertEqual([page["total_items"] for page in cursor_pages], [size] * len(sizes))
+            self.assertEqual(cursor_pages[0]["next_cursor"], cursor_pages[0]["executions"][-1]["execution_id"])
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_list_objects_cursor_not_found(self, mock_orm):
+        with Session(sqlite_engine()) as session:
+            mock_orm().orm.session = session
+            with self.assertRaises(ParamInvalid):
+                self.__controller_execution.list_objects({"amount": 3, "cursor": "0195dfda-3263-82cc-6b25-9a302b1df9b5"})
+        self.assertFalse(mock_orm().orm.execute_query.called)
+
     @mock.patch("src.controllers.OrmConnect")
     def test_list_objects_execution_id(self, mock_orm):
         mock_executions = (1, "019774be-31d2-4ea9-1493-f0cd729e0406", "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
                            "Fibonacci sequence", "0195316d-80fc-40c2-b3ca-44a90d8c6851", "fibonacci number",
                            "100", "VALUE_100", "DONE", None, datetime.now(), "Running Time",
-                           "664.9029433", "secs", None, "DONE")
+                           "664.9029433", "secs", None, "DONE", None)
         mock_count = tuple([1]+[None]*(len(mock_executions)-1))
         mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
         params = {"amount": 100,
@@ -121,7 +503,7 @@ class TestControllerExecution(BaseTestClass):
         mock_executions = (1, "019774be-31d2-4ea9-1493-f0cd729e0406", "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
                            "Fibonacci sequence", "0195316d-80fc-40c2-b3ca-44a90d8c6851", "fibonacci number",
                            "100", "VALUE_100", "DONE", None, datetime.now(), "Running Time",
-                           "664.9029433", "secs", None, "DONE")
+                           "664.9029433", "secs", None, "DONE", None)
         mock_count = tuple([1]+[None]*(len(mock_executions)-1))
         mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
         params = {"amount": 100,
@@ -140,7 +522,7 @@ class TestControllerExecution(BaseTestClass):
         mock_executions = (1, "019774be-31d2-4ea9-1493-f0cd729e0406", "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
                            "Fibonacci sequence", "0195316d-80fc-40c2-b3ca-44a90d8c6851", "fibonacci number",
                            "100", "VALUE_100", "DONE", None, datetime.now(), "Running Time",
-                           "664.9029433", "secs", None, "DONE")
+                           "664.9029433", "secs", None, "DONE", None)
         mock_count = tuple([1]+[None]*(len(mock_executions)-1))
         mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
         params = {"amount": 100,
@@ -159,7 +541,7 @@ class TestControllerExecution(BaseTestClass):
         mock_executions = (1, "019774be-31d2-4ea9-1493-f0cd729e0406", "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
                            "Fibonacci sequence", "0195316d-80fc-40c2-b3ca-44a90d8c6851", "fibonacci number",
                            "100", "VALUE_100", "DONE", None, datetime.now(), "Running Time",
-                           "664.9029433", "secs", None, "DONE")
+                           "664.9029433", "secs", None, "DONE", None)
         mock_count = tuple([1]+[None]*(len(mock_executions)-1))
         mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
         params = {"amount": 100,
@@ -178,7 +560,7 @@ class TestControllerExecution(BaseTestClass):
         mock_executions = (1, "019774be-31d2-4ea9-1493-f0cd729e0406", "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
                            "Fibonacci sequence", "0195316d-80fc-40c2-b3ca-44a90d8c6851", "fibonacci number",
                            "100", "VALUE_100", "DONE", None, datetime.now(), "Running Time",
-                           "664.9029433", "secs", None, "DONE")
+                           "664.9029433", "secs", None, "DONE", None)
         mock_count = tuple([1]+[None]*(len(mock_executions)-1))
         mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
         params = {"amount": 100,
@@ -197,7 +579,7 @@ class TestControllerExecution(BaseTestClass):
         mock_executions = (1, "019774be-31d2-4ea9-1493-f0cd729e0406", "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
                            "Fibonacci sequence", "0195316d-80fc-40c2-b3ca-44a90d8c6851", "fibonacci number",
                            "100", "VALUE_100", "DONE", None, datetime.now(), "Running Time",
-                           "664.9029433", "secs", None, "DONE")
+                           "664.9029433", "secs", None, "DONE", None)
         mock_count = tuple([1]+[None]*(len(mock_executions)-1))
         mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
         params = {"amount": 100,
@@ -216,7 +598,7 @@ class TestControllerExecution(BaseTestClass):
         mock_executions = (1, "019774be-31d2-4ea9-1493-f0cd729e0406", "0195316b-d5ca-431a-8d95-f3f65e3ec1dd",
                            "Fibonacci sequence", "0195316d-80fc-40c2-b3ca-44a90d8c6851", "fibonacci number",
                            "100", "VALUE_100", "DONE", None, datetime.now(), "Running Time",
-                           "664.9029433", "secs", None, "DONE")
+                           "664.9029433", "secs", None, "DONE", None)
         mock_count = tuple([1]+[None]*(len(mock_executions)-1))
         mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
         params = {"amount": 100,
@@ -230,12 +612,14 @@ class TestControllerExecution(BaseTestClass):
         self.assertIn("total_items", result.keys())
         self.assertIsInstance(result['executions'][0]['result'], list)
 
+    @mock.patch("src.controllers.result.ControllerResult")
     @mock.patch("src.controllers.execution.Evaluation")
     @mock.patch("src.controllers.execution.ControllerResult")
     @mock.patch("src.controllers.execution.ControllerCriteria")
     @mock.patch("src.controllers.execution.Codes")
     @mock.patch("src.controllers.OrmConnect")
-    def test_run(self, mock_orm, mock_code, mock_control_criteria, mock_control_result, mock_evaluation):
+    def test_run(self, mock_orm, mock_code, mock_control_criteria, mock_control_result, mock_evaluation,
+                 mock_batch_result):
         mock_algorithm = mock.MagicMock()
         mock_algorithm.get.return_value = {"algorithm_id": "mock_id", "name": "mock_algorithm"}
         mock_input = mock.MagicMock()
@@ -252,19 +636,219 @@ class TestControllerExecution(BaseTestClass):
         mock_orm().orm.session.query().filter_by.return_value = [mock_execution]
         mock_control_criteria().get_criteria_by_algorithm_id.return_value = [{"algorithm_name": "mock_algorithm", "criteria_id": "mock_criteria_id", "criteria_name": "mock_criteria_name"}]
         mock_control_criteria().get_instance.return_value = mock_criteria
-        mock_control_result().add.return_value = "mock_result_id"
+        mock_control_result().add_results.return_value = ["mock_result_id"]
         mock_base_evaluation = mock.MagicMock()
-        mock_evaluation().get_instance.return_value = mock_base_evaluation
+        mock_base_evaluation.process.side_effect = lambda code, payload, result_id, session, results: \
+            results.set_done_result({"result_id": result_id})
+        mock_evaluation.get_instance.return_value = mock_base_evaluation
         params = {
             "execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7",
+            "queue": "algorithm-analysis-service_execution_slow",
+            "queue_wait_secs": 12.5,
         }
         self.__controller_execution.run(params)
         result = mock_execution.get()
         self.assertEqual(result['status'], STATUS_DONE)
+        self.assertEqual((result['queue'], result['queue_wait_secs']), ("algorithm-analysis-service_execution_slow", 12.5))
+        mock_control_result().add_results.assert_called_once_with(params["execution_id"], ["mock_criteria_id"])
+        self.assertFalse(mock_control_result().add.called)
+        process = mock_base_evaluation.process.call_args
+        self.assertEqual(process.args[2], "mock_result_id")
+        self.assertIsInstance(process.args[4], ResultBatch)
+        mock_batch_result().set_progress_results.assert_called_once_with(["mock_result_id"])
         self.assertTrue(mock_orm().orm.session.query().filter_by.called)
         self.assertTrue(mock_orm().orm.object_commit.called)
         self.assertFalse(mock_orm().orm.remove_session.called)
 
+    @mock.patch("src.controllers.result.ControllerResult")
+    @mock.patch("src.controllers.execution.Evaluation")
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.execution.ControllerCriteria")
+    @mock.patch("src.controllers.execution.Codes")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_run_status_as_finish_fanout(self, mock_orm, mock_code, mock_control_criteria, mock_control_result,
+                                         mock_evaluation, mock_batch_result):
+        outcomes = {STATUS_DONE: lambda results, result_id: results.set_done_result({"result_id": result_id}),
+                    STATUS_WARNING: lambda results, result_id: results.set_warning_result({"result_id": result_id}),
+                    STATUS_ERROR: lambda results, result_id: results.set_error_result({"result_id": result_id})}
+        for statuses in ([STATUS_DONE, STATUS_DONE], [STATUS_DONE, STATUS_WARNING], [STATUS_WARNING, STATUS_ERROR]):
+            mock_execution = Execution()
+            mock_execution.algorithm = mock.MagicMock()
+            mock_execution.payload = mock.MagicMock()
+            mock_orm().orm.session.query().filter_by.return_value = [mock_execution]
+            mock_control_criteria().get_criteria_by_algorithm_id.return_value = [
+                {"criteria_id": f"mock_criteria_id_{i}", "criteria_name": "mock_criteria_name"} for i in range(2)]
+            mock_control_result().add_results.return_value = ["mock_result_id_0", "mock_result_id_1"]
+            status_by_result = dict(zip(mock_control_result().add_results.return_value, statuses))
+            mock_evaluation.get_instance().process.side_effect = lambda code, payload, result_id, session, results: \
+                outcomes[status_by_result[result_id]](results, result_id)
+            self.__controller_execution.run({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"})
+            fanned_out = Execution()
+            fanned_out.algorithm = mock.MagicMock()
+            fanned_out.payload = mock.MagicMock()
+            mock_orm().orm.session.query().filter_by.return_value = [fanned_out]
+            mock_control_result().get_statuses_by_execution_id.return_value = statuses
+            self.__controller_execution.finish_fanout({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"})
+            self.assertEqual((mock_execution.status, mock_execution.message), (fanned_out.status, fanned_out.message))
+            self.assertEqual(mock_execution.status, max(statuses, key=[STATUS_DONE, STATUS_WARNING, STATUS_ERROR].index))
+
+    @mock.patch("src.controllers.execution.Evaluation")
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.execution.ControllerCriteria")
+    @mock.patch("src.controllers.execution.Codes")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_run_criteria_by_probe(self, mock_orm, mock_code, mock_control_criteria, mock_control_result, mock_evaluation):
+        mock_algorithm = mock.MagicMock()
+        mock_algorithm.get.return_value = {"algorithm_id": "mock_id", "name": "mock_algorithm"}
+        mock_execution = Execution()
+        mock_execution.algorithm = mock_algorithm
+        mock_execution.payload = mock.MagicMock()
+        mock_orm().orm.session.query().filter_by.return_value = [mock_execution]
+        names = ["Running Time", "Count Nodes", "Memory Consume"]
+        mock_control_criteria().get_criteria_by_algorithm_id.return_value = [
+            {"algorithm_name": "mock_algorithm", "criteria_id": f"mock_criteria_id_{i}", "criteria_name": n}
+            for i, n in enumerate(names)]
+        evaluations = {n: mock.MagicMock(probe=p) for n, p in zip(names, (PROBE_TIMING, None, PROBE_RSS_SAMPLING))}
+        processed = []
+        for name, evaluation in evaluations.items():
+            evaluation.process.side_effect = lambda *args, name=name: processed.append((name, args[3]))
+        mock_evaluation.get_instance.side_effect = lambda name: evaluations[name]
+        mock_control_result().add_results.side_effect = lambda execution_id, criteria_ids: [f"result_{c}"
+                                                                                           for c in criteria_ids]
+        self.__controller_execution.run({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"})
+        self.assertEqual([p[0] for p in processed], ["Count Nodes", "Memory Consume", "Running Time"])
+        sessions = {id(p[1]) for p in processed}
+        self.assertEqual(len(sessions), 1)
+        self.assertIsInstance(processed[0][1], MeasurementSession)
+
+    @mock.patch("src.controllers.execution.ControllerPayload")
+    @mock.patch("src.controllers.execution.Evaluation")
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.execution.ControllerCriteria")
+    @mock.patch("src.controllers.execution.Codes")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_prepare_fanout(self, mock_orm, mock_code, mock_control_criteria, mock_control_result, mock_evaluation,
+                            mock_control_payload):
+        mock_algorithm = mock.MagicMock()
+        mock_algorithm.get.return_value = {"algorithm_id": "mock_id", "name": "mock_algorithm"}
+        mock_execution = Execution()
+        mock_execution.algorithm = mock_algorithm
+        mock_execution.payload = mock.MagicMock()
+        mock_orm().orm.session.query().filter_by.return_value = [mock_execution]
+        names = ["Running Time", "Count Nodes", "CPU Time", "Detect Cycle"]
+        mock_control_criteria().get_criteria_by_algorithm_id.return_value = [
+            {"algorithm_name": "mock_algorithm", "criteria_id": f"mock_criteria_id_{i}", "criteria_name": n}
+            for i, n in enumerate(names)]
+        probes = dict(zip(names, (PROBE_TIMING, None, PROBE_TIMING, None)))
+        mock_evaluation.get_instance.side_effect = lambda name: mock.MagicMock(probe=probes[name])
+        mock_control_result().add_results.return_value = [f"mock_result_id_{i}" for i in range(len(names))]
+        groups = self.__controller_execution.prepare_fanout({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"})
+        self.assertEqual(mock_execution.get()['status'], STATUS_PROCESSING)
+        mock_code.get_instance().setup.assert_called_once()
+        self.assertTrue(mock_control_payload().add_generated_inputs.called)
+        self.assertEqual([g["probe"] for g in groups], [None, None, PROBE_TIMING])
+        self.assertEqual([[r["criteria_name"] for r in g["results"]] for g in groups],
+                         [["Count Nodes"], ["Detect Cycle"], ["Running Time", "CPU Time"]])
+        self.assertEqual(groups[2]["results"][1]["result_id"], "mock_result_id_3")
+        mock_control_result().add_results.assert_called_once_with(
+            "21d88834-5021-5fff-a66f-0069f40ec3e7",
+            ["mock_criteria_id_1", "mock_criteria_id_3", "mock_criteria_id_0", "mock_criteria_id_2"])
+
+    @mock.patch("src.controllers.execution.Evaluation")
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.execution.Codes")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_run_criteria(self, mock_orm, mock_code, mock_control_result, mock_evaluation):
+        mock_algorithm = mock.MagicMock()
+        mock_algorithm.get.return_value = {"algorithm_id": "mock_id", "name": "mock_algorithm"}
+        mock_execution = Execution()
+        mock_execution.algorithm = mock_algorithm
+        mock_execution.payload = mock.MagicMock()
+        mock_orm().orm.session.query().filter_by.return_value = [mock_execution]
+        results = [{"result_id": "mock_result_id_0", "criteria_name": "Running Time"},
+                   {"result_id": "mock_result_id_1", "criteria_name": "CPU Time"}]
+        with mock.patch("src.controllers.execution.MeasurementSession", wraps=MeasurementSession) as mock_session:
+            self.__controller_execution.run_criteria({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7",
+                                                      "results": results})
+        self.assertEqual(mock_session.call_args.kwargs["lock"], "21d88834-5021-5fff-a66f-0069f40ec3e7")
+        mock_code.get_instance().setup.assert_called_once()
+        calls = mock_evaluation.get_instance().process.call_args_list
+        self.assertEqual([c.args[2] for c in calls], ["mock_result_id_0", "mock_result_id_1"])
+        self.assertIs(calls[0].args[3], calls[1].args[3])
+        self.assertFalse(mock_control_result().set_error_result.called)
+
+    @mock.patch("src.controllers.execution.Evaluation")
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.execution.Codes")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_run_criteria_setup_error(self, mock_orm, mock_code, mock_control_result, mock_evaluation):
+        mock_algorithm = mock.MagicMock()
+        mock_algorithm.get.return_value = {"algorithm_id": "mock_id", "name": "mock_algorithm"}
+        mock_execution = Execution()
+        mock_execution.algorithm = mock_algorithm
+        mock_execution.payload = mock.MagicMock()
+        mock_orm().orm.session.query().filter_by.return_value = [mock_execution]
+        mock_code.get_instance().setup.side_effect = MemoryError("mock")
+        results = [{"result_id": "mock_result_id_0", "criteria_name": "Count Nodes"}]
+        self.__controller_execution.run_criteria({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7",
+                                                  "results": results})
+        mock_orm().orm.bulk_update_mappings.assert_called_once_with(Result, [{"result_id": "mock_result_id_0",
+                                                                              "status": STATUS_ERROR,
+                                                                              "message": "mock"}])
+        self.assertFalse(mock_orm().orm.session.execute.called)
+        self.assertFalse(mock_evaluation.get_instance().process.called)
+
+    @mock.patch("src.controllers.execution.CpuLock")
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_finish_fanout(self, mock_orm, mock_control_result, mock_lock):
+        cases = ((["DONE", "DONE"], STATUS_DONE, None),
+                 (["DONE", "WARNING"], STATUS_WARNING, "1 of 2 criteria exceeded a limit"),
+                 (["ERROR", "WARNING", "DONE"], STATUS_ERROR, "1 of 3 criteria failed"),
+                 (["DONE", "QUEUE"], STATUS_ERROR, "1 of 2 criteria failed"))
+        for statuses, status, message in cases:
+            mock_execution = Execution()
+            mock_execution.algorithm = mock.MagicMock()
+            mock_execution.payload = mock.MagicMock()
+            mock_orm().orm.session.query().filter_by.return_value = [mock_execution]
+            mock_control_result().get_statuses_by_execution_id.return_value = statuses
+            self.__controller_execution.finish_fanout({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"})
+            self.assertEqual(mock_execution.status, status)
+            self.assertEqual(mock_execution.message, message)
+        mock_lock.discard.assert_called_with("21d88834-5021-5fff-a66f-0069f40ec3e7")
+
+    @mock.patch.multiple("src.evaluation.sandbox.config_app", SANDBOX_ENABLED=False)
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.execution.ControllerCriteria")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_run_memory_returns_to_baseline(self, mock_orm, mock_control_criteria, mock_control_result):
+        num_nodes = 16_000  # 256 MB matrix without edges, Dijkstra stops after the source
+
+        def setup(payload: list, sparse: bool = False):
+            graph = np.full((num_nodes, num_nodes), 0, dtype=np.uint8)
+            payload.extend([{'input': {'name': 'source', 'input_type': 'integer'}, 'input_value': 0},
+                            {'input': {'name': 'target', 'input_type': 'integer'}, 'input_value': num_nodes - 1},
+                            {'input': {'name': 'graph', 'input_type': 'ndarray'}, 'input_value': graph}])
+
+        mock_algorithm = mock.MagicMock()
+        mock_algorithm.get.return_value = {"algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5", "name": "Dijkstra"}
+        mock_execution = Execution()
+        mock_execution.algorithm = mock_algorithm
+        mock_execution.payload = mock.MagicMock()
+        mock_orm().orm.session.query().filter_by.return_value = [mock_execution]
+        mock_control_criteria().get_criteria_by_algorithm_id.return_value = [
+            {"algorithm_name": "Dijkstra", "criteria_id": "01a14ebf-aed2-b569-5566-5f3e51e6c4ea",
+             "criteria_name": "Peak Memory Allocation"}]
+        mock_control_result().add_results.return_value = ["mock_result_id"]
+        gc.collect()
+        baseline = current_rss()
+        with mock.patch("src.codes.dijkstra.Dijkstra.setup", side_effect=setup):
+            self.__controller_execution.run({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"})
+        mappings = mock_orm().orm.bulk_update_mappings.call_args.args[1]
+        self.assertEqual([(m["result_id"], m["status"]) for m in mappings], [("mock_result_id", STATUS_DONE)])
+        gc.collect()
+        self.assertLess(current_rss() - baseline, 32 * 2 ** 20)
+
     @mock.patch("src.controllers.OrmConnect")
     def test_run_invalid_execution_object(self, mock_orm):
         mock_orm().orm.session.query().filter_by.return_value = [None]
@@ -367,7 +951,96 @@ class TestControllerExecution(BaseTestClass):
         self.assertFalse(mock_orm().orm.object_commit.called)
         self.assertFalse(mock_orm().orm.remove_session.called)
 
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_estimate(self, mock_orm, mock_result):
+        algorithm_id, input_id = "0192919b-2501-91c1-d4bb-c71b4c0785d5", "0192919b-2501-59d0-d088-50be8a4e5ae6"
+        mock_result().estimate_series.return_value = [
+            (algorithm_id, "001fe2d3-09a5-4bc0-b891-45d475a4b1bc", "Running Time", input_id, n, 1e-6 * n ** 2, "secs")
+            for n in (100, 200, 400, 800)]
+        self.__controller_execution.refresh_estimates()
+        params = {"algorithm_id": algorithm_id,
+                  "input": [{"id": input_id, "value": "1000"},
+                            {"id": "01a14eb6-5d62-b802-7a97-5611303e1447", "value": "complete"}]}
+        result = json.loads(self.__controller_execution.estimate(params))
+        self.assertEqual(result["algorithm_id"], algorithm_id)
+        self.assertEqual(len(result["estimates"]), 1)
+        estimate = result["estimates"][0]
+        self.assertEqual(estimate["input_id"], input_id)
+        self.assertEqual(estimate["input_value"], 1000)
+        self.assertEqual(estimate["criteria"], "Running Time")
+        self.assertEqual(estimate["complexity"], "O(n^2)")
+        self.assertAlmostEqual(float(estimate["value"]), 1.0)
+        # The models are refreshed apart and served from memory, the requests do not query the results
+        self.__controller_execution.estimate(params)
+        self.assertEqual(mock_result().estimate_series.call_count, 1)
+
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_estimate_upper_case_ids(self, mock_orm, mock_result):
+        algorithm_id, input_id = "0192919b-2501-91c1-d4bb-c71b4c0785d5", "0192919b-2501-59d0-d088-50be8a4e5ae6"
+        mock_result().estimate_series.return_value = [
+            (algorithm_id, "001fe2d3-09a5-4bc0-b891-45d475a4b1bc", "Running Time", input_id, n, 1e-6 * n ** 2, "secs")
+            for n in (100, 200, 400, 800)]
+        self.__controller_execution.refresh_estimates()
+        params = {"algorithm_id": algorithm_id.upper(),
+                  "input": [{"id": input_id.upper(), "value": "1000"}]}
+        result = json.loads(self.__controller_execution.estimate(params))
+        self.assertEqual(len(result["estimates"]), 1)
+        self.assertAlmostEqual(float(result["estimates"][0]["value"]), 1.0)
+
+    @mock.patch("src.controllers.execution.ControllerResult")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_estimate_without_history(self, mock_orm, mock_result):
+        mock_result().estimate_series.return_value = []
+        self.__controller_execution.refresh_estimates()
+        params = {"algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+                  "input": [{"id": "0192919b-2501-59d0-d088-50be8a4e5ae6", "value": "1000"}]}
+        result = json.loads(self.__controller_execution.estimate(params))
+        self.assertEqual(result["estimates"], [])
+
     @mock.patch("src.controllers.OrmConnect")
     def test_db_disconnect(self, mock_orm,):
         self.__controller_execution.db_disconnect()
         self.assertTrue(mock_orm().orm.remove_session.called)
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_run_sweep(self, mock_orm):
+        controller = self.__controller_execution
+        params = {"execution_ids": ["21d88834-5021-5fff-a66f-0069f40ec3e7", "21d88834-5021-5fff-a66f-0069f40ec3e8",
+                                    "21d88834-5021-5fff-a66f-0069f40ec3e9"],
+                  "queue": "algorithm-analysis-service_execution", "queue_wait_secs": 0.5}
+        with mock.patch.object(ControllerExecution, "run", side_effect=[None, Exception("mock"), None]) as mock_run, \
+                mock.patch.object(ControllerExecution, "set_error_execution") as mock_set_error:
+            controller.run_sweep(params)
+        self.assertEqual([c.args[0]["execution_id"] for c in mock_run.call_args_list], params["execution_ids"])
+        self.assertEqual({c.args[0]["queue_wait_secs"] for c in mock_run.call_args_list}, {0.5})
+        mock_set_error.assert_called_once_with({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e8", "error": "mock"})
+        self.assertTrue(mock_orm().orm.single_session.called)
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_run_sweep_db_error(self, mock_orm):
+        engine = sqlite_engine()
+        with Session(engine) as session:
+            algorithm = Algorithm(name="mock_algorithm", description="mock_description", source="mock_source")
+            executions = [Execution(alias="mock_alias", status=STATUS_PROCESSING, algorithm=algorithm) for _ in range(2)]
+            session.add_all(executions)
+            session.commit()
+            execution_ids = [str(e.execution_id) for e in executions]
+
+        def run(params):
+            if params["execution_id"] == execution_ids[0]:
+                session.add(Input(algorithm_id=None))  # Fails the flush, the transaction must be rolled back
+                session.flush()
+            execution = session.query(Execution).filter_by(execution_id=params["execution_id"]).one()
+            execution.status = STATUS_DONE
+            session.commit()
+
+        with Session(engine) as session:
+            mock_orm().orm.session = session
+            mock_orm().orm.object_commit.side_effect = lambda obj: (session.add(obj), session.commit())
+            with mock.patch.object(ControllerExecution, "run", side_effect=run):
+                self.__controller_execution.run_sweep({"execution_ids": execution_ids})
+        with Session(engine) as session:
+            statuses = [session.query(Execution).filter_by(execution_id=e).one().status for e in execution_ids]
+        self.assertEqual(statuses, [STATUS_ERROR, STATUS_DONE])
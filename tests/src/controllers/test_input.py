@@ -25,7 +25,7 @@ class TestControllerInput(BaseTestClass):
     
     @mock.patch("src.controllers.OrmConnect")
     def test_get_input_by_algorithm_id(self, mock_orm):
-        mock_query_result = ("mock_input_id", "mock_input_type", "mock_name", "mock_description")
+        mock_query_result = ("mock_input_id", "mock_input_type", "mock_name", "mock_description", False)
         mock_orm().orm.session.query().filter.return_value = [mock_query_result]
         p_id = "4a00110b-8fbd-4e1d-81da-169e259f92d4"
         result = self.__controller_input.get_input_by_algorithm_id(p_id)
@@ -38,3 +38,13 @@ class TestControllerInput(BaseTestClass):
         self.assertIn('input_type', result.keys())
         self.assertIn('name', result.keys())
         self.assertIn('description', result.keys())
+        self.assertFalse(result['required'])
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_get_instances_by_algorithm_id(self, mock_orm):
+        mock_orm().orm.session.query().filter().all.return_value = [Input(), Input()]
+        p_id = "4a00110b-8fbd-4e1d-81da-169e259f92d4"
+        result = self.__controller_input.get_instances_by_algorithm_id(p_id)
+        self.assertTrue(mock_orm().orm.remove_session.called)
+        self.assertEqual(len(result), 2)
+        self.assertIsInstance(result[0], Input)
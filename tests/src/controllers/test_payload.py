@@ -6,6 +6,8 @@ from src.models.tb_execution import Execution
 from src.models.tb_input import Input
 from src.models.tb_payload import Payload
 from tests import BaseTestClass
+from tests.src.controllers import inputs
+
 
 class TestControllerPayload(BaseTestClass):
     
@@ -43,10 +45,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'bool',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertFalse(mock_orm().orm.object_commit.called)
+        self.assertFalse(mock_orm().orm.session.add_all.called)
         self.assertFalse(result)
     
     @mock.patch("src.controllers.payload.ControllerInput")
@@ -61,10 +62,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'not_exist',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertFalse(mock_orm().orm.object_commit.called)
+        self.assertFalse(mock_orm().orm.session.add_all.called)
         self.assertFalse(result)
 
     @mock.patch("src.controllers.payload.ControllerInput")
@@ -79,10 +79,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'bool',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertFalse(mock_orm().orm.object_commit.called)
+        self.assertFalse(mock_orm().orm.session.add_all.called)
         self.assertFalse(result)
 
     @mock.patch("src.controllers.payload.ControllerInput")
@@ -97,10 +96,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'bool',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertTrue(mock_orm().orm.object_commit.called)
+        self.assertTrue(mock_orm().orm.session.add_all.called)
         self.assertTrue(result)
 
     @mock.patch("src.controllers.payload.ControllerInput")
@@ -115,10 +113,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'bool',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertTrue(mock_orm().orm.object_commit.called)
+        self.assertTrue(mock_orm().orm.session.add_all.called)
         self.assertTrue(result)
 
     @mock.patch("src.controllers.payload.ControllerInput")
@@ -133,10 +130,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'bool',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()        
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertFalse(mock_orm().orm.object_commit.called)
+        self.assertFalse(mock_orm().orm.session.add_all.called)
         self.assertFalse(result)
 
     @mock.patch("src.controllers.payload.ControllerInput")
@@ -151,10 +147,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'integer',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertTrue(mock_orm().orm.object_commit.called)
+        self.assertTrue(mock_orm().orm.session.add_all.called)
         self.assertTrue(result)
 
     @mock.patch("src.controllers.payload.ControllerInput")
@@ -169,10 +164,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'int',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertTrue(mock_orm().orm.object_commit.called)
+        self.assertTrue(mock_orm().orm.session.add_all.called)
         self.assertTrue(result)
 
     @mock.patch("src.controllers.payload.ControllerInput")
@@ -187,10 +181,9 @@ class TestControllerPayload(BaseTestClass):
                        'input_type': 'float',
                        'name': 'factorial number',
                        'description': 'number to calculate factorial'}]                
-        mock_cont_input().get_input_by_algorithm_id.return_value = mock_input
-        mock_cont_input().get_instance.return_value = Input()
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
         result = self.__controller_payload.add(params, mock_execution)
-        self.assertTrue(mock_orm().orm.object_commit.called)
+        self.assertTrue(mock_orm().orm.session.add_all.called)
         self.assertTrue(result)
 
     @mock.patch("src.controllers.OrmConnect")
@@ -198,5 +191,99 @@ class TestControllerPayload(BaseTestClass):
         mock_execution = mock.Mock(spec=Execution)
         params = {}
         result = self.__controller_payload.add(params, mock_execution)
+        self.assertFalse(mock_orm().orm.session.add_all.called)
+        self.assertFalse(result)
+
+    @mock.patch("src.controllers.payload.ControllerInput")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_payload_optional_input_missing(self, mock_orm, mock_cont_input):
+        mock_execution = Execution()
+        params = {'algorithm_id': '0192919b-2501-91c1-d4bb-c71b4c0785d5',
+                  'input': [{'id': '0192919b-2501-59d0-d088-50be8a4e5ae6', 'value': '20'}],
+                  'alias': 'Execution_2025_06_10_20_40_35',
+                  'algorithm': Algorithm()}
+        mock_input = [{'input_id': '0192919b-2501-59d0-d088-50be8a4e5ae6',
+                       'input_type': 'integer',
+                       'name': 'number of nodes',
+                       'description': 'number of nodes to build a random graph',
+                       'required': True},
+                      {'input_id': '01a14eb2-b92f-2725-bd10-7d2b8a8309df',
+                       'input_type': 'integer',
+                       'name': 'seed',
+                       'description': 'seed of the random graph generator',
+                       'required': False}]
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
+        result = self.__controller_payload.add(params, mock_execution)
+        self.assertTrue(mock_orm().orm.session.add_all.called)
+        self.assertTrue(result)
+
+    @mock.patch("src.controllers.payload.ControllerInput")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_payload_optional_input_invalid(self, mock_orm, mock_cont_input):
+        mock_execution = Execution()
+        params = {'algorithm_id': '0192919b-2501-91c1-d4bb-c71b4c0785d5',
+                  'input': [{'id': '0192919b-2501-59d0-d088-50be8a4e5ae6', 'value': '20'},
+                            {'id': '01a14eb2-b92f-2725-bd10-7d2b8a8309df', 'value': 'invalid'}],
+                  'alias': 'Execution_2025_06_10_20_40_35',
+                  'algorithm': Algorithm()}
+        mock_input = [{'input_id': '0192919b-2501-59d0-d088-50be8a4e5ae6',
+                       'input_type': 'integer',
+                       'name': 'number of nodes',
+                       'description': 'number of nodes to build a random graph',
+                       'required': True},
+                      {'input_id': '01a14eb2-b92f-2725-bd10-7d2b8a8309df',
+                       'input_type': 'integer',
+                       'name': 'seed',
+                       'description': 'seed of the random graph generator',
+                       'required': False}]
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
+        result = self.__controller_payload.add(params, mock_execution)
+        self.assertFalse(mock_orm().orm.session.add_all.called)
+        self.assertFalse(result)
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_generated_inputs(self, mock_orm):
+        mock_algorithm = Algorithm()
+        mock_execution = Execution()
+        mock_execution.algorithm = mock_algorithm
+        for name, required in (('number of nodes', True), ('seed', False)):
+            input = Input()
+            input.add({'name': name, 'description': 'mock_description', 'input_type': 'integer',
+                       'required': required, 'algorithm': mock_algorithm})
+            input.input_id = '01a14eb2-b92f-2725-bd10-7d2b8a8309df' if name == 'seed' else None
+            input.enabled = True
+        payload = [{'payload_id': 'mock_payload_id', 'input_value': '20',
+                    'input': {'input_id': '0192919b-2501-59d0-d088-50be8a4e5ae6', 'name': 'number of nodes'}},
+                   {'payload_id': None, 'input_value': 42, 'input': {'input_id': None, 'name': 'seed'}},
+                   {'payload_id': None, 'input_value': [[0]], 'input': {'input_id': None, 'name': 'graph'}}]
+        self.__controller_payload.add_generated_inputs(mock_execution, payload)
+        self.assertEqual(mock_orm().orm.commit.call_count, 1)
+        added = mock_orm().orm.session.add_all.call_args[0][0]
+        self.assertEqual(len(added), 1)
+        self.assertIsInstance(added[0], Payload)
+        self.assertEqual(added[0].input_value, '42')
+        self.assertEqual(payload[1]['payload_id'], str(added[0].payload_id))
+        self.assertIsNotNone(payload[1]['payload_id'])
+        self.assertEqual(payload[1]['input']['input_id'], '01a14eb2-b92f-2725-bd10-7d2b8a8309df')
+        self.assertIsNone(payload[2]['payload_id'])
+
+    @mock.patch("src.controllers.payload.ControllerInput")
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_payload_bulk(self, mock_orm, mock_cont_input):
+        mock_execution = Execution()
+        mock_input = [{'input_id': f'0192919b-2501-585f-1492-4f5d22c9826{i}',
+                       'input_type': 'integer',
+                       'name': f'input {i}',
+                       'description': None} for i in range(5)]
+        params = {'algorithm_id': '0192919b-2501-2fea-a93d-5d5541c4002b',
+                  'input': [{'id': i['input_id'], 'value': str(n)} for n, i in enumerate(mock_input)]}
+        mock_cont_input().get_instances_by_algorithm_id.return_value = inputs(mock_input)
+        self.assertTrue(self.__controller_payload.add(params, mock_execution))
+        mock_cont_input().get_instances_by_algorithm_id.assert_called_once_with(params['algorithm_id'])
+        self.assertFalse(mock_cont_input().get_instance.called)
+        self.assertFalse(mock_orm().orm.commit.called)
         self.assertFalse(mock_orm().orm.object_commit.called)
-        self.assertFalse(result)
\ No newline at end of file
+        added = mock_orm().orm.session.add_all.call_args[0][0]
+        self.assertEqual([p.input_ref.name for p in added], [i['name'] for i in mock_input])
+        self.assertEqual(len({p.payload_id for p in added}), 5)
+        self.assertTrue(all(p.execution is mock_execution for p in added))
@@ -1,9 +1,10 @@
 import json
 import mock
 from datetime import datetime
+from decimal import Decimal
 from src.common import Singleton
-from src.controllers.result import ControllerResult
-from src.exceptions import ObjectNotFound
+from src.controllers.result import ControllerResult, ResultBatch
+from src.exceptions import ObjectNotFound, ParamInvalid
 from src.models.tb_criteria import Criteria
 from src.models.tb_execution import Execution
 from src.models.tb_result import Result, STATUS_DONE, STATUS_ERROR, STATUS_PROCESSING, STATUS_WARNING
@@ -37,6 +38,88 @@ class TestControllerResult(BaseTestClass):
         self.assertIn("total_items", result.keys())
         self.assertIsInstance(result['report'], list)
 
+    @mock.patch("src.controllers.OrmConnect")
+    def test_report_statistics(self, mock_orm):
+        mock_executions = (0, "5", "0.000002165000000000000000", "secs",
+                           "0.000002", "0.000002165", "0.000002170", "0.000002300", "0.0000001")
+        mock_count = tuple([1]+[None]*(len(mock_executions)-1))
+        mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
+        params = {"amount": 100,
+                  "page": 0,
+                  "algorithm_id": "00195316b-d5ca-431a-8d95-f3f65e3ec1dd",
+                  "criteria_id": '001fe2d3-09a5-4bc0-b891-45d475a4b1bc',
+                  "input_id": "0195316d-80fc-40c2-b3ca-44a90d8c6851"}
+        result = json.loads(self.__controller_result.report(params))
+        statistics = result['report'][0]['statistics']
+        self.assertEqual(set(statistics.keys()), {"min", "median", "mean", "p95", "stddev"})
+        self.assertEqual(statistics["median"], "0.000002165")
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_report_without_statistics(self, mock_orm):
+        mock_executions = (0, "5", "1024", "bytes", None, None, None, None, None)
+        mock_count = tuple([1]+[None]*(len(mock_executions)-1))
+        mock_orm().orm.execute_query.return_value= [mock_executions, mock_count]
+        params = {"amount": 100,
+                  "page": 0,
+                  "algorithm_id": "00195316b-d5ca-431a-8d95-f3f65e3ec1dd",
+                  "criteria_id": 'f6465865-d1a3-496c-82b7-5d7d67adf927',
+                  "input_id": "0195316d-80fc-40c2-b3ca-44a90d8c6851"}
+        result = json.loads(self.__controller_result.report(params))
+        self.assertIsNone(result['report'][0]['statistics'])
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_complexity_report(self, mock_orm):
+        sizes = [100, 200, 400, 800, 1600]
+        mock_orm().orm.execute_query.return_value = [(n, Decimal(str(0.01 + 3e-7 * n ** 2)), "secs") for n in sizes]
+        params = {"algorithm_id": "0192919b-2501-91c1-d4bb-c71b4c0785d5",
+                  "criteria_id": "001fe2d3-09a5-4bc0-b891-45d475a4b1bc",
+                  "input_id": "0192919b-2501-59d0-d088-50be8a4e5ae6",
+                  "n": 10000}
+        result = json.loads(self.__controller_result.complexity_report(params))
+        self.assertTrue(mock_orm().orm.remove_session.called)
+        self.assertEqual(result["unit"], "secs")
+        self.assertEqual(result["points"], len(sizes))
+        self.assertEqual(result["best"]["complexity"], "O(n^2)")
+        self.assertEqual(len(result["models"]), 6)  # phi^n and 2^n are left out past n=1000
+        self.assertEqual(result["prediction"]["n"], 10000)
+        self.assertAlmostEqual(float(result["prediction"]["value"]), 30.01)
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_complexity_report_without_n(self, mock_orm):
+        mock_orm().orm.execute_query.return_value = [(n, Decimal(n), "bytes") for n in (10, 20, 30)]
+        result = json.loads(self.__controller_result.complexity_report({}))
+        self.assertEqual(result["best"]["complexity"], "O(n)")
+        self.assertIsNone(result["prediction"])
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_complexity_report_too_few_points(self, mock_orm):
+        mock_orm().orm.execute_query.return_value = [(10, Decimal(1), "secs")]
+        with self.assertRaises(ParamInvalid):
+            self.__controller_result.complexity_report({})
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_complexity_report_units(self, mock_orm):
+        mock_orm().orm.execute_query.return_value = [(10, Decimal(1), "secs"), (20, Decimal(2), "MiB"),
+                                                     (30, Decimal(3), "secs")]
+        with self.assertRaises(ParamInvalid):
+            self.__controller_result.complexity_report({})
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_estimate_series(self, mock_orm):
+        row = ("0192919b-2501-91c1-d4bb-c71b4c0785d5", "001fe2d3-09a5-4bc0-b891-45d475a4b1bc", "Running Time",
+               "0192919b-2501-59d0-d088-50be8a4e5ae6", 100, Decimal("0.01"), "secs")
+        mock_orm().orm.execute_query.return_value = [row]
+        result = self.__controller_result.estimate_series()
+        self.assertEqual(result, [row])
+        self.assertTrue(mock_orm().orm.remove_session.called)
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_get_statuses_by_execution_id(self, mock_orm):
+        mock_orm().orm.session.query().filter_by.return_value = [("DONE",), ("WARNING",)]
+        result = self.__controller_result.get_statuses_by_execution_id("21d88834-5021-5fff-a66f-0069f40ec3e7")
+        self.assertEqual(result, ["DONE", "WARNING"])
+        self.assertTrue(mock_orm().orm.remove_session.called)
+
     @mock.patch("src.controllers.OrmConnect")
     def test_report_request_date(self, mock_orm):
         mock_executions = (1, "5", "0.000002165000000000000000", "secs")
@@ -108,6 +191,64 @@ class TestControllerResult(BaseTestClass):
         self.assertTrue(mock_orm().orm.object_commit.called)
         self.assertTrue(mock_orm().orm.remove_session.called)
 
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_results(self, mock_orm):
+        execution_id = "21d88834-5021-5fff-a66f-0069f40ec3e7"
+        result_ids = self.__controller_result.add_results(execution_id, ["criteria_0", "criteria_1", "criteria_2"])
+        self.assertEqual(len(set(result_ids)), 3)
+        mock_orm().orm.session.execute.assert_called_once()
+        smt = mock_orm().orm.session.execute.call_args.args[0]
+        self.assertEqual(smt.table, Result.__table__)
+        self.assertEqual(len(smt._multi_values[0]), 3)
+        self.assertEqual(mock_orm().orm.commit.call_count, 1)
+        self.assertFalse(mock_orm().orm.object_commit.called)
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_add_results_empty(self, mock_orm):
+        self.assertEqual(self.__controller_result.add_results("21d88834-5021-5fff-a66f-0069f40ec3e7", []), [])
+        self.assertFalse(mock_orm().orm.session.execute.called)
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_set_progress_results(self, mock_orm):
+        self.__controller_result.set_progress_results(["result_0", "result_1"])
+        mock_orm().orm.session.execute.assert_called_once()
+        self.assertIn("UPDATE", str(mock_orm().orm.session.execute.call_args.args[0]))
+        self.assertEqual(mock_orm().orm.commit.call_count, 1)
+        self.assertFalse(mock_orm().orm.session.query.called)
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_result_batch(self, mock_orm):
+        batch = ResultBatch(["result_0", "result_1", "result_2"])
+        batch.start()
+        for result_id in ("result_0", "result_1", "result_2"):
+            batch.set_progress_result({"result_id": result_id})
+        batch.set_done_result({"result_id": "result_0", "value": "1", "unit": "secs", "message": None,
+                               "statistics": {"min": 1.0}})
+        batch.set_warning_result({"result_id": "result_1", "warning": "mock_warning"})
+        batch.set_error_result({"result_id": "result_2", "error": "mock_error"})
+        self.assertFalse(mock_orm().orm.bulk_update_mappings.called)
+        batch.flush()
+        batch.flush()
+        mock_orm().orm.bulk_update_mappings.assert_called_once_with(Result, [
+            {"result_id": "result_0", "status": STATUS_DONE, "value": "1", "unit": "secs", "message": None,
+             "statistics": {"min": 1.0}},
+            {"result_id": "result_1", "status": STATUS_WARNING, "message": "mock_warning"},
+            {"result_id": "result_2", "status": STATUS_ERROR, "message": "mock_error"}])
+        self.assertEqual(mock_orm().orm.session.execute.call_count, 1)
+        self.assertFalse(mock_orm().orm.session.query.called)
+        self.assertEqual(batch.statuses, [STATUS_DONE, STATUS_WARNING, STATUS_ERROR])
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_result_batch_statuses_unprocessed(self, mock_orm):
+        batch = ResultBatch(["result_0", "result_1"])
+        batch.set_done_result({"result_id": "result_1"})
+        self.assertEqual(batch.statuses, [STATUS_PROCESSING, STATUS_DONE])
+
+    @mock.patch("src.controllers.OrmConnect")
+    def test_result_batch_invalid_statistics(self, mock_orm):
+        with self.assertRaises(ParamInvalid):
+            ResultBatch(["result_0"]).set_done_result({"result_id": "result_0", "statistics": [1.0]})
+
     @mock.patch("src.controllers.OrmConnect")
     def test_set_done_result(self, mock_orm):
         mock_criteria = mock.MagicMock()
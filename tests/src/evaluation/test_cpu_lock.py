@@ -0,0 +1,55 @@
+import fcntl
+import os
+import tempfile
+
+from src.evaluation.cpu_lock import CpuLock
+from tests import BaseTestClass
+
+
+class TestCpuLock(BaseTestClass):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+        self.__locks = os.path.join(self.__dir.name, "locks")
+        self.__path = os.path.join(self.__locks, "mock_execution.lock")
+
+    def tearDown(self):
+        self.__dir.cleanup()
+
+    def __try_lock(self, operation: int) -> bool:
+        fd = os.open(self.__path, os.O_RDWR)
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+        finally:
+            os.close(fd)
+
+    def test_shared(self):
+        with CpuLock(exclusive=False, name="mock_execution", directory=self.__locks), CpuLock(exclusive=False, name="mock_execution", directory=self.__locks):
+            self.assertTrue(self.__try_lock(fcntl.LOCK_SH))
+            self.assertFalse(self.__try_lock(fcntl.LOCK_EX))
+        self.assertTrue(self.__try_lock(fcntl.LOCK_EX))
+
+    def test_exclusive(self):
+        with CpuLock(exclusive=True, name="mock_execution", directory=self.__locks):
+            self.assertFalse(self.__try_lock(fcntl.LOCK_SH))
+        self.assertTrue(self.__try_lock(fcntl.LOCK_SH))
+
+    def test_disabled(self):
+        with CpuLock(exclusive=True, name="mock_execution", directory=""):
+            pass
+        self.assertFalse(os.path.exists(self.__path))
+
+    def test_per_name(self):
+        with CpuLock(exclusive=True, name="mock_execution", directory=self.__locks):
+            with CpuLock(exclusive=True, name="mock_other_execution", directory=self.__locks):
+                self.assertFalse(self.__try_lock(fcntl.LOCK_SH))
+
+    def test_discard(self):
+        with CpuLock(exclusive=True, name="mock_execution", directory=self.__locks):
+            pass
+        CpuLock.discard("mock_execution", directory=self.__locks)
+        self.assertFalse(os.path.exists(self.__path))
+        CpuLock.discard("mock_execution", directory=self.__locks)
@@ -1,7 +1,13 @@
 import mock
+import tracemalloc
+
+import numpy as np
+
 from src.common import Singleton
+from src.codes import Codes
 from src.evaluation import Evaluation
 from src.codes.base import BaseCode
+from src.codes.graph import CSRGraph
 from src.evaluation.base import BaseEvaluation
 
 from tests import BaseTestClass
@@ -37,6 +43,10 @@ class TestEvaluation(BaseTestClass):
         with self.assertRaises(NotImplementedError):
             BaseEvaluation().run(BaseCode(), {})
 
+    def test_get_connected_components(self):
+        evaluation = self.__evaluation.get_instance("Connected Components")
+        self.assertIsInstance(evaluation, BaseEvaluation)
+
     def test_get_count_edges(self):
         evaluation = self.__evaluation.get_instance("Count Edges")
         self.assertIsInstance(evaluation, BaseEvaluation)
@@ -45,6 +55,18 @@ class TestEvaluation(BaseTestClass):
         evaluation = self.__evaluation.get_instance("Count Nodes")
         self.assertIsInstance(evaluation, BaseEvaluation)
     
+    def test_get_cpu_time(self):
+        evaluation = self.__evaluation.get_instance("CPU Time")
+        self.assertIsInstance(evaluation, BaseEvaluation)
+
+    def test_get_degree(self):
+        evaluation = self.__evaluation.get_instance("Degree")
+        self.assertIsInstance(evaluation, BaseEvaluation)
+
+    def test_get_density(self):
+        evaluation = self.__evaluation.get_instance("Density")
+        self.assertIsInstance(evaluation, BaseEvaluation)
+
     def test_get_detect_cycle(self):
         evaluation = self.__evaluation.get_instance("Detect Cycle")
         self.assertIsInstance(evaluation, BaseEvaluation)
@@ -53,10 +75,69 @@ class TestEvaluation(BaseTestClass):
         evaluation = self.__evaluation.get_instance("Memory Consume")
         self.assertIsInstance(evaluation, BaseEvaluation)
 
+    def test_get_peak_memory(self):
+        evaluation = self.__evaluation.get_instance("Peak Memory Allocation")
+        self.assertIsInstance(evaluation, BaseEvaluation)
+
     def test_get_running_time(self):
         evaluation = self.__evaluation.get_instance("Running Time")
         self.assertIsInstance(evaluation, BaseEvaluation)
 
+    def test_get_weight_histogram(self):
+        evaluation = self.__evaluation.get_instance("Weight Histogram")
+        self.assertIsInstance(evaluation, BaseEvaluation)
+
+    def test_run_structural(self):
+        graph = [[0, 4, 0, 8],
+                 [4, 0, 8, 0],
+                 [0, 8, 0, 0],
+                 [8, 0, 0, 0]]
+        results = {name: self.__evaluation.get_instance(name).run(None, {'graph': graph})
+                   for name in ("Count Nodes", "Count Edges", "Density", "Degree", "Weight Histogram",
+                                "Connected Components")}
+        self.assertEqual(results["Count Nodes"], {'value': '4', 'unit': 'node(s)'})
+        self.assertEqual(results["Count Edges"], {'value': '6', 'unit': 'edge(s)'})
+        self.assertEqual(results["Density"], {'value': '0.5', 'unit': None})
+        self.assertEqual(results["Degree"]['value'], '1.5')
+        self.assertEqual((results["Degree"]['statistics']['min'], results["Degree"]['statistics']['max']), (1.0, 2.0))
+        self.assertEqual(results["Weight Histogram"]['value'], '6.66667')
+        self.assertEqual(results["Weight Histogram"]['statistics']['counts'], [2, 0, 0, 0, 0, 0, 0, 0, 0, 4])
+        self.assertEqual(len(results["Weight Histogram"]['statistics']['bins']), 11)
+        self.assertEqual(results["Connected Components"], {'value': '1', 'unit': 'component(s)'})
+
+    def test_run_structural_empty(self):
+        for name in ("Degree", "Weight Histogram"):
+            self.assertIsNone(self.__evaluation.get_instance(name).run(None, {'graph': []})['statistics'])
+
+    def test_run_detect_cycle(self):
+        evaluation = self.__evaluation.get_instance("Detect Cycle")
+        directed_cycle = [[0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1], [0, 1, 0, 0]]
+        undirected_cycle = [[0, 1, 1, 0], [1, 0, 1, 0], [1, 1, 0, 1], [0, 0, 1, 0]]
+        cases = [([[0, 1, 1], [0, 0, 1], [0, 0, 0]], None),
+                 (directed_cycle, "cycle of 3 node(s): 1 -> 2 -> 3 -> 1"),
+                 ([[0, 1, 0], [1, 0, 1], [0, 1, 0]], None),
+                 (undirected_cycle, "cycle of 3 node(s): 2 -> 0 -> 1 -> 2"),
+                 ([[0, 1], [0, 1]], "cycle of 1 node(s): 1 -> 1"),
+                 ([], None)]
+        for graph, message in cases:
+            for param in (graph, CSRGraph.from_matrix(graph)):
+                result = evaluation.run(None, {'graph': param})
+                self.assertEqual(result.get('message'), message, msg=graph)
+                self.assertEqual(result['value'], 'No cycle detected' if message is None else 'Cycle detected')
+
+    def test_run_detect_cycle_long(self):
+        evaluation = self.__evaluation.get_instance("Detect Cycle")
+        n = 200_000
+        src, dst = np.arange(n - 1), np.arange(1, n)
+        path = CSRGraph.from_edges(n, src, dst, np.ones(n - 1, dtype=np.int32), directed=True)
+        self.assertEqual(evaluation.run(None, {'graph': path})['value'], 'No cycle detected')
+        self.assertEqual(evaluation.run(None, {'graph': CSRGraph.from_edges(n, src, dst, path.weights)})['value'],
+                         'No cycle detected')
+        ring = CSRGraph.from_edges(n, np.append(src, n - 1), np.append(dst, 0), np.ones(n, dtype=np.int32), directed=True)
+        result = evaluation.run(None, {'graph': ring})
+        self.assertEqual(result['value'], 'Cycle detected')
+        self.assertEqual(result['message'], f"cycle of {n} node(s): 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9 -> ... -> 0")
+
     @mock.patch('src.evaluation.base.BaseCode')
     @mock.patch('src.evaluation.base.ControllerResult')
     @mock.patch('src.evaluation.base.ControllerDefault')
@@ -281,6 +362,7 @@ class TestEvaluation(BaseTestClass):
         mock_cont_result().set_progress_result.assert_called_once()
         mock_cont_result().set_done_result.assert_called_once()
 
+    @mock.patch.multiple('src.evaluation.running_time.config_app', RUNNING_TIME_MIN_SECS=0.001, RUNNING_TIME_BUDGET_SECS=0.01)
     @mock.patch('src.evaluation.base.BaseCode')
     @mock.patch('src.evaluation.base.ControllerResult')
     @mock.patch('src.evaluation.base.ControllerDefault')
@@ -337,6 +419,80 @@ class TestEvaluation(BaseTestClass):
         mock_cont_result().set_progress_result.assert_called_once()
         mock_cont_result().set_done_result.assert_called_once()
 
+    @mock.patch.multiple('src.evaluation.running_time.config_app', RUNNING_TIME_MIN_SECS=0.001, RUNNING_TIME_BUDGET_SECS=0.01)
+    @mock.patch('src.evaluation.base.ControllerResult')
+    @mock.patch('src.evaluation.base.ControllerDefault')
+    def test_process_running_time_large_result(self, mock_cont_default, mock_cont_result):
+        # 10000! has more digits than int-to-str conversion allows, the result must not be stringified
+        code = Codes.get_instance("Factorial (math.factorial)")
+        evaluation = self.__evaluation.get_instance("Running Time")
+        payload = [{'payload_id': '0195e2e4-5079-c5f4-1b8a-c33287607035',
+                    'input': {
+                         'input_id': '01a14eb9-840a-eb15-f1a5-8c78d78c1a25',
+                         'name': 'factorial number',
+                         'description': 'number to calculate factorial',
+                         'input_type': 'integer',
+                         },
+                    'input_value': '10000',
+                    'enabled': True
+                   }]
+        result_id = "019747a2-eece-ca62-b2d5-88e95cc3fee0"
+        evaluation.process(code, payload, result_id)
+        mock_cont_result().set_done_result.assert_called_once()
+        mock_cont_result().set_error_result.assert_not_called()
+
+    @mock.patch('src.evaluation.base.ControllerResult')
+    def test_process_result_batch(self, mock_cont_result):
+        evaluation = self.__evaluation.get_instance("Count Nodes")
+        payload = [{'input': {'name': 'graph', 'input_type': 'list'}, 'input_value': [[0, 1], [1, 0]]}]
+        results = mock.MagicMock()
+        evaluation.process(None, payload, "mock_result_id", results=results)
+        results.set_done_result.assert_called_once_with({'result_id': "mock_result_id", 'value': '2',
+                                                         'unit': 'node(s)', 'message': None, 'statistics': None})
+        self.assertFalse(mock_cont_result().set_progress_result.called)
+        self.assertFalse(mock_cont_result().set_done_result.called)
+
+    @mock.patch.multiple('src.evaluation.running_time.config_app', RUNNING_TIME_WARMUP=2,
+                         RUNNING_TIME_MIN_SECS=0.001, RUNNING_TIME_BUDGET_SECS=0.01,
+                         RUNNING_TIME_MIN_REPEAT=3, RUNNING_TIME_MAX_REPEAT=5)
+    def test_run_running_time_statistics(self):
+        code = Codes.get_instance("Factorial (iterative)")
+        evaluation = self.__evaluation.get_instance("Running Time")
+        result = evaluation.run(code, {'factorial number': 50})
+        stats = result['statistics']
+        self.assertEqual(result['unit'], 'secs')
+        self.assertEqual(result['value'], f'{stats["median"]:.9f}')
+        self.assertTrue(3 <= stats['repeat'] <= 5)
+        self.assertGreaterEqual(stats['loops'], 1)
+        self.assertTrue(0 <= stats['min'] <= stats['median'] <= stats['p95'])
+        self.assertGreaterEqual(stats['stddev'], 0)
+        self.assertGreaterEqual(stats['timer_overhead'], 0)
+
+    @mock.patch.multiple('src.evaluation.running_time.config_app', RUNNING_TIME_WARMUP=1,
+                         RUNNING_TIME_MIN_SECS=0.001, RUNNING_TIME_BUDGET_SECS=0.01,
+                         RUNNING_TIME_MIN_REPEAT=3, RUNNING_TIME_MAX_REPEAT=5)
+    def test_run_cpu_time(self):
+        code = Codes.get_instance("Factorial (iterative)")
+        evaluation = self.__evaluation.get_instance("CPU Time")
+        result = evaluation.run(code, {'factorial number': 50})
+        stats = result['statistics']
+        self.assertEqual(result['unit'], 'secs')
+        self.assertEqual(result['value'], f'{stats["median"]:.9f}')
+        self.assertTrue(3 <= stats['repeat'] <= 5)
+        self.assertTrue(0 <= stats['min'] <= stats['median'] <= stats['p95'])
+
+    def test_run_running_time_warmup(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        evaluation = self.__evaluation.get_instance("Running Time")
+        with mock.patch.multiple('src.evaluation.running_time.config_app', RUNNING_TIME_WARMUP=3,
+                                 RUNNING_TIME_MIN_SECS=0.0, RUNNING_TIME_BUDGET_SECS=0.0,
+                                 RUNNING_TIME_MIN_REPEAT=4, RUNNING_TIME_MAX_REPEAT=4):
+            result = evaluation.run(mock_instance_code, {})
+        # 3 warmup calls, 1 call to calibrate the loops (first sample) and 3 more samples
+        self.assertEqual(mock_instance_code.run.call_count, 7)
+        self.assertEqual(result['statistics']['repeat'], 4)
+        self.assertEqual(result['statistics']['loops'], 1)
+
     @mock.patch('src.evaluation.base.BaseCode')
     @mock.patch('src.evaluation.base.ControllerResult')
     @mock.patch('src.evaluation.base.ControllerDefault')
@@ -391,4 +547,48 @@ class TestEvaluation(BaseTestClass):
         result_id = "019747a2-eece-ca62-b2d5-88e95cc3fee0"
         evaluation.process(mock_instance_code, payload, result_id)
         mock_cont_result().set_progress_result.assert_called_once()
-        mock_cont_result().set_done_result.assert_called_once()
\ No newline at end of file
+        mock_cont_result().set_done_result.assert_called_once()
+
+    def test_run_peak_memory(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        mock_instance_code.run.side_effect = lambda params: [0] * params['size']
+        evaluation = self.__evaluation.get_instance("Peak Memory Allocation")
+        result = evaluation.run(mock_instance_code, {'size': 1_000_000})
+        self.assertEqual(result['unit'], 'MiB')
+        self.assertGreaterEqual(result['statistics']['peak_bytes'], 8 * 1_000_000)
+        self.assertEqual(result['value'], f"{result['statistics']['peak_bytes'] / 2 ** 20:.7f}")
+        self.assertGreaterEqual(result['statistics']['rss_delta_bytes'], 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_run_peak_memory_excludes_baseline(self):
+        kept = [0] * 1_000_000  # Allocated before the run, it must not be counted
+        evaluation = self.__evaluation.get_instance("Peak Memory Allocation")
+        tracemalloc.start()
+        try:
+            result = evaluation.run(Codes.get_instance("Factorial (iterative)"), {'factorial number': 20})
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+        self.assertLess(result['statistics']['peak_bytes'], 8 * len(kept))
+
+    @mock.patch('src.evaluation.base.ControllerResult')
+    @mock.patch('src.evaluation.base.ControllerDefault')
+    def test_process_peak_memory(self, mock_cont_default, mock_cont_result):
+        code = Codes.get_instance("Fibonacci (iterative)")
+        evaluation = self.__evaluation.get_instance("Peak Memory Allocation")
+        payload = [{'payload_id': '0195e2e4-5079-c5f4-1b8a-c33287607035',
+                    'input': {
+                         'input_id': '01a14eb8-10a5-79fd-38e4-d24f48221667',
+                         'name': 'fibonacci number',
+                         'description': 'number to calculate fibonacci sequence',
+                         'input_type': 'integer',
+                         },
+                    'input_value': '1000',
+                    'enabled': True
+                   }]
+        result_id = "019747a2-eece-ca62-b2d5-88e95cc3fee0"
+        evaluation.process(code, payload, result_id)
+        mock_cont_result().set_done_result.assert_called_once()
+        done = mock_cont_result().set_done_result.call_args.args[0]
+        self.assertEqual(done['unit'], 'MiB')
+        self.assertIn('peak_bytes', done['statistics'])
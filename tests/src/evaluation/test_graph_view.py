@@ -0,0 +1,86 @@
+import mock
+import numpy as np
+
+from src.codes.graph import CSRGraph, erdos_renyi_graph, random_dag
+from src.evaluation.graph_view import GraphView, describe, describe_counts
+from src.exceptions import ParamInvalid
+from tests import BaseTestClass
+
+# Two components: the triangle 0-1-2 and the edge 3 -> 4, stored in one direction only
+MATRIX = [[0, 4, 2, 0, 0],
+          [4, 0, 7, 0, 0],
+          [2, 7, 0, 0, 0],
+          [0, 0, 0, 0, 9],
+          [0, 0, 0, 0, 0]]
+
+
+class TestGraphView(BaseTestClass):
+
+    def test_matrix_and_csr(self):
+        for graph in (MATRIX, np.array(MATRIX, dtype=np.uint8), CSRGraph.from_matrix(MATRIX)):
+            view = GraphView(graph)
+            self.assertEqual(view.n_vertices, 5)
+            self.assertEqual(view.n_edges, 7)
+            self.assertAlmostEqual(view.density, 7 / 20)
+            self.assertEqual(view.degrees().tolist(), [2, 2, 2, 1, 0])
+            self.assertEqual(sorted(view.weights().tolist()), [2, 2, 4, 4, 7, 7, 9])
+            self.assertEqual(view.weight_counts().tolist(), [0, 0, 2, 0, 2, 0, 0, 2, 0, 1])
+            self.assertEqual(view.components(), 2)
+
+    def test_empty(self):
+        view = GraphView([])
+        self.assertEqual(view.n_vertices, 0)
+        self.assertEqual(view.n_edges, 0)
+        self.assertEqual(view.density, 0.0)
+        self.assertEqual(view.components(), 0)
+        self.assertEqual(len(view.weights()), 0)
+
+    def test_not_square(self):
+        with self.assertRaises(ParamInvalid):
+            GraphView([[0, 1, 0], [1, 0, 0]])
+
+    def test_float_weights(self):
+        view = GraphView([[0, 0.5], [0.25, 0]])
+        self.assertIsNone(view.weight_counts())
+        self.assertEqual(sorted(view.weights().tolist()), [0.25, 0.5])
+
+    @mock.patch("src.evaluation.graph_view.BLOCK_CELLS", 1000)
+    def test_blocks(self):
+        graph = erdos_renyi_graph(300, 0.01, seed=7)
+        view, blocked = GraphView(graph), GraphView(graph.to_matrix())
+        self.assertEqual(blocked.degrees().tolist(), view.degrees().tolist())
+        self.assertEqual(blocked.weight_counts().tolist(), view.weight_counts().tolist())
+        self.assertEqual(blocked.components(), view.components())
+        self.assertEqual(blocked.in_degrees().tolist(), view.in_degrees().tolist())
+        self.assertEqual(blocked.adjacency()[1].tolist(), view.adjacency()[1].tolist())
+        self.assertTrue(blocked.is_symmetric())
+
+    def test_components_directed(self):
+        graph = random_dag(200, 0.005, seed=3)
+        self.assertEqual(GraphView(graph).components(), GraphView(graph.to_matrix()).components())
+
+    def test_describe_counts(self):
+        values = np.array([1, 3, 3, 3, 8, 8, 10])
+        counts = np.bincount(values)
+        for key, value in describe(values).items():
+            self.assertAlmostEqual(describe_counts(counts)[key], value, msg=key)
+
+    def test_directions(self):
+        for graph in (MATRIX, CSRGraph.from_matrix(MATRIX)):
+            view = GraphView(graph)
+            self.assertEqual(view.in_degrees().tolist(), [2, 2, 2, 0, 1])
+            self.assertIsNone(view.self_loop())
+            self.assertFalse(view.is_symmetric())
+            indptr, indices = view.adjacency()
+            self.assertEqual(indptr.tolist(), [0, 2, 4, 6, 7, 7])
+            self.assertEqual(indices.tolist(), [1, 2, 0, 2, 0, 1, 4])
+            sources, targets = (np.concatenate(arrays) for arrays in zip(*view.edges()))
+            self.assertEqual(sources.tolist(), [0, 0, 1, 1, 2, 2, 3])
+            self.assertEqual(targets.tolist(), indices.tolist())
+
+    def test_symmetric_and_self_loop(self):
+        matrix = [[0, 1, 0], [1, 0, 0], [0, 0, 3]]
+        for graph in (matrix, CSRGraph.from_matrix(matrix)):
+            view = GraphView(graph)
+            self.assertTrue(view.is_symmetric())
+            self.assertEqual(view.self_loop(), 2)
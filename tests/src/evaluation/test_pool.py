@@ -0,0 +1,91 @@
+import mock
+import numpy as np
+
+from src.codes.graph import CSRGraph
+from src.evaluation import Evaluation
+from src.evaluation.pool import CriteriaPool, SharedParams
+from src.exceptions import ParamInvalid
+from tests import BaseTestClass
+
+
+class TestSharedParams(BaseTestClass):
+
+    def test_attach(self):
+        matrix = np.array([[0, 3], [5, 0]], dtype=np.uint8)
+        graph = CSRGraph.from_matrix(matrix)
+        shared = SharedParams({'graph': graph, 'matrix': matrix, 'source': 0})
+        try:
+            params, blocks = SharedParams.attach(shared.spec)
+            self.assertEqual(len(blocks), 4)
+            self.assertEqual(params['source'], 0)
+            np.testing.assert_array_equal(params['matrix'], matrix)
+            self.assertEqual(params['matrix'].dtype, np.uint8)
+            np.testing.assert_array_equal(params['graph'].to_matrix(), matrix)
+            del params
+            for block in blocks:
+                block.close()
+        finally:
+            shared.close()
+
+    def test_nbytes(self):
+        matrix = np.zeros((4, 4), dtype=np.uint8)
+        graph = CSRGraph.from_matrix(np.eye(4, dtype=np.uint8))
+        self.assertEqual(SharedParams.nbytes({'matrix': matrix, 'source': 0}), 16)
+        self.assertEqual(SharedParams.nbytes({'graph': graph}),
+                         sum(array.nbytes for array in graph.arrays().values()))
+
+    @mock.patch("src.evaluation.pool.os.statvfs")
+    def test_fits(self, mock_statvfs):
+        mock_statvfs.return_value = mock.Mock(f_bavail=4, f_frsize=4096)
+        self.assertTrue(SharedParams.fits({'graph': np.zeros((128, 128), dtype=np.uint8)}))
+        self.assertFalse(SharedParams.fits({'graph': np.zeros((129, 128), dtype=np.uint8)}))
+        mock_statvfs.side_effect = FileNotFoundError
+        self.assertTrue(SharedParams.fits({'graph': np.zeros((129, 128), dtype=np.uint8)}))
+
+    def test_attach_empty_array(self):
+        shared = SharedParams({'graph': np.zeros((0, 0), dtype=np.uint8)})
+        try:
+            params, blocks = SharedParams.attach(shared.spec)
+            self.assertEqual(params['graph'].shape, (0, 0))
+            del params
+            for block in blocks:
+                block.close()
+        finally:
+            shared.close()
+
+
+class TestCriteriaPool(BaseTestClass):
+
+    @classmethod
+    def tearDownClass(cls):
+        CriteriaPool.shutdown()
+
+    @mock.patch("src.evaluation.pool.config_app.CRITERIA_POOL_WORKERS", 2)
+    def test_evaluate(self):
+        graph = np.array([[0, 1, 0], [0, 0, 1], [1, 0, 0]], dtype=np.uint8)
+        evaluations = [Evaluation.get_instance(n) for n in ("Count Nodes", "Count Edges", "Detect Cycle")]
+        results = CriteriaPool.evaluate(evaluations, {'graph': graph})
+        self.assertEqual(results["Count Nodes"]['value'], '3')
+        self.assertEqual(results["Count Edges"]['value'], '3')
+        self.assertEqual(results["Detect Cycle"]['value'], 'Cycle detected')
+
+    @mock.patch("src.evaluation.pool.config_app.CRITERIA_POOL_WORKERS", 2)
+    def test_evaluate_error(self):
+        evaluations = [Evaluation.get_instance(n) for n in ("Count Nodes", "Count Edges")]
+        results = CriteriaPool.evaluate(evaluations, {'graph': np.zeros((2, 3))})
+        self.assertIsInstance(results["Count Nodes"], ParamInvalid)
+        self.assertIsInstance(results["Count Edges"], ParamInvalid)
+
+    @mock.patch("src.evaluation.pool.config_app.CRITERIA_POOL_WORKERS", 2)
+    @mock.patch("src.evaluation.pool.shared_memory.SharedMemory")
+    @mock.patch("src.evaluation.pool.os.statvfs")
+    def test_evaluate_without_shared_memory(self, mock_statvfs, mock_shared_memory):
+        mock_statvfs.return_value = mock.Mock(f_bavail=1, f_frsize=4)
+        graph = np.array([[0, 1, 0], [0, 0, 1], [1, 0, 0]], dtype=np.uint8)
+        evaluations = [Evaluation.get_instance(n) for n in ("Count Nodes", "Detect Cycle")]
+        results = CriteriaPool.evaluate(evaluations, {'graph': graph})
+        self.assertEqual(results["Count Nodes"]['value'], '3')
+        self.assertEqual(results["Detect Cycle"]['value'], 'Cycle detected')
+        self.assertFalse(mock_shared_memory.called)
+        results = CriteriaPool.evaluate(evaluations, {'graph': np.zeros((2, 3))})
+        self.assertIsInstance(results["Count Nodes"], ParamInvalid)
@@ -0,0 +1,123 @@
+import time
+
+import mock
+from src.common import Singleton
+from src.codes import Codes
+from src.codes.base import BaseCode
+from src.evaluation import Evaluation, MeasurementSession, Sandbox
+from src.exceptions import LimitExceeded
+
+from tests import BaseTestClass
+
+MIB = 2 ** 20
+
+
+class TestSandbox(BaseTestClass):
+
+    def setUp(self):
+        Singleton.drop()
+
+    def test_run(self):
+        sandbox = Sandbox(time_limit=10, memory_limit=512 * MIB)
+        self.assertEqual(sandbox.run(sum, [1, 2, 3]), 6)
+        self.assertEqual(sandbox.run(lambda n: {'value': str(n)}, 7), {'value': '7'})
+
+    def test_run_large_result(self):
+        sandbox = Sandbox(time_limit=10, memory_limit=512 * MIB)
+        self.assertEqual(len(sandbox.run(lambda: 'x' * 1_000_000)), 1_000_000)
+
+    def test_run_error(self):
+        sandbox = Sandbox(time_limit=10, memory_limit=512 * MIB)
+        with self.assertRaises(RuntimeError) as error:
+            sandbox.run(lambda: 1 / 0)
+        self.assertIn('ZeroDivisionError', str(error.exception))
+
+    def test_run_time_limit(self):
+        sandbox = Sandbox(time_limit=0.5, memory_limit=512 * MIB)
+        started = time.monotonic()
+        with self.assertRaises(LimitExceeded) as error:
+            sandbox.run(time.sleep, 30)
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertIn('Time limit exceeded', str(error.exception))
+
+    def test_run_time_limit_per_run(self):
+        sandbox = Sandbox(time_limit=0.5, memory_limit=512 * MIB)
+        self.assertIsNone(sandbox.run(time.sleep, 0.8, runs=2))
+        with self.assertRaises(LimitExceeded) as error:
+            sandbox.run(time.sleep, 30, runs=2)
+        self.assertIn('the 2 runs of the measurement took more than 1 secs', str(error.exception))
+
+    def test_run_memory_limit(self):
+        sandbox = Sandbox(time_limit=10, memory_limit=64 * MIB)
+        with self.assertRaises(LimitExceeded) as error:
+            sandbox.run(bytearray, 1024 * MIB)
+        self.assertIn('Memory limit exceeded', str(error.exception))
+
+    def test_run_worker_unaffected(self):
+        sandbox = Sandbox(time_limit=10, memory_limit=64 * MIB)
+        state = {'runs': 0}
+        sandbox.run(lambda: state.update(runs=1))
+        self.assertEqual(state['runs'], 0)
+        self.assertEqual(len(bytearray(128 * MIB)), 128 * MIB)
+
+    def test_for_code(self):
+        self.assertIsInstance(Sandbox.for_code(Codes.get_instance("Fibonacci sequence")), Sandbox)
+        self.assertIsInstance(Sandbox.for_code(mock.Mock(spec=BaseCode)), Sandbox)
+
+    @mock.patch.multiple('src.evaluation.sandbox.config_app', SANDBOX_ENABLED=False)
+    def test_for_code_disabled(self):
+        self.assertIsNone(Sandbox.for_code(Codes.get_instance("Fibonacci sequence")))
+
+    @mock.patch.multiple('src.evaluation.sandbox.config_app', SANDBOX_TIME_LIMIT_SECS=0.5)
+    def test_session_time_limit_shared_by_probe(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        mock_instance_code.run.side_effect = lambda params: time.sleep(30)
+        session = MeasurementSession(Sandbox.for_code(mock_instance_code))
+        started = time.monotonic()
+        for name in ("Running Time", "CPU Time"):
+            with self.assertRaises(LimitExceeded):
+                session.evaluate(Evaluation.get_instance(name), mock_instance_code, {})
+        # The second criterion of the probe fails without running the code again
+        self.assertLess(time.monotonic() - started, 10)
+
+    @mock.patch.multiple('src.evaluation.sandbox.config_app', SANDBOX_TIME_LIMIT_SECS=0.25)
+    def test_session_time_limit_of_one_run(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        mock_instance_code.run.side_effect = lambda params: time.sleep(0.1)
+        session = MeasurementSession(Sandbox.for_code(mock_instance_code))
+        # 1 warmup call and at least 3 repetitions of 0.1 secs, within 4 runs of 0.25 secs
+        result = session.evaluate(Evaluation.get_instance("Running Time"), mock_instance_code, {})
+        self.assertEqual(result['unit'], 'secs')
+        self.assertGreaterEqual(float(result['value']), 0.1)
+
+    @mock.patch.multiple('src.evaluation.running_time.config_app', RUNNING_TIME_MIN_SECS=0.0,
+                         RUNNING_TIME_BUDGET_SECS=60.0, RUNNING_TIME_MAX_REPEAT=100)
+    def test_measure_stops_at_deadline(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        mock_instance_code.run.side_effect = lambda params: time.sleep(0.05)
+        started = time.monotonic()
+        measurement = Evaluation.get_instance("Running Time").measure(mock_instance_code, {}, started + 0.5)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertLess(measurement['repeat'], 10)
+
+    @mock.patch.multiple('src.evaluation.sandbox.config_app', SANDBOX_TIME_LIMIT_SECS=0.5)
+    @mock.patch('src.evaluation.base.ControllerResult')
+    @mock.patch('src.evaluation.base.ControllerDefault')
+    def test_process_time_limit_warning(self, mock_cont_default, mock_cont_result):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        mock_instance_code.run.side_effect = lambda params: time.sleep(30)
+        evaluation = Evaluation.get_instance("Peak Memory Allocation")
+        evaluation.process(mock_instance_code, [], "019747a2-eece-ca62-b2d5-88e95cc3fee0")
+        mock_cont_result().set_warning_result.assert_called_once()
+        mock_cont_result().set_done_result.assert_not_called()
+        self.assertIn('Time limit exceeded', mock_cont_result().set_warning_result.call_args.args[0]['warning'])
+
+    @mock.patch('src.evaluation.base.ControllerResult')
+    @mock.patch('src.evaluation.base.ControllerDefault')
+    def test_process_error(self, mock_cont_default, mock_cont_result):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        mock_instance_code.run.side_effect = ValueError('mock_error')
+        evaluation = Evaluation.get_instance("Peak Memory Allocation")
+        evaluation.process(mock_instance_code, [], "019747a2-eece-ca62-b2d5-88e95cc3fee0")
+        mock_cont_result().set_error_result.assert_called_once()
+        self.assertIn('mock_error', mock_cont_result().set_error_result.call_args.args[0]['error'])
@@ -0,0 +1,165 @@
+import os
+import tempfile
+import threading
+
+import mock
+from src.common import Singleton
+from src.codes.base import BaseCode
+from src.evaluation import Evaluation, MeasurementSession
+from src.evaluation.cpu_lock import CpuLock
+from src.evaluation.session import PROBE_HEAP_TRACING, PROBE_RSS_SAMPLING, PROBE_TIMING
+
+from tests import BaseTestClass
+
+FAST_TIMING = {'RUNNING_TIME_WARMUP': 1, 'RUNNING_TIME_MIN_SECS': 0.0, 'RUNNING_TIME_BUDGET_SECS': 0.0,
+               'RUNNING_TIME_MIN_REPEAT': 3, 'RUNNING_TIME_MAX_REPEAT': 3}
+
+
+class TestMeasurementSession(BaseTestClass):
+
+    def setUp(self):
+        Singleton.drop()
+
+    def test_schedule(self):
+        names = ["Running Time", "Memory Consume", "Count Nodes", "Peak Memory Allocation", "CPU Time", "Detect Cycle"]
+        evaluations = MeasurementSession.schedule([Evaluation.get_instance(n) for n in names])
+        self.assertEqual([e.probe for e in evaluations],
+                         [None, None, PROBE_RSS_SAMPLING, PROBE_HEAP_TRACING, PROBE_TIMING, PROBE_TIMING])
+
+    def test_schedule_key(self):
+        criteria = [({'criteria_name': "CPU Time"}, Evaluation.get_instance("CPU Time")),
+                    ({'criteria_name': "Count Edges"}, Evaluation.get_instance("Count Edges"))]
+        criteria = MeasurementSession.schedule(criteria, key=lambda c: c[1])
+        self.assertEqual([c[0]['criteria_name'] for c in criteria], ["Count Edges", "CPU Time"])
+
+    def test_groups(self):
+        names = ["Running Time", "Count Nodes", "Memory Consume", "Detect Cycle", "CPU Time"]
+        groups = MeasurementSession.groups([Evaluation.get_instance(n) for n in names])
+        self.assertEqual([[e.name for e in group] for group in groups],
+                         [["Count Nodes"], ["Detect Cycle"], ["Memory Consume"], ["Running Time", "CPU Time"]])
+
+    @mock.patch('src.evaluation.session.CpuLock')
+    def test_evaluate_locks_cpu(self, mock_lock):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        session = MeasurementSession(lock="mock_execution")
+        session.evaluate(Evaluation.get_instance("Count Nodes"), mock_instance_code, {'graph': [[0]]})
+        session.evaluate(Evaluation.get_instance("Memory Consume"), mock_instance_code, {})
+        with mock.patch.multiple('src.evaluation.running_time.config_app', **FAST_TIMING):
+            session.evaluate(Evaluation.get_instance("Running Time"), mock_instance_code, {})
+            session.evaluate(Evaluation.get_instance("CPU Time"), mock_instance_code, {})
+        self.assertEqual([c.kwargs['exclusive'] for c in mock_lock.call_args_list], [False, False, True])
+        self.assertEqual({c.kwargs['name'] for c in mock_lock.call_args_list}, {"mock_execution"})
+
+    @mock.patch('src.evaluation.session.CpuLock')
+    def test_evaluate_without_lock(self, mock_lock):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        session = MeasurementSession()
+        session.evaluate(Evaluation.get_instance("Count Nodes"), mock_instance_code, {'graph': [[0]]})
+        with mock.patch.multiple('src.evaluation.running_time.config_app', **FAST_TIMING):
+            session.evaluate(Evaluation.get_instance("Running Time"), mock_instance_code, {})
+        self.assertFalse(mock_lock.called)
+
+    @mock.patch.multiple('src.evaluation.running_time.config_app', **FAST_TIMING)
+    def test_evaluate_not_blocked_by_timing(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.multiple('src.evaluation.cpu_lock.config_app', CPU_LOCK_DIR=directory):
+            mock_instance_code = mock.Mock(spec=BaseCode)
+            results = []
+
+            def evaluate(session, name):
+                results.append(session.evaluate(Evaluation.get_instance(name), mock_instance_code, {'graph': [[0]]}))
+
+            # A heavy timing run of a fanned out execution holds its lock exclusively
+            with CpuLock(exclusive=True, name="mock_heavy_execution"):
+                self.assertTrue(os.path.exists(os.path.join(directory, "mock_heavy_execution.lock")))
+                # A fast queue execution (no lock) and the criteria of another fanned out execution go on
+                for session, name in ((MeasurementSession(), "Count Nodes"),
+                                      (MeasurementSession(), "Running Time"),
+                                      (MeasurementSession(lock="mock_fast_execution"), "Running Time")):
+                    thread = threading.Thread(target=evaluate, args=(session, name), daemon=True)
+                    thread.start()
+                    thread.join(timeout=10)
+                    self.assertFalse(thread.is_alive())
+            self.assertEqual(len(results), 3)
+
+    @mock.patch('src.evaluation.session.CriteriaPool')
+    def test_evaluate_concurrent(self, mock_pool):
+        mock_pool.enabled.return_value = True
+        mock_pool.evaluate.return_value = {"Count Nodes": {'value': '2', 'unit': 'node(s)'},
+                                           "Detect Cycle": ValueError("mock")}
+        names = ["Count Nodes", "Running Time", "Detect Cycle"]
+        evaluations = [Evaluation.get_instance(n) for n in names]
+        session = MeasurementSession()
+        session.concurrent(evaluations)
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        result = session.evaluate(evaluations[0], mock_instance_code, {'graph': [[0, 1], [1, 0]]})
+        self.assertEqual(result['value'], '2')
+        with self.assertRaises(ValueError):
+            session.evaluate(evaluations[2], mock_instance_code, {'graph': [[0, 1], [1, 0]]})
+        mock_pool.evaluate.assert_called_once()
+        self.assertEqual([e.name for e in mock_pool.evaluate.call_args.args[0]], ["Count Nodes", "Detect Cycle"])
+
+    @mock.patch('src.evaluation.session.CriteriaPool')
+    def test_evaluate_concurrent_single(self, mock_pool):
+        mock_pool.enabled.return_value = True
+        evaluations = [Evaluation.get_instance(n) for n in ("Count Nodes", "Running Time")]
+        session = MeasurementSession()
+        session.concurrent(evaluations)
+        result = session.evaluate(evaluations[0], mock.Mock(spec=BaseCode), {'graph': [[0, 1], [1, 0]]})
+        self.assertEqual(result['value'], '2')
+        self.assertFalse(mock_pool.evaluate.called)
+
+    @mock.patch.multiple('src.evaluation.running_time.config_app', **FAST_TIMING)
+    def test_evaluate_shares_timing_runs(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        session = MeasurementSession()
+        running_time = session.evaluate(Evaluation.get_instance("Running Time"), mock_instance_code, {})
+        calls = mock_instance_code.run.call_count
+        cpu_time = session.evaluate(Evaluation.get_instance("CPU Time"), mock_instance_code, {})
+        # 1 warmup call, 1 call to calibrate the loops and 2 more samples, the CPU time reuses them
+        self.assertEqual(calls, 4)
+        self.assertEqual(mock_instance_code.run.call_count, calls)
+        self.assertEqual(running_time['unit'], 'secs')
+        self.assertEqual(cpu_time['unit'], 'secs')
+        self.assertEqual(running_time['statistics']['repeat'], cpu_time['statistics']['repeat'])
+        self.assertEqual(len(running_time['statistics']['gc_collections']), 3)
+
+    @mock.patch.multiple('src.evaluation.running_time.config_app', **FAST_TIMING)
+    def test_evaluate_isolates_probes(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        session = MeasurementSession()
+        session.evaluate(Evaluation.get_instance("Peak Memory Allocation"), mock_instance_code, {})
+        self.assertEqual(mock_instance_code.run.call_count, 1)
+        session.evaluate(Evaluation.get_instance("Running Time"), mock_instance_code, {})
+        self.assertEqual(mock_instance_code.run.call_count, 1 + 4)
+        session.evaluate(Evaluation.get_instance("Peak Memory Allocation"), mock_instance_code, {})
+        self.assertEqual(mock_instance_code.run.call_count, 1 + 4)
+
+    @mock.patch.multiple('src.evaluation.running_time.config_app', **FAST_TIMING)
+    def test_evaluate_shares_timing_error(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        mock_instance_code.run.side_effect = ValueError('mock_error')
+        session = MeasurementSession()
+        for name in ("Running Time", "CPU Time"):
+            with self.assertRaises(ValueError):
+                session.evaluate(Evaluation.get_instance(name), mock_instance_code, {})
+        # The measurement failed on the warmup call, the CPU time does not measure the code again
+        self.assertEqual(mock_instance_code.run.call_count, 1)
+
+    def test_evaluate_without_probe(self):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        session = MeasurementSession()
+        result = session.evaluate(Evaluation.get_instance("Count Nodes"), mock_instance_code, {'graph': [[0, 1], [1, 0]]})
+        self.assertEqual(result['value'], '2')
+        mock_instance_code.run.assert_not_called()
+
+    @mock.patch.multiple('src.evaluation.running_time.config_app', **FAST_TIMING)
+    @mock.patch('src.evaluation.base.ControllerResult')
+    @mock.patch('src.evaluation.base.ControllerDefault')
+    def test_process_with_session(self, mock_cont_default, mock_cont_result):
+        mock_instance_code = mock.Mock(spec=BaseCode)
+        session = MeasurementSession()
+        for name in ("Running Time", "CPU Time"):
+            Evaluation.get_instance(name).process(mock_instance_code, [], "019747a2-eece-ca62-b2d5-88e95cc3fee0", session)
+        self.assertEqual(mock_cont_result().set_done_result.call_count, 2)
+        self.assertEqual(mock_instance_code.run.call_count, 4)
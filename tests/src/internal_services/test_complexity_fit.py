@@ -0,0 +1,124 @@
+import math
+
+import numpy as np
+
+from src.exceptions import ParamInvalid
+from src.internal_services.complexity_fit import PHI, ComplexityFit
+
+from tests import BaseTestClass
+
+SIZES = [100, 200, 400, 800, 1600, 3200, 6400]
+
+
+class TestComplexityFit(BaseTestClass):
+
+    def __best(self, sizes, values) -> dict:
+        return ComplexityFit.fit(sizes, values)[0]
+
+    def test_fit_classes(self):
+        n = np.array(SIZES, dtype=float)
+        series = {
+            'O(log n)': 0.001 + 0.0002 * np.log2(n),
+            'O(n)': 0.001 + 1e-5 * n,
+            'O(n log n)': 2e-6 * n * np.log2(n),
+            'O(n^2)': 0.01 + 3e-7 * n ** 2,
+            'O(n^3)': 5e-11 * n ** 3,
+        }
+        for complexity, values in series.items():
+            best = self.__best(SIZES, values)
+            self.assertEqual(best['complexity'], complexity)
+            self.assertAlmostEqual(best['r2'], 1.0)
+
+    def test_fit_coefficients(self):
+        best = self.__best(SIZES, [0.01 + 3e-7 * n ** 2 for n in SIZES])
+        self.assertAlmostEqual(best['coefficients']['a'], 0.01)
+        self.assertAlmostEqual(best['coefficients']['b'] / 3e-7, 1.0)
+
+    def test_fit_noisy_linear(self):
+        rng = np.random.default_rng(7)
+        values = [1e-5 * n * (1 + rng.normal(0, 0.05)) for n in SIZES]
+        best = self.__best(SIZES, values)
+        self.assertEqual(best['complexity'], 'O(n)')
+        self.assertGreater(best['r2'], 0.95)
+
+    def test_fit_constant(self):
+        rng = np.random.default_rng(7)
+        best = self.__best(SIZES, [0.5 + rng.normal(0, 0.01) for _ in SIZES])
+        self.assertEqual(best['complexity'], 'O(1)')
+
+    def test_fit_exponential(self):
+        sizes = [10, 15, 20, 25, 30]
+        best = self.__best(sizes, [1e-7 * 2 ** n for n in sizes])
+        self.assertEqual(best['complexity'], 'O(2^n)')
+
+    def test_fit_golden_ratio(self):
+        sizes = [20, 24, 27, 30]
+        best = self.__best(sizes, [4e-7 * PHI ** n for n in sizes])
+        self.assertEqual(best['complexity'], 'O(phi^n)')
+        self.assertAlmostEqual(ComplexityFit.predict(best, 35) / (4e-7 * PHI ** 35), 1.0, places=3)
+
+    def test_fit_exponential_out_of_range(self):
+        models = ComplexityFit.fit([1000, 2000, 4000], [1.0, 2.0, 4.0])
+        self.assertNotIn('O(2^n)', [m['complexity'] for m in models])
+        self.assertNotIn('O(phi^n)', [m['complexity'] for m in models])
+        self.assertEqual(models[0]['complexity'], 'O(n)')
+
+    def test_fit_models_sorted(self):
+        models = ComplexityFit.fit(SIZES, [1e-5 * n for n in SIZES])
+        self.assertEqual(len(models), 6)  # phi^n and 2^n are left out past n=1000
+        r2 = [m['r2'] for m in models[1:]]
+        self.assertEqual(r2, sorted(r2, reverse=True))
+
+    def test_fit_too_few_points(self):
+        with self.assertRaises(ParamInvalid):
+            ComplexityFit.fit([100, 100, 200], [1.0, 1.1, 2.0])
+
+    def test_predict(self):
+        best = self.__best(SIZES, [0.01 + 3e-7 * n ** 2 for n in SIZES])
+        self.assertAlmostEqual(ComplexityFit.predict(best, 10_000), 0.01 + 3e-7 * 10_000 ** 2)
+
+    def test_predict_constant(self):
+        model = {'complexity': 'O(1)', 'coefficients': {'a': 0.5, 'b': 0.0}, 'r2': 0.0}
+        self.assertEqual(ComplexityFit.predict(model, 10 ** 9), 0.5)
+
+    def test_predict_exponential_overflow(self):
+        model = {'complexity': 'O(2^n)', 'coefficients': {'a': 0.0, 'b': 1e-7}, 'r2': 1.0}
+        self.assertTrue(math.isinf(ComplexityFit.predict(model, 5000)))
+
+    def test_band(self):
+        values = [0.01 + 3e-7 * n ** 2 for n in SIZES]
+        best = self.__best(SIZES, values)
+        band = ComplexityFit.band(best, SIZES, values)
+        self.assertEqual(band['points'], len(SIZES))
+        self.assertAlmostEqual(band['se'], 0.0)
+        self.assertAlmostEqual(band['x_mean'], float(np.mean(np.array(SIZES, dtype=float) ** 2)))
+
+    def test_interval(self):
+        rng = np.random.default_rng(7)
+        values = [1e-5 * n * (1 + rng.normal(0, 0.05)) for n in SIZES]
+        best = self.__best(SIZES, values)
+        band = ComplexityFit.band(best, SIZES, values)
+        lower, upper = ComplexityFit.interval(best, band, 3200)
+        self.assertLess(lower, ComplexityFit.predict(best, 3200))
+        self.assertGreater(upper, ComplexityFit.predict(best, 3200))
+        far_lower, far_upper = ComplexityFit.interval(best, band, 100_000)
+        self.assertGreater(far_upper - far_lower, upper - lower)
+
+    def test_interval_exact_fit(self):
+        values = [1e-5 * n for n in SIZES]
+        best = self.__best(SIZES, values)
+        lower, upper = ComplexityFit.interval(best, ComplexityFit.band(best, SIZES, values), 10_000)
+        self.assertAlmostEqual(lower, 0.1)
+        self.assertAlmostEqual(upper, 0.1)
+
+    def test_interval_not_negative(self):
+        model = {'complexity': 'O(1)', 'coefficients': {'a': 0.1, 'b': 0.0}, 'r2': 0.0}
+        band = {'points': 3, 'x_mean': 0.0, 'sxx': 0.0, 'se': 1.0}
+        lower, upper = ComplexityFit.interval(model, band, 100)
+        self.assertEqual(lower, 0.0)
+        self.assertAlmostEqual(upper, 0.1 + 4.303 * np.sqrt(1 + 1 / 3))
+
+    def test_interval_exponential_overflow(self):
+        model = {'complexity': 'O(2^n)', 'coefficients': {'a': 0.0, 'b': 1e-7}, 'r2': 1.0}
+        band = {'points': 5, 'x_mean': 1.0, 'sxx': 1.0, 'se': 1.0}
+        self.assertTrue(all(math.isinf(v) for v in ComplexityFit.interval(model, band, 5000)))
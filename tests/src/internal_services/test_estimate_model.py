@@ -0,0 +1,65 @@
+
+from src.common import Singleton
+from src.internal_services.estimate_model import EstimateModel
+
+from tests import BaseTestClass
+
+ALGORITHM_ID = "0192919b-2501-91c1-d4bb-c71b4c0785d5"
+INPUT_ID = "0192919b-2501-59d0-d088-50be8a4e5ae6"
+RUNNING_TIME_ID = "001fe2d3-09a5-4bc0-b891-45d475a4b1bc"
+PEAK_MEMORY_ID = "01a14ebf-aed2-b569-5566-5f3e51e6c4ea"
+SIZES = [100, 200, 400, 800, 1600]
+
+
+def series(criteria_id, criteria, unit, f, sizes=SIZES, input_id=INPUT_ID):
+    return [(ALGORITHM_ID, criteria_id, criteria, input_id, n, f(n), unit) for n in sizes]
+
+
+class TestEstimateModel(BaseTestClass):
+
+    def setUp(self):
+        Singleton.drop()
+
+    def test_estimate(self):
+        model = EstimateModel()
+        model.refresh(series(RUNNING_TIME_ID, "Running Time", "secs", lambda n: 1e-6 * n ** 2 * (1.02 if n % 400 else 0.98))
+                      + series(PEAK_MEMORY_ID, "Peak Memory Allocation", "bytes", lambda n: 1024 + 64 * n))
+        estimates = model.estimate(ALGORITHM_ID, INPUT_ID, 3200)
+        self.assertEqual([e["criteria"] for e in estimates], ["Peak Memory Allocation", "Running Time"])
+        memory, running_time = estimates
+        self.assertEqual(memory["complexity"], "O(n)")
+        self.assertAlmostEqual(memory["value"], 1024 + 64 * 3200)
+        self.assertEqual(memory["unit"], "bytes")
+        self.assertEqual(memory["points"], 5)
+        self.assertEqual(running_time["complexity"], "O(n^2)")
+        self.assertEqual(running_time["criteria_id"], RUNNING_TIME_ID)
+        self.assertLess(running_time["lower"], running_time["value"])
+        self.assertLess(running_time["value"], running_time["upper"])
+        self.assertGreaterEqual(running_time["lower"], 0)
+
+    def test_estimate_interval_widens_with_extrapolation(self):
+        model = EstimateModel()
+        model.refresh(series(RUNNING_TIME_ID, "Running Time", "secs", lambda n: 1e-4 * n * (1.05 if n % 400 else 0.95)))
+        near = model.estimate(ALGORITHM_ID, INPUT_ID, 800)[0]
+        far = model.estimate(ALGORITHM_ID, INPUT_ID, 100_000)[0]
+        self.assertLess(near["upper"] - near["lower"], far["upper"] - far["lower"])
+
+    def test_estimate_without_history(self):
+        model = EstimateModel()
+        model.refresh(series(RUNNING_TIME_ID, "Running Time", "secs", lambda n: n, sizes=[100, 200])
+                      + series(PEAK_MEMORY_ID, "Peak Memory Allocation", "bytes", lambda n: n, input_id="other"))
+        self.assertEqual(model.estimate(ALGORITHM_ID, INPUT_ID, 3200), [])
+        self.assertEqual(model.estimate("unknown", INPUT_ID, 3200), [])
+
+    def test_estimate_mixed_units(self):
+        model = EstimateModel()
+        rows = series(RUNNING_TIME_ID, "Running Time", "secs", lambda n: n)
+        rows[0] = rows[0][:6] + ("MiB",)
+        model.refresh(rows)
+        self.assertEqual(model.estimate(ALGORITHM_ID, INPUT_ID, 3200), [])
+
+    def test_refresh_replaces_models(self):
+        model = EstimateModel()
+        model.refresh(series(RUNNING_TIME_ID, "Running Time", "secs", lambda n: n))
+        model.refresh([])
+        self.assertEqual(model.estimate(ALGORITHM_ID, INPUT_ID, 3200), [])
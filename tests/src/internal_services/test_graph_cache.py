@@ -0,0 +1,82 @@
+import os
+import pathlib
+import tempfile
+
+import mock
+import numpy as np
+
+from src.common import Singleton
+from src.internal_services.graph_cache import GraphCache
+from tests import BaseTestClass
+
+
+class TestGraphCache(BaseTestClass):
+
+    def setUp(self):
+        Singleton.drop()
+        self.__tmp = tempfile.TemporaryDirectory()
+        self.__path = pathlib.Path(self.__tmp.name)
+
+    def tearDown(self):
+        self.__tmp.cleanup()
+
+    def __cache(self, max_bytes=10_000_000):
+        return GraphCache(str(self.__path), max_bytes)
+
+    def test_key(self):
+        key = GraphCache.key({'generator': 'complete', 'num_nodes': 10, 'density': 1.0, 'seed': 1})
+        self.assertEqual(key, GraphCache.key({'seed': 1, 'density': 1.0, 'num_nodes': 10, 'generator': 'complete'}))
+        self.assertNotEqual(key, GraphCache.key({'generator': 'complete', 'num_nodes': 10, 'density': 1.0, 'seed': 2}))
+
+    def test_get_or_create_miss_then_hit(self):
+        cache = self.__cache()
+        build = mock.Mock(return_value={'matrix': np.arange(9, dtype=np.uint8).reshape(3, 3)})
+        params = {'generator': 'complete', 'num_nodes': 3, 'density': 1.0, 'seed': 7}
+        first = cache.get_or_create(params, build)
+        second = cache.get_or_create(params, build)
+        build.assert_called_once()
+        self.assertIsInstance(second['matrix'], np.memmap)
+        self.assertTrue((first['matrix'] == second['matrix']).all())
+        self.assertFalse(second['matrix'].flags.writeable)
+        self.assertTrue((self.__path / GraphCache.key(params) / 'matrix.npy').exists())
+
+    def test_get_or_create_several_arrays(self):
+        cache = self.__cache()
+        arrays = {'indptr': np.array([0, 1, 2]), 'indices': np.array([1, 0]), 'weights': np.array([5, 5])}
+        result = cache.get_or_create({'seed': 1}, lambda: arrays)
+        self.assertEqual(set(result.keys()), {'indptr', 'indices', 'weights'})
+        self.assertEqual(list(result['weights']), [5, 5])
+
+    def test_disabled(self):
+        cache = self.__cache(max_bytes=0)
+        build = mock.Mock(return_value={'matrix': np.zeros((2, 2))})
+        cache.get_or_create({'seed': 1}, build)
+        cache.get_or_create({'seed': 1}, build)
+        self.assertFalse(cache.enabled)
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(list(self.__path.iterdir()), [])
+
+    def test_evict_least_recently_used(self):
+        cache = self.__cache(max_bytes=2500)
+        for seed in range(3):
+            cache.get_or_create({'seed': seed}, lambda: {'matrix': np.zeros(1000, dtype=np.uint8)})
+            entry = self.__path / GraphCache.key({'seed': seed})
+            os.utime(entry, (seed, seed))
+        cache.get_or_create({'seed': 0}, lambda: {'matrix': np.zeros(1000, dtype=np.uint8)})  # hit, now most recent
+        cache.get_or_create({'seed': 3}, lambda: {'matrix': np.zeros(1000, dtype=np.uint8)})
+        entries = {e.name for e in self.__path.iterdir()}
+        self.assertIn(GraphCache.key({'seed': 0}), entries)
+        self.assertIn(GraphCache.key({'seed': 3}), entries)
+        self.assertNotIn(GraphCache.key({'seed': 1}), entries)
+        self.assertNotIn(GraphCache.key({'seed': 2}), entries)
+
+    def test_store_race_keeps_first_entry(self):
+        cache = self.__cache()
+        params = {'seed': 1}
+        cache.get_or_create(params, lambda: {'matrix': np.ones(4)})
+        os.utime(self.__path / GraphCache.key(params), (0, 0))
+        with mock.patch.object(GraphCache, '_GraphCache__load', side_effect=[None, None]):
+            result = cache.get_or_create(params, lambda: {'matrix': np.zeros(4)})
+        self.assertEqual(list(result['matrix']), [0, 0, 0, 0])
+        self.assertEqual(list(cache.get_or_create(params, lambda: None)['matrix']), [1, 1, 1, 1])
+        self.assertEqual([e for e in self.__path.iterdir() if e.name.startswith('.')], [])
@@ -71,6 +71,30 @@ class TestOrm(BaseTestClass):
         self.assertTrue(mock_scoped_session.called)
         self.assertTrue(db_driver.session.remove.called)
 
+    @mock.patch('src.models.orm.scoped_session')
+    @mock.patch('src.models.orm.create_engine')
+    def test_single_session(self, mock_create_engine, mock_scoped_session):
+        db_driver = Orm('database', 'timeout', 'pool_size')
+        with db_driver.single_session():
+            db_driver.remove_session()
+            with db_driver.single_session():
+                db_driver.remove_session()
+            self.assertFalse(db_driver.session.remove.called)
+        db_driver.session.remove.assert_called_once()
+        db_driver.remove_session()
+        self.assertEqual(db_driver.session.remove.call_count, 2)
+
+    @mock.patch('src.models.orm.scoped_session')
+    @mock.patch('src.models.orm.create_engine')
+    def test_single_session_exception(self, mock_create_engine, mock_scoped_session):
+        db_driver = Orm('database', 'timeout', 'pool_size')
+        with self.assertRaises(ValueError):
+            with db_driver.single_session():
+                raise ValueError("mock")
+        db_driver.session.remove.assert_called_once()
+        db_driver.remove_session()
+        self.assertEqual(db_driver.session.remove.call_count, 2)
+
     @mock.patch('src.models.orm.scoped_session')
     @mock.patch('src.models.orm.create_engine')
     @mock.patch('src.models.orm.sessionmaker')
@@ -107,3 +107,25 @@ class TestExecution(BaseTestClass):
         result = execution.get()
         self.assertEqual(result["status"], STATUS_ERROR)
         self.assertEqual(result["message"], message)
+
+    def test_set_queue_wait(self):
+        execution = self.__execution
+        execution.algorithm = Algorithm()
+        self.assertIsNone(execution.get()["queue_wait_secs"])
+        execution.set_queue_wait("algorithm-analysis-service_execution_slow", 12.5)
+        result = execution.get()
+        self.assertEqual(result["queue"], "algorithm-analysis-service_execution_slow")
+        self.assertEqual(result["queue_wait_secs"], 12.5)
+
+    def test_set_status_from_results(self):
+        cases = (([STATUS_DONE, STATUS_DONE], STATUS_DONE, None),
+                 ([STATUS_DONE, STATUS_WARNING], STATUS_WARNING, "1 of 2 criteria exceeded a limit"),
+                 ([STATUS_ERROR, STATUS_WARNING, STATUS_DONE], STATUS_ERROR, "1 of 3 criteria failed"),
+                 ([STATUS_DONE, STATUS_PROCESSING], STATUS_ERROR, "1 of 2 criteria failed"))
+        for statuses, status, message in cases:
+            execution = self.__execution
+            execution.algorithm = Algorithm()
+            execution.set_status_from_results(statuses)
+            result = execution.get()
+            self.assertEqual(result["status"], status)
+            self.assertEqual(result["message"], message)
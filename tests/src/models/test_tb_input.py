@@ -23,7 +23,32 @@ class TestInput(BaseTestClass):
         self.assertEqual(result.get("name"), params.get("name"))
         self.assertEqual(result.get("description"), params.get("description"))
         self.assertEqual(result.get("input_type"), params.get("input_type"))
+        self.assertTrue(result.get("required"))
         self.assertIn("input_id", result)
+
+    def test_add_not_required(self):
+        params = {
+            "name": "mock_name",
+            "description": "mock_description",
+            "input_type": "mock_input_type",
+            "required": False,
+            "algorithm": Algorithm(),
+        }
+        input = self.__input
+        input.add(params)
+        self.assertFalse(input.get().get("required"))
+
+    def test_add_required_invalid(self):
+        params = {
+            "name": "mock_name",
+            "description": "mock_description",
+            "input_type": "mock_input_type",
+            "required": "no",
+            "algorithm": Algorithm(),
+        }
+        input = self.__input
+        with self.assertRaises(ParamInvalid):
+            input.add(params)
     
     def test_add_algorithm_null(self):
         params = {
@@ -116,6 +116,30 @@ class TestResult(BaseTestClass):
         result.criteria = Criteria()
         result = result.get()
         self.assertEqual(result["status"], STATUS_DONE)
+        self.assertIsNone(result["statistics"])
+
+    def test_set_status_to_done_statistics(self):
+        params = {
+            "value": "0.000001000",
+            "unit": "secs",
+            "message": None,
+            "statistics": {"min": 0.0000009, "median": 0.000001, "repeat": 5},
+        }
+        result = self.__result
+        result.set_status_to_done(params)
+        result.criteria = Criteria()
+        result = result.get()
+        self.assertEqual(result["statistics"], params["statistics"])
+
+    def test_set_status_to_done_statistics_invalid(self):
+        params = {
+            "value": "0.000001000",
+            "unit": "secs",
+            "statistics": [0.0000009, 0.000001],
+        }
+        result = self.__result
+        with self.assertRaises(ParamInvalid):
+            result.set_status_to_done(params)
 
     def test_set_status_to_warning(self):
         result = self.__result
@@ -1,11 +1,27 @@
 import mock
 
-from src.tasks.execution import process_algorithm, queue_execution
+from celery.app.task import Context
+from billiard.exceptions import WorkerLostError
+
+from src.tasks import celery_app
+from src.tasks.execution import (fail_execution, fan_out, finish_execution, process_algorithm, process_criteria,
+                                 process_sweep, queue_execution, queue_sweep)
 from tests import BaseTestClass
 
 
 class TestTaskExecution(BaseTestClass):
 
+    @mock.patch("src.tasks.execution.log")
+    @mock.patch("src.tasks.execution.current_rss")
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_process_algorithm_logs_rss(self, mock_controller, mock_current_rss, mock_log):
+        mock_current_rss.side_effect = [100 * 2 ** 20, 150 * 2 ** 20]
+        process_algorithm(**{"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"})
+        self.assertEqual(mock_current_rss.call_count, 2)
+        message = mock_log.info.call_args.args[0]
+        self.assertIn("100.0 MiB before", message)
+        self.assertIn("+50.0 MiB", message)
+
     @mock.patch("src.tasks.execution.ControllerExecution")
     def test_process_algorithm(self, mock_controller):
         params = {
@@ -53,4 +69,121 @@ class TestTaskExecution(BaseTestClass):
             "alias": "Execution_2025_01_01_16_06_41"
         }
         queue_execution(params)
-        self.assertTrue(mock_process.delay.called)
+        kwargs = mock_process.apply_async.call_args.kwargs
+        self.assertEqual(kwargs["queue"], "algorithm-analysis-service_execution")
+        self.assertEqual(kwargs["kwargs"]["queue"], "algorithm-analysis-service_execution")
+        self.assertIn("queued_at", kwargs["kwargs"])
+
+    @mock.patch("src.tasks.execution.process_algorithm")
+    def test_queue_execution_routed(self, mock_process):
+        queue_execution({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"}, "algorithm-analysis-service_execution_heavy")
+        self.assertEqual(mock_process.apply_async.call_args.kwargs["queue"], "algorithm-analysis-service_execution_heavy")
+
+    @mock.patch("src.tasks.execution.log")
+    @mock.patch("src.tasks.execution.time.time", return_value=1_000_012.5)
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_process_algorithm_logs_queue_wait(self, mock_controller, mock_time, mock_log):
+        process_algorithm(**{"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7",
+                             "queue": "algorithm-analysis-service_execution_slow", "queued_at": 1_000_000.0})
+        wait = mock_log.info.call_args_list[0]
+        self.assertEqual(wait.args[0], "task waited 12.500 secs in queue algorithm-analysis-service_execution_slow")
+        self.assertEqual(wait.kwargs["extra"]["queue_wait_secs"], 12.5)
+        self.assertEqual(wait.kwargs["extra"]["queue"], "algorithm-analysis-service_execution_slow")
+        # The wait is stored with the execution
+        self.assertEqual(mock_controller().run.call_args.args[0]["queue_wait_secs"], 12.5)
+
+    @mock.patch("src.tasks.execution.time.time", return_value=1_000_003.0)
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_process_sweep_stores_queue_wait(self, mock_controller, mock_time):
+        process_sweep(**{"execution_ids": ["21d88834-5021-5fff-a66f-0069f40ec3e7"],
+                         "queue": "algorithm-analysis-service_execution_heavy", "queued_at": 1_000_000.0})
+        params = mock_controller().run_sweep.call_args.args[0]
+        self.assertEqual(params["queue"], "algorithm-analysis-service_execution_heavy")
+        self.assertEqual(params["queue_wait_secs"], 3.0)
+
+    @mock.patch("src.tasks.execution.fan_out")
+    @mock.patch("src.tasks.execution.config_app.EXECUTION_FANOUT", True)
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_process_algorithm_fanout(self, mock_controller, mock_fan_out):
+        params = {"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"}
+        mock_controller().prepare_fanout.return_value = [{"probe": None, "results": []}]
+        process_algorithm(**params)
+        self.assertFalse(mock_controller().run.called)
+        mock_fan_out.assert_called_once_with(dict(params, queue_wait_secs=None), [{"probe": None, "results": []}])
+
+    @mock.patch("src.tasks.execution.chord")
+    @mock.patch("src.tasks.execution.finish_execution")
+    @mock.patch("src.tasks.execution.process_criteria")
+    def test_fan_out(self, mock_criteria, mock_finish, mock_chord):
+        groups = [{"probe": None, "results": [{"result_id": "mock_result_id_0", "criteria_name": "Count Nodes"}]},
+                  {"probe": "timing", "results": [{"result_id": "mock_result_id_1", "criteria_name": "Running Time"}]}]
+        fan_out({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7",
+                 "queue": "algorithm-analysis-service_execution_slow"}, groups)
+        calls = mock_criteria.signature.call_args_list
+        self.assertEqual([c.kwargs["queue"] for c in calls],
+                         ["algorithm-analysis-service_execution", "algorithm-analysis-service_execution_slow"])
+        self.assertEqual(calls[1].kwargs["kwargs"]["results"], groups[1]["results"])
+        self.assertEqual(calls[1].kwargs["kwargs"]["execution_id"], "21d88834-5021-5fff-a66f-0069f40ec3e7")
+        mock_chord.assert_called_once_with([mock_criteria.signature.return_value] * 2)
+        mock_chord.return_value.assert_called_once_with(mock_finish.signature.return_value)
+        mock_finish.signature.return_value.link_error.assert_called_once()
+        self.assertEqual(mock_finish.signature.call_args.kwargs["queue"], "algorithm-analysis-service_execution_slow")
+
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    @mock.patch("src.tasks.execution.chord")
+    @mock.patch("src.tasks.execution.process_criteria")
+    def test_fan_out_lost_subtask(self, mock_criteria, mock_chord, mock_controller):
+        groups = [{"probe": "timing", "results": [{"result_id": "mock_result_id_1", "criteria_name": "Running Time"}]}]
+        fan_out({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"}, groups)
+        callback = mock_chord.return_value.call_args.args[0]
+        # What Celery does when a task of the chord fails, finish_execution is never called
+        request = Context({"id": "mock_task_id", "errbacks": callback.options["link_error"], "delivery_info": {}})
+        celery_app.backend._call_task_errbacks(request, WorkerLostError("Worker exited prematurely"), None)
+        params = mock_controller().set_error_execution.call_args.args[0]
+        self.assertEqual(params["execution_id"], "21d88834-5021-5fff-a66f-0069f40ec3e7")
+        self.assertIn("Worker exited prematurely", params["error"])
+        self.assertFalse(mock_controller().finish_fanout.called)
+
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_fail_execution(self, mock_controller):
+        fail_execution(None, Exception("mock"), None, execution_id="21d88834-5021-5fff-a66f-0069f40ec3e7")
+        mock_controller().set_error_execution.assert_called_once_with(
+            {"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7", "error": "Criteria processing failed: mock"})
+        self.assertTrue(mock_controller().db_disconnect.called)
+
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_process_criteria_does_not_raise(self, mock_controller):
+        mock_controller().run_criteria.side_effect = Exception("mock")
+        process_criteria(**{"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7", "results": []})
+        self.assertTrue(mock_controller().db_disconnect.called)
+
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_finish_execution(self, mock_controller):
+        finish_execution([None, None], execution_id="21d88834-5021-5fff-a66f-0069f40ec3e7")
+        mock_controller().finish_fanout.assert_called_once_with({"execution_id": "21d88834-5021-5fff-a66f-0069f40ec3e7"})
+        mock_controller().finish_fanout.side_effect = Exception("mock")
+        with self.assertRaises(Exception):
+            finish_execution([None], execution_id="21d88834-5021-5fff-a66f-0069f40ec3e7")
+        self.assertTrue(mock_controller().set_error_execution.called)
+
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_process_sweep(self, mock_controller):
+        params = {"execution_ids": ["21d88834-5021-5fff-a66f-0069f40ec3e7", "21d88834-5021-5fff-a66f-0069f40ec3e8"]}
+        process_sweep(**params)
+        mock_controller().run_sweep.assert_called_once_with(dict(params, queue_wait_secs=None))
+        self.assertTrue(mock_controller().db_disconnect.called)
+
+    @mock.patch("src.tasks.execution.ControllerExecution")
+    def test_exception_process_sweep(self, mock_controller):
+        params = {"execution_ids": ["21d88834-5021-5fff-a66f-0069f40ec3e7"]}
+        mock_controller().run_sweep.side_effect = Exception("mock")
+        with self.assertRaises(Exception):
+            process_sweep(**params)
+        self.assertTrue(mock_controller().db_disconnect.called)
+
+    @mock.patch("src.tasks.execution.process_sweep")
+    def test_queue_sweep(self, mock_process):
+        queue_sweep({"execution_ids": ["21d88834-5021-5fff-a66f-0069f40ec3e7"]}, "algorithm-analysis-service_execution_slow")
+        kwargs = mock_process.apply_async.call_args.kwargs
+        self.assertEqual(kwargs["queue"], "algorithm-analysis-service_execution_slow")
+        self.assertEqual(kwargs["kwargs"]["execution_ids"], ["21d88834-5021-5fff-a66f-0069f40ec3e7"])
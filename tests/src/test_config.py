@@ -58,3 +58,13 @@ class TestConfig(BaseTestClass):
         importlib.reload(src.config)
         res = self.__application_config.broker_url
         self.assertEqual(res, "sqs://mock_sqs_access_key:mock_sqs_secret_key@")
+        queues = self.__application_config.broker_transport_options["predefined_queues"]
+        self.assertEqual(len(queues), 3)
+        self.assertTrue(all(q["url"] == "mock_sqs_url" for q in queues.values()))
+        self.assertTrue(all(q["access_key_id"] == "mock_sqs_access_key" for q in queues.values()))
+
+    def test_task_queues(self):
+        config = self.__application_config
+        names = [q.name for q in config.task_queues]
+        self.assertEqual(names, [config.QUEUE_EXECUTION, config.QUEUE_EXECUTION_SLOW, config.QUEUE_EXECUTION_HEAVY])
+        self.assertEqual(config.task_default_queue, config.QUEUE_EXECUTION)
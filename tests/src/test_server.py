@@ -1,6 +1,7 @@
 import mock
 from tornado.web import Application
 import asyncio
+import threading
 from src.server import ApiServer
 from tests import BaseTestClass
 
@@ -9,17 +10,37 @@ class TestServer(BaseTestClass):
 
     """Class for test the methods module server."""
 
+    @mock.patch('src.server.ControllerExecution')
+    @mock.patch('src.server.PeriodicCallback')
     @mock.patch('src.server.HTTPServer')
     @mock.patch('src.server.asyncio.Event')
-    def test_server(self, mock_event, mock_httpserver):
+    def test_server(self, mock_event, mock_httpserver, mock_periodic, mock_controller):
         mock_result = mock.AsyncMock()
         mock_result.return_value = "teste"
         mock_event().wait.return_value = mock_result()
         server = ApiServer()
         asyncio.run(server.start())
         self.assertTrue(mock_event().wait.called)
+        self.assertTrue(mock_controller().refresh_estimates.called)
+        self.assertEqual(mock_periodic.call_args.args[0], server.refresh_estimates)
+        self.assertTrue(mock_periodic().start.called)
         self.assertIsInstance(server.make_app(), Application)
 
+    @mock.patch('src.server.ControllerExecution')
+    def test_refresh_estimates_error(self, mock_controller):
+        mock_controller().refresh_estimates.side_effect = Exception("connection refused")
+        with self.assertLogs(level='ERROR'):
+            asyncio.run(ApiServer.refresh_estimates())
+
+    @mock.patch('src.server.ControllerExecution')
+    def test_refresh_estimates_off_the_loop(self, mock_controller):
+        threads = []
+        mock_controller().refresh_estimates.side_effect = lambda: threads.append(threading.current_thread())
+        asyncio.run(ApiServer.refresh_estimates())
+        # The query runs in an executor thread, not in the thread of the IOLoop that serves the requests
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
     # @mock.patch('src.server.HTTPServer')
     # @mock.patch('src.server.asyncio.Event')
     # @mock.patch('src.server.ElasticAPM', mock.MagicMock())